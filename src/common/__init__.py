@@ -3,12 +3,14 @@
 공통 모듈 - 메시지 모델 및 설정 관리
 """
 
-from .message_models import BSS메시지, MessageType
+from .message_models import BSS메시지, 지연BSS메시지, MessageType
 from .message_models import 가입메시지생성, 번호이동메시지생성, 명의변경메시지생성, 해지메시지생성
 from .config import 설정관리자, 설정가져오기, 설정초기화
+from .message_codecs import 메시지코덱, JSON코덱, 바이너리코덱, 코덱등록, 코덱가져오기
 
 __all__ = [
-    'BSS메시지', 'MessageType',
+    'BSS메시지', '지연BSS메시지', 'MessageType',
     '가입메시지생성', '번호이동메시지생성', '명의변경메시지생성', '해지메시지생성',
-    '설정관리자', '설정가져오기', '설정초기화'
+    '설정관리자', '설정가져오기', '설정초기화',
+    '메시지코덱', 'JSON코덱', '바이너리코덱', '코덱등록', '코덱가져오기'
 ]
@@ -34,6 +34,21 @@ class 설정관리자:
         self.큐이름 = os.getenv('QUEUE_NAME', 'bss_single_queue')
         self.큐내구성 = os.getenv('QUEUE_DURABLE', 'true').lower() == 'true'
         
+        # 메시지 우선순위 (작업 큐 x-max-priority, 0이면 사용 안 함 - 기존 큐는 인자가 달라 재생성 필요)
+        self.큐최대우선순위 = int(os.getenv('QUEUE_MAX_PRIORITY', '0'))
+        self.타입별우선순위 = {
+            타입.strip().upper(): int(값)
+            for 타입, _, 값 in (
+                항목.partition('=') for 항목 in os.getenv(
+                    'MESSAGE_PRIORITIES', 'TERMINATION=8,MNP=6,CHANGE=4,SUBSCRIPTION=2'
+                ).split(',') if 항목.strip()
+            )
+        }
+        
+        # 라우팅 설정 (single: 단일 큐 + Consumer 필터링, direct/headers: 타입별 큐)
+        self.라우팅모드 = os.getenv('ROUTING_MODE', 'single').lower()
+        self.교환기이름 = os.getenv('EXCHANGE_NAME', 'bss_message_exchange')
+        
         # 메시지 설정
         self.최대재시도횟수 = int(os.getenv('MAX_RETRIES', '3'))
         self.재시도지연시간 = int(os.getenv('RETRY_DELAY_MS', '5000'))
@@ -44,6 +59,95 @@ class 설정관리자:
         self.처리타임아웃 = int(os.getenv('PROCESSING_TIMEOUT_SEC', '300'))  # 5분
         self.프리페치카운트 = int(os.getenv('CONSUMER_PREFETCH_COUNT', '10'))
         
+        # 적응형 prefetch (처리 시간/ACK 지연 관측으로 basic_qos를 실행 중에 조정)
+        self.적응형프리페치 = os.getenv('CONSUMER_PREFETCH_ADAPTIVE', 'false').lower() == 'true'
+        self.프리페치최소 = int(os.getenv('CONSUMER_PREFETCH_MIN', '1'))
+        self.프리페치최대 = int(os.getenv('CONSUMER_PREFETCH_MAX', '500'))
+        self.프리페치보충지연ms = int(os.getenv('CONSUMER_PREFETCH_REFILL_MS', '200'))
+        self.프리페치조정간격 = float(os.getenv('CONSUMER_PREFETCH_ADJUST_INTERVAL_SEC', '5'))
+        self.동시처리수 = int(os.getenv('CONSUMER_CONCURRENCY', '1'))
+        
+        # 처리 중지 시 드레인 대기 시간 (Pod terminationGracePeriodSeconds보다 짧게)
+        self.드레인타임아웃 = float(os.getenv('CONSUMER_DRAIN_TIMEOUT_SEC', '25'))
+        
+        # prefork 감독자의 작업 프로세스 수 (0이면 CPU 코어 수)
+        self.작업프로세스수 = int(os.getenv('CONSUMER_PROCESSES', '1'))
+        
+        # 소비 엔진 (thread | asyncio) 및 asyncio 엔진의 동시 처리 메시지 수
+        self.소비엔진 = os.getenv('CONSUMER_ENGINE', 'thread').lower()
+        self.비동기동시처리수 = int(os.getenv('CONSUMER_ASYNC_CONCURRENCY', '200'))
+        
+        # 일괄 처리 (최대 메시지 수 / 첫 메시지 이후 최대 대기 시간, 1이면 비활성 - thread 엔진 전용)
+        self.소비일괄크기 = int(os.getenv('CONSUMER_BATCH_SIZE', '1'))
+        self.소비일괄대기ms = int(os.getenv('CONSUMER_BATCH_WAIT_MS', '50'))
+        
+        # 메시지 직렬화 코덱 (json | binary)
+        self.메시지코덱 = os.getenv('MESSAGE_CODEC', 'json').lower()
+        
+        # 생산자 설정 (백엔드 / 풀 / Publisher Confirm)
+        self.생산자백엔드 = os.getenv('PRODUCER_BACKEND', 'blocking').lower()
+        self.생산자연결풀크기 = int(os.getenv('PRODUCER_CONNECTION_POOL_SIZE', '2'))
+        self.생산자채널풀크기 = int(os.getenv('PRODUCER_CHANNEL_POOL_SIZE', '10'))
+        self.발행확인활성화 = os.getenv('PUBLISHER_CONFIRMS', 'false').lower() == 'true'
+        self.발행확인윈도우 = int(os.getenv('PUBLISHER_CONFIRM_WINDOW', '256'))
+        self.발행확인타임아웃 = float(os.getenv('PUBLISHER_CONFIRM_TIMEOUT_SEC', '5'))
+        
+        # 생산자 연결 감독 설정 (주기 점검 / 재연결 지수 백오프)
+        self.생산자점검간격 = float(os.getenv('PRODUCER_HEALTH_CHECK_INTERVAL_SEC', '5'))
+        self.재연결기본지연ms = int(os.getenv('PRODUCER_RECONNECT_BASE_MS', '500'))
+        self.재연결최대지연 = float(os.getenv('PRODUCER_RECONNECT_MAX_SEC', '30'))
+        
+        # 게이트웨이 설정 (단일 요청 마이크로 배칭)
+        self.마이크로배치활성화 = os.getenv('MICRO_BATCH_ENABLED', 'false').lower() == 'true'
+        self.마이크로배치대기ms = int(os.getenv('MICRO_BATCH_MAX_WAIT_MS', '5'))
+        self.마이크로배치최대크기 = int(os.getenv('MICRO_BATCH_MAX_SIZE', '100'))
+        
+        # 로컬 스풀 설정 (브로커 장애 시 게이트웨이가 메시지를 로컬 디스크에 보관)
+        self.스풀활성화 = os.getenv('SPOOL_ENABLED', 'false').lower() == 'true'
+        self.스풀디렉터리 = os.getenv('SPOOL_DIR', '/var/lib/bss/spool')
+        self.스풀세그먼트MB = int(os.getenv('SPOOL_SEGMENT_MB', '16'))
+        self.스풀동기화간격ms = int(os.getenv('SPOOL_FSYNC_INTERVAL_MS', '50'))
+        self.스풀재생배치크기 = int(os.getenv('SPOOL_REPLAY_BATCH_SIZE', '500'))
+        self.스풀재생간격 = float(os.getenv('SPOOL_REPLAY_INTERVAL_SEC', '1'))
+        
+        # 데드레터 큐 재주입 설정 (초당 재주입 수 / 대상 작업 큐 깊이 상한)
+        self.데드레터재주입초당개수 = float(os.getenv('DLQ_REPLAY_RATE_PER_SEC', '200'))
+        self.데드레터재주입큐상한 = int(os.getenv('DLQ_REPLAY_MAX_QUEUE_DEPTH', '1000'))
+        
+        # 처리시뮬레이션 난수 시드 (비우면 매번 다른 결과, 정수를 주면 재현 가능)
+        시드 = os.getenv('SIMULATION_SEED', '')
+        self.시뮬레이션시드 = int(시드) if 시드 else None
+        
+        # 타입별 처리 시간 분포 명세 (예: 'lognormal:median=1.2,sigma=0.8', 비우면 처리 서비스 기본 균등 분포)
+        self.처리시간분포명세 = {
+            타입: os.getenv(f'SERVICE_TIME_{타입}', '').strip()
+            for 타입 in ('SUBSCRIPTION', 'MNP', 'CHANGE', 'TERMINATION')
+        }
+        # 타입별 처리 실패 비율 (0~1, 지정하지 않은 타입은 처리 서비스 기본값)
+        self.타입별실패율 = {
+            타입.strip().upper(): float(값)
+            for 타입, _, 값 in (
+                항목.partition('=') for 항목 in os.getenv('FAILURE_RATIOS', '').split(',') if 항목.strip()
+            )
+        }
+        
+        # 처리 결과 지연 쓰기 (레코드를 모아 최대 건수/대기 시간마다 한 번에 쓰고, 쓰기 후 ACK)
+        self.쓰기지연활성화 = os.getenv('WRITE_BEHIND_ENABLED', 'false').lower() == 'true'
+        self.쓰기지연최대건수 = int(os.getenv('WRITE_BEHIND_MAX_RECORDS', '100'))
+        self.쓰기지연최대대기ms = float(os.getenv('WRITE_BEHIND_MAX_WAIT_MS', '50'))
+        
+        # 모의 백엔드 쓰기 비용 (호출당 왕복 지연 + 레코드당 지연, 0이면 처리시뮬레이션에 포함된 것으로 봄)
+        self.백엔드왕복지연ms = float(os.getenv('BACKEND_WRITE_RTT_MS', '0'))
+        self.백엔드레코드당지연ms = float(os.getenv('BACKEND_WRITE_PER_RECORD_MS', '0'))
+        self.백엔드동시쓰기한도 = int(os.getenv('BACKEND_WRITE_CONCURRENCY', '4'))
+        self.백엔드쓰기실패율 = float(os.getenv('BACKEND_WRITE_FAILURE_RATIO', '0'))
+        
+        # Consumer 중복 처리 방지 (메시지 아이디 LRU/TTL 캐시, 경로를 주면 SQLite에도 기록)
+        self.중복제거활성화 = os.getenv('IDEMPOTENCY_ENABLED', 'false').lower() == 'true'
+        self.중복제거최대개수 = int(os.getenv('IDEMPOTENCY_MAX_ENTRIES', '100000'))
+        self.중복제거TTL초 = float(os.getenv('IDEMPOTENCY_TTL_SEC', '3600'))
+        self.중복제거저장경로 = os.getenv('IDEMPOTENCY_DB_PATH', '') or None
+        
         # 로깅 설정
         self.로그레벨 = os.getenv('LOG_LEVEL', 'INFO')
         
@@ -82,7 +186,21 @@ class 설정관리자:
             '내구성': self.큐내구성,
             '자동삭제': False,
             '배타적': False,
-            'TTL': self.메시지TTL
+            'TTL': self.메시지TTL,
+            '최대우선순위': self.큐최대우선순위,
+            '타입별우선순위': self.타입별우선순위
+        }
+    
+    def 라우팅설정가져오기(self) -> Dict[str, Any]:
+        """
+        메시지 라우팅 설정 정보 반환
+        
+        Returns:
+            dict: 라우팅 설정 딕셔너리
+        """
+        return {
+            '라우팅모드': self.라우팅모드,
+            '교환기이름': self.교환기이름
         }
     
     def 처리설정가져오기(self) -> Dict[str, Any]:
@@ -96,10 +214,127 @@ class 설정관리자:
             '배치크기': self.배치크기,
             '타임아웃': self.처리타임아웃,
             '프리페치카운트': self.프리페치카운트,
+            '적응형프리페치': self.적응형프리페치,
+            '프리페치최소': self.프리페치최소,
+            '프리페치최대': self.프리페치최대,
+            '프리페치보충지연ms': self.프리페치보충지연ms,
+            '프리페치조정간격': self.프리페치조정간격,
+            '동시처리수': self.동시처리수,
+            '작업프로세스수': self.작업프로세스수,
+            '드레인타임아웃': self.드레인타임아웃,
+            '엔진': self.소비엔진,
+            '비동기동시처리수': self.비동기동시처리수,
+            '일괄크기': self.소비일괄크기,
+            '일괄대기ms': self.소비일괄대기ms,
             '최대재시도': self.최대재시도횟수,
             '재시도지연': self.재시도지연시간
         }
     
+    def 생산자설정가져오기(self) -> Dict[str, Any]:
+        """
+        메시지 생산자 설정 정보 반환
+        
+        Returns:
+            dict: 생산자 설정 딕셔너리
+        """
+        return {
+            '백엔드': self.생산자백엔드,
+            '코덱': self.메시지코덱,
+            '연결풀크기': self.생산자연결풀크기,
+            '채널풀크기': self.생산자채널풀크기,
+            '발행확인': self.발행확인활성화,
+            '확인윈도우': self.발행확인윈도우,
+            '확인타임아웃': self.발행확인타임아웃,
+            '점검간격': self.생산자점검간격,
+            '재연결기본지연': self.재연결기본지연ms / 1000,
+            '재연결최대지연': self.재연결최대지연
+        }
+    
+    def 게이트웨이설정가져오기(self) -> Dict[str, Any]:
+        """
+        API 게이트웨이 설정 정보 반환
+        
+        Returns:
+            dict: 게이트웨이 설정 딕셔너리
+        """
+        return {
+            '마이크로배치': self.마이크로배치활성화,
+            '배치대기ms': self.마이크로배치대기ms,
+            '배치최대크기': self.마이크로배치최대크기
+        }
+    
+    def 스풀설정가져오기(self) -> Dict[str, Any]:
+        """
+        로컬 스풀 설정 정보 반환
+        
+        Returns:
+            dict: 스풀 설정 딕셔너리
+        """
+        return {
+            '활성화': self.스풀활성화,
+            '디렉터리': self.스풀디렉터리,
+            '세그먼트크기': self.스풀세그먼트MB * 1024 * 1024,
+            '동기화간격ms': self.스풀동기화간격ms,
+            '재생배치크기': self.스풀재생배치크기,
+            '재생간격': self.스풀재생간격
+        }
+    
+    def 데드레터설정가져오기(self) -> Dict[str, Any]:
+        """
+        데드레터 큐 재주입 설정 정보 반환
+        
+        Returns:
+            dict: 데드레터 설정 딕셔너리
+        """
+        return {
+            '재주입초당개수': self.데드레터재주입초당개수,
+            '재주입큐상한': self.데드레터재주입큐상한
+        }
+    
+    def 중복제거설정가져오기(self) -> Dict[str, Any]:
+        """
+        Consumer 중복 처리 방지 설정 정보 반환
+        
+        Returns:
+            dict: 중복 제거 설정 딕셔너리
+        """
+        return {
+            '활성화': self.중복제거활성화,
+            '최대개수': self.중복제거최대개수,
+            'TTL초': self.중복제거TTL초,
+            '저장경로': self.중복제거저장경로
+        }
+    
+    def 시뮬레이션설정가져오기(self) -> Dict[str, Any]:
+        """
+        처리시뮬레이션 설정 정보 반환
+        
+        Returns:
+            dict: 시뮬레이션 설정 딕셔너리
+        """
+        return {
+            '시드': self.시뮬레이션시드,
+            '처리시간분포': self.처리시간분포명세,
+            '실패율': self.타입별실패율
+        }
+    
+    def 쓰기지연설정가져오기(self) -> Dict[str, Any]:
+        """
+        처리 결과 지연 쓰기 및 모의 백엔드 설정 정보 반환
+        
+        Returns:
+            dict: 지연 쓰기 설정 딕셔너리
+        """
+        return {
+            '활성화': self.쓰기지연활성화,
+            '최대건수': self.쓰기지연최대건수,
+            '최대대기ms': self.쓰기지연최대대기ms,
+            '백엔드왕복지연ms': self.백엔드왕복지연ms,
+            '백엔드레코드당지연ms': self.백엔드레코드당지연ms,
+            '백엔드동시쓰기한도': self.백엔드동시쓰기한도,
+            '백엔드쓰기실패율': self.백엔드쓰기실패율
+        }
+    
     def 포트설정가져오기(self) -> Dict[str, int]:
         """
         포트 설정 정보 반환
@@ -156,7 +391,15 @@ class 설정관리자:
                 '활성화': self.모니터링활성화
             },
             '큐설정': self.큐설정가져오기(),
+            '라우팅설정': self.라우팅설정가져오기(),
             '처리설정': self.처리설정가져오기(),
+            '생산자설정': self.생산자설정가져오기(),
+            '게이트웨이설정': self.게이트웨이설정가져오기(),
+            '스풀설정': self.스풀설정가져오기(),
+            '데드레터설정': self.데드레터설정가져오기(),
+            '중복제거설정': self.중복제거설정가져오기(),
+            '시뮬레이션설정': self.시뮬레이션설정가져오기(),
+            '쓰기지연설정': self.쓰기지연설정가져오기(),
             '포트설정': self.포트설정가져오기(),
             '로깅': {
                 '레벨': self.로그레벨
@@ -0,0 +1,313 @@
+# 파일 경로: src/common/dead_letter.py
+# 데드레터(parking) 큐 조회 및 재주입 도구
+
+import argparse
+import json
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Any, Optional, List
+
+import pika
+
+from src.common.config import 설정가져오기
+from src.common.queue_topology import 큐토폴로지
+from src.common.message_codecs import 코덱가져오기
+
+
+class 데드레터관리자:
+    """
+    데드레터 큐에 격리된 메시지를 조회하고, 타입/실패 사유로 골라 원래 작업 큐로 재주입하는 클래스
+
+    재주입은 초당 개수로 속도를 제한하고, 대상 작업 큐 깊이가 상한을 넘으면 잠시 멈춰
+    장애 복구 후 수만 건을 되돌려도 Consumer가 한꺼번에 밀리지 않도록 함
+    (Publisher Confirm을 받은 뒤에만 데드레터 큐의 원본을 ACK하므로 재주입 중 유실 없음)
+
+    속성:
+        토폴로지: 큐 토폴로지 (데드레터 큐 이름, 헤더 규칙)
+        진행상황 (dict): 마지막(또는 진행 중인) 재주입 작업의 진행 상황
+    """
+
+    재주입헤더 = 'x-replay-count'
+    _제거헤더 = ('x-death', 'x-first-death-exchange', 'x-first-death-queue', 'x-first-death-reason')
+
+    def __init__(self):
+        """데드레터 관리자 초기화 (연결은 작업마다 생성)"""
+        self.설정 = 설정가져오기()
+        self.로거 = self.설정.로거설정('데드레터관리자')
+        self.토폴로지 = 큐토폴로지()
+
+        데드레터설정 = self.설정.데드레터설정가져오기()
+        self.기본초당개수 = 데드레터설정['재주입초당개수']
+        self.기본큐상한 = 데드레터설정['재주입큐상한']
+
+        self.진행상황: Dict[str, Any] = {'상태': '대기'}
+        self._실행잠금 = threading.Lock()
+        self._중지요청 = threading.Event()
+
+    def _연결생성(self) -> pika.BlockingConnection:
+        """작업용 RabbitMQ 연결 생성"""
+        return pika.BlockingConnection(pika.URLParameters(self.설정.연결문자열가져오기()))
+
+    def _대상큐목록(self, 타입: Optional[str]) -> List[str]:
+        """조회/재주입할 데드레터 큐 목록"""
+        if 타입:
+            return [self.토폴로지.데드레터큐이름(타입.upper())]
+        return self.토폴로지.데드레터큐목록()
+
+    def _메시지요약(self, properties, body: bytes, 데드레터큐: str) -> Dict[str, Any]:
+        """데드레터 메시지의 타입, 실패 사유, 원래 큐 등 요약 (헤더 우선, 없으면 본문 디코딩)"""
+        헤더 = properties.headers or {}
+        타입 = 헤더.get('message_type')
+        아이디 = properties.message_id
+        if not 타입 or not 아이디:
+            try:
+                메시지 = 코덱가져오기(properties.content_type).디코딩(body)
+                타입 = 타입 or 메시지.타입
+                아이디 = 아이디 or 메시지.아이디
+            except Exception:
+                타입 = 타입 or 'UNKNOWN'
+
+        return {
+            '아이디': 아이디,
+            '타입': 타입,
+            '실패사유': self.토폴로지.실패사유(헤더),
+            '재시도횟수': self.토폴로지.재시도횟수(헤더),
+            '재주입횟수': int(헤더.get(self.재주입헤더, 0)),
+            '원래큐': self.토폴로지.원래큐이름(헤더, 데드레터큐),
+            '실패시각': 헤더.get(self.토폴로지.실패시각헤더),
+            '바이트': len(body)
+        }
+
+    @staticmethod
+    def _조건일치(요약: Dict[str, Any], 타입: Optional[str], 사유: Optional[str]) -> bool:
+        """타입(정확히 일치)과 실패 사유(부분 문자열) 조건 확인"""
+        if 타입 and 요약['타입'] != 타입.upper():
+            return False
+        if 사유 and 사유.lower() not in str(요약['실패사유']).lower():
+            return False
+        return True
+
+    def 조회(self, 타입: Optional[str] = None, 사유: Optional[str] = None,
+           최대개수: int = 100, 최대검사개수: int = 10000) -> Dict[str, Any]:
+        """
+        데드레터 큐 메시지 조회 (메시지는 ACK하지 않고 연결 종료 시 큐로 되돌림)
+
+        Args:
+            타입: 메시지 타입 필터
+            사유: 실패 사유 부분 문자열 필터
+            최대개수: 반환할 최대 메시지 수
+            최대검사개수: 사유별/타입별 집계를 위해 살펴볼 최대 메시지 수
+
+        Returns:
+            dict: 큐별 깊이, 사유별/타입별 개수, 조건에 맞는 메시지 요약 목록
+        """
+        연결 = self._연결생성()
+        try:
+            채널 = 연결.channel()
+            큐별깊이 = {}
+            사유별개수: Dict[str, int] = {}
+            타입별개수: Dict[str, int] = {}
+            메시지목록 = []
+            검사개수 = 0
+
+            for 데드레터큐 in self._대상큐목록(타입):
+                큐별깊이[데드레터큐] = 채널.queue_declare(
+                    queue=데드레터큐, passive=True
+                ).method.message_count
+
+                while 검사개수 < 최대검사개수:
+                    method, properties, body = 채널.basic_get(queue=데드레터큐, auto_ack=False)
+                    if method is None:
+                        break
+                    검사개수 += 1
+
+                    요약 = self._메시지요약(properties, body, 데드레터큐)
+                    if not self._조건일치(요약, 타입, 사유):
+                        continue
+                    사유별개수[요약['실패사유']] = 사유별개수.get(요약['실패사유'], 0) + 1
+                    타입별개수[요약['타입']] = 타입별개수.get(요약['타입'], 0) + 1
+                    if len(메시지목록) < 최대개수:
+                        메시지목록.append(요약)
+
+            return {
+                '큐별깊이': 큐별깊이,
+                '검사개수': 검사개수,
+                '사유별개수': 사유별개수,
+                '타입별개수': 타입별개수,
+                '메시지목록': 메시지목록
+            }
+        finally:
+            # ACK하지 않은 메시지는 채널이 닫히면서 데드레터 큐로 돌아감
+            연결.close()
+
+    def _재주입속성(self, properties):
+        """재주입용 속성 (재시도 횟수, 실패 정보, x-death 제거 후 재주입 횟수 증가)"""
+        토폴로지 = self.토폴로지
+        제거 = {토폴로지.재시도헤더, 토폴로지.실패사유헤더, 토폴로지.원래큐헤더,
+              토폴로지.실패시각헤더, *self._제거헤더}
+        헤더 = {키: 값 for 키, 값 in (properties.headers or {}).items() if 키 not in 제거}
+        헤더[self.재주입헤더] = int((properties.headers or {}).get(self.재주입헤더, 0)) + 1
+
+        return pika.BasicProperties(
+            content_type=properties.content_type,
+            delivery_mode=properties.delivery_mode,
+            priority=properties.priority,
+            message_id=properties.message_id,
+            timestamp=properties.timestamp,
+            headers=헤더
+        )
+
+    def _큐깊이(self, 채널, 큐이름: str) -> int:
+        """작업 큐의 현재 메시지 수"""
+        return 채널.queue_declare(queue=큐이름, passive=True).method.message_count
+
+    def 재주입(self, 타입: Optional[str] = None, 사유: Optional[str] = None,
+            최대개수: Optional[int] = None, 초당개수: Optional[float] = None,
+            큐상한: Optional[int] = None) -> Dict[str, Any]:
+        """
+        조건에 맞는 데드레터 메시지를 원래 작업 큐로 재주입 (블로킹, 한 번에 하나의 작업만 실행)
+
+        Args:
+            타입: 메시지 타입 필터
+            사유: 실패 사유 부분 문자열 필터
+            최대개수: 재주입할 최대 메시지 수 (None이면 조건에 맞는 전체)
+            초당개수: 초당 재주입 수 (None이면 설정값, 0이면 속도 제한 없음)
+            큐상한: 대상 작업 큐 깊이가 이 값을 넘으면 줄어들 때까지 대기 (None이면 설정값, 0이면 확인 안 함)
+
+        Returns:
+            dict: 재주입 결과 (재주입/건너뜀/검사 개수, 대기 시간, 소요 시간)
+
+        Raises:
+            RuntimeError: 이미 재주입이 실행 중인 경우
+        """
+        if not self._실행잠금.acquire(blocking=False):
+            raise RuntimeError("이미 데드레터 재주입이 실행 중입니다")
+
+        초당개수 = self.기본초당개수 if 초당개수 is None else 초당개수
+        큐상한 = self.기본큐상한 if 큐상한 is None else 큐상한
+        간격 = 1.0 / 초당개수 if 초당개수 > 0 else 0
+        시작 = time.monotonic()
+        self._중지요청.clear()
+        진행 = self.진행상황 = {
+            '상태': '실행중',
+            '조건': {'타입': 타입, '사유': 사유, '최대개수': 최대개수},
+            '초당개수': 초당개수,
+            '큐상한': 큐상한,
+            '검사개수': 0,
+            '재주입개수': 0,
+            '건너뜀개수': 0,
+            '큐대기초': 0.0,
+            '큐별재주입': {},
+            '시작시간': datetime.now().isoformat()
+        }
+
+        연결 = None
+        try:
+            연결 = self._연결생성()
+            채널 = 연결.channel()
+            채널.confirm_delivery()
+            다음발행시각 = time.monotonic()
+            다음깊이확인 = 0
+
+            for 데드레터큐 in self._대상큐목록(타입):
+                while not self._중지요청.is_set():
+                    if 최대개수 is not None and 진행['재주입개수'] >= 최대개수:
+                        break
+
+                    method, properties, body = 채널.basic_get(queue=데드레터큐, auto_ack=False)
+                    if method is None:
+                        break
+                    진행['검사개수'] += 1
+
+                    요약 = self._메시지요약(properties, body, 데드레터큐)
+                    if not self._조건일치(요약, 타입, 사유):
+                        # 조건에 맞지 않는 메시지는 ACK하지 않고 두었다가 연결 종료 시 되돌림
+                        진행['건너뜀개수'] += 1
+                        continue
+
+                    원래큐 = 요약['원래큐']
+                    if 큐상한 and 진행['재주입개수'] >= 다음깊이확인:
+                        # 깊이 확인은 100건마다 (매번 확인하면 재주입보다 조회가 많아짐)
+                        진행['큐대기초'] += self._큐여유대기(연결, 채널, 원래큐, 큐상한)
+                        다음깊이확인 = 진행['재주입개수'] + 100
+
+                    # 초당 개수 제한 (연결 이벤트를 처리하며 대기하여 heartbeat 유지)
+                    지금 = time.monotonic()
+                    if 다음발행시각 > 지금:
+                        연결.sleep(다음발행시각 - 지금)
+                    다음발행시각 = max(다음발행시각, 지금) + 간격
+
+                    채널.basic_publish(
+                        exchange='', routing_key=원래큐, body=body,
+                        properties=self._재주입속성(properties)
+                    )
+                    채널.basic_ack(delivery_tag=method.delivery_tag)
+                    진행['재주입개수'] += 1
+                    진행['큐별재주입'][원래큐] = 진행['큐별재주입'].get(원래큐, 0) + 1
+
+            진행['상태'] = '중지됨' if self._중지요청.is_set() else '완료'
+
+        except Exception as e:
+            진행['상태'] = '실패'
+            진행['오류'] = str(e)
+            self.로거.error(f"데드레터 재주입 실패: {e}")
+        finally:
+            if 연결 is not None and not 연결.is_closed:
+                연결.close()
+            진행['큐대기초'] = round(진행['큐대기초'], 1)
+            진행['소요초'] = round(time.monotonic() - 시작, 1)
+            self._실행잠금.release()
+
+        self.로거.info(
+            f"데드레터 재주입 {진행['상태']}: 재주입 {진행['재주입개수']}개, "
+            f"건너뜀 {진행['건너뜀개수']}개, {진행['소요초']}초"
+        )
+        return dict(진행)
+
+    def _큐여유대기(self, 연결, 채널, 큐이름: str, 큐상한: int) -> float:
+        """대상 작업 큐 깊이가 상한 이하가 될 때까지 대기하고 대기한 시간(초) 반환"""
+        대기시작 = time.monotonic()
+        while not self._중지요청.is_set() and self._큐깊이(채널, 큐이름) > 큐상한:
+            연결.sleep(1)
+        return time.monotonic() - 대기시작
+
+    def 실행중(self) -> bool:
+        """재주입 작업이 실행 중인지 확인"""
+        return self._실행잠금.locked()
+
+    def 중지(self):
+        """실행 중인 재주입 작업 중지 요청 (현재 메시지까지 처리 후 종료)"""
+        self._중지요청.set()
+
+    def 진행상황조회(self) -> Dict[str, Any]:
+        """마지막(또는 진행 중인) 재주입 작업 진행 상황"""
+        return dict(self.진행상황)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='데드레터 큐 조회 및 재주입')
+    하위 = parser.add_subparsers(dest='명령', required=True)
+
+    조회파서 = 하위.add_parser('list', help='데드레터 메시지 조회')
+    재주입파서 = 하위.add_parser('replay', help='데드레터 메시지 재주입')
+    for 파서 in (조회파서, 재주입파서):
+        파서.add_argument('--type', dest='타입', help='메시지 타입 (SUBSCRIPTION, MNP, CHANGE, TERMINATION)')
+        파서.add_argument('--reason', dest='사유', help='실패 사유에 포함된 문자열')
+    조회파서.add_argument('--limit', type=int, default=20, help='출력할 최대 메시지 수')
+    재주입파서.add_argument('--limit', type=int, default=None, help='재주입할 최대 메시지 수')
+    재주입파서.add_argument('--rate', type=float, default=None, help='초당 재주입 수')
+    재주입파서.add_argument('--max-queue-depth', type=int, default=None,
+                         help='대상 작업 큐 깊이 상한 (0이면 확인 안 함)')
+    args = parser.parse_args()
+
+    관리자 = 데드레터관리자()
+    if args.명령 == 'list':
+        결과 = 관리자.조회(args.타입, args.사유, args.limit)
+    else:
+        결과 = 관리자.재주입(args.타입, args.사유, args.limit, args.rate, args.max_queue_depth)
+    print(json.dumps(결과, ensure_ascii=False, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
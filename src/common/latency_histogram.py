@@ -0,0 +1,210 @@
+# 파일 경로: src/common/latency_histogram.py
+# 고정 메모리 HDR 방식 지연 시간 히스토그램 클래스
+
+import math
+import threading
+from array import array
+from typing import Dict, Any, Optional, Tuple
+
+
+class 지연히스토그램:
+    """
+    HDR(High Dynamic Range) 방식의 지연 시간 히스토그램
+
+    값을 최소단위 정수로 바꾼 뒤 2의 거듭제곱 구간마다 같은 개수의 선형 부분 구간으로 나눠 세므로,
+    최소단위부터 최대값까지 상대 오차가 유효자릿수 이내로 유지되고 메모리는 기록 수와 무관하게 고정
+    (기본: 0.1ms ~ 1시간, 유효자릿수 2 → 부분 구간 256개, 계수 배열 약 2,600칸 ≈ 20KB)
+
+    속성:
+        개수 (int): 기록한 값 수
+        최소 / 최대 (float): 기록한 값의 최소/최대 (초)
+        상한초과수 (int): 최대값을 넘어 최대값으로 기록한 수
+    """
+
+    백분위목록 = (('p50', 50.0), ('p90', 90.0), ('p99', 99.0), ('p999', 99.9))
+
+    def __init__(self, 최대값: float = 3600.0, 최소단위: float = 0.0001, 유효자릿수: int = 2):
+        """
+        지연 히스토그램 초기화
+
+        Args:
+            최대값: 기록할 최대 값(초), 넘는 값은 최대값으로 기록
+            최소단위: 구분할 최소 단위(초)
+            유효자릿수: 값의 유효 자릿수 (2면 상대 오차 1% 이내)
+        """
+        self.최소단위 = 최소단위
+        self.최대값 = 최대값
+        self._최대정수 = max(1, int(최대값 / 최소단위))
+        self._부분비트 = math.ceil(math.log2(2 * 10 ** 유효자릿수))
+        self._부분수 = 1 << self._부분비트
+        self._절반 = self._부분수 // 2
+        self._계수 = array('q', [0]) * (self._인덱스(self._최대정수) + 1)
+        self.개수 = 0
+        self._합계 = 0.0
+        self.최소 = math.inf
+        self.최대 = 0.0
+        self.상한초과수 = 0
+
+    def _인덱스(self, 정수값: int) -> int:
+        """정수값이 들어갈 계수 배열 위치 (부분 구간 수 미만은 선형, 이후는 2배마다 절반 개씩)"""
+        if 정수값 < self._부분수:
+            return 정수값
+        지수 = 정수값.bit_length() - self._부분비트
+        return 지수 * self._절반 + (정수값 >> 지수)
+
+    def _대표값(self, 인덱스: int) -> float:
+        """계수 배열 위치가 나타내는 구간의 중간값(초)"""
+        if 인덱스 < self._부분수:
+            return 인덱스 * self.최소단위
+        지수 = 인덱스 // self._절반 - 1
+        부분 = 인덱스 - 지수 * self._절반
+        return ((부분 << 지수) + ((1 << 지수) - 1) / 2) * self.최소단위
+
+    def 기록(self, 값: float):
+        """
+        값(초) 하나 기록 - O(1)
+
+        Args:
+            값: 지연 시간(초), 음수는 0으로 기록
+        """
+        정수값 = int(max(0.0, 값) / self.최소단위)
+        if 정수값 > self._최대정수:
+            정수값 = self._최대정수
+            self.상한초과수 += 1
+        self._계수[self._인덱스(정수값)] += 1
+        self.개수 += 1
+        self._합계 += 값
+        if 값 < self.최소:
+            self.최소 = 값
+        if 값 > self.최대:
+            self.최대 = 값
+
+    def 백분위(self, *비율들: float) -> Tuple[float, ...]:
+        """
+        백분위 값들 (계수 배열을 한 번만 훑음)
+
+        Args:
+            비율들: 백분위(0~100), 오름차순
+
+        Returns:
+            tuple: 비율별 값(초), 기록이 없으면 0
+        """
+        if not self.개수:
+            return tuple(0.0 for _ in 비율들)
+        목표들 = [max(1, math.ceil(비율 / 100 * self.개수)) for 비율 in 비율들]
+        결과 = []
+        누적 = 0
+        for 인덱스, 계수 in enumerate(self._계수):
+            if not 계수:
+                continue
+            누적 += 계수
+            while 목표들 and 누적 >= 목표들[0]:
+                결과.append(min(self._대표값(인덱스), self.최대, self.최대값))
+                목표들.pop(0)
+            if not 목표들:
+                break
+        return tuple(결과)
+
+    def 병합(self, 다른: '지연히스토그램'):
+        """같은 설정의 다른 히스토그램 기록을 더함 (작업 프로세스/구간 합산용)"""
+        if len(다른._계수) != len(self._계수) or 다른.최소단위 != self.최소단위:
+            raise ValueError("설정이 다른 히스토그램은 병합할 수 없음")
+        for 인덱스, 계수 in enumerate(다른._계수):
+            if 계수:
+                self._계수[인덱스] += 계수
+        self.개수 += 다른.개수
+        self._합계 += 다른._합계
+        self.최소 = min(self.최소, 다른.최소)
+        self.최대 = max(self.최대, 다른.최대)
+        self.상한초과수 += 다른.상한초과수
+
+    def 요약(self) -> Dict[str, Any]:
+        """
+        개수, 평균, 최소/최대, p50/p90/p99/p999 (초, 밀리초 단위까지 반올림)
+
+        Returns:
+            dict: 요약 통계
+        """
+        이름들 = [이름 for 이름, _ in self.백분위목록]
+        값들 = self.백분위(*(비율 for _, 비율 in self.백분위목록))
+        return {
+            '개수': self.개수,
+            '평균': round(self._합계 / self.개수, 4) if self.개수 else 0.0,
+            '최소': round(self.최소, 4) if self.개수 else 0.0,
+            '최대': round(self.최대, 4),
+            **{이름: round(값, 4) for 이름, 값 in zip(이름들, 값들)}
+        }
+
+
+class 지연통계:
+    """
+    처리 서비스 하나의 지표(처리시간/큐대기시간/종단시간)별, 분류(결과/세부유형)별 지연 히스토그램 모음
+
+    분류 수는 처리 서비스의 결과와 세부유형 수로 정해지므로 메모리는 처리 서비스당 고정
+    여러 작업 스레드에서 기록하므로 잠금 사용
+
+    속성:
+        지표목록 (tuple): 기록하는 지표 이름
+    """
+
+    지표목록 = ('처리시간', '큐대기시간', '종단시간')
+
+    def __init__(self, 최대값: float = 3600.0, 최소단위: float = 0.0001, 유효자릿수: int = 2,
+                 최대분류수: int = 32):
+        """
+        지연 통계 초기화
+
+        Args:
+            최대값 / 최소단위 / 유효자릿수: 히스토그램 설정
+            최대분류수: 분류 수 상한 (넘는 분류는 '기타'로 합침)
+        """
+        self._설정 = (최대값, 최소단위, 유효자릿수)
+        self.최대분류수 = 최대분류수
+        self._히스토그램: Dict[str, Dict[str, 지연히스토그램]] = {}
+        self._잠금 = threading.Lock()
+
+    def 기록(self, 분류: str, 처리시간: Optional[float] = None, 큐대기시간: Optional[float] = None,
+           종단시간: Optional[float] = None):
+        """
+        한 메시지의 지표 기록 (None인 지표는 건너뜀)
+
+        Args:
+            분류: 결과/세부유형 (예: '성공/신규가입', '재시도', '데드레터')
+            처리시간: 처리 서비스 처리 시간(초)
+            큐대기시간: 메시지 생성부터 처리 시작까지(초)
+            종단시간: 메시지 생성부터 처리 완료까지(초)
+        """
+        with self._잠금:
+            지표별 = self._히스토그램.get(분류)
+            if 지표별 is None:
+                if len(self._히스토그램) >= self.최대분류수:
+                    분류 = '기타'
+                    지표별 = self._히스토그램.get(분류)
+                if 지표별 is None:
+                    지표별 = self._히스토그램[분류] = {
+                        지표: 지연히스토그램(*self._설정) for 지표 in self.지표목록
+                    }
+            for 지표, 값 in zip(self.지표목록, (처리시간, 큐대기시간, 종단시간)):
+                if 값 is not None:
+                    지표별[지표].기록(값)
+
+    def 조회(self) -> Dict[str, Any]:
+        """
+        분류별 지표 요약과 전체 합산 요약
+
+        Returns:
+            dict: {'전체': {지표: 요약}, '분류별': {분류: {지표: 요약}}}
+        """
+        with self._잠금:
+            전체 = {지표: 지연히스토그램(*self._설정) for 지표 in self.지표목록}
+            분류별 = {}
+            for 분류, 지표별 in self._히스토그램.items():
+                분류별[분류] = {}
+                for 지표, 히스토그램 in 지표별.items():
+                    전체[지표].병합(히스토그램)
+                    if 히스토그램.개수:
+                        분류별[분류][지표] = 히스토그램.요약()
+        return {
+            '전체': {지표: 히스토그램.요약() for 지표, 히스토그램 in 전체.items()},
+            '분류별': 분류별
+        }
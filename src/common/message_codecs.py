@@ -0,0 +1,205 @@
+# 파일 경로: src/common/message_codecs.py
+# BSS 메시지 직렬화 코덱 클래스
+
+import json
+import struct
+import uuid
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+from src.common.message_models import BSS메시지, MessageType
+
+
+class 메시지코덱(ABC):
+    """
+    BSS 메시지 직렬화 코덱의 추상 기본 클래스
+    AMQP content_type 값으로 코덱을 식별
+
+    속성:
+        content_type (str): 이 코덱이 생성하는 AMQP content_type
+    """
+
+    content_type: str = ''
+
+    @abstractmethod
+    def 인코딩(self, 메시지: BSS메시지) -> bytes:
+        """
+        메시지를 바이트열로 직렬화
+
+        Args:
+            메시지: 직렬화할 BSS 메시지
+
+        Returns:
+            bytes: 메시지 본문
+        """
+        pass
+
+    @abstractmethod
+    def 디코딩(self, 본문: bytes) -> BSS메시지:
+        """
+        바이트열에서 메시지 복원
+
+        Args:
+            본문: 메시지 본문
+
+        Returns:
+            BSS메시지: 복원된 메시지
+
+        Raises:
+            ValueError: 본문 형식이 잘못된 경우
+        """
+        pass
+
+
+class JSON코덱(메시지코덱):
+    """
+    공백 없는 compact JSON 코덱 (기본값이자 fallback)
+    기존 to_json() 형식(indent=2)으로 발행된 본문도 그대로 디코딩 가능
+    """
+
+    content_type = 'application/json'
+
+    def 인코딩(self, 메시지: BSS메시지) -> bytes:
+        """메시지를 compact JSON 바이트열로 직렬화"""
+        return json.dumps(
+            메시지.to_dict(), ensure_ascii=False, separators=(',', ':')
+        ).encode('utf-8')
+
+    def 디코딩(self, 본문: bytes) -> BSS메시지:
+        """JSON 바이트열에서 메시지 복원"""
+        return BSS메시지.from_json(본문.decode('utf-8'))
+
+
+class 바이너리코덱(메시지코덱):
+    """
+    고정 헤더 struct + 가변 길이 payload 형식의 compact 바이너리 코덱
+
+    레이아웃 (network byte order):
+        헤더: 버전(B) 타입코드(B) 플래그(B) 생성시간 마이크로초(q)
+        아이디: 표준 표기 UUID면 16바이트, 아니면 길이(H) + UTF-8
+        본문: 내용 길이(I) 속성 길이(I) + 내용 UTF-8 + 속성 compact JSON UTF-8
+    """
+
+    content_type = 'application/x-bss-binary'
+
+    버전 = 1
+    _헤더 = struct.Struct('!BBBq')
+    _아이디길이 = struct.Struct('!H')
+    _본문길이 = struct.Struct('!II')
+    _UUID플래그 = 0x01
+
+    _타입목록 = [t.value for t in MessageType]
+    _타입코드 = {타입: 코드 for 코드, 타입 in enumerate(_타입목록)}
+
+    @staticmethod
+    def _표준UUID(아이디: str) -> bool:
+        """소문자 하이픈 표기 UUID인지 확인 (대문자/중괄호/urn 표기는 16바이트로 바꾸면 원문이 복원되지 않음)"""
+        try:
+            return str(uuid.UUID(아이디)) == 아이디
+        except ValueError:
+            return False
+
+    def 인코딩(self, 메시지: BSS메시지) -> bytes:
+        """메시지를 바이너리 바이트열로 직렬화"""
+        타입코드 = self._타입코드.get(메시지.타입)
+        if 타입코드 is None:
+            raise ValueError(f"바이너리 코덱이 지원하지 않는 메시지 타입: {메시지.타입}")
+
+        플래그 = 0
+        if self._표준UUID(메시지.아이디):
+            아이디부 = uuid.UUID(메시지.아이디).bytes
+            플래그 |= self._UUID플래그
+        else:
+            아이디바이트 = 메시지.아이디.encode('utf-8')
+            아이디부 = self._아이디길이.pack(len(아이디바이트)) + 아이디바이트
+
+        내용부 = 메시지.내용.encode('utf-8')
+        속성부 = json.dumps(
+            메시지.속성들, ensure_ascii=False, separators=(',', ':')
+        ).encode('utf-8') if 메시지.속성들 else b''
+
+        생성시간 = 메시지.생성시간ns // 1000
+
+        return b''.join((
+            self._헤더.pack(self.버전, 타입코드, 플래그, 생성시간),
+            아이디부,
+            self._본문길이.pack(len(내용부), len(속성부)),
+            내용부,
+            속성부
+        ))
+
+    def 디코딩(self, 본문: bytes) -> BSS메시지:
+        """바이너리 바이트열에서 메시지 복원"""
+        try:
+            버전, 타입코드, 플래그, 생성시간 = self._헤더.unpack_from(본문, 0)
+            if 버전 != self.버전:
+                raise ValueError(f"지원하지 않는 바이너리 버전: {버전}")
+
+            위치 = self._헤더.size
+            if 플래그 & self._UUID플래그:
+                헥스 = bytes(본문[위치:위치 + 16]).hex()
+                아이디 = f"{헥스[:8]}-{헥스[8:12]}-{헥스[12:16]}-{헥스[16:20]}-{헥스[20:]}"
+                위치 += 16
+            else:
+                (아이디길이,) = self._아이디길이.unpack_from(본문, 위치)
+                위치 += self._아이디길이.size
+                아이디 = bytes(본문[위치:위치 + 아이디길이]).decode('utf-8')
+                위치 += 아이디길이
+
+            내용길이, 속성길이 = self._본문길이.unpack_from(본문, 위치)
+            위치 += self._본문길이.size
+            내용 = bytes(본문[위치:위치 + 내용길이]).decode('utf-8')
+            위치 += 내용길이
+            속성들 = json.loads(bytes(본문[위치:위치 + 속성길이])) if 속성길이 else {}
+
+            메시지 = BSS메시지(
+                타입=self._타입목록[타입코드],
+                내용=내용,
+                아이디=아이디,
+                속성들=속성들
+            )
+            메시지.생성시간ns = 생성시간 * 1000
+            return 메시지
+
+        except (struct.error, IndexError, UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ValueError(f"바이너리 메시지 파싱 실패: {e}")
+
+
+# content_type → 코덱 레지스트리
+_코덱레지스트리: Dict[str, 메시지코덱] = {}
+_코덱별칭: Dict[str, str] = {}
+
+
+def 코덱등록(코덱: 메시지코덱, 별칭: Optional[str] = None):
+    """
+    코덱을 레지스트리에 등록
+
+    Args:
+        코덱: 등록할 코덱 인스턴스
+        별칭: 설정(MESSAGE_CODEC)에서 사용할 짧은 이름
+    """
+    _코덱레지스트리[코덱.content_type] = 코덱
+    if 별칭:
+        _코덱별칭[별칭] = 코덱.content_type
+
+
+def 코덱가져오기(content_type: Optional[str]) -> 메시지코덱:
+    """
+    content_type에 해당하는 코덱 반환 (없거나 모르는 값이면 JSON 코덱)
+
+    Args:
+        content_type: AMQP content_type 또는 코덱 별칭
+
+    Returns:
+        메시지코덱: 코덱 인스턴스
+    """
+    if content_type:
+        content_type = _코덱별칭.get(content_type, content_type)
+        코덱 = _코덱레지스트리.get(content_type)
+        if 코덱:
+            return 코덱
+    return _코덱레지스트리[JSON코덱.content_type]
+
+
+코덱등록(JSON코덱(), 'json')
+코덱등록(바이너리코덱(), 'binary')
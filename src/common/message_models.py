@@ -2,9 +2,10 @@
 # BSS 메시지 모델 클래스 정의
 
 import json
+import time
 import uuid
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable
 from enum import Enum
 
 
@@ -19,15 +20,26 @@ class MessageType(Enum):
 class BSS메시지:
     """
     Queue-Based Load Leveling 패턴을 위한 기본 BSS 메시지 클래스
+    메시지당 할당을 줄이기 위해 __slots__를 사용하고, 아이디(uuid4)·속성 dict·
+    생성시간 datetime/문자열은 처음 필요할 때 만들어 캐시
     
     속성:
         아이디 (str): 고유 메시지 식별자
         타입 (str): 메시지 타입 (SUBSCRIPTION, MNP, CHANGE, TERMINATION)
         내용 (str): 메시지 본문 내용
         생성시간 (datetime): 메시지 생성 시간
+        생성시간ns (int): 메시지 생성 시간 (epoch 나노초)
+        생성시간문자열 (str): 생성시간의 ISO 8601 문자열
         속성들 (dict): 추가 메시지 속성
     """
     
+    __slots__ = (
+        '_아이디', '_타입', '_내용', '_생성ns', '_생성시간', '_생성시간문자열',
+        '_속성들', '_검증됨'
+    )
+    
+    _유효타입 = frozenset(t.value for t in MessageType)
+    
     def __init__(self, 타입: str, 내용: str, 아이디: Optional[str] = None, 속성들: Optional[Dict[str, Any]] = None):
         """
         BSS 메시지 초기화
@@ -35,36 +47,119 @@ class BSS메시지:
         Args:
             타입: 메시지 타입 (SUBSCRIPTION, MNP, CHANGE, TERMINATION)
             내용: 메시지 내용
-            아이디: 메시지 고유 식별자 (None이면 자동 생성)
+            아이디: 메시지 고유 식별자 (None이면 처음 조회할 때 자동 생성)
             속성들: 추가 메시지 속성
         """
-        self.아이디 = 아이디 or str(uuid.uuid4())
-        self.타입 = 타입.upper()
-        self.내용 = 내용
-        self.생성시간 = datetime.now()
-        self.속성들 = 속성들 or {}
+        self._아이디 = 아이디 or None
+        self._타입 = 타입.upper()
+        self._내용 = 내용
+        self._생성ns = time.time_ns()
+        self._생성시간: Optional[datetime] = None
+        self._생성시간문자열: Optional[str] = None
+        self._속성들 = 속성들 or None
+        self._검증됨 = False
+    
+    @property
+    def 아이디(self) -> str:
+        """메시지 고유 식별자 (최초 조회 시 uuid4 생성)"""
+        if self._아이디 is None:
+            self._아이디 = str(uuid.uuid4())
+        return self._아이디
+    
+    @아이디.setter
+    def 아이디(self, 값: str):
+        self._아이디 = 값
+        self._검증됨 = False
+    
+    @property
+    def 타입(self) -> str:
+        """메시지 타입"""
+        return self._타입
+    
+    @타입.setter
+    def 타입(self, 값: str):
+        self._타입 = 값
+        self._검증됨 = False
+    
+    @property
+    def 내용(self) -> str:
+        """메시지 본문 내용"""
+        return self._내용
+    
+    @내용.setter
+    def 내용(self, 값: str):
+        self._내용 = 값
+        self._검증됨 = False
+    
+    @property
+    def 속성들(self) -> Dict[str, Any]:
+        """추가 메시지 속성 (최초 조회 시 빈 dict 생성)"""
+        if self._속성들 is None:
+            self._속성들 = {}
+        return self._속성들
+    
+    @속성들.setter
+    def 속성들(self, 값: Dict[str, Any]):
+        self._속성들 = 값
+    
+    @property
+    def 생성시간ns(self) -> int:
+        """메시지 생성 시간 (epoch 나노초)"""
+        return self._생성ns
+    
+    @생성시간ns.setter
+    def 생성시간ns(self, 값: int):
+        self._생성ns = 값
+        self._생성시간 = None
+        self._생성시간문자열 = None
+    
+    @property
+    def 생성시간(self) -> datetime:
+        """메시지 생성 시간 (최초 조회 시 나노초 타임스탬프에서 변환하여 캐시)"""
+        if self._생성시간 is None:
+            초, 나노초 = divmod(self._생성ns, 1_000_000_000)
+            self._생성시간 = datetime.fromtimestamp(초).replace(microsecond=나노초 // 1000)
+        return self._생성시간
+    
+    @생성시간.setter
+    def 생성시간(self, 값: datetime):
+        self._생성ns = round(값.timestamp() * 1_000_000) * 1000
+        self._생성시간 = 값
+        self._생성시간문자열 = None
+    
+    @property
+    def 생성시간문자열(self) -> str:
+        """생성시간의 ISO 8601 문자열 (최초 조회 시 변환하여 캐시)"""
+        if self._생성시간문자열 is None:
+            self._생성시간문자열 = self.생성시간.isoformat()
+        return self._생성시간문자열
     
     def 메시지검증(self) -> bool:
         """
         메시지 유효성 검증
+        한 번 통과하면 결과를 기억하여 게이트웨이 → 라우터 → 생산자 구간에서 다시 검사하지 않음
+        (아이디/타입/내용이 변경되면 다시 검증)
         
         Returns:
             bool: 메시지가 유효하면 True, 그렇지 않으면 False
         """
+        if self._검증됨:
+            return True
+        
         try:
             # 필수 필드 존재 확인
             if not self.아이디 or not self.타입 or not self.내용:
                 return False
             
             # 타입 유효성 확인
-            valid_types = [t.value for t in MessageType]
-            if self.타입 not in valid_types:
+            if self.타입 not in self._유효타입:
                 return False
             
             # 내용 길이 확인 (최소 1자 이상)
             if len(self.내용.strip()) == 0:
                 return False
-                
+            
+            self._검증됨 = True
             return True
             
         except Exception:
@@ -93,7 +188,7 @@ class BSS메시지:
             '아이디': self.아이디,
             '타입': self.타입,
             '내용': self.내용,
-            '생성시간': self.생성시간.isoformat(),
+            '생성시간': self.생성시간문자열,
             '속성들': self.속성들
         }, ensure_ascii=False, indent=2)
     
@@ -128,8 +223,9 @@ class BSS메시지:
                 속성들=data.get('속성들', {})
             )
             
-            # 생성시간 복원
+            # 생성시간 복원 (원본 문자열은 그대로 캐시하여 재직렬화 시 재사용)
             message.생성시간 = datetime.fromisoformat(data['생성시간'])
+            message._생성시간문자열 = data['생성시간']
             
             return message
             
@@ -149,7 +245,7 @@ class BSS메시지:
             '아이디': self.아이디,
             '타입': self.타입,
             '내용': self.내용,
-            '생성시간': self.생성시간.isoformat(),
+            '생성시간': self.생성시간문자열,
             '속성들': self.속성들
         }
     
@@ -162,6 +258,82 @@ class BSS메시지:
         return f"BSS메시지(아이디='{self.아이디}', 타입='{self.타입}', 내용='{self.내용}', 생성시간='{self.생성시간}')"
 
 
+class 지연BSS메시지(BSS메시지):
+    """
+    본문 역직렬화를 필드 최초 접근 시점까지 미루는 BSS 메시지
+    Consumer가 AMQP 헤더만으로 수락/거부를 판단하고,
+    실제로 처리하는 메시지에 대해서만 본문을 파싱하도록 하기 위해 사용
+
+    속성:
+        헤더타입 (str): AMQP 헤더의 message_type (없으면 None)
+        파싱완료 (bool): 본문 역직렬화 여부
+    """
+
+    __slots__ = ('_본문', '_디코딩함수', '헤더타입', '파싱완료')
+
+    def __init__(self, 본문: bytes, 디코딩함수: Callable[[bytes], BSS메시지],
+                 헤더타입: Optional[str] = None):
+        """
+        지연 BSS 메시지 초기화 (본문은 파싱하지 않음)
+
+        Args:
+            본문: 메시지 본문 바이트열
+            디코딩함수: 본문을 BSS메시지로 복원하는 함수 (코덱의 디코딩)
+            헤더타입: AMQP 헤더의 message_type
+        """
+        # BSS메시지 슬롯은 일부러 채우지 않음 → 첫 접근 시 __getattr__에서 파싱
+        self._본문 = 본문
+        self._디코딩함수 = 디코딩함수
+        self.헤더타입 = 헤더타입.upper() if 헤더타입 else None
+        self.파싱완료 = False
+
+    def 본문파싱(self):
+        """본문을 역직렬화하여 아직 채워지지 않은 슬롯을 채움"""
+        if self.파싱완료:
+            return
+        원본 = self._디코딩함수(self._본문)
+        for 이름 in BSS메시지.__slots__:
+            try:
+                object.__getattribute__(self, 이름)
+            except AttributeError:
+                object.__setattr__(self, 이름, object.__getattribute__(원본, 이름))
+        self.파싱완료 = True
+        self._본문 = None
+
+    def __getattr__(self, 이름: str):
+        """채워지지 않은 BSS메시지 슬롯 접근 시 본문을 파싱한 뒤 반환"""
+        if self.파싱완료 or 이름 not in BSS메시지.__slots__:
+            raise AttributeError(이름)
+        self.본문파싱()
+        return getattr(self, 이름)
+
+    def 타입확인(self, 타입: str) -> bool:
+        """
+        메시지 타입 확인 (헤더에 타입이 있으면 본문을 파싱하지 않음)
+
+        Args:
+            타입: 확인할 메시지 타입
+
+        Returns:
+            bool: 타입이 일치하면 True, 그렇지 않으면 False
+        """
+        if self.헤더타입 and not self.파싱완료:
+            return self.헤더타입 == 타입.upper()
+        return super().타입확인(타입)
+
+    def __str__(self) -> str:
+        """문자열 표현 (파싱 전에는 헤더 정보만 표시)"""
+        if not self.파싱완료:
+            return f"지연BSS메시지(타입={self.헤더타입}, 파싱전)"
+        return super().__str__()
+
+    def __repr__(self) -> str:
+        """개발자용 문자열 표현"""
+        if not self.파싱완료:
+            return f"지연BSS메시지(헤더타입='{self.헤더타입}', 파싱완료=False)"
+        return super().__repr__()
+
+
 # 편의를 위한 팩토리 함수들
 def 가입메시지생성(내용: str, 고객정보: Optional[Dict] = None) -> BSS메시지:
     """가입 메시지 생성 헬퍼 함수"""
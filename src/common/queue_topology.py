@@ -0,0 +1,342 @@
+# 파일 경로: src/common/queue_topology.py
+# 큐/Exchange 토폴로지 관리 클래스
+
+from typing import Dict, Any, Optional, Tuple
+
+from src.common.message_models import MessageType
+from src.common.config import 설정가져오기
+
+
+class 큐토폴로지:
+    """
+    라우팅 모드에 따른 RabbitMQ 큐/Exchange 구성을 한 곳에서 관리하는 클래스
+    생산자와 소비자가 같은 규칙으로 발행 대상과 소비 큐를 결정
+
+    라우팅 모드:
+        single: 기본 Exchange로 단일 큐에 발행, Consumer가 타입별 필터링 (기존 방식)
+        direct: message_type을 routing key로 direct Exchange에 발행, 타입별 큐로 전달
+        headers: message_type 헤더로 headers Exchange에 발행, 타입별 큐로 전달
+
+    재시도/데드레터 큐 (작업 큐마다):
+        {작업큐}.retry.{단계}: 단계별 TTL(재시도지연 × 2^(단계-1)) 동안 대기 후
+            기본 Exchange를 통해 작업 큐로 dead-letter되어 다시 전달
+        {작업큐}.dlq: 최대 재시도를 넘었거나 처리할 수 없는 메시지 보관 (parking 큐)
+            작업 큐는 {큐이름}.dlx Exchange를 dead-letter Exchange로 선언하므로
+            requeue=False로 reject된 메시지도 사라지지 않고 이 큐로 이동
+
+    우선순위 (QUEUE_MAX_PRIORITY > 0):
+        작업 큐를 x-max-priority로 선언하고 생산자가 타입별 우선순위를 priority 속성으로 설정
+        (메시지 속성들의 '우선순위'가 있으면 그 값 사용) - 단일 큐에서 SUBSCRIPTION 폭주 중에도
+        TERMINATION/MNP가 먼저 전달됨. 이미 Consumer prefetch로 넘어간 메시지에는 적용되지 않음
+
+    속성:
+        라우팅모드 (str): single / direct / headers
+        교환기이름 (str): 타입별 라우팅에 사용할 Exchange 이름
+        큐이름 (str): 기본 큐 이름 (타입별 큐 이름의 접두어)
+    """
+
+    지원모드 = ('single', 'direct', 'headers')
+    재시도헤더 = 'x-retry-count'
+    실패사유헤더 = 'x-failure-reason'
+    원래큐헤더 = 'x-original-queue'
+    실패시각헤더 = 'x-failed-at'
+
+    def __init__(self):
+        """큐 토폴로지 초기화"""
+        self.설정 = 설정가져오기()
+
+        라우팅설정 = self.설정.라우팅설정가져오기()
+        self.라우팅모드 = 라우팅설정['라우팅모드']
+        self.교환기이름 = 라우팅설정['교환기이름']
+
+        if self.라우팅모드 not in self.지원모드:
+            raise ValueError(f"지원하지 않는 라우팅 모드: {self.라우팅모드}")
+
+        self.큐설정 = self.설정.큐설정가져오기()
+        self.큐이름 = self.큐설정['큐이름']
+        self.데드레터교환기이름 = f"{self.큐이름}.dlx"
+        self.최대우선순위 = max(0, min(255, self.큐설정['최대우선순위']))
+        self.타입별우선순위 = self.큐설정['타입별우선순위']
+
+        처리설정 = self.설정.처리설정가져오기()
+        self.재시도단계수 = max(0, 처리설정['최대재시도'])
+        self.재시도기본지연ms = 처리설정['재시도지연']
+
+    def 타입별라우팅(self) -> bool:
+        """타입별 큐로 라우팅하는 모드인지 확인"""
+        return self.라우팅모드 != 'single'
+
+    def 타입필터필요(self) -> bool:
+        """Consumer가 수신 메시지의 타입을 직접 걸러야 하는지 확인"""
+        return not self.타입별라우팅()
+
+    def 소비큐이름(self, 타입: str) -> str:
+        """
+        메시지 타입이 최종적으로 쌓이는 큐 이름 반환
+
+        Args:
+            타입: 메시지 타입
+
+        Returns:
+            str: 큐 이름
+        """
+        if not self.타입별라우팅():
+            return self.큐이름
+        return f"{self.큐이름}.{타입.lower()}"
+
+    def 발행대상(self, 타입: str) -> Tuple[str, str]:
+        """
+        메시지 타입에 따른 발행 Exchange와 routing key 반환
+
+        Args:
+            타입: 메시지 타입
+
+        Returns:
+            tuple: (exchange, routing_key)
+        """
+        if self.라우팅모드 == 'direct':
+            return self.교환기이름, 타입
+        if self.라우팅모드 == 'headers':
+            return self.교환기이름, ''
+        return '', self.큐이름
+
+    def 우선순위(self, 메시지) -> Optional[int]:
+        """
+        메시지의 AMQP priority 결정 (우선순위를 쓰지 않으면 None)
+
+        Args:
+            메시지: BSS 메시지 (속성들의 '우선순위'가 타입별 기본값보다 우선)
+
+        Returns:
+            int: 0 ~ 최대우선순위로 제한한 priority
+        """
+        if not self.최대우선순위:
+            return None
+        값 = 메시지.속성들.get('우선순위', self.타입별우선순위.get(메시지.타입, 0))
+        try:
+            return max(0, min(self.최대우선순위, int(값)))
+        except (TypeError, ValueError):
+            return self.타입별우선순위.get(메시지.타입, 0)
+
+    def 재시도지연ms(self, 단계: int) -> int:
+        """재시도 단계의 대기 시간(ms) - 단계마다 두 배"""
+        return self.재시도기본지연ms * (2 ** (단계 - 1))
+
+    def 재시도횟수(self, 헤더: Optional[Dict[str, Any]]) -> int:
+        """메시지 헤더에 기록된 재시도 횟수 (헤더가 없는 최초 메시지는 0)"""
+        return int((헤더 or {}).get(self.재시도헤더, 0))
+
+    def 재시도큐이름(self, 타입: str, 재시도횟수: int) -> str:
+        """
+        n번째 재시도 메시지를 보낼 지연 큐 이름 반환 (단계 수를 넘으면 마지막 단계)
+
+        Args:
+            타입: 메시지 타입
+            재시도횟수: 이번이 몇 번째 재시도인지 (1부터)
+
+        Returns:
+            str: 재시도 지연 큐 이름
+        """
+        단계 = min(max(1, 재시도횟수), max(1, self.재시도단계수))
+        return f"{self.소비큐이름(타입)}.retry.{단계}"
+
+    def 데드레터큐이름(self, 타입: str) -> str:
+        """최종 실패 메시지를 보관할 데드레터 큐 이름 반환"""
+        return f"{self.소비큐이름(타입)}.dlq"
+
+    def 데드레터큐목록(self) -> list:
+        """전체 데드레터 큐 이름 목록 (단일 큐 모드는 하나)"""
+        return list(dict.fromkeys(self.데드레터큐이름(t.value) for t in MessageType))
+
+    def 원래큐이름(self, 헤더: Optional[Dict[str, Any]], 데드레터큐: str) -> str:
+        """
+        데드레터 큐 메시지가 원래 있던 작업 큐 이름 반환
+        (소비자가 옮긴 메시지는 x-original-queue, 브로커가 옮긴 메시지는 x-death 헤더 사용)
+        """
+        헤더 = 헤더 or {}
+        if 헤더.get(self.원래큐헤더):
+            return 헤더[self.원래큐헤더]
+        if 헤더.get('x-death'):
+            return 헤더['x-death'][0].get('queue')
+        return 데드레터큐[:-len('.dlq')]
+
+    def 실패사유(self, 헤더: Optional[Dict[str, Any]]) -> str:
+        """데드레터 큐 메시지의 실패 사유 (브로커가 옮긴 메시지는 x-death의 reason)"""
+        헤더 = 헤더 or {}
+        if 헤더.get(self.실패사유헤더):
+            return 헤더[self.실패사유헤더]
+        if 헤더.get('x-death'):
+            return str(헤더['x-death'][0].get('reason', 'unknown'))
+        return 'unknown'
+
+    def _보조큐목록(self, 처리타입: Optional[str]) -> list:
+        """작업 큐별 재시도 지연 큐와 데드레터 큐의 (이름, 인자, DLX 바인딩 키) 목록"""
+        작업큐목록 = dict.fromkeys(self.소비큐이름(타입) for 타입 in self._대상타입들(처리타입))
+
+        보조큐목록 = []
+        for 작업큐 in 작업큐목록:
+            for 단계 in range(1, self.재시도단계수 + 1):
+                보조큐목록.append((f"{작업큐}.retry.{단계}", {
+                    'x-message-ttl': self.재시도지연ms(단계),
+                    'x-dead-letter-exchange': '',
+                    'x-dead-letter-routing-key': 작업큐
+                }, None))
+            보조큐목록.append((f"{작업큐}.dlq", None, 작업큐))
+        return 보조큐목록
+
+    def 큐인자(self, 작업큐: Optional[str] = None) -> Dict[str, Any]:
+        """
+        작업 큐 선언 시 사용할 x-arguments 반환
+        (reject된 메시지를 DLX를 거쳐 해당 작업 큐의 데드레터 큐로 보냄,
+        우선순위 사용 시 x-max-priority 추가)
+
+        Args:
+            작업큐: 작업 큐 이름 (None이면 기본 큐)
+
+        Returns:
+            dict: 큐 선언 인자
+        """
+        인자 = {
+            'x-dead-letter-exchange': self.데드레터교환기이름,
+            'x-dead-letter-routing-key': 작업큐 or self.큐이름
+        }
+        if self.최대우선순위:
+            인자['x-max-priority'] = self.최대우선순위
+        return 인자
+
+    def _바인딩인자(self, 타입: str) -> Optional[Dict[str, Any]]:
+        """headers Exchange 바인딩 인자 반환"""
+        if self.라우팅모드 == 'headers':
+            return {'x-match': 'all', 'message_type': 타입}
+        return None
+
+    def _대상타입들(self, 처리타입: Optional[str]) -> list:
+        """선언할 타입 목록 (처리타입이 없으면 전체 타입)"""
+        if 처리타입:
+            return [처리타입.upper()]
+        return [t.value for t in MessageType]
+
+    def 선언(self, 채널, 처리타입: Optional[str] = None):
+        """
+        pika 채널에 토폴로지 선언
+
+        생산자는 처리타입 없이 호출하여 모든 타입 큐를 미리 만들어 두고
+        (Consumer가 뜨기 전에 발행된 메시지 유실 방지), 소비자는 자신의 타입만 선언
+
+        Args:
+            채널: pika BlockingChannel
+            처리타입: 소비자 처리 타입 (생산자는 None)
+        """
+        채널.exchange_declare(
+            exchange=self.데드레터교환기이름,
+            exchange_type='direct',
+            durable=True
+        )
+        for 큐이름, 인자, 바인딩키 in self._보조큐목록(처리타입):
+            채널.queue_declare(queue=큐이름, durable=self.큐설정['내구성'], arguments=인자)
+            if 바인딩키:
+                채널.queue_bind(
+                    queue=큐이름, exchange=self.데드레터교환기이름, routing_key=바인딩키
+                )
+
+        if not self.타입별라우팅():
+            채널.queue_declare(
+                queue=self.큐이름,
+                durable=self.큐설정['내구성'],
+                auto_delete=self.큐설정['자동삭제'],
+                exclusive=self.큐설정['배타적'],
+                arguments=self.큐인자(self.큐이름)
+            )
+            return
+
+        채널.exchange_declare(
+            exchange=self.교환기이름,
+            exchange_type=self.라우팅모드,
+            durable=True
+        )
+
+        for 타입 in self._대상타입들(처리타입):
+            큐이름 = self.소비큐이름(타입)
+            채널.queue_declare(
+                queue=큐이름,
+                durable=self.큐설정['내구성'],
+                auto_delete=self.큐설정['자동삭제'],
+                exclusive=self.큐설정['배타적'],
+                arguments=self.큐인자(큐이름)
+            )
+            채널.queue_bind(
+                queue=큐이름,
+                exchange=self.교환기이름,
+                routing_key=타입 if self.라우팅모드 == 'direct' else '',
+                arguments=self._바인딩인자(타입)
+            )
+
+    async def 비동기선언(self, 채널, 처리타입: Optional[str] = None):
+        """
+        aio-pika 채널에 토폴로지 선언 (선언 규칙은 선언()과 동일)
+
+        Args:
+            채널: aio-pika 채널
+            처리타입: 소비자 처리 타입 (생산자는 None)
+        """
+        데드레터교환기 = await 채널.declare_exchange(
+            self.데드레터교환기이름,
+            type='direct',
+            durable=True
+        )
+        for 큐이름, 인자, 바인딩키 in self._보조큐목록(처리타입):
+            큐 = await 채널.declare_queue(큐이름, durable=self.큐설정['내구성'], arguments=인자)
+            if 바인딩키:
+                await 큐.bind(데드레터교환기, routing_key=바인딩키)
+
+        if not self.타입별라우팅():
+            await 채널.declare_queue(
+                self.큐이름,
+                durable=self.큐설정['내구성'],
+                auto_delete=self.큐설정['자동삭제'],
+                exclusive=self.큐설정['배타적'],
+                arguments=self.큐인자(self.큐이름)
+            )
+            return
+
+        교환기 = await 채널.declare_exchange(
+            self.교환기이름,
+            type=self.라우팅모드,
+            durable=True
+        )
+
+        for 타입 in self._대상타입들(처리타입):
+            큐 = await 채널.declare_queue(
+                self.소비큐이름(타입),
+                durable=self.큐설정['내구성'],
+                auto_delete=self.큐설정['자동삭제'],
+                exclusive=self.큐설정['배타적'],
+                arguments=self.큐인자(self.소비큐이름(타입))
+            )
+            await 큐.bind(
+                교환기,
+                routing_key=타입 if self.라우팅모드 == 'direct' else '',
+                arguments=self._바인딩인자(타입)
+            )
+
+    def 소비큐목록(self) -> list:
+        """상태 조회 대상 큐 이름 목록 반환"""
+        if not self.타입별라우팅():
+            return [self.큐이름]
+        return [self.소비큐이름(t.value) for t in MessageType]
+
+    def 토폴로지정보(self) -> Dict[str, Any]:
+        """
+        토폴로지 정보 반환
+
+        Returns:
+            dict: 라우팅 모드, Exchange, 큐 목록
+        """
+        return {
+            '라우팅모드': self.라우팅모드,
+            '교환기이름': self.교환기이름 if self.타입별라우팅() else '',
+            '큐목록': self.소비큐목록(),
+            '데드레터큐목록': self.데드레터큐목록(),
+            '최대우선순위': self.최대우선순위,
+            '타입별우선순위': self.타입별우선순위 if self.최대우선순위 else {}
+        }
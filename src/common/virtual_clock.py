@@ -0,0 +1,59 @@
+# 파일 경로: src/common/virtual_clock.py
+# 처리 시뮬레이션용 시계 클래스 (실제 시계 / 가상 시계)
+
+import time
+
+
+class 실제시계:
+    """
+    time.time()과 time.sleep()을 그대로 사용하는 시계 (기본값, 실제 Consumer 실행용)
+    """
+
+    가상 = False
+
+    def 시각(self) -> float:
+        """현재 시각 (epoch 초)"""
+        return time.time()
+
+    def 대기(self, 초: float):
+        """지정한 시간만큼 실제로 대기"""
+        time.sleep(초)
+
+
+class 가상시계:
+    """
+    sleep하지 않고 시각만 진행하는 시계 (오프라인 이산 사건 시뮬레이션용)
+
+    처리시뮬레이션의 대기는 현재 시각을 처리 시간만큼 앞으로 옮기기만 하므로,
+    시뮬레이터는 처리 시작 시각으로 이동(이동) → 메시지처리 호출 → 시각()으로 완료 시각을 얻음
+    하나의 스레드에서만 사용 (여러 작업 스레드가 공유하면 시각이 섞임)
+
+    속성:
+        누적대기 (float): 지금까지 대기한 가상 시간 합계(초)
+    """
+
+    가상 = True
+
+    def __init__(self, 시작시각: float = 0.0):
+        """
+        가상 시계 초기화
+
+        Args:
+            시작시각: 시작 시각(초)
+        """
+        self._지금 = 시작시각
+        self.누적대기 = 0.0
+
+    def 시각(self) -> float:
+        """현재 가상 시각(초)"""
+        return self._지금
+
+    def 대기(self, 초: float):
+        """sleep 없이 가상 시각을 초만큼 진행"""
+        if 초 > 0:
+            self._지금 += 초
+            self.누적대기 += 초
+
+    def 이동(self, 시각: float):
+        """다음 사건 시각으로 이동 (시뮬레이터 전용)"""
+        self._지금 = 시각
@@ -4,15 +4,19 @@
 """
 
 from .base_processor import 기본처리서비스
+from .async_engine import 비동기소비엔진
 from .subscription_processor import 가입처리서비스
 from .mnp_processor import 번호이동처리서비스
 from .change_processor import 명의변경처리서비스
 from .termination_processor import 해지처리서비스
+from .prefork_supervisor import 프리포크감독자
 
 __all__ = [
     '기본처리서비스',
+    '비동기소비엔진',
     '가입처리서비스',
     '번호이동처리서비스',
     '명의변경처리서비스',
-    '해지처리서비스'
+    '해지처리서비스',
+    '프리포크감독자'
 ]
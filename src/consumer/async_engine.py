@@ -0,0 +1,345 @@
+# 파일 경로: src/consumer/async_engine.py
+# asyncio 기반 소비 엔진 클래스 (aio-pika 기반)
+
+import asyncio
+import inspect
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Set
+
+import aio_pika
+
+from src.common.message_models import BSS메시지, 지연BSS메시지
+from src.common.message_codecs import 코덱가져오기
+
+
+class 비동기소비엔진:
+    """
+    기본처리서비스의 메시지 처리 루프를 asyncio + aio-pika로 대체하는 소비 엔진
+    세마포어로 프로세스당 동시 처리 메시지 수를 제한하여 I/O 대기 중인 메시지를 수백 개까지 유지
+
+    메시지처리가 async def이면 이벤트 루프에서 바로 await하고,
+    기존처럼 동기 함수이면 전용 스레드 풀에서 실행 (기존 처리 서비스는 수정 없이 동작)
+
+    속성:
+        처리서비스: 메시지 처리 로직, 통계, 재시도 규칙을 제공하는 기본처리서비스 인스턴스
+        동시처리수 (int): 동시에 처리할 최대 메시지 수 (세마포어 크기)
+        연결: aio-pika 연결 (실행 중에만 존재)
+    """
+
+    def __init__(self, 처리서비스, 동시처리수: Optional[int] = None):
+        """
+        비동기 소비 엔진 초기화
+
+        Args:
+            처리서비스: 기본처리서비스 하위 클래스 인스턴스
+            동시처리수: 동시 처리 메시지 수 (None이면 설정에서 가져옴)
+        """
+        self.처리서비스 = 처리서비스
+        self.로거 = 처리서비스.로거
+
+        처리설정 = 처리서비스.설정.처리설정가져오기()
+        self.동시처리수 = max(1, 동시처리수 or 처리설정['비동기동시처리수'])
+        # 지연 쓰기면 ACK이 묶음 쓰기 뒤로 미뤄지므로 기본처리서비스와 같이 묶음 하나만큼 더 받음
+        쓰기여유 = 처리서비스.설정.쓰기지연설정가져오기()['최대건수'] if 처리서비스.쓰기지연버퍼 else 0
+        self.프리페치카운트 = max(처리설정['프리페치카운트'], self.동시처리수 + 쓰기여유)
+        self.프리페치제어기 = 처리서비스._프리페치제어기생성(self.프리페치카운트, self.동시처리수)
+
+        self.비동기처리 = inspect.iscoroutinefunction(처리서비스.메시지처리)
+        self.연결: Optional[aio_pika.abc.AbstractRobustConnection] = None
+        self._채널: Optional[aio_pika.abc.AbstractChannel] = None
+        self._세마포어: Optional[asyncio.Semaphore] = None
+        self._작업실행기: Optional[ThreadPoolExecutor] = None
+        self._처리태스크들: Set[asyncio.Task] = set()
+        self._대기콜백수 = 0
+
+    def 실행(self):
+        """처리 스레드에서 이벤트 루프를 만들고 처리 중단 신호가 올 때까지 소비"""
+        try:
+            asyncio.run(self._소비루프())
+        except Exception as e:
+            self.로거.error(f"비동기 메시지 처리 루프 실패: {e}")
+
+    async def _소비루프(self):
+        """연결/큐 선언 후 메시지 소비, 중단 신호 수신 시 처리 중인 메시지를 마무리하고 종료"""
+        처리서비스 = self.처리서비스
+        self._세마포어 = asyncio.Semaphore(self.동시처리수)
+        if not self.비동기처리:
+            self._작업실행기 = ThreadPoolExecutor(
+                max_workers=self.동시처리수,
+                thread_name_prefix=f'{처리서비스.처리타입.lower()}-async-worker'
+            )
+
+        try:
+            self.연결 = await aio_pika.connect_robust(처리서비스.설정.연결문자열가져오기())
+            채널 = self._채널 = await self.연결.channel()
+            await 채널.set_qos(
+                prefetch_count=(
+                    self.프리페치제어기.현재값 if self.프리페치제어기 else self.프리페치카운트
+                )
+            )
+
+            await 처리서비스.토폴로지.비동기선언(채널, 처리서비스.처리타입)
+            큐 = await 채널.get_queue(처리서비스.소비큐이름, ensure=False)
+            소비자태그 = await 큐.consume(self._메시지콜백, no_ack=False)
+
+            self.로거.info(
+                f"{처리서비스.처리타입} Consumer 대기 중... "
+                f"(asyncio 엔진, 동시처리수 {self.동시처리수})"
+            )
+
+            while not 처리서비스.처리중단플래그.is_set():
+                await asyncio.sleep(0.1)
+                await self._프리페치조정(채널)
+
+            await self._드레인(큐, 소비자태그)
+            await 채널.close()
+
+        finally:
+            처리서비스.소비상태 = '중지됨'
+            if self.연결 is not None:
+                await self.연결.close()
+                self.연결 = None
+            if self._작업실행기:
+                self._작업실행기.shutdown(wait=False)
+                self._작업실행기 = None
+
+    async def _프리페치조정(self, 채널: aio_pika.abc.AbstractChannel):
+        """조정 주기가 되면 prefetch를 다시 계산하여 set_qos 재설정"""
+        if not self.프리페치제어기:
+            return
+        새값 = self.프리페치제어기.조정()
+        if 새값 is not None:
+            await 채널.set_qos(prefetch_count=새값)
+            self.로거.info(f"prefetch 조정: {새값} ({self.프리페치제어기.상태조회()})")
+
+    async def _드레인(self, 큐: aio_pika.abc.AbstractQueue, 소비자태그: str):
+        """
+        기본처리서비스._드레인과 같은 순서로 드레인 (채널을 닫기 전에 처리 중 메시지를 ACK)
+        Consumer 취소 → 세마포어를 기다리던 메시지 반환 → 지연 쓰기 버퍼 비우기 → 처리 중 메시지 완료 대기
+
+        Args:
+            큐: 소비 중인 큐
+            소비자태그: consume 결과 태그
+        """
+        처리서비스 = self.처리서비스
+        처리서비스.소비상태 = '드레인중'
+        시작 = time.monotonic()
+        self.로거.info(f"{처리서비스.처리타입} 드레인 시작 (처리 중 {처리서비스.처리중개수}개)")
+        try:
+            await 큐.cancel(소비자태그)
+        except Exception as e:
+            self.로거.warning(f"Consumer 취소 실패: {e}")
+
+        if 처리서비스.쓰기지연버퍼 is not None:
+            await asyncio.get_running_loop().run_in_executor(
+                self._작업실행기, 처리서비스.쓰기지연버퍼.비우기, 처리서비스.드레인타임아웃
+            )
+        await self._작업완료대기(max(0.0, 처리서비스.드레인타임아웃 - (time.monotonic() - 시작)))
+        # 처리 태스크가 끝나며 세마포어를 얻은 대기 콜백이 반환(nack)을 마칠 때까지
+        마감 = time.monotonic() + 1
+        while self._대기콜백수 and time.monotonic() < 마감:
+            await asyncio.sleep(0.01)
+
+        처리서비스.드레인정보.update(
+            미완료개수=처리서비스.처리중개수, 소요시간=round(time.monotonic() - 시작, 3)
+        )
+        self.로거.info(f"{처리서비스.처리타입} 드레인 완료: {처리서비스.드레인정보}")
+
+    async def _작업완료대기(self, 타임아웃: float = 30):
+        """
+        처리 중인 메시지가 끝날 때까지 대기 (타임아웃까지 끝나지 않은 메시지는 취소)
+
+        Args:
+            타임아웃: 최대 대기 시간(초)
+        """
+        if not self._처리태스크들:
+            return
+        _, 미완료 = await asyncio.wait(set(self._처리태스크들), timeout=타임아웃)
+        if 미완료:
+            self.로거.warning(f"ACK되지 않은 처리 중 메시지 {len(미완료)}개 (채널 종료 후 브로커가 재전달)")
+            for 태스크 in 미완료:
+                태스크.cancel()
+
+    async def _메시지콜백(self, 수신메시지: aio_pika.abc.AbstractIncomingMessage):
+        """
+        aio-pika 메시지 콜백 (타입 필터링과 본문 파싱 후 처리 태스크 생성)
+
+        세마포어는 콜백 안에서 획득하므로 동시처리수만큼 처리 중이면
+        다음 메시지의 수신 처리가 그 자리에서 대기 (prefetch와 함께 역압 역할)
+
+        Args:
+            수신메시지: aio-pika 수신 메시지
+        """
+        처리서비스 = self.처리서비스
+        try:
+            # 기본처리서비스._메시지콜백과 같은 규칙: 헤더 우선 타입 필터링, 대상 메시지만 본문 파싱
+            헤더타입 = (수신메시지.headers or {}).get('message_type')
+            메시지 = 지연BSS메시지(
+                수신메시지.body,
+                코덱가져오기(수신메시지.content_type).디코딩,
+                헤더타입
+            )
+
+            if not 메시지.타입확인(처리서비스.처리타입):
+                await 수신메시지.reject(requeue=처리서비스.토폴로지.타입필터필요())
+                return
+
+            메시지.본문파싱()
+
+        except Exception as e:
+            self.로거.error(f"메시지 콜백 처리 실패: {e}")
+            # 파싱 실패 등 처리할 수 없는 메시지는 데드레터 큐로 격리
+            await self._실패메시지정산(수신메시지, 'dead', f"파싱 실패: {e}")
+            처리서비스._통계증가(처리서비스.처리통계, '실패처리개수')
+            return
+
+        if 처리서비스._중복확인(메시지):
+            await 수신메시지.ack()
+            return
+
+        수신시각 = time.monotonic()
+        self._대기콜백수 += 1
+        try:
+            await self._세마포어.acquire()
+        finally:
+            self._대기콜백수 -= 1
+
+        if 처리서비스.소비상태 == '드레인중':
+            # 드레인 시작 전에 처리 자리를 얻지 못한 메시지는 처리하지 않고 반환
+            self._세마포어.release()
+            await 수신메시지.nack(requeue=True)
+            처리서비스.드레인정보['반환개수'] += 1
+            return
+
+        처리서비스.처리중개수 += 1
+        태스크 = asyncio.get_running_loop().create_task(self._처리(수신메시지, 메시지, 수신시각))
+        self._처리태스크들.add(태스크)
+        태스크.add_done_callback(self._처리태스크들.discard)
+
+    async def _처리(self, 수신메시지: aio_pika.abc.AbstractIncomingMessage, 메시지: BSS메시지,
+                  수신시각: float):
+        """메시지 처리 후 결과에 따라 ACK 또는 재시도/데드레터 큐로 정산"""
+        처리서비스 = self.처리서비스
+        try:
+            처리결과, 처리시간, 오류 = await self._처리실행(메시지)
+            if self.프리페치제어기:
+                self.프리페치제어기.관측(
+                    처리시간['처리시간'], time.monotonic() - 수신시각, 처리서비스.처리중개수
+                )
+            재시도횟수 = 처리서비스.토폴로지.재시도횟수(수신메시지.headers)
+            레코드 = 처리서비스._지연쓰기레코드(처리결과)
+            판정 = 처리서비스._결과판정(
+                메시지, 처리결과, 처리시간, 오류, 재시도횟수, 지연쓰기=레코드 is not None
+            )
+            사유 = 처리서비스._실패사유(처리결과, 오류)
+
+            # 지연 쓰기면 레코드가 묶음으로 기록될 때까지 ACK을 미룸
+            if 판정 == 'ack' and 레코드 is not None:
+                성공, 쓰기오류 = await self._지연쓰기(레코드)
+                판정 = 처리서비스._쓰기결과판정(메시지, 성공, 쓰기오류, 재시도횟수)
+                사유 = f"백엔드 쓰기 실패: {쓰기오류}"
+
+            try:
+                if 판정 == 'ack':
+                    await 수신메시지.ack()
+                else:
+                    await self._실패메시지정산(수신메시지, 판정, 사유)
+            except Exception as e:
+                # 채널이 닫혔으면 브로커가 재전달
+                self.로거.warning(f"ACK/NACK 전송 실패 (재전달 예정): {메시지.아이디} - {e}")
+        finally:
+            처리서비스.처리중개수 -= 1
+            self._세마포어.release()
+
+    async def _지연쓰기(self, 레코드: Dict[str, Any]) -> tuple:
+        """
+        레코드를 처리 서비스의 지연 쓰기 버퍼에 넣고 묶음 쓰기가 끝날 때까지 대기
+
+        Returns:
+            tuple: (성공 여부, 쓰기 중 발생한 예외)
+        """
+        루프 = asyncio.get_running_loop()
+        완료 = 루프.create_future()
+
+        def 완료콜백(성공: bool, 오류: Optional[Exception]):
+            # 쓰기 스레드에서 호출되므로 이벤트 루프로 넘겨 결과 설정
+            루프.call_soon_threadsafe(완료.set_result, (성공, 오류))
+
+        self.처리서비스.쓰기지연버퍼.추가(레코드, 완료콜백)
+        return await 완료
+
+    async def _실패메시지정산(self, 수신메시지: aio_pika.abc.AbstractIncomingMessage,
+                         판정: str, 사유: str):
+        """
+        실패 메시지를 재시도 지연 큐 또는 데드레터 큐로 발행하고 원본 ACK
+        (기본처리서비스._실패메시지정산과 같은 규칙, 발행 실패 시 requeue)
+
+        Args:
+            수신메시지: aio-pika 수신 메시지
+            판정: 'retry' 또는 'dead'
+            사유: 실패 사유 (데드레터 큐 헤더에 기록)
+        """
+        큐이름, 새헤더 = self.처리서비스._재처리헤더(판정, 수신메시지.headers, 사유)
+
+        try:
+            await self._채널.default_exchange.publish(
+                aio_pika.Message(
+                    수신메시지.body,
+                    headers=새헤더,
+                    content_type=수신메시지.content_type,
+                    delivery_mode=수신메시지.delivery_mode,
+                    priority=수신메시지.priority,
+                    message_id=수신메시지.message_id
+                ),
+                routing_key=큐이름
+            )
+        except Exception as e:
+            self.로거.error(f"재시도/데드레터 큐 발행 실패 - 원본 requeue: {e}")
+            await 수신메시지.reject(requeue=True)
+            return
+        await 수신메시지.ack()
+
+    async def _처리실행(self, 메시지: BSS메시지) -> tuple:
+        """
+        메시지처리 실행 (async def면 await, 동기 함수면 작업 스레드 풀에서 실행)
+
+        Returns:
+            tuple: (처리결과, 처리시간 정보, 예외)
+        """
+        처리서비스 = self.처리서비스
+        if not self.비동기처리:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._작업실행기, 처리서비스._처리실행, 메시지
+            )
+
+        처리시작시간 = 처리서비스.시계.시각()
+        try:
+            처리결과 = await 처리서비스.메시지처리(메시지)
+            # 지연 쓰기가 아니면 기본처리서비스._처리실행과 같이 처리 결과 레코드를 바로 기록
+            # (백엔드 쓰기는 블로킹이므로 이벤트 루프를 막지 않도록 스레드 풀에서 실행)
+            if 처리서비스.쓰기지연버퍼 is None:
+                처리결과 = (await asyncio.get_running_loop().run_in_executor(
+                    self._작업실행기, 처리서비스._결과쓰기, [처리결과]
+                ))[0]
+            return 처리결과, 처리서비스.처리시간측정(처리시작시간), None
+        except Exception as e:
+            return None, 처리서비스.처리시간측정(처리시작시간), e
+
+    def 연결됨(self) -> bool:
+        """aio-pika 연결이 열려 있는지 확인"""
+        return self.연결 is not None and not self.연결.is_closed
+
+    def 상태조회(self) -> Dict[str, Any]:
+        """
+        엔진 상태 조회
+
+        Returns:
+            dict: 동시처리수, 처리 방식, 처리 중 태스크 수
+        """
+        return {
+            '엔진': 'asyncio',
+            '동시처리수': self.동시처리수,
+            '처리방식': 'coroutine' if self.비동기처리 else 'thread-adapter',
+            '처리중태스크': len(self._처리태스크들)
+        }
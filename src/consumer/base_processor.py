@@ -2,15 +2,29 @@
 # 기본 처리 서비스 클래스 (부모 클래스)
 
 import pika
+import copy
 import json
+import random
 import time
 import threading
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, List
 from datetime import datetime
 
-from src.common.message_models import BSS메시지
+from src.common.message_models import BSS메시지, 지연BSS메시지
 from src.common.config import 설정가져오기
+from src.common.queue_topology import 큐토폴로지
+from src.common.message_codecs import 코덱가져오기
+from src.common.virtual_clock import 실제시계
+from src.common.latency_histogram import 지연통계
+from src.consumer.async_engine import 비동기소비엔진
+from src.consumer.batch_ack import 일괄확인추적기
+from src.consumer.prefetch_controller import 적응형프리페치제어기
+from src.consumer.idempotency import 처리완료캐시
+from src.consumer.service_time import 처리시간분포, 균등분포, 분포생성
+from src.consumer.write_behind import 모의백엔드, 쓰기지연버퍼
 
 
 class 기본처리서비스(ABC):
@@ -26,6 +40,17 @@ class 기본처리서비스(ABC):
         처리중단플래그: 처리 중단 신호
     """
     
+    # 처리시뮬레이션 기본 처리 시간 범위(초)와 실패 비율 (하위 클래스에서 지정,
+    # SERVICE_TIME_{타입} / FAILURE_RATIOS 설정이 있으면 그 값을 사용)
+    기본처리시간범위 = (0.1, 2.0)
+    기본실패율 = 0.05
+    
+    # 처리 결과 결과데이터에서 세부유형(가입타입 등)을 담는 키 (지연 통계 분류용)
+    세부유형키: Optional[str] = None
+    
+    # 처리 결과 결과데이터에서 백엔드에 기록할 레코드(고객정보 등)를 담는 키
+    결과레코드키: Optional[str] = None
+    
     def __init__(self, 처리타입: str):
         """
         기본 처리 서비스 초기화
@@ -41,14 +66,114 @@ class 기본처리서비스(ABC):
         self.연결: Optional[pika.BlockingConnection] = None
         self.채널: Optional[pika.channel.Channel] = None
         
+        # 큐 토폴로지 (단일 큐 또는 타입별 큐)
+        self.토폴로지 = 큐토폴로지()
+        self.소비큐이름 = self.토폴로지.소비큐이름(self.처리타입)
+        
         # 처리 통계
         self.처리통계 = {
             '총처리개수': 0,
             '성공처리개수': 0,
             '실패처리개수': 0,
+            '재시도개수': 0,
+            '데드레터개수': 0,
+            '중복건너뜀개수': 0,
+            '쓰기실패개수': 0,
             '시작시간': datetime.now(),
             '마지막처리시간': None
         }
+        # 처리 통계와 하위 클래스의 유형별 통계는 연결/작업/쓰기 스레드에서 함께 갱신하므로 잠금으로 보호
+        self._통계잠금 = threading.Lock()
+        
+        # 결과/세부유형별 처리시간, 큐대기시간, 종단시간 히스토그램 (처리 서비스당 고정 메모리)
+        self.지연통계 = 지연통계()
+        
+        # 소비 엔진 (thread: pika + 작업 스레드 풀, asyncio: aio-pika + 세마포어)
+        처리설정 = self.설정.처리설정가져오기()
+        self.엔진 = 처리설정['엔진']
+        self._비동기엔진: Optional[비동기소비엔진] = None
+        
+        # 작업 스레드 풀 (동시처리수가 2 이상일 때 처리 시작 시 생성)
+        self.동시처리수 = max(1, 처리설정['동시처리수'])
+        self._작업실행기: Optional[ThreadPoolExecutor] = None
+        self.처리중개수 = 0
+        
+        # 일괄 처리 (일괄크기가 2 이상이면 최대 일괄크기개 또는 일괄대기초만큼 모아 메시지일괄처리 호출)
+        self.일괄크기 = max(1, 처리설정['일괄크기'])
+        if self.엔진 == 'asyncio' and self.일괄크기 > 1:
+            # asyncio 엔진은 메시지일괄처리를 호출하지 않으므로 메시지 단위로 처리
+            self.로거.warning("asyncio 엔진은 일괄 처리를 지원하지 않아 CONSUMER_BATCH_SIZE 무시 (메시지 단위 처리)")
+            self.일괄크기 = 1
+        self.일괄대기 = 처리설정['일괄대기ms'] / 1000
+        self._일괄버퍼: list = []
+        self._일괄타이머 = None
+        self._확인추적기 = 일괄확인추적기()
+        
+        # 처리 중 메시지의 원본 (본문, 속성, 수신시각) - 실패 시 재시도/데드레터 큐로 재발행할 때 사용
+        self._수신정보: Dict[int, tuple] = {}
+        
+        # 처리 결과 지연 쓰기 (일괄 처리가 아닐 때만 사용, 일괄 처리는 묶음 단위로 바로 씀)
+        쓰기설정 = self.설정.쓰기지연설정가져오기()
+        self.쓰기지연 = 쓰기설정['활성화'] and self.일괄크기 == 1
+        
+        # Prefetch (작업 스레드마다 일괄 하나씩 채울 수 있도록 최소 동시처리수 × 일괄크기,
+        # 지연 쓰기면 ACK이 묶음 쓰기 뒤로 미뤄지므로 묶음 하나를 채울 수 있도록 최대건수만큼 더함)
+        # 적응형이면 처리 시간/ACK 지연 관측으로 실행 중에 조정
+        self.프리페치카운트 = max(
+            처리설정['프리페치카운트'],
+            self.동시처리수 * self.일괄크기 + (쓰기설정['최대건수'] if self.쓰기지연 else 0)
+        )
+        self.프리페치제어기 = self._프리페치제어기생성(
+            self.프리페치카운트, self.동시처리수 * self.일괄크기
+        )
+        if self.프리페치제어기 and self.엔진 == 'thread' and self.동시처리수 * self.일괄크기 == 1:
+            # 연결 스레드에서 바로 처리하면 prefetch로 받아 둔 메시지는 pika 버퍼에 남아
+            # 처리 중 메시지 수가 1을 넘지 않으므로 제어기가 포화를 관측하지 못함
+            self.로거.warning(
+                "CONSUMER_CONCURRENCY=1이면 적응형 prefetch를 조정할 수 없어 고정 prefetch 사용 "
+                "(적응형으로 쓰려면 CONSUMER_CONCURRENCY 2 이상)"
+            )
+            self.프리페치제어기 = None
+        
+        # 중복 처리 방지 (처리를 마친 메시지 아이디 캐시, 비활성화면 None)
+        중복제거설정 = self.설정.중복제거설정가져오기()
+        self.처리완료캐시: Optional[처리완료캐시] = (
+            처리완료캐시(
+                중복제거설정['최대개수'], 중복제거설정['TTL초'], 중복제거설정['저장경로']
+            ) if 중복제거설정['활성화'] else None
+        )
+        
+        # 처리시뮬레이션용 시계와 난수 (오프라인 검증기는 가상시계로 바꿔 sleep 없이 실행,
+        # 시드를 주면 타입별로 같은 처리 시간/결과 순서를 재현)
+        시뮬레이션설정 = self.설정.시뮬레이션설정가져오기()
+        시드 = 시뮬레이션설정['시드']
+        self.시계 = 실제시계()
+        self.난수 = random.Random(f"{시드}:{self.처리타입}" if 시드 is not None else None)
+        
+        # 처리 시간 분포와 실패 비율 (운영 지연 꼬리를 재현하려면 lognormal/pareto/empirical 등 지정)
+        분포명세 = 시뮬레이션설정['처리시간분포'].get(self.처리타입)
+        self.처리시간분포: 처리시간분포 = (
+            분포생성(분포명세) if 분포명세 else 균등분포(*self.기본처리시간범위)
+        )
+        self.실패율 = 시뮬레이션설정['실패율'].get(self.처리타입, self.기본실패율)
+        if not 0 <= self.실패율 <= 1:
+            raise ValueError(f"{self.처리타입} 실패율은 0~1 사이여야 함: {self.실패율}")
+        
+        # 처리 결과를 기록하는 모의 백엔드와 지연 쓰기 버퍼 (버퍼가 없으면 메시지마다 바로 씀)
+        self.백엔드 = 모의백엔드(
+            쓰기설정['백엔드왕복지연ms'], 쓰기설정['백엔드레코드당지연ms'],
+            쓰기설정['백엔드동시쓰기한도'], 쓰기설정['백엔드쓰기실패율'],
+            random.Random(f"{시드}:{self.처리타입}:백엔드" if 시드 is not None else None)
+        )
+        self.쓰기지연버퍼: Optional[쓰기지연버퍼] = self._쓰기지연버퍼생성() if self.쓰기지연 else None
+        if 쓰기설정['활성화'] and not self.쓰기지연:
+            self.로거.info("일괄 처리 중에는 지연 쓰기 대신 묶음 단위로 바로 기록")
+        
+        # 소비 상태 (대기 → 실행중 → 드레인중 → 중지됨) 및 마지막 드레인 결과
+        self.소비상태 = '대기'
+        self.드레인타임아웃 = 처리설정['드레인타임아웃']
+        self.드레인정보: Dict[str, Any] = {'반환개수': 0, '미완료개수': 0, '소요시간': None}
+        self._소비자태그: Optional[str] = None
         
         # 제어 플래그
         self.처리중단플래그 = threading.Event()
@@ -66,25 +191,61 @@ class 기본처리서비스(ABC):
             self.연결 = pika.BlockingConnection(connection_params)
             self.채널 = self.연결.channel()
             
-            # 큐 선언
-            큐설정 = self.설정.큐설정가져오기()
-            self.채널.queue_declare(
-                queue=큐설정['큐이름'],
-                durable=큐설정['내구성'],
-                auto_delete=큐설정['자동삭제'],
-                exclusive=큐설정['배타적']
-            )
+            # 큐 선언 (타입별 라우팅 모드면 자신의 타입 큐만 선언 및 바인딩)
+            self.토폴로지.선언(self.채널, self.처리타입)
             
-            # Prefetch 설정
-            처리설정 = self.설정.처리설정가져오기()
-            self.채널.basic_qos(prefetch_count=처리설정['프리페치카운트'])
+            # Prefetch 설정 (재연결 시에는 제어기가 조정해 둔 값 사용)
+            self.채널.basic_qos(
+                prefetch_count=(
+                    self.프리페치제어기.현재값 if self.프리페치제어기 else self.프리페치카운트
+                )
+            )
             
-            self.로거.info(f"RabbitMQ 연결 성공: {큐설정['큐이름']}")
+            self.로거.info(f"RabbitMQ 연결 성공: {self.소비큐이름}")
             
         except Exception as e:
             self.로거.error(f"RabbitMQ 연결 실패: {e}")
             raise
     
+    def _프리페치제어기생성(self, 초기값: int, 동시처리수: int) -> Optional[적응형프리페치제어기]:
+        """
+        적응형 prefetch가 켜져 있으면 제어기 생성 (스레드/asyncio 엔진 공용)
+        
+        Args:
+            초기값: 시작 prefetch
+            동시처리수: 동시에 처리하는 메시지 수
+            
+        Returns:
+            적응형프리페치제어기: 비활성화면 None
+        """
+        처리설정 = self.설정.처리설정가져오기()
+        if not 처리설정['적응형프리페치']:
+            return None
+        return 적응형프리페치제어기(
+            초기값=초기값,
+            동시처리수=동시처리수,
+            최소값=처리설정['프리페치최소'],
+            최대값=처리설정['프리페치최대'],
+            보충지연=처리설정['프리페치보충지연ms'] / 1000,
+            조정간격=처리설정['프리페치조정간격']
+        )
+    
+    def _처리관측(self, 처리시간: Dict[str, Any], 수신시각: float, 처리중개수: int):
+        """처리 시간과 수신부터 정산까지의 ACK 지연을 prefetch 제어기에 기록"""
+        if self.프리페치제어기:
+            self.프리페치제어기.관측(
+                처리시간['처리시간'], time.monotonic() - 수신시각, 처리중개수
+            )
+    
+    def _프리페치조정(self):
+        """조정 주기가 되면 prefetch를 다시 계산하여 basic_qos 재설정 (연결 스레드에서 실행)"""
+        if not self.프리페치제어기:
+            return
+        새값 = self.프리페치제어기.조정()
+        if 새값 is not None:
+            self.채널.basic_qos(prefetch_count=새값)
+            self.로거.info(f"prefetch 조정: {새값} ({self.프리페치제어기.상태조회()})")
+    
     def 메시지처리시작(self):
         """
         메시지 처리 시작 (비동기)
@@ -94,9 +255,20 @@ class 기본처리서비스(ABC):
             return
         
         self.처리중단플래그.clear()
-        self.처리스레드 = threading.Thread(target=self._메시지처리루프, daemon=True)
+        if self.쓰기지연버퍼 is not None and self.쓰기지연버퍼.중지됨:
+            # 이전 중지에서 쓰기 스레드를 종료했으므로 재시작 시 새 버퍼 사용
+            self.쓰기지연버퍼 = self._쓰기지연버퍼생성()
+        self.소비상태 = '실행중'
+        self.드레인정보 = {'반환개수': 0, '미완료개수': 0, '소요시간': None}
+        if self.엔진 == 'asyncio':
+            # 이벤트 루프는 처리 스레드 안에서 실행 (메인 스레드 대기/시그널 처리 방식은 그대로)
+            self._비동기엔진 = 비동기소비엔진(self)
+            대상 = self._비동기엔진.실행
+        else:
+            대상 = self._메시지처리루프
+        self.처리스레드 = threading.Thread(target=대상, daemon=True)
         self.처리스레드.start()
-        self.로거.info(f"{self.처리타입} 메시지 처리 시작")
+        self.로거.info(f"{self.처리타입} 메시지 처리 시작 ({self.엔진} 엔진)")
     
     def 메시지처리중지(self):
         """메시지 처리 중지"""
@@ -104,21 +276,37 @@ class 기본처리서비스(ABC):
         
         if self.처리스레드 and self.처리스레드.is_alive():
             self.로거.info("메시지 처리 중지 요청...")
-            self.처리스레드.join(timeout=30)  # 30초 대기
+            self.처리스레드.join(timeout=self.드레인타임아웃 + 5)  # 드레인 시간 + 연결 종료 여유
             
         self._연결해제()
+        # 연결을 닫은 뒤 남은 레코드를 기록하고 쓰기 스레드 종료 (ACK 못 한 메시지는 브로커가 재전달)
+        if self.쓰기지연버퍼 is not None and not self.쓰기지연버퍼.중지(self.드레인타임아웃):
+            self.로거.warning(f"지연 쓰기 대기 레코드 {self.쓰기지연버퍼.대기개수()}개를 기록하지 못하고 중지")
         self.로거.info(f"{self.처리타입} 메시지 처리 중지 완료")
     
+    def _쓰기지연버퍼생성(self) -> 쓰기지연버퍼:
+        """설정에 따른 지연 쓰기 버퍼 생성 (쓰기 스레드 시작)"""
+        쓰기설정 = self.설정.쓰기지연설정가져오기()
+        return 쓰기지연버퍼(
+            self._백엔드쓰기, 쓰기설정['최대건수'], 쓰기설정['최대대기ms'],
+            이름=f'{self.처리타입.lower()}-write-behind'
+        )
+    
     def _메시지처리루프(self):
         """메시지 처리 메인 루프"""
         try:
             # RabbitMQ 연결 생성
             self._연결생성()
             
+            if self.동시처리수 > 1:
+                self._작업실행기 = ThreadPoolExecutor(
+                    max_workers=self.동시처리수,
+                    thread_name_prefix=f'{self.처리타입.lower()}-worker'
+                )
+            
             # Consumer 설정
-            큐설정 = self.설정.큐설정가져오기()
-            self.채널.basic_consume(
-                queue=큐설정['큐이름'],
+            self._소비자태그 = self.채널.basic_consume(
+                queue=self.소비큐이름,
                 on_message_callback=self._메시지콜백,
                 auto_ack=False  # 수동 ACK
             )
@@ -130,6 +318,7 @@ class 기본처리서비스(ABC):
                 try:
                     # 0.1초 타임아웃으로 메시지 처리
                     self.연결.process_data_events(time_limit=0.1)
+                    self._프리페치조정()
                 except Exception as e:
                     self.로거.error(f"메시지 처리 중 오류: {e}")
                     time.sleep(1)  # 오류 시 잠시 대기
@@ -137,11 +326,98 @@ class 기본처리서비스(ABC):
         except Exception as e:
             self.로거.error(f"메시지 처리 루프 실패: {e}")
         finally:
+            self._드레인()
             self._연결해제()
+            self.소비상태 = '중지됨'
+    
+    def _드레인(self):
+        """
+        처리 중지 시 드레인 (연결 스레드에서 실행) - 스케일 다운 시 재전달 폭주 방지
+        
+        1. Consumer 취소: 브로커가 더 보내지 않음 (pika가 콜백에 넘기지 않은 메시지는 pika가 반환)
+        2. 받았지만 시작하지 않은 메시지(일괄 버퍼, 작업 스레드 풀 대기열)는 requeue로 nack
+        3. 지연 쓰기 버퍼에 모인 레코드를 최대대기를 기다리지 않고 바로 기록
+        4. 처리 중인 메시지가 끝나 ACK/NACK될 때까지 남은 드레인타임아웃만큼 대기
+        """
+        시작 = time.monotonic()
+        if self.채널 and not self.채널.is_closed:
+            self.소비상태 = '드레인중'
+            self.로거.info(f"{self.처리타입} 드레인 시작 (처리 중 {self.처리중개수}개)")
+            try:
+                if self._소비자태그:
+                    self.채널.basic_cancel(self._소비자태그)
+                
+                if self._일괄타이머 is not None:
+                    self.연결.remove_timeout(self._일괄타이머)
+                    self._일괄타이머 = None
+                묶음, self._일괄버퍼 = self._일괄버퍼, []
+                if 묶음:
+                    self._미시작반환(self.채널, [전달태그 for 전달태그, _ in 묶음])
+            except Exception as e:
+                self.로거.warning(f"Consumer 취소/반환 실패 (브로커가 재전달): {e}")
+        
+        # 쓰기 완료 콜백의 ACK는 add_callback_threadsafe로 예약되어 이어지는 대기에서 전송
+        if self.쓰기지연버퍼 is not None:
+            self.쓰기지연버퍼.비우기(self.드레인타임아웃)
+        self._작업완료대기(max(0.0, self.드레인타임아웃 - (time.monotonic() - 시작)))
+        self.드레인정보.update(
+            미완료개수=self.처리중개수, 소요시간=round(time.monotonic() - 시작, 3)
+        )
+        self.로거.info(f"{self.처리타입} 드레인 완료: {self.드레인정보}")
+    
+    def _미시작반환(self, channel, 전달태그목록: List[int]):
+        """
+        드레인 중 처리를 시작하지 않은 메시지를 requeue로 nack (연결 스레드에서 실행)
+        
+        Args:
+            channel: RabbitMQ 채널
+            전달태그목록: 반환할 delivery tag 목록
+        """
+        for 전달태그 in 전달태그목록:
+            self._수신정보.pop(전달태그, None)
+            self.처리중개수 -= 1
+            channel.basic_nack(delivery_tag=전달태그, requeue=True)
+            if self.일괄크기 > 1:
+                self._확인추적기.완료(전달태그, False)
+        self.드레인정보['반환개수'] += len(전달태그목록)
+        
+        # 반환한 메시지 뒤에 확인을 기다리던 일괄 성공 메시지가 있으면 함께 확인
+        if self.일괄크기 > 1:
+            확인태그 = self._확인추적기.확인가능태그()
+            if 확인태그 is not None:
+                channel.basic_ack(delivery_tag=확인태그, multiple=True)
+    
+    def _작업완료대기(self, 타임아웃: float = 30):
+        """
+        처리 중인 작업이 끝나 ACK/NACK이 전송될 때까지 연결 이벤트를 처리하며 대기
+        
+        Args:
+            타임아웃: 최대 대기 시간(초)
+        """
+        if not self._작업실행기 and not self.쓰기지연버퍼:
+            return
+        
+        # 지연 쓰기 중인 메시지도 처리중개수에 포함되므로 쓰기 후 ACK까지 함께 대기
+        종료시각 = time.monotonic() + 타임아웃
+        try:
+            while self.처리중개수 > 0 and time.monotonic() < 종료시각:
+                if not self.연결 or self.연결.is_closed:
+                    break
+                self.연결.process_data_events(time_limit=0.1)
+        except Exception as e:
+            self.로거.warning(f"처리 중 작업 대기 실패: {e}")
+        
+        if self.처리중개수 > 0:
+            self.로거.warning(f"ACK되지 않은 처리 중 메시지 {self.처리중개수}개 (브로커가 재전달)")
+        if self._작업실행기:
+            self._작업실행기.shutdown(wait=False)
+            self._작업실행기 = None
     
     def _메시지콜백(self, channel, method, properties, body):
         """
-        RabbitMQ 메시지 콜백 함수
+        RabbitMQ 메시지 콜백 함수 (연결 스레드에서 실행)
+        타입 필터링과 본문 파싱만 수행하고, 실제 처리는 작업 스레드 풀로 넘김
+        (동시처리수가 1이면 기존처럼 콜백 안에서 바로 처리)
         
         Args:
             channel: RabbitMQ 채널
@@ -149,67 +425,556 @@ class 기본처리서비스(ABC):
             properties: 메시지 속성
             body: 메시지 본문
         """
-        메시지아이디 = properties.message_id or "unknown"
-        
         try:
-            # JSON에서 BSS메시지 복원
-            메시지 = BSS메시지.from_json(body.decode('utf-8'))
+            # 본문은 필드에 처음 접근할 때 content_type에 맞는 코덱으로 복원 (알 수 없으면 JSON)
+            # message_type 헤더가 있으면 타입 필터링은 본문 파싱 없이 헤더만으로 수행
+            헤더타입 = (properties.headers or {}).get('message_type')
+            메시지 = 지연BSS메시지(
+                body,
+                코덱가져오기(properties.content_type).디코딩,
+                헤더타입
+            )
             
-            # 메시지 타입 필터링
+            # 메시지 타입 필터링 (헤더가 없는 기존 메시지는 본문을 파싱하여 확인)
             if not 메시지.타입확인(self.처리타입):
-                # 해당 타입이 아닌 메시지는 reject (다른 Consumer가 처리)
-                channel.basic_reject(delivery_tag=method.delivery_tag, requeue=True)
+                # 단일 큐 모드: 해당 타입이 아닌 메시지는 reject (다른 Consumer가 처리)
+                # 타입별 큐 모드: 잘못 라우팅된 메시지이므로 requeue하지 않음 (무한 재전달 방지)
+                channel.basic_reject(
+                    delivery_tag=method.delivery_tag,
+                    requeue=self.토폴로지.타입필터필요()
+                )
                 return
             
-            # 메시지 처리 시작 시간 기록
-            처리시작시간 = time.time()
+            # 처리 대상 메시지는 여기서 본문 파싱 (파싱 실패는 아래에서 requeue 없이 reject)
+            메시지.본문파싱()
             
-            # 실제 메시지 처리
+        except Exception as e:
+            self.로거.error(f"메시지 콜백 처리 실패: {e}")
+            # 파싱 실패 등 처리할 수 없는 메시지는 데드레터 큐로 격리
+            self._실패메시지정산(
+                channel, method.delivery_tag, 'dead', body, properties, f"파싱 실패: {e}"
+            )
+            self._통계증가(self.처리통계, '실패처리개수')
+            return
+        
+        # 이미 처리를 마친 메시지(ACK 전 연결 끊김 등으로 재전달)는 처리하지 않고 ACK
+        if self._중복확인(메시지):
+            channel.basic_ack(delivery_tag=method.delivery_tag)
+            return
+        
+        self._수신정보[method.delivery_tag] = (body, properties, time.monotonic())
+        self.처리중개수 += 1
+        if self.일괄크기 > 1:
+            self._일괄추가(channel, method.delivery_tag, 메시지)
+        elif self._작업실행기:
+            self._작업실행기.submit(self._작업실행, channel, method.delivery_tag, 메시지)
+        else:
+            self._결과반영(channel, method.delivery_tag, 메시지, *self._처리실행(메시지))
+    
+    def _통계증가(self, 통계: Dict[str, Any], *키목록: str):
+        """
+        통계 항목을 1씩 증가 (스레드 안전)
+        
+        Args:
+            통계: 처리통계 또는 하위 클래스의 유형별 통계
+            키목록: 증가할 항목 키
+        """
+        with self._통계잠금:
+            for 키 in 키목록:
+                통계[키] += 1
+    
+    def _중복확인(self, 메시지: BSS메시지) -> bool:
+        """
+        처리 완료 캐시에 있는 메시지인지 확인 (스레드/asyncio 엔진 공용)
+        
+        Returns:
+            bool: 이미 처리된 메시지면 True (중복건너뜀개수 증가)
+        """
+        if self.처리완료캐시 is None or not self.처리완료캐시.확인(메시지.아이디):
+            return False
+        self._통계증가(self.처리통계, '중복건너뜀개수')
+        self.로거.info(f"이미 처리된 메시지 건너뜀: {메시지.타입} - {메시지.아이디}")
+        return True
+    
+    def _처리실행(self, 메시지: BSS메시지) -> tuple:
+        """
+        메시지 처리 및 처리 시간 측정 (작업 스레드에서 실행)
+        
+        Args:
+            메시지: 처리할 BSS 메시지
+            
+        Returns:
+            tuple: (처리결과, 처리시간 정보, 예외) - 처리 중 예외가 나면 처리결과는 None
+        """
+        # 메시지 처리 시작 시간 기록
+        처리시작시간 = self.시계.시각()
+        
+        try:
+            # 실제 메시지 처리 (지연 쓰기가 아니면 처리 결과 레코드를 바로 기록)
             처리결과 = self.메시지처리(메시지)
+            if self.쓰기지연버퍼 is None:
+                처리결과 = self._결과쓰기([처리결과])[0]
+            return 처리결과, self.처리시간측정(처리시작시간), None
+        except Exception as e:
+            return None, self.처리시간측정(처리시작시간), e
+    
+    def _작업실행(self, channel, 전달태그: int, 메시지: BSS메시지):
+        """
+        작업 스레드에서 메시지를 처리하고 ACK/NACK은 연결 스레드로 넘김
+        (pika 연결은 스레드 안전하지 않으므로 add_callback_threadsafe로 전달)
+        
+        Args:
+            channel: RabbitMQ 채널
+            전달태그: 메시지 delivery tag
+            메시지: 처리할 BSS 메시지
+        """
+        if self.소비상태 == '드레인중':
+            # 드레인 시작 전에 작업 스레드를 잡지 못한 메시지는 처리하지 않고 반환
+            콜백 = functools.partial(self._미시작반환, channel, [전달태그])
+        else:
+            콜백 = functools.partial(
+                self._결과반영, channel, 전달태그, 메시지, *self._처리실행(메시지)
+            )
+        try:
+            self.연결.add_callback_threadsafe(콜백)
+        except Exception as e:
+            # 연결이 이미 닫혔으면 ACK하지 못한 메시지는 브로커가 재전달
+            self.로거.warning(f"처리 결과 전달 실패 (재전달 예정): {메시지.아이디} - {e}")
+    
+    def _결과반영(self, channel, 전달태그: int, 메시지: BSS메시지,
+               처리결과: Optional[Dict[str, Any]], 처리시간: Dict[str, Any],
+               오류: Optional[Exception]):
+        """
+        처리 결과에 따라 ACK/NACK 및 통계 업데이트 (연결 스레드에서 실행)
+        
+        Args:
+            channel: RabbitMQ 채널
+            전달태그: 메시지 delivery tag
+            메시지: 처리한 BSS 메시지
+            처리결과: 메시지처리 결과 (예외 발생 시 None)
+            처리시간: 처리시간측정 결과
+            오류: 처리 중 발생한 예외
+        """
+        본문, 속성, 수신시각 = self._수신정보.pop(전달태그)
+        self._처리관측(처리시간, 수신시각, self.처리중개수)
+        레코드 = self._지연쓰기레코드(처리결과)
+        판정 = self._결과판정(
+            메시지, 처리결과, 처리시간, 오류, self.토폴로지.재시도횟수(속성.headers),
+            지연쓰기=레코드 is not None
+        )
+        
+        if 판정 == 'ack' and 레코드 is not None:
+            # 레코드를 기록한 뒤 ACK (처리중개수는 쓰기 결과 반영 시 감소)
+            self.쓰기지연버퍼.추가(레코드, functools.partial(
+                self._쓰기완료전달, channel, 전달태그, 메시지, 본문, 속성
+            ))
+            return
+        
+        self.처리중개수 -= 1
+        try:
+            if 판정 == 'ack':
+                channel.basic_ack(delivery_tag=전달태그)
+            else:
+                self._실패메시지정산(
+                    channel, 전달태그, 판정, 본문, 속성, self._실패사유(처리결과, 오류)
+                )
+        except Exception as e:
+            # 채널이 닫혔으면 브로커가 재전달
+            self.로거.warning(f"ACK/NACK 전송 실패 (재전달 예정): {메시지.아이디} - {e}")
+    
+    def _쓰기완료전달(self, channel, 전달태그: int, 메시지: BSS메시지, 본문: bytes, 속성,
+                  성공: bool, 오류: Optional[Exception]):
+        """지연 쓰기 완료 결과를 연결 스레드로 넘김 (쓰기 스레드에서 실행)"""
+        try:
+            self.연결.add_callback_threadsafe(functools.partial(
+                self._쓰기결과반영, channel, 전달태그, 메시지, 본문, 속성, 성공, 오류
+            ))
+        except Exception as e:
+            # 연결이 이미 닫혔으면 ACK하지 못한 메시지는 브로커가 재전달 (중복은 처리 완료 캐시로 방지)
+            self.로거.warning(f"쓰기 결과 전달 실패 (재전달 예정): {메시지.아이디} - {e}")
+    
+    def _쓰기결과반영(self, channel, 전달태그: int, 메시지: BSS메시지, 본문: bytes, 속성,
+                  성공: bool, 오류: Optional[Exception]):
+        """
+        지연 쓰기 결과에 따라 ACK 또는 재시도/데드레터 큐로 정산 (연결 스레드에서 실행)
+        
+        Args:
+            channel: RabbitMQ 채널
+            전달태그: 메시지 delivery tag
+            메시지: 처리한 BSS 메시지
+            본문: 원본 메시지 본문
+            속성: 원본 메시지 속성
+            성공: 레코드 쓰기 성공 여부
+            오류: 쓰기 중 발생한 예외
+        """
+        self.처리중개수 -= 1
+        판정 = self._쓰기결과판정(메시지, 성공, 오류, self.토폴로지.재시도횟수(속성.headers))
+        try:
+            if 판정 == 'ack':
+                channel.basic_ack(delivery_tag=전달태그)
+            else:
+                self._실패메시지정산(
+                    channel, 전달태그, 판정, 본문, 속성, f"백엔드 쓰기 실패: {오류}"
+                )
+        except Exception as e:
+            self.로거.warning(f"ACK/NACK 전송 실패 (재전달 예정): {메시지.아이디} - {e}")
+    
+    def _재처리헤더(self, 판정: str, 헤더: Optional[Dict[str, Any]], 사유: str) -> tuple:
+        """
+        실패 메시지를 다시 발행할 큐 이름과 헤더 결정 (스레드/asyncio 엔진 공용)
+        재시도 횟수는 x-retry-count 헤더에 기록하여 재전달 후에도 유지하고,
+        데드레터 큐로 보낼 때는 실패 사유, 원래 작업 큐, 실패 시각을 함께 기록
+        
+        Args:
+            판정: 'retry' 또는 'dead'
+            헤더: 원본 메시지 헤더
+            사유: 실패 사유
             
-            # 처리 시간 계산
-            처리시간 = self.처리시간측정(처리시작시간)
+        Returns:
+            tuple: (큐 이름, 새 헤더)
+        """
+        토폴로지 = self.토폴로지
+        재시도횟수 = 토폴로지.재시도횟수(헤더)
+        새헤더 = dict(헤더 or {})
+        if 판정 == 'retry':
+            재시도횟수 += 1
+            큐이름 = 토폴로지.재시도큐이름(self.처리타입, 재시도횟수)
+        else:
+            큐이름 = 토폴로지.데드레터큐이름(self.처리타입)
+            새헤더[토폴로지.실패사유헤더] = 사유[:500]
+            새헤더[토폴로지.원래큐헤더] = self.소비큐이름
+            새헤더[토폴로지.실패시각헤더] = datetime.now().isoformat()
+        새헤더[토폴로지.재시도헤더] = 재시도횟수
+        return 큐이름, 새헤더
+    
+    def _재처리발행(self, channel, 판정: str, 본문: bytes, 속성, 사유: str):
+        """
+        실패 메시지를 재시도 지연 큐 또는 데드레터 큐로 발행 (원본 ACK은 호출 측에서 수행)
+        
+        Args:
+            channel: RabbitMQ 채널
+            판정: 'retry' 또는 'dead'
+            본문: 원본 메시지 본문
+            속성: 원본 메시지 속성 (BasicProperties)
+            사유: 실패 사유
+        """
+        큐이름, 새헤더 = self._재처리헤더(판정, 속성.headers, 사유)
+        새속성 = copy.copy(속성)
+        새속성.headers = 새헤더
+        channel.basic_publish(exchange='', routing_key=큐이름, body=본문, properties=새속성)
+    
+    @staticmethod
+    def _실패사유(처리결과: Optional[Dict[str, Any]], 오류: Optional[Exception]) -> str:
+        """처리 결과 또는 예외에서 실패 사유 문자열 추출"""
+        if 오류 is not None:
+            return f"{type(오류).__name__}: {오류}"
+        if 처리결과:
+            return str(처리결과.get('메시지') or 처리결과.get('오류') or '처리 실패')
+        return '처리 실패'
+    
+    def _실패메시지정산(self, channel, 전달태그: int, 판정: str, 본문: bytes, 속성, 사유: str):
+        """실패 메시지를 재시도/데드레터 큐로 옮기고 원본 ACK (발행 실패 시 requeue)"""
+        try:
+            self._재처리발행(channel, 판정, 본문, 속성, 사유)
+        except Exception as e:
+            self.로거.error(f"재시도/데드레터 큐 발행 실패 - 원본 requeue: {e}")
+            channel.basic_reject(delivery_tag=전달태그, requeue=True)
+            return
+        channel.basic_ack(delivery_tag=전달태그)
+    
+    def _일괄추가(self, channel, 전달태그: int, 메시지: BSS메시지):
+        """
+        메시지를 일괄 버퍼에 추가 (연결 스레드에서 실행)
+        일괄크기가 차면 바로, 아니면 첫 메시지 수신 후 일괄대기초가 지나면 처리
+        
+        Args:
+            channel: RabbitMQ 채널
+            전달태그: 메시지 delivery tag
+            메시지: 처리할 BSS 메시지
+        """
+        self._확인추적기.등록(전달태그)
+        self._일괄버퍼.append((전달태그, 메시지))
+        
+        if len(self._일괄버퍼) >= self.일괄크기:
+            if self._일괄타이머 is not None:
+                self.연결.remove_timeout(self._일괄타이머)
+                self._일괄타이머 = None
+            self._일괄실행(channel)
+        elif self._일괄타이머 is None:
+            self._일괄타이머 = self.연결.call_later(
+                self.일괄대기, functools.partial(self._일괄대기만료, channel)
+            )
+    
+    def _일괄대기만료(self, channel):
+        """일괄대기 타이머 만료 시 모인 메시지 처리 (연결 스레드에서 실행)"""
+        self._일괄타이머 = None
+        self._일괄실행(channel)
+    
+    def _일괄실행(self, channel):
+        """모인 메시지를 작업 스레드 풀 또는 현재 스레드에서 일괄 처리"""
+        묶음, self._일괄버퍼 = self._일괄버퍼, []
+        if not 묶음:
+            return
+        
+        if self._작업실행기:
+            self._작업실행기.submit(self._일괄작업실행, channel, 묶음)
+        else:
+            self._일괄결과반영(channel, 묶음, *self._일괄처리실행([메시지 for _, 메시지 in 묶음]))
+    
+    def _일괄처리실행(self, 메시지목록: List[BSS메시지]) -> tuple:
+        """
+        메시지일괄처리 호출 및 처리 시간 측정
+        
+        Returns:
+            tuple: (처리결과 목록, 처리시간 정보, 예외)
+        """
+        처리시작시간 = self.시계.시각()
+        
+        try:
+            결과목록 = self.메시지일괄처리(메시지목록)
+            if len(결과목록) != len(메시지목록):
+                raise ValueError(
+                    f"일괄 처리 결과 수 불일치: 메시지 {len(메시지목록)}개, 결과 {len(결과목록)}개"
+                )
+            return self._결과쓰기(결과목록), self.처리시간측정(처리시작시간), None
+        except Exception as e:
+            return None, self.처리시간측정(처리시작시간), e
+    
+    def _일괄작업실행(self, channel, 묶음: list):
+        """작업 스레드에서 일괄 처리하고 ACK/NACK은 연결 스레드로 넘김"""
+        if self.소비상태 == '드레인중':
+            콜백 = functools.partial(self._미시작반환, channel, [전달태그 for 전달태그, _ in 묶음])
+        else:
+            콜백 = functools.partial(
+                self._일괄결과반영, channel, 묶음,
+                *self._일괄처리실행([메시지 for _, 메시지 in 묶음])
+            )
+        try:
+            self.연결.add_callback_threadsafe(콜백)
+        except Exception as e:
+            self.로거.warning(f"일괄 처리 결과 전달 실패 (재전달 예정): {len(묶음)}개 - {e}")
+    
+    def _일괄결과반영(self, channel, 묶음: list,
+                 결과목록: Optional[List[Dict[str, Any]]], 처리시간: Dict[str, Any],
+                 오류: Optional[Exception]):
+        """
+        일괄 처리 결과 반영 (연결 스레드에서 실행)
+        실패 메시지는 재시도/데드레터 큐로 재발행한 뒤, 성공 메시지와 함께
+        연속 구간의 최대 태그까지 basic_ack(multiple=True) 한 번으로 확인
+        
+        Args:
+            channel: RabbitMQ 채널
+            묶음: (delivery tag, 메시지) 목록
+            결과목록: 메시지일괄처리 결과 (예외 발생 시 None)
+            처리시간: 처리시간측정 결과
+            오류: 처리 중 발생한 예외 (묶음 전체 실패로 처리)
+        """
+        처리중개수 = self.처리중개수
+        self.처리중개수 -= len(묶음)
+        
+        try:
+            for 순번, (전달태그, 메시지) in enumerate(묶음):
+                본문, 속성, 수신시각 = self._수신정보.pop(전달태그)
+                self._처리관측(처리시간, 수신시각, 처리중개수)
+                처리결과 = 결과목록[순번] if 결과목록 else None
+                판정 = self._결과판정(
+                    메시지, 처리결과, 처리시간, 오류, self.토폴로지.재시도횟수(속성.headers)
+                )
+                if 판정 != 'ack':
+                    try:
+                        self._재처리발행(
+                            channel, 판정, 본문, 속성, self._실패사유(처리결과, 오류)
+                        )
+                    except Exception as e:
+                        self.로거.error(f"재시도/데드레터 큐 발행 실패 - 원본 requeue: {e}")
+                        channel.basic_reject(delivery_tag=전달태그, requeue=True)
+                        self._확인추적기.완료(전달태그, False)
+                        continue
+                self._확인추적기.완료(전달태그, True)
+            
+            확인태그 = self._확인추적기.확인가능태그()
+            if 확인태그 is not None:
+                channel.basic_ack(delivery_tag=확인태그, multiple=True)
+        except Exception as e:
+            # 채널이 닫혔으면 브로커가 재전달
+            self.로거.warning(f"일괄 ACK/NACK 전송 실패 (재전달 예정): {e}")
+    
+    def _결과판정(self, 메시지: BSS메시지, 처리결과: Optional[Dict[str, Any]],
+               처리시간: Dict[str, Any], 오류: Optional[Exception], 재시도횟수: int = 0,
+               지연쓰기: bool = False) -> str:
+        """
+        처리 결과로 ACK/재시도/데드레터 여부를 결정하고 통계 업데이트
+        (스레드 엔진과 asyncio 엔진이 같은 재시도 규칙을 쓰도록 분리)
+        
+        Args:
+            메시지: 처리한 BSS 메시지
+            처리결과: 메시지처리 결과 (예외 발생 시 None)
+            처리시간: 처리시간측정 결과
+            오류: 처리 중 발생한 예외
+            재시도횟수: 지금까지 재시도한 횟수 (x-retry-count 헤더)
+            지연쓰기: 호출 측이 레코드를 지연 쓰기 버퍼로 기록하는지 여부
+                     (True면 처리 완료 캐시 기록을 쓰기 결과 반영 시로 미룸)
+            
+        Returns:
+            str: 'ack' / 'retry' (재시도 지연 큐) / 'dead' (데드레터 큐)
+        """
+        try:
+            if 오류 is not None:
+                raise 오류
             
             # 처리 결과에 따라 ACK/NACK
             if 처리결과['성공']:
-                channel.basic_ack(delivery_tag=method.delivery_tag)
-                self.처리통계['성공처리개수'] += 1
+                판정 = 'ack'
+                self._통계증가(self.처리통계, '성공처리개수')
+                # 지연 쓰기 대상은 레코드를 기록한 뒤 캐시에 기록 (쓰기 실패 후 재전달을 건너뛰지 않도록)
+                if self.처리완료캐시 is not None and not 지연쓰기:
+                    self.처리완료캐시.기록(메시지.아이디)
                 self.로거.info(
-                    f"메시지 처리 성공: {메시지.타입} - {메시지아이디} "
+                    f"메시지 처리 성공: {메시지.타입} - {메시지.아이디} "
                     f"(처리시간: {처리시간['처리시간']:.2f}초)"
                 )
             else:
-                # 재시도 로직
-                재시도횟수 = 메시지.속성들.get('재시도횟수', 0)
+                # 재시도 로직 (지연 큐에서 단계별 지수 백오프 후 작업 큐로 복귀)
                 최대재시도 = self.설정.처리설정가져오기()['최대재시도']
                 
                 if 재시도횟수 < 최대재시도:
-                    # 재시도 카운트 증가 후 requeue
-                    메시지.속성들['재시도횟수'] = 재시도횟수 + 1
-                    channel.basic_reject(delivery_tag=method.delivery_tag, requeue=True)
+                    판정 = 'retry'
+                    self._통계증가(self.처리통계, '재시도개수')
                     self.로거.warning(
                         f"메시지 처리 실패 - 재시도 {재시도횟수 + 1}/{최대재시도}: "
-                        f"{메시지.타입} - {메시지아이디}"
+                        f"{메시지.타입} - {메시지.아이디}"
                     )
                 else:
-                    # 최대 재시도 초과 - Dead Letter로 이동
-                    channel.basic_reject(delivery_tag=method.delivery_tag, requeue=False)
+                    # 최대 재시도 초과 - 데드레터 큐로 이동
+                    판정 = 'dead'
+                    self._통계증가(self.처리통계, '데드레터개수')
                     self.로거.error(
                         f"메시지 처리 최종 실패 (최대 재시도 초과): "
-                        f"{메시지.타입} - {메시지아이디}"
+                        f"{메시지.타입} - {메시지.아이디}"
                     )
                 
-                self.처리통계['실패처리개수'] += 1
+                self._통계증가(self.처리통계, '실패처리개수')
             
             # 통계 업데이트
-            self.처리통계['총처리개수'] += 1
+            self._통계증가(self.처리통계, '총처리개수')
             self.처리통계['마지막처리시간'] = datetime.now()
+            self._지연기록(메시지, 처리결과, 처리시간, 판정)
+            return 판정
             
         except Exception as e:
+            # 처리 중 예외는 재시도해도 같은 결과일 가능성이 높으므로 바로 격리
             self.로거.error(f"메시지 콜백 처리 실패: {e}")
-            # 파싱 실패 등의 경우 메시지 reject (requeue하지 않음)
-            channel.basic_reject(delivery_tag=method.delivery_tag, requeue=False)
-            self.처리통계['실패처리개수'] += 1
+            self._통계증가(self.처리통계, '실패처리개수', '데드레터개수')
+            self._지연기록(메시지, None, 처리시간, 'dead')
+            return 'dead'
+    
+    def _결과레코드(self, 처리결과: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """성공한 처리 결과에서 백엔드에 기록할 레코드 추출 (기록할 것이 없으면 None)"""
+        if not self.결과레코드키 or not 처리결과 or not 처리결과.get('성공'):
+            return None
+        결과데이터 = 처리결과.get('결과데이터') or {}
+        if self.결과레코드키 not in 결과데이터:
+            return None
+        return {
+            '메시지아이디': 결과데이터.get('메시지아이디'),
+            '처리타입': self.처리타입,
+            self.결과레코드키: 결과데이터[self.결과레코드키]
+        }
+    
+    def _지연쓰기레코드(self, 처리결과: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """지연 쓰기 버퍼에 넣을 레코드 (지연 쓰기가 아니거나 기록할 것이 없으면 None)"""
+        return self._결과레코드(처리결과) if self.쓰기지연버퍼 is not None else None
+    
+    def _백엔드쓰기(self, 레코드목록: List[Dict[str, Any]]):
+        """레코드 목록을 모의 백엔드에 한 번에 기록 (처리시뮬레이션과 같은 시계 사용)"""
+        self.백엔드.쓰기(레코드목록, self.시계)
+    
+    def _결과쓰기(self, 결과목록: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        처리 결과들의 레코드를 백엔드에 한 번에 기록 (작업 스레드에서 실행)
+        쓰기에 실패하면 레코드가 있던 결과를 실패로 바꿔 재시도 큐로 보내지도록 함
+        
+        Args:
+            결과목록: 메시지처리 결과 목록
+            
+        Returns:
+            list: 쓰기 결과를 반영한 처리 결과 목록
+        """
+        대상 = []
+        for 순번, 결과 in enumerate(결과목록):
+            레코드 = self._결과레코드(결과)
+            if 레코드 is not None:
+                대상.append((순번, 레코드))
+        if not 대상:
+            return 결과목록
+        try:
+            self._백엔드쓰기([레코드 for _, 레코드 in 대상])
+        except Exception as e:
+            self.로거.warning(f"백엔드 쓰기 실패 - 레코드 {len(대상)}개 재시도 예정: {e}")
+            결과목록 = list(결과목록)
+            for 순번, 레코드 in 대상:
+                결과목록[순번] = {
+                    '성공': False,
+                    '메시지': f'백엔드 쓰기 실패: {e}',
+                    '결과데이터': {'메시지아이디': 레코드['메시지아이디'], '오류원인': str(e)}
+                }
+        return 결과목록
+    
+    def _쓰기결과판정(self, 메시지: BSS메시지, 성공: bool, 오류: Optional[Exception],
+                  재시도횟수: int = 0) -> str:
+        """
+        지연 쓰기 결과로 ACK/재시도/데드레터 여부 결정 (스레드/asyncio 엔진 공용)
+        처리는 성공했으므로 성공처리개수는 그대로 두고 쓰기실패개수로 따로 셈
+        
+        Args:
+            메시지: 처리한 BSS 메시지
+            성공: 레코드 쓰기 성공 여부
+            오류: 쓰기 중 발생한 예외
+            재시도횟수: 지금까지 재시도한 횟수 (x-retry-count 헤더)
+            
+        Returns:
+            str: 'ack' / 'retry' / 'dead'
+        """
+        if 성공:
+            if self.처리완료캐시 is not None:
+                self.처리완료캐시.기록(메시지.아이디)
+            return 'ack'
+        
+        self._통계증가(self.처리통계, '쓰기실패개수')
+        if 재시도횟수 < self.설정.처리설정가져오기()['최대재시도']:
+            self._통계증가(self.처리통계, '재시도개수')
+            self.로거.warning(f"백엔드 쓰기 실패 - 재시도: {메시지.타입} - {메시지.아이디} ({오류})")
+            return 'retry'
+        self._통계증가(self.처리통계, '데드레터개수')
+        self.로거.error(f"백엔드 쓰기 최종 실패: {메시지.타입} - {메시지.아이디} ({오류})")
+        return 'dead'
+    
+    def _지연기록(self, 메시지: BSS메시지, 처리결과: Optional[Dict[str, Any]],
+               처리시간: Optional[Dict[str, Any]], 판정: str):
+        """
+        처리시간, 큐대기시간(생성 → 처리 시작), 종단시간(생성 → 처리 완료)을 결과/세부유형별 히스토그램에 기록
+        
+        생성 시각은 본문의 생성시간 (created_at 헤더와 같은 값), 재시도 메시지는 최초 생성부터 잼
+        가상 시계로 실행 중이면 생성 시각과 기준이 달라 처리시간만 기록
+        """
+        if not 처리시간:
+            return
+        try:
+            if 판정 == 'ack':
+                세부유형 = ((처리결과 or {}).get('결과데이터') or {}).get(self.세부유형키) if self.세부유형키 else None
+                분류 = f"성공/{세부유형}" if 세부유형 else '성공'
+            else:
+                분류 = '재시도' if 판정 == 'retry' else '데드레터'
+            
+            큐대기시간 = 종단시간 = None
+            if not self.시계.가상:
+                생성시각 = 메시지.생성시간ns / 1_000_000_000
+                큐대기시간 = 처리시간['시작시간'] - 생성시각
+                종단시간 = 처리시간['종료시간'] - 생성시각
+            self.지연통계.기록(분류, 처리시간['처리시간'], 큐대기시간, 종단시간)
+        except Exception as e:
+            # 통계 기록 실패가 ACK/재시도 판정에 영향을 주지 않도록 함
+            self.로거.debug(f"지연 통계 기록 실패: {e}")
     
     @abstractmethod
     def 메시지처리(self, 메시지: BSS메시지) -> Dict[str, Any]:
@@ -224,6 +989,40 @@ class 기본처리서비스(ABC):
         """
         pass
     
+    def 메시지일괄처리(self, 메시지목록: List[BSS메시지]) -> List[Dict[str, Any]]:
+        """
+        여러 메시지를 한 번에 처리 (CONSUMER_BATCH_SIZE가 2 이상일 때 호출)
+        기본 구현은 메시지처리를 차례로 호출하므로, 대량 쓰기가 가능한 처리 서비스에서 재정의
+        
+        Args:
+            메시지목록: 처리할 BSS 메시지 목록
+            
+        Returns:
+            list: 메시지 순서와 같은 처리 결과 목록 (각 결과는 메시지처리 결과 형식)
+        """
+        결과목록 = []
+        for 메시지 in 메시지목록:
+            try:
+                결과목록.append(self.메시지처리(메시지))
+            except Exception as e:
+                결과목록.append({'성공': False, '메시지': f'처리 중 예외 발생: {e}', '결과데이터': None})
+        return 결과목록
+    
+    def _결과유형선택(self, 성공유형: Dict[str, float], 실패유형: str) -> tuple:
+        """
+        처리시뮬레이션 결과 유형 선택 (실패율로 실패 여부를 정하고, 성공이면 가중치 비율로 유형 선택)
+        
+        Args:
+            성공유형: 성공 유형별 가중치
+            실패유형: 실패 시 유형 이름
+            
+        Returns:
+            tuple: (유형, 성공 여부)
+        """
+        if self.난수.random() < self.실패율:
+            return 실패유형, False
+        return self.난수.choices(list(성공유형), weights=list(성공유형.values()))[0], True
+    
     @abstractmethod
     def 처리시뮬레이션(self) -> Dict[str, Any]:
         """
@@ -240,12 +1039,12 @@ class 기본처리서비스(ABC):
         메시지 처리 시간 측정 및 기록
         
         Args:
-            시작시간: 처리 시작 시간 (time.time())
+            시작시간: 처리 시작 시간 (self.시계.시각())
             
         Returns:
             dict: 시간 측정 결과
         """
-        종료시간 = time.time()
+        종료시간 = self.시계.시각()
         처리시간 = 종료시간 - 시작시간
         
         # 모니터링이 활성화된 경우 상세 로깅
@@ -279,8 +1078,13 @@ class 기본처리서비스(ABC):
                 '총처리개수': 총처리개수,
                 '성공처리개수': self.처리통계['성공처리개수'],
                 '실패처리개수': self.처리통계['실패처리개수'],
+                '재시도개수': self.처리통계['재시도개수'],
+                '데드레터개수': self.처리통계['데드레터개수'],
+                '중복건너뜀개수': self.처리통계['중복건너뜀개수'],
+                '쓰기실패개수': self.처리통계['쓰기실패개수'],
                 '성공률': f"{성공률}%"
             },
+            '지연분포': self.지연통계.조회(),
             '시간정보': {
                 '시작시간': self.처리통계['시작시간'].isoformat(),
                 '마지막처리시간': (
@@ -291,10 +1095,41 @@ class 기본처리서비스(ABC):
             },
             '상태정보': {
                 '처리중': self.처리스레드.is_alive() if self.처리스레드 else False,
-                '연결상태': not self.연결.is_closed if self.연결 else False
+                '소비상태': self.소비상태,
+                '드레인': self.드레인정보,
+                '엔진': self.엔진,
+                '동시처리수': (
+                    self._비동기엔진.동시처리수 if self._비동기엔진 else self.동시처리수
+                ),
+                '처리중개수': self.처리중개수,
+                '일괄크기': self.일괄크기,
+                '일괄확인': self._확인추적기.통계조회(),
+                '프리페치': self._프리페치상태(),
+                '중복제거': self.처리완료캐시.통계조회() if self.처리완료캐시 else None,
+                '백엔드쓰기': self.백엔드.통계조회(),
+                '쓰기지연': self.쓰기지연버퍼.통계조회() if self.쓰기지연버퍼 else None,
+                '처리시뮬레이션': {
+                    **self.처리시간분포.정보(),
+                    '평균처리시간': round(self.처리시간분포.평균(), 3),
+                    '실패율': self.실패율
+                },
+                '연결상태': (
+                    self._비동기엔진.연결됨() if self._비동기엔진
+                    else (not self.연결.is_closed if self.연결 else False)
+                )
             }
         }
     
+    def _프리페치상태(self) -> Dict[str, Any]:
+        """현재 엔진의 prefetch 상태 (적응형이 아니면 고정값)"""
+        제어기 = self._비동기엔진.프리페치제어기 if self._비동기엔진 else self.프리페치제어기
+        if 제어기:
+            return {'적응형': True, **제어기.상태조회()}
+        return {
+            '적응형': False,
+            '현재값': self._비동기엔진.프리페치카운트 if self._비동기엔진 else self.프리페치카운트
+        }
+    
     def 연결상태확인(self) -> bool:
         """
         RabbitMQ 연결 상태 확인
@@ -302,6 +1137,8 @@ class 기본처리서비스(ABC):
         Returns:
             bool: 연결이 정상이면 True
         """
+        if self._비동기엔진:
+            return self._비동기엔진.연결됨()
         try:
             if self.연결 and not self.연결.is_closed:
                 self.연결.process_data_events(time_limit=0)
@@ -0,0 +1,84 @@
+# 파일 경로: src/consumer/batch_ack.py
+# 일괄 처리 메시지의 multiple ACK 추적 클래스
+
+from collections import deque
+from typing import Dict, Any, Optional
+
+
+class 일괄확인추적기:
+    """
+    아직 ACK/NACK하지 않은 delivery tag를 수신 순서대로 추적하여
+    basic_ack(multiple=True) 한 번으로 확인할 수 있는 최대 태그를 계산
+
+    multiple ACK은 해당 태그 이하의 미확인 메시지를 모두 확인하므로,
+    앞쪽에 아직 처리 중인 메시지가 있으면 그 뒤의 성공 메시지는 확인을 미룸
+    (실패 메시지는 개별 reject로 이미 정산되어 multiple ACK 범위에 들어가도 안전)
+
+    연결 스레드에서만 호출 (pika 채널과 같은 스레드)
+
+    속성:
+        확인프레임수 (int): 전송한 multiple ACK 프레임 수
+        확인메시지수 (int): multiple ACK으로 확인한 메시지 수
+    """
+
+    def __init__(self):
+        """추적기 초기화"""
+        self._대기태그 = deque()
+        self._완료: Dict[int, bool] = {}
+        self.확인프레임수 = 0
+        self.확인메시지수 = 0
+
+    def 등록(self, 태그: int):
+        """수신한 메시지의 delivery tag 등록 (채널의 태그는 항상 증가)"""
+        self._대기태그.append(태그)
+
+    def 완료(self, 태그: int, 성공: bool):
+        """
+        메시지 정산 결과 기록
+
+        Args:
+            태그: delivery tag
+            성공: True면 ACK 대상, False면 이미 개별 reject한 메시지
+        """
+        self._완료[태그] = 성공
+
+    def 확인가능태그(self) -> Optional[int]:
+        """
+        앞에서부터 연속으로 정산된 구간을 걷어내고 multiple ACK할 최대 성공 태그 반환
+
+        Returns:
+            int: basic_ack(multiple=True)에 사용할 태그 (확인할 성공 메시지가 없으면 None)
+        """
+        확인태그 = None
+        확인개수 = 0
+        while self._대기태그 and self._대기태그[0] in self._완료:
+            태그 = self._대기태그.popleft()
+            if self._완료.pop(태그):
+                확인태그 = 태그
+                확인개수 += 1
+
+        if 확인태그 is not None:
+            self.확인프레임수 += 1
+            self.확인메시지수 += 확인개수
+        return 확인태그
+
+    def 대기개수(self) -> int:
+        """아직 확인하지 않은 메시지 수"""
+        return len(self._대기태그)
+
+    def 통계조회(self) -> Dict[str, Any]:
+        """
+        확인 통계 조회
+
+        Returns:
+            dict: 대기 메시지 수, ACK 프레임 수, 프레임당 확인 메시지 수
+        """
+        return {
+            '확인대기': len(self._대기태그),
+            '확인프레임수': self.확인프레임수,
+            '확인메시지수': self.확인메시지수,
+            '프레임당메시지': (
+                round(self.확인메시지수 / self.확인프레임수, 1)
+                if self.확인프레임수 else 0
+            )
+        }
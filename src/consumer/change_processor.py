@@ -2,7 +2,6 @@
 # 명의변경 처리 서비스
 
 import time
-import random
 from typing import Dict, Any
 from src.consumer.base_processor import 기본처리서비스
 from src.common.message_models import BSS메시지, MessageType
@@ -14,6 +13,11 @@ class 명의변경처리서비스(기본처리서비스):
     CHANGE 타입 메시지만 처리
     """
     
+    기본처리시간범위 = (0.5, 3.0)
+    기본실패율 = 0.1
+    세부유형키 = '변경타입'
+    결과레코드키 = '변경정보'
+    
     def __init__(self):
         """명의변경 처리 서비스 초기화"""
         super().__init__(MessageType.CHANGE.value)
@@ -55,7 +59,7 @@ class 명의변경처리서비스(기본처리서비스):
             if 처리결과['성공']:
                 # 성공 시 통계 업데이트
                 변경타입 = 처리결과.get('변경타입', '개인전환')
-                self.명의변경통계[변경타입] += 1
+                self._통계증가(self.명의변경통계, 변경타입)
                 
                 self.로거.info(f"명의변경 처리 완료: {메시지.아이디} - {변경타입}")
                 
@@ -71,7 +75,7 @@ class 명의변경처리서비스(기본처리서비스):
                     }
                 }
             else:
-                self.명의변경통계['변경실패'] += 1
+                self._통계증가(self.명의변경통계, '변경실패')
                 return {
                     '성공': False,
                     '메시지': f'명의변경 처리 실패: {처리결과["오류"]}',
@@ -82,7 +86,7 @@ class 명의변경처리서비스(기본처리서비스):
                 }
                 
         except Exception as e:
-            self.명의변경통계['변경실패'] += 1
+            self._통계증가(self.명의변경통계, '변경실패')
             error_msg = f"명의변경 처리 중 예외 발생: {e}"
             self.로거.error(error_msg)
             
@@ -104,30 +108,18 @@ class 명의변경처리서비스(기본처리서비스):
             dict: 시뮬레이션 결과
         """
         try:
-            # 처리 시간 시뮬레이션 (0.5~3.0초 - 문서 검증 시간 포함)
-            처리시간 = random.uniform(0.5, 3.0)
-            time.sleep(처리시간)
+            # 처리 시간 시뮬레이션 (기본 0.5~3.0초 균등, SERVICE_TIME_CHANGE로 분포 변경)
+            처리시간 = self.처리시간분포.표본(self.난수)
+            self.시계.대기(처리시간)
             
-            # 변경 타입 랜덤 결정 (40% 개인전환, 25% 법인전환, 25% 가족간이동, 10% 실패)
-            rand = random.random()
-            if rand < 0.4:
-                변경타입 = '개인전환'
-                성공 = True
-            elif rand < 0.65:
-                변경타입 = '법인전환'
-                성공 = True
-            elif rand < 0.9:
-                변경타입 = '가족간이동'
-                성공 = True
-            else:
-                변경타입 = '변경실패'
-                성공 = False
+            # 변경 타입 결정 (기본 40% 개인전환, 25% 법인전환, 25% 가족간이동, 10% 실패)
+            변경타입, 성공 = self._결과유형선택({'개인전환': 40, '법인전환': 25, '가족간이동': 25}, '변경실패')
             
             if 성공:
                 # 성공 시뮬레이션
-                기존명의자 = f"고객{random.randint(1000, 9999)}"
-                신규명의자 = f"고객{random.randint(1000, 9999)}"
-                계약번호 = f"CONTRACT{random.randint(100000, 999999)}"
+                기존명의자 = f"고객{self.난수.randint(1000, 9999)}"
+                신규명의자 = f"고객{self.난수.randint(1000, 9999)}"
+                계약번호 = f"CONTRACT{self.난수.randint(100000, 999999)}"
                 
                 변경정보 = {
                     '기존명의자': 기존명의자,
@@ -140,11 +132,11 @@ class 명의변경처리서비스(기본처리서비스):
                 
                 # 변경 타입별 추가 정보
                 if 변경타입 == '법인전환':
-                    변경정보['사업자번호'] = f"{random.randint(100, 999)}-{random.randint(10, 99)}-{random.randint(10000, 99999)}"
-                    변경정보['법인명'] = f"(주)테스트{random.randint(1, 100)}"
+                    변경정보['사업자번호'] = f"{self.난수.randint(100, 999)}-{self.난수.randint(10, 99)}-{self.난수.randint(10000, 99999)}"
+                    변경정보['법인명'] = f"(주)테스트{self.난수.randint(1, 100)}"
                 elif 변경타입 == '가족간이동':
-                    변경정보['관계'] = random.choice(['배우자', '자녀', '부모', '형제자매'])
-                    변경정보['가족증명서'] = f"DOC{random.randint(100000, 999999)}"
+                    변경정보['관계'] = self.난수.choice(['배우자', '자녀', '부모', '형제자매'])
+                    변경정보['가족증명서'] = f"DOC{self.난수.randint(100000, 999999)}"
                 
                 return {
                     '성공': True,
@@ -154,7 +146,7 @@ class 명의변경처리서비스(기본처리서비스):
                 }
             else:
                 # 실패 시뮬레이션
-                오류원인 = random.choice([
+                오류원인 = self.난수.choice([
                     '신분증 확인 실패',
                     '서류 미비',
                     '신용정보 불량',
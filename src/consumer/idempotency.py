@@ -0,0 +1,153 @@
+# 파일 경로: src/consumer/idempotency.py
+# 메시지 아이디 기반 처리 완료 캐시 클래스 (중복 처리 방지)
+
+import time
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+
+class 처리완료캐시:
+    """
+    처리를 마친 메시지 아이디를 기억하여 재전달된 메시지를 다시 처리하지 않도록 하는 캐시
+
+    메모리 계층: OrderedDict 기반 LRU + TTL (조회/기록 O(1), 최대개수로 메모리 상한)
+    영속 계층(선택): SQLite 파일 - Consumer 재시작이나 같은 Pod의 다른 작업 프로세스가
+    처리한 아이디도 확인 (메모리에 없을 때만 조회하고, 찾으면 메모리로 올림)
+
+    처리 완료(ACK 직전)에 기록하므로, 처리 후 ACK 전에 연결이 끊겨 재전달된 메시지와
+    실패 후 requeue되어 다른 Consumer가 다시 받은 메시지 중 이미 성공한 것을 건너뜀
+
+    속성:
+        최대개수 (int): 메모리에 보관할 최대 아이디 수
+        TTL초 (float): 아이디 보관 시간(초)
+        조회수 (int): 확인 호출 수
+        적중수 (int): 이미 처리된 아이디로 확인된 수
+    """
+
+    _정리주기 = 1000
+
+    def __init__(self, 최대개수: int = 100000, TTL초: float = 3600, 저장경로: Optional[str] = None):
+        """
+        처리 완료 캐시 초기화
+
+        Args:
+            최대개수: 메모리 보관 최대 아이디 수
+            TTL초: 아이디 보관 시간(초)
+            저장경로: SQLite 파일 경로 (None이면 메모리만 사용)
+        """
+        self.최대개수 = max(1, 최대개수)
+        self.TTL초 = TTL초
+        self._항목: 'OrderedDict[str, float]' = OrderedDict()  # 아이디 -> 만료 시각
+        self._잠금 = threading.Lock()
+
+        self.조회수 = 0
+        self.적중수 = 0
+        self.영속적중수 = 0
+        self._기록수 = 0
+
+        self._db: Optional[sqlite3.Connection] = None
+        if 저장경로:
+            self._db = sqlite3.connect(저장경로, check_same_thread=False, isolation_level=None)
+            # 여러 작업 프로세스가 같은 파일을 쓰므로 WAL + 잠금 대기
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('PRAGMA synchronous=NORMAL')
+            self._db.execute('PRAGMA busy_timeout=1000')
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS processed (id TEXT PRIMARY KEY, expires REAL NOT NULL)'
+            )
+
+    def 확인(self, 아이디: str) -> bool:
+        """
+        이미 처리를 마친 아이디인지 확인
+
+        Args:
+            아이디: 메시지 아이디
+
+        Returns:
+            bool: 처리 완료 기록이 있고 만료되지 않았으면 True
+        """
+        지금 = time.time()
+        with self._잠금:
+            self.조회수 += 1
+            만료 = self._항목.get(아이디)
+            if 만료 is not None:
+                if 만료 > 지금:
+                    self._항목.move_to_end(아이디)
+                    self.적중수 += 1
+                    return True
+                del self._항목[아이디]
+
+            if self._db is None:
+                return False
+            try:
+                행 = self._db.execute(
+                    'SELECT expires FROM processed WHERE id = ?', (아이디,)
+                ).fetchone()
+            except sqlite3.Error:
+                return False
+            if 행 is None or 행[0] <= 지금:
+                return False
+            self._메모리기록(아이디, 행[0])
+            self.적중수 += 1
+            self.영속적중수 += 1
+            return True
+
+    def 기록(self, 아이디: str):
+        """
+        처리 완료 아이디 기록
+
+        Args:
+            아이디: 메시지 아이디
+        """
+        만료 = time.time() + self.TTL초
+        with self._잠금:
+            self._메모리기록(아이디, 만료)
+            if self._db is None:
+                return
+            try:
+                self._db.execute(
+                    'INSERT OR REPLACE INTO processed (id, expires) VALUES (?, ?)', (아이디, 만료)
+                )
+                self._기록수 += 1
+                if self._기록수 % self._정리주기 == 0:
+                    self._db.execute('DELETE FROM processed WHERE expires <= ?', (time.time(),))
+            except sqlite3.Error:
+                # 영속 계층 실패는 중복 방지 범위만 줄어들 뿐 처리에는 영향 없음
+                pass
+
+    def _메모리기록(self, 아이디: str, 만료: float):
+        """메모리 LRU에 기록하고 최대개수를 넘으면 가장 오래 쓰지 않은 아이디 제거"""
+        self._항목[아이디] = 만료
+        self._항목.move_to_end(아이디)
+        while len(self._항목) > self.최대개수:
+            self._항목.popitem(last=False)
+
+    def 적중률(self) -> float:
+        """조회 대비 적중 비율(%)"""
+        return round(self.적중수 / self.조회수 * 100, 2) if self.조회수 else 0.0
+
+    def 통계조회(self) -> Dict[str, Any]:
+        """
+        캐시 통계 조회
+
+        Returns:
+            dict: 보관 개수, 조회/적중 수, 적중률, 영속 계층 사용 여부
+        """
+        return {
+            '보관개수': len(self._항목),
+            '최대개수': self.최대개수,
+            '조회수': self.조회수,
+            '적중수': self.적중수,
+            '영속적중수': self.영속적중수,
+            '적중률': f"{self.적중률()}%",
+            '영속계층': self._db is not None
+        }
+
+    def 닫기(self):
+        """SQLite 연결 종료"""
+        with self._잠금:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
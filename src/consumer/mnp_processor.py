@@ -2,7 +2,6 @@
 # 번호이동 처리 서비스
 
 import time
-import random
 from typing import Dict, Any
 from src.consumer.base_processor import 기본처리서비스
 from src.common.message_models import BSS메시지, MessageType
@@ -14,6 +13,11 @@ class 번호이동처리서비스(기본처리서비스):
     MNP 타입 메시지만 처리
     """
     
+    기본처리시간범위 = (1.0, 5.0)
+    기본실패율 = 0.05
+    세부유형키 = '이동상태'
+    결과레코드키 = '이동정보'
+    
     def __init__(self):
         """번호이동 처리 서비스 초기화"""
         super().__init__(MessageType.MNP.value)
@@ -55,7 +59,7 @@ class 번호이동처리서비스(기본처리서비스):
             if 처리결과['성공']:
                 # 성공 시 통계 업데이트
                 이동상태 = 처리결과.get('이동상태', '이동완료')
-                self.번호이동통계[이동상태] += 1
+                self._통계증가(self.번호이동통계, 이동상태)
                 
                 self.로거.info(f"번호이동 처리 완료: {메시지.아이디} - {이동상태}")
                 
@@ -71,7 +75,7 @@ class 번호이동처리서비스(기본처리서비스):
                     }
                 }
             else:
-                self.번호이동통계['이동실패'] += 1
+                self._통계증가(self.번호이동통계, '이동실패')
                 return {
                     '성공': False,
                     '메시지': f'번호이동 처리 실패: {처리결과["오류"]}',
@@ -82,7 +86,7 @@ class 번호이동처리서비스(기본처리서비스):
                 }
                 
         except Exception as e:
-            self.번호이동통계['이동실패'] += 1
+            self._통계증가(self.번호이동통계, '이동실패')
             error_msg = f"번호이동 처리 중 예외 발생: {e}"
             self.로거.error(error_msg)
             
@@ -104,30 +108,18 @@ class 번호이동처리서비스(기본처리서비스):
             dict: 시뮬레이션 결과
         """
         try:
-            # 처리 시간 시뮬레이션 (1.0~5.0초 - MNP는 복잡한 처리)
-            처리시간 = random.uniform(1.0, 5.0)
-            time.sleep(처리시간)
+            # 처리 시간 시뮬레이션 (기본 1.0~5.0초 균등, SERVICE_TIME_MNP로 분포 변경)
+            처리시간 = self.처리시간분포.표본(self.난수)
+            self.시계.대기(처리시간)
             
-            # 번호이동 상태 랜덤 결정 (60% 완료, 25% 대기, 10% 취소, 5% 실패)
-            rand = random.random()
-            if rand < 0.6:
-                이동상태 = '이동완료'
-                성공 = True
-            elif rand < 0.85:
-                이동상태 = '이동대기'
-                성공 = True
-            elif rand < 0.95:
-                이동상태 = '이동취소'
-                성공 = True
-            else:
-                이동상태 = '이동실패'
-                성공 = False
+            # 번호이동 상태 결정 (기본 60% 완료, 25% 대기, 10% 취소, 5% 실패)
+            이동상태, 성공 = self._결과유형선택({'이동완료': 60, '이동대기': 25, '이동취소': 10}, '이동실패')
             
             if 성공:
                 # 성공 시뮬레이션
-                기존번호 = f"010{random.randint(10000000, 99999999)}"
-                신규번호 = f"010{random.randint(10000000, 99999999)}"
-                기증통신사 = random.choice(['SKT', 'KT', 'LGU+'])
+                기존번호 = f"010{self.난수.randint(10000000, 99999999)}"
+                신규번호 = f"010{self.난수.randint(10000000, 99999999)}"
+                기증통신사 = self.난수.choice(['SKT', 'KT', 'LGU+'])
                 
                 이동정보 = {
                     '기존번호': 기존번호,
@@ -140,7 +132,7 @@ class 번호이동처리서비스(기본처리서비스):
                 # 이동 대기인 경우 예상 완료일 추가
                 if 이동상태 == '이동대기':
                     이동정보['예상완료일'] = time.strftime('%Y-%m-%d', 
-                        time.localtime(time.time() + random.randint(86400, 259200)))  # 1-3일 후
+                        time.localtime(time.time() + self.난수.randint(86400, 259200)))  # 1-3일 후
                 
                 return {
                     '성공': True,
@@ -150,7 +142,7 @@ class 번호이동처리서비스(기본처리서비스):
                 }
             else:
                 # 실패 시뮬레이션
-                오류원인 = random.choice([
+                오류원인 = self.난수.choice([
                     '기증통신사 연동 실패',
                     '번호 중복',
                     '고객 정보 불일치',
@@ -0,0 +1,155 @@
+# 파일 경로: src/consumer/prefetch_controller.py
+# 처리 시간 기반 적응형 prefetch 제어 클래스
+
+import math
+import time
+from typing import Dict, Any, Optional
+
+
+class 적응형프리페치제어기:
+    """
+    관측한 처리 시간, 처리 중 메시지 수, ACK 지연으로 prefetch를 실시간 조정하는 제어기
+
+    목표값 (Little's law):
+        처리율 λ = 동시처리수 / 평균처리시간
+        목표 prefetch = 동시처리수 + ceil(λ × 보충지연)
+        → 작업자가 모두 바쁜 상태에서 브로커가 다음 메시지를 채워 넣는 동안(보충지연)
+          소비할 만큼만 미리 받아 둠. 빠른 타입은 크게, 느린 타입(MNP 1~5초)은 작업자 수 근처로
+
+    조정 (AIMD):
+        현재값 < 목표이고 주기 중 처리 중 메시지 수가 prefetch까지 찼으면:
+            증가단계씩 더해 목표까지 증가 (가산 증가, 큐가 비어 창이 남으면 늘리지 않음)
+        현재값 > 목표이고 로컬 대기(ACK 지연 - 처리시간)가 보충지연보다 길면:
+            감소비율을 곱해 목표까지 감소 (승산 감소) - 받아 두고 처리하지 못하는 메시지를
+            놀고 있는 다른 Pod가 가져갈 수 있도록 반환
+
+    연결 스레드(또는 이벤트 루프)에서만 호출
+
+    속성:
+        현재값 (int): 현재 적용 중인 prefetch
+        동시처리수 (int): 동시에 처리하는 메시지 수 (작업자 수 × 일괄크기)
+    """
+
+    _평활계수 = 0.2
+
+    def __init__(self, 초기값: int, 동시처리수: int, 최소값: int = 1, 최대값: int = 500,
+                 보충지연: float = 0.2, 조정간격: float = 5.0, 증가단계: Optional[int] = None,
+                 감소비율: float = 0.5, 최소표본: int = 10):
+        """
+        적응형 prefetch 제어기 초기화
+
+        Args:
+            초기값: 시작 prefetch
+            동시처리수: 동시에 처리하는 메시지 수
+            최소값: prefetch 하한
+            최대값: prefetch 상한
+            보충지연: 브로커가 새 메시지를 채워 넣는 데 걸린다고 보는 시간(초)
+            조정간격: 조정 주기(초)
+            증가단계: 가산 증가 폭 (None이면 동시처리수)
+            감소비율: 승산 감소 비율
+            최소표본: 조정 전에 필요한 주기당 최소 관측 수
+        """
+        self.동시처리수 = max(1, 동시처리수)
+        self.최소값 = max(1, 최소값)
+        self.최대값 = max(self.최소값, 최대값)
+        self.보충지연 = 보충지연
+        self.조정간격 = 조정간격
+        self.증가단계 = 증가단계 or self.동시처리수
+        self.감소비율 = 감소비율
+        self.최소표본 = 최소표본
+
+        self.현재값 = self._제한(초기값)
+        self.평균처리시간: Optional[float] = None
+        self.평균ACK지연: Optional[float] = None
+        self.최대처리중 = 0
+        self.조정횟수 = 0
+        self._표본수 = 0
+        self._다음조정시각 = time.monotonic() + 조정간격
+
+    def _제한(self, 값: int) -> int:
+        """최소/최대값 범위로 제한"""
+        return max(self.최소값, min(self.최대값, int(값)))
+
+    def _평활(self, 이전: Optional[float], 새값: float) -> float:
+        """지수 가중 이동 평균"""
+        if 이전 is None:
+            return 새값
+        return 이전 + self._평활계수 * (새값 - 이전)
+
+    def 관측(self, 처리시간: float, ACK지연: float, 처리중개수: int):
+        """
+        메시지 하나의 처리 결과 관측
+
+        Args:
+            처리시간: 메시지처리 소요 시간(초)
+            ACK지연: 수신부터 ACK/NACK까지 걸린 시간(초) - 로컬 대기 시간 포함
+            처리중개수: 관측 시점의 처리 중 메시지 수
+        """
+        self.평균처리시간 = self._평활(self.평균처리시간, 처리시간)
+        self.평균ACK지연 = self._평활(self.평균ACK지연, ACK지연)
+        self.최대처리중 = max(self.최대처리중, 처리중개수)
+        self._표본수 += 1
+
+    def 목표값(self) -> Optional[int]:
+        """Little's law 목표 prefetch (관측 전이면 None)"""
+        if self.평균처리시간 is None:
+            return None
+        처리율 = self.동시처리수 / max(self.평균처리시간, 1e-3)
+        return self._제한(self.동시처리수 + math.ceil(처리율 * self.보충지연))
+
+    def 로컬대기(self) -> float:
+        """수신 후 처리 시작까지 Consumer 안에서 기다린 평균 시간(초)"""
+        if self.평균처리시간 is None or self.평균ACK지연 is None:
+            return 0.0
+        return max(0.0, self.평균ACK지연 - self.평균처리시간)
+
+    def 조정(self, 지금: Optional[float] = None) -> Optional[int]:
+        """
+        조정 주기가 되었으면 새 prefetch 계산
+
+        Args:
+            지금: 현재 시각 (time.monotonic, 테스트용)
+
+        Returns:
+            int: 변경할 prefetch (바꿀 필요가 없으면 None)
+        """
+        지금 = time.monotonic() if 지금 is None else 지금
+        if 지금 < self._다음조정시각:
+            return None
+        self._다음조정시각 = 지금 + self.조정간격
+
+        표본수, self._표본수 = self._표본수, 0
+        포화 = self.최대처리중 >= self.현재값
+        self.최대처리중 = 0
+        목표 = self.목표값()
+        if 목표 is None or 표본수 < self.최소표본:
+            return None
+
+        새값 = self.현재값
+        if self.현재값 < 목표 and 포화:
+            새값 = min(목표, self.현재값 + self.증가단계)
+        elif self.현재값 > 목표 and self.로컬대기() > self.보충지연:
+            새값 = max(목표, math.floor(self.현재값 * self.감소비율))
+
+        새값 = self._제한(새값)
+        if 새값 == self.현재값:
+            return None
+        self.현재값 = 새값
+        self.조정횟수 += 1
+        return 새값
+
+    def 상태조회(self) -> Dict[str, Any]:
+        """
+        제어기 상태 조회
+
+        Returns:
+            dict: 현재/목표 prefetch, 평균 처리 시간, 평균 ACK 지연, 조정 횟수
+        """
+        return {
+            '현재값': self.현재값,
+            '목표값': self.목표값(),
+            '평균처리시간': round(self.평균처리시간, 3) if self.평균처리시간 is not None else None,
+            '평균ACK지연': round(self.평균ACK지연, 3) if self.평균ACK지연 is not None else None,
+            '로컬대기': round(self.로컬대기(), 3),
+            '조정횟수': self.조정횟수
+        }
@@ -0,0 +1,324 @@
+# 파일 경로: src/consumer/prefork_supervisor.py
+# 다중 프로세스 Consumer 감독 클래스 (prefork 방식)
+
+import os
+import sys
+import time
+import json
+import signal
+import argparse
+import threading
+import importlib
+import multiprocessing
+from typing import Dict, Any, Optional, List
+
+from src.common.config import 설정가져오기
+
+
+# 처리 타입별 처리 서비스 클래스 경로 ("모듈:클래스")
+처리서비스경로 = {
+    'SUBSCRIPTION': 'src.consumer.subscription_processor:가입처리서비스',
+    'MNP': 'src.consumer.mnp_processor:번호이동처리서비스',
+    'CHANGE': 'src.consumer.change_processor:명의변경처리서비스',
+    'TERMINATION': 'src.consumer.termination_processor:해지처리서비스'
+}
+
+# 공유 메모리 슬롯의 필드 순서 (작업 프로세스마다 한 슬롯)
+통계필드 = ('총처리개수', '성공처리개수', '실패처리개수', '재시도개수', '데드레터개수', '처리중개수', '갱신시각')
+_누적필드 = 통계필드[:6]
+# 작업 프로세스가 재시작해도 이어서 합산할 누적 카운터 (처리중개수는 현재값이므로 제외)
+_이월필드 = 통계필드[:5]
+
+
+def _처리서비스클래스(경로: str):
+    """'모듈:클래스' 경로 또는 처리 타입으로 처리 서비스 클래스 로드"""
+    경로 = 처리서비스경로.get(경로.upper(), 경로)
+    모듈이름, _, 클래스이름 = 경로.partition(':')
+    return getattr(importlib.import_module(모듈이름), 클래스이름)
+
+
+def _통계기록(공유통계, 슬롯: int, 통계: Dict[str, Any]):
+    """
+    작업 프로세스의 처리 통계를 공유 메모리 슬롯에 기록
+
+    Args:
+        공유통계: multiprocessing.Array('d')
+        슬롯: 작업 프로세스 번호
+        통계: 처리통계조회() 결과
+    """
+    기본통계 = 통계['기본통계']
+    값들 = [float(기본통계.get(필드, 0)) for 필드 in _누적필드[:5]]
+    값들.append(float(통계.get('상태정보', {}).get('처리중개수', 0)))
+    값들.append(time.time())
+
+    시작 = 슬롯 * len(통계필드)
+    with 공유통계.get_lock():
+        공유통계[시작:시작 + len(통계필드)] = 값들
+
+
+def _작업프로세스실행(경로: str, 슬롯: int, 공유통계, 중단이벤트, 보고간격: float):
+    """
+    작업 프로세스 본체: 처리 서비스 하나를 실행하며 주기적으로 통계를 공유 메모리에 기록
+
+    처리 스레드가 죽으면 종료 코드 1로 끝나 감독자가 다시 띄움
+
+    Args:
+        경로: 처리 서비스 클래스 경로 또는 처리 타입
+        슬롯: 작업 프로세스 번호
+        공유통계: 통계 공유 메모리
+        중단이벤트: 감독자의 종료 신호
+        보고간격: 통계 기록 주기(초)
+    """
+    # Ctrl+C는 감독자가 받아 중단이벤트로 전달, SIGTERM은 이 프로세스만 종료
+    # (중단이벤트는 감독자와 모든 작업 프로세스가 공유하므로 자기 종료 신호는 따로 둠)
+    자체중단 = threading.Event()
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, lambda signum, frame: 자체중단.set())
+
+    processor = _처리서비스클래스(경로)()
+    종료코드 = 0
+    try:
+        processor.메시지처리시작()
+        while not (자체중단.is_set() or 중단이벤트.wait(보고간격)):
+            _통계기록(공유통계, 슬롯, processor.처리통계조회())
+            if not (processor.처리스레드 and processor.처리스레드.is_alive()):
+                processor.로거.error(f"작업 프로세스 {슬롯} 처리 스레드 종료 - 재시작 필요")
+                종료코드 = 1
+                break
+    finally:
+        processor.메시지처리중지()
+        _통계기록(공유통계, 슬롯, processor.처리통계조회())
+    sys.exit(종료코드)
+
+
+class 프리포크감독자:
+    """
+    처리 서비스 하나를 작업 프로세스 N개로 fork하여 실행하고 감시하는 감독자
+
+    작업 프로세스는 각자 RabbitMQ 연결과 처리 스레드를 가지며 (GIL을 나누지 않으므로
+    CPU 위주 처리도 Pod의 모든 코어 사용), 처리 통계를 공유 메모리의 자기 슬롯에 기록
+    죽은 작업 프로세스는 지수 백오프로 다시 띄움
+
+    속성:
+        경로 (str): 처리 서비스 클래스 경로 또는 처리 타입
+        작업프로세스수 (int): 실행할 작업 프로세스 수
+        재시작횟수 (list): 슬롯별 재시작 횟수
+        이전통계 (list): 슬롯별로 종료된 작업 프로세스들이 마지막으로 보고한 누적 카운터 합계
+    """
+
+    def __init__(self, 경로: str, 작업프로세스수: Optional[int] = None, 보고간격: float = 1.0,
+                 재시작지연: float = 1.0, 최대재시작지연: float = 30.0, 정상실행시간: float = 60.0):
+        """
+        감독자 초기화
+
+        Args:
+            경로: 처리 타입 (SUBSCRIPTION 등) 또는 '모듈:클래스' 경로
+            작업프로세스수: 작업 프로세스 수 (None이면 설정, 0이면 CPU 코어 수)
+            보고간격: 작업 프로세스의 통계 기록 주기(초)
+            재시작지연: 첫 재시작 대기 시간(초), 연속 실패 시 두 배씩 증가
+            최대재시작지연: 재시작 대기 시간 상한(초)
+            정상실행시간: 이 시간 이상 실행된 뒤 죽으면 재시작 지연을 초기화(초)
+        """
+        self.설정 = 설정가져오기()
+        self.로거 = self.설정.로거설정(f"{self.__class__.__name__}")
+
+        if 작업프로세스수 is None:
+            작업프로세스수 = self.설정.처리설정가져오기()['작업프로세스수']
+        self.경로 = 경로
+        self.작업프로세스수 = max(1, 작업프로세스수 or os.cpu_count() or 1)
+        self.보고간격 = 보고간격
+        self.재시작지연 = 재시작지연
+        self.최대재시작지연 = 최대재시작지연
+        self.정상실행시간 = 정상실행시간
+
+        # fork는 부모의 import 상태를 그대로 물려받아 시작이 빠름 (지원하지 않는 플랫폼은 spawn)
+        방식 = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn'
+        self._컨텍스트 = multiprocessing.get_context(방식)
+        self._공유통계 = self._컨텍스트.Array('d', self.작업프로세스수 * len(통계필드))
+        self._중단이벤트 = self._컨텍스트.Event()
+
+        self._프로세스들: List[Optional[multiprocessing.Process]] = [None] * self.작업프로세스수
+        self._시작시각 = [0.0] * self.작업프로세스수
+        self._연속실패 = [0] * self.작업프로세스수
+        self._재시작예정 = [0.0] * self.작업프로세스수
+        self.재시작횟수 = [0] * self.작업프로세스수
+        self.이전통계 = [dict.fromkeys(_이월필드, 0) for _ in range(self.작업프로세스수)]
+
+    def _작업프로세스시작(self, 슬롯: int):
+        """슬롯의 작업 프로세스 시작"""
+        프로세스 = self._컨텍스트.Process(
+            target=_작업프로세스실행,
+            args=(self.경로, 슬롯, self._공유통계, self._중단이벤트, self.보고간격),
+            name=f"consumer-worker-{슬롯}",
+            daemon=False
+        )
+        프로세스.start()
+        self._프로세스들[슬롯] = 프로세스
+        self._시작시각[슬롯] = time.monotonic()
+        self.로거.info(f"작업 프로세스 {슬롯} 시작 (pid {프로세스.pid})")
+
+    def 시작(self):
+        """모든 작업 프로세스 시작"""
+        self._중단이벤트.clear()
+        for 슬롯 in range(self.작업프로세스수):
+            self._작업프로세스시작(슬롯)
+        self.로거.info(f"{self.경로} 작업 프로세스 {self.작업프로세스수}개 시작")
+
+    def 상태점검(self):
+        """
+        죽은 작업 프로세스를 찾아 재시작 예약 및 예약 시각이 된 슬롯 재시작
+        (감독 루프에서 주기적으로 호출)
+        """
+        if self._중단이벤트.is_set():
+            return
+        지금 = time.monotonic()
+
+        for 슬롯, 프로세스 in enumerate(self._프로세스들):
+            if 프로세스 is None or 프로세스.is_alive():
+                continue
+
+            if not self._재시작예정[슬롯]:
+                실행시간 = 지금 - self._시작시각[슬롯]
+                if 실행시간 >= self.정상실행시간:
+                    self._연속실패[슬롯] = 0
+                지연 = min(self.최대재시작지연, self.재시작지연 * (2 ** self._연속실패[슬롯]))
+                self._연속실패[슬롯] += 1
+                self._재시작예정[슬롯] = 지금 + 지연
+                self.로거.warning(
+                    f"작업 프로세스 {슬롯} 종료 (pid {프로세스.pid}, 종료코드 {프로세스.exitcode}) "
+                    f"- {지연:.1f}초 후 재시작"
+                )
+            elif 지금 >= self._재시작예정[슬롯]:
+                self._재시작예정[슬롯] = 0.0
+                self.재시작횟수[슬롯] += 1
+                self._슬롯통계이월(슬롯)
+                self._작업프로세스시작(슬롯)
+
+    def 중지(self, 타임아웃: float = 35):
+        """
+        모든 작업 프로세스에 종료 신호를 보내고 대기 (처리 중 메시지 마무리 시간 포함)
+
+        Args:
+            타임아웃: 전체 대기 시간(초), 넘기면 강제 종료
+        """
+        self._중단이벤트.set()
+        마감 = time.monotonic() + 타임아웃
+        for 슬롯, 프로세스 in enumerate(self._프로세스들):
+            if 프로세스 is None:
+                continue
+            프로세스.join(max(0.0, 마감 - time.monotonic()))
+            if 프로세스.is_alive():
+                self.로거.warning(f"작업 프로세스 {슬롯} 강제 종료 (pid {프로세스.pid})")
+                프로세스.kill()
+                프로세스.join()
+        self.로거.info("모든 작업 프로세스 종료 완료")
+
+    def 실행(self, 점검간격: float = 1.0, 통계간격: float = 10.0):
+        """
+        작업 프로세스를 시작하고 종료 신호가 올 때까지 감시 (메인 실행부용)
+
+        Args:
+            점검간격: 상태 점검 주기(초)
+            통계간격: 합산 통계 로그 주기(초, 모니터링 활성화 시)
+        """
+        def signal_handler(signum, frame):
+            self.로거.info("종료 신호 수신, 작업 프로세스 종료 중...")
+            self._중단이벤트.set()
+
+        signal.signal(signal.SIGINT, signal_handler)
+        signal.signal(signal.SIGTERM, signal_handler)
+
+        self.시작()
+        다음통계 = time.monotonic() + 통계간격
+        try:
+            while not self._중단이벤트.wait(점검간격):
+                self.상태점검()
+                if self.설정.모니터링상태확인() and time.monotonic() >= 다음통계:
+                    다음통계 = time.monotonic() + 통계간격
+                    self.로거.info(f"합산 처리 통계: {self.처리통계조회()['기본통계']}")
+        finally:
+            self.중지()
+
+    def _슬롯통계이월(self, 슬롯: int):
+        """
+        종료된 작업 프로세스가 마지막으로 보고한 누적 카운터를 이전통계로 옮기고 슬롯 초기화
+        (새 작업 프로세스는 카운터 0부터 같은 슬롯을 덮어쓰므로 합산 통계가 줄지 않도록 함)
+        """
+        시작 = 슬롯 * len(통계필드)
+        with self._공유통계.get_lock():
+            값들 = self._공유통계[시작:시작 + len(통계필드)]
+            self._공유통계[시작:시작 + len(통계필드)] = [0.0] * len(통계필드)
+        for 필드, 값 in zip(통계필드, 값들):
+            if 필드 in self.이전통계[슬롯]:
+                self.이전통계[슬롯][필드] += int(값)
+
+    def _슬롯통계(self, 슬롯: int) -> Dict[str, float]:
+        """공유 메모리에서 슬롯 통계 읽기"""
+        시작 = 슬롯 * len(통계필드)
+        with self._공유통계.get_lock():
+            값들 = self._공유통계[시작:시작 + len(통계필드)]
+        return dict(zip(통계필드, 값들))
+
+    def 처리통계조회(self) -> Dict[str, Any]:
+        """
+        모든 작업 프로세스의 통계를 합산하여 조회 (기본처리서비스.처리통계조회와 같은 형태)
+        누적 카운터는 재시작 전 작업 프로세스들의 이전통계를 더한 값
+
+        Returns:
+            dict: 합산 처리 통계와 작업 프로세스별 상태
+        """
+        합계 = dict.fromkeys(_누적필드, 0)
+        작업프로세스목록 = []
+        for 슬롯, 프로세스 in enumerate(self._프로세스들):
+            슬롯통계 = self._슬롯통계(슬롯)
+            for 필드 in _누적필드:
+                합계[필드] += int(슬롯통계[필드]) + self.이전통계[슬롯].get(필드, 0)
+            작업프로세스목록.append({
+                '슬롯': 슬롯,
+                'pid': 프로세스.pid if 프로세스 else None,
+                '실행중': bool(프로세스 and 프로세스.is_alive()),
+                '재시작횟수': self.재시작횟수[슬롯],
+                '총처리개수': int(슬롯통계['총처리개수']) + self.이전통계[슬롯]['총처리개수'],
+                '처리중개수': int(슬롯통계['처리중개수']),
+                '마지막보고': 슬롯통계['갱신시각'] or None
+            })
+
+        총처리개수 = 합계['총처리개수']
+        성공률 = round(
+            합계['성공처리개수'] / 총처리개수 * 100, 2
+        ) if 총처리개수 > 0 else 0
+
+        return {
+            '처리타입': self.경로,
+            '기본통계': {
+                '총처리개수': 총처리개수,
+                '성공처리개수': 합계['성공처리개수'],
+                '실패처리개수': 합계['실패처리개수'],
+                '재시도개수': 합계['재시도개수'],
+                '데드레터개수': 합계['데드레터개수'],
+                '성공률': f"{성공률}%"
+            },
+            '상태정보': {
+                '작업프로세스수': self.작업프로세스수,
+                '실행중프로세스수': sum(1 for 항목 in 작업프로세스목록 if 항목['실행중']),
+                '처리중개수': 합계['처리중개수'],
+                '총재시작횟수': sum(self.재시작횟수)
+            },
+            '작업프로세스': 작업프로세스목록
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='처리 서비스를 여러 작업 프로세스로 실행')
+    parser.add_argument('processor', help='처리 타입 (SUBSCRIPTION, MNP, CHANGE, TERMINATION) 또는 모듈:클래스')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='작업 프로세스 수 (기본: CONSUMER_PROCESSES, 0이면 CPU 코어 수)')
+    args = parser.parse_args()
+
+    감독자 = 프리포크감독자(args.processor, args.workers)
+    감독자.실행()
+    print(json.dumps(감독자.처리통계조회(), ensure_ascii=False, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
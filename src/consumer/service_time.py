@@ -0,0 +1,258 @@
+# 파일 경로: src/consumer/service_time.py
+# 처리시뮬레이션용 처리 시간 분포 클래스 (균등/로그정규/감마/파레토/이봉/경험 분포)
+
+import math
+import bisect
+import random
+from typing import Dict, Any, List, Optional, Tuple
+
+
+class 처리시간분포:
+    """
+    처리 시간 분포 기본 클래스
+
+    표본(난수)으로 처리 시간(초)을 뽑음 - 난수는 처리 서비스의 시드 난수를 받아 재현성 유지
+    """
+
+    이름 = ''
+
+    def 표본(self, 난수: random.Random) -> float:
+        """처리 시간 표본 (초)"""
+        raise NotImplementedError
+
+    def 평균(self) -> float:
+        """분포의 평균 처리 시간 (초)"""
+        raise NotImplementedError
+
+    def 정보(self) -> Dict[str, Any]:
+        """분포 이름과 파라미터 (상태 조회/로그용)"""
+        return {'분포': self.이름, **{
+            키.lstrip('_'): 값 for 키, 값 in vars(self).items() if not isinstance(값, (list, 처리시간분포))
+        }}
+
+
+class 균등분포(처리시간분포):
+    """최소~최대 사이 균등 분포 (기존 처리시뮬레이션 기본값)"""
+
+    이름 = 'uniform'
+
+    def __init__(self, low: float, high: float):
+        if not 0 <= low <= high:
+            raise ValueError(f"uniform 범위 오류: low={low}, high={high}")
+        self.low = low
+        self.high = high
+
+    def 표본(self, 난수: random.Random) -> float:
+        return 난수.uniform(self.low, self.high)
+
+    def 평균(self) -> float:
+        return (self.low + self.high) / 2
+
+
+class 로그정규분포(처리시간분포):
+    """
+    로그정규 분포 (중앙값과 로그 표준편차로 지정, 대부분의 원격 호출 지연에 가까운 오른쪽 꼬리)
+
+    median=1.0, sigma=0.5면 p99 ≈ 3.2초, sigma=1.0이면 p99 ≈ 10초
+    """
+
+    이름 = 'lognormal'
+
+    def __init__(self, median: float, sigma: float):
+        if median <= 0 or sigma < 0:
+            raise ValueError(f"lognormal 파라미터 오류: median={median}, sigma={sigma}")
+        self.median = median
+        self.sigma = sigma
+
+    def 표본(self, 난수: random.Random) -> float:
+        return 난수.lognormvariate(math.log(self.median), self.sigma)
+
+    def 평균(self) -> float:
+        return self.median * math.exp(self.sigma ** 2 / 2)
+
+
+class 감마분포(처리시간분포):
+    """감마 분포 (평균 = shape × scale, shape가 작을수록 변동이 큼)"""
+
+    이름 = 'gamma'
+
+    def __init__(self, shape: float, scale: float):
+        if shape <= 0 or scale <= 0:
+            raise ValueError(f"gamma 파라미터 오류: shape={shape}, scale={scale}")
+        self.shape = shape
+        self.scale = scale
+
+    def 표본(self, 난수: random.Random) -> float:
+        return 난수.gammavariate(self.shape, self.scale)
+
+    def 평균(self) -> float:
+        return self.shape * self.scale
+
+
+class 파레토분포(처리시간분포):
+    """
+    파레토 분포 (최소값 xmin, 꼬리 지수 alpha - alpha가 작을수록 꼬리가 두꺼움)
+
+    alpha ≤ 1이면 평균이 무한이므로 cap(초)으로 상한을 둠 (처리 타임아웃에 해당)
+    """
+
+    이름 = 'pareto'
+
+    def __init__(self, xmin: float, alpha: float, cap: Optional[float] = None):
+        if xmin <= 0 or alpha <= 0 or (cap is not None and cap < xmin):
+            raise ValueError(f"pareto 파라미터 오류: xmin={xmin}, alpha={alpha}, cap={cap}")
+        self.xmin = xmin
+        self.alpha = alpha
+        self.cap = cap
+
+    def 표본(self, 난수: random.Random) -> float:
+        값 = self.xmin * 난수.paretovariate(self.alpha)
+        return min(값, self.cap) if self.cap is not None else 값
+
+    def 평균(self) -> float:
+        if self.cap is None:
+            return self.xmin * self.alpha / (self.alpha - 1) if self.alpha > 1 else math.inf
+        # 상한을 둔 파레토의 평균 (적분 결과)
+        비 = self.xmin / self.cap
+        if self.alpha == 1:
+            꼬리 = self.xmin * math.log(self.cap / self.xmin)
+        else:
+            꼬리 = self.alpha * self.xmin / (self.alpha - 1) * (1 - 비 ** (self.alpha - 1))
+        return 꼬리 + self.cap * 비 ** self.alpha
+
+
+class 이봉분포(처리시간분포):
+    """
+    빠른 경로와 느린 경로가 섞인 이봉 분포 (캐시 적중/미스, 외부 연동 유무 등)
+
+    slow_ratio 비율로 느린 로그정규 분포(slow), 나머지는 빠른 로그정규 분포(fast)에서 뽑음
+    """
+
+    이름 = 'bimodal'
+
+    def __init__(self, fast: float, slow: float, slow_ratio: float, sigma: float = 0.3):
+        if not 0 <= slow_ratio <= 1:
+            raise ValueError(f"bimodal slow_ratio 범위 오류: {slow_ratio}")
+        self.slow_ratio = slow_ratio
+        self._빠른분포 = 로그정규분포(fast, sigma)
+        self._느린분포 = 로그정규분포(slow, sigma)
+        self.fast = fast
+        self.slow = slow
+        self.sigma = sigma
+
+    def 표본(self, 난수: random.Random) -> float:
+        분포 = self._느린분포 if 난수.random() < self.slow_ratio else self._빠른분포
+        return 분포.표본(난수)
+
+    def 평균(self) -> float:
+        return (1 - self.slow_ratio) * self._빠른분포.평균() + self.slow_ratio * self._느린분포.평균()
+
+
+class 경험분포(처리시간분포):
+    """
+    기록된 지연 시간 히스토그램 파일에서 읽은 경험 분포
+
+    파일 형식: 한 줄에 '상한(초),건수' (# 주석과 빈 줄 무시, 상한 오름차순)
+    구간 i는 (이전 상한, 상한] 범위이며, 건수 비율로 구간을 고른 뒤 구간 안에서 균등하게 뽑음
+    Prometheus 히스토그램처럼 누적 건수로 기록한 파일은 cumulative=true로 지정
+    """
+
+    이름 = 'empirical'
+
+    def __init__(self, path: str, cumulative: bool = False):
+        self.path = path
+        self._구간 = self._파일읽기(path, cumulative)
+        self._누적: List[int] = []
+        합계 = 0
+        for _, _, 건수 in self._구간:
+            합계 += 건수
+            self._누적.append(합계)
+        if 합계 <= 0:
+            raise ValueError(f"empirical 히스토그램에 건수가 없음: {path}")
+
+    @staticmethod
+    def _파일읽기(경로: str, 누적: bool) -> List[Tuple[float, float, int]]:
+        """히스토그램 파일을 (하한, 상한, 건수) 구간 목록으로 변환"""
+        구간 = []
+        하한 = 0.0
+        이전누적 = 0
+        with open(경로, encoding='utf-8') as 파일:
+            for 줄번호, 줄 in enumerate(파일, 1):
+                줄 = 줄.split('#', 1)[0].strip()
+                if not 줄:
+                    continue
+                try:
+                    상한문자열, 건수문자열 = (값.strip() for 값 in 줄.split(','))
+                    상한, 건수 = float(상한문자열), int(float(건수문자열))
+                except ValueError:
+                    raise ValueError(f"{경로}:{줄번호} 형식 오류 (상한,건수): {줄}")
+                if 상한 < 하한:
+                    raise ValueError(f"{경로}:{줄번호} 상한이 오름차순이 아님: {상한}")
+                if 누적:
+                    건수, 이전누적 = 건수 - 이전누적, 건수
+                if 건수 < 0:
+                    raise ValueError(f"{경로}:{줄번호} 건수가 음수: {건수}")
+                구간.append((하한, 상한, 건수))
+                하한 = 상한
+        return 구간
+
+    def 표본(self, 난수: random.Random) -> float:
+        위치 = bisect.bisect_right(self._누적, 난수.random() * self._누적[-1])
+        하한, 상한, _ = self._구간[min(위치, len(self._구간) - 1)]
+        return 난수.uniform(하한, 상한)
+
+    def 평균(self) -> float:
+        return sum((하한 + 상한) / 2 * 건수 for 하한, 상한, 건수 in self._구간) / self._누적[-1]
+
+
+# 분포 이름 → 클래스 (새 분포는 처리시간분포를 상속해 여기에 등록)
+분포등록 = {
+    클래스.이름: 클래스
+    for 클래스 in (균등분포, 로그정규분포, 감마분포, 파레토분포, 이봉분포, 경험분포)
+}
+
+
+def _값변환(값: str) -> Any:
+    """명세 문자열의 파라미터 값을 숫자/불리언/문자열로 변환"""
+    if 값.lower() in ('true', 'false'):
+        return 값.lower() == 'true'
+    try:
+        return float(값)
+    except ValueError:
+        return 값
+
+
+def 분포생성(명세: str) -> 처리시간분포:
+    """
+    명세 문자열로 처리 시간 분포 생성
+
+    명세 형식: '이름:키=값,키=값' (예: 'lognormal:median=1.2,sigma=0.8',
+    'pareto:xmin=0.5,alpha=1.5,cap=60', 'empirical:path=/data/mnp_latency.csv')
+
+    Args:
+        명세: 분포 명세 문자열
+
+    Returns:
+        처리시간분포: 생성한 분포
+
+    Raises:
+        ValueError: 알 수 없는 분포 이름이나 잘못된 파라미터
+    """
+    이름, _, 파라미터문자열 = 명세.strip().partition(':')
+    클래스 = 분포등록.get(이름.strip().lower())
+    if 클래스 is None:
+        raise ValueError(f"알 수 없는 처리 시간 분포: {이름} (사용 가능: {', '.join(분포등록)})")
+
+    파라미터 = {}
+    for 항목 in 파라미터문자열.split(','):
+        if not 항목.strip():
+            continue
+        키, 구분자, 값 = 항목.partition('=')
+        if not 구분자:
+            raise ValueError(f"분포 파라미터 형식 오류 (키=값): {항목}")
+        파라미터[키.strip()] = _값변환(값.strip())
+
+    try:
+        return 클래스(**파라미터)
+    except TypeError as e:
+        raise ValueError(f"{이름} 분포 파라미터 오류: {e}")
@@ -2,7 +2,6 @@
 # 가입 처리 서비스
 
 import time
-import random
 from typing import Dict, Any
 from src.consumer.base_processor import 기본처리서비스
 from src.common.message_models import BSS메시지, MessageType
@@ -14,6 +13,11 @@ class 가입처리서비스(기본처리서비스):
     SUBSCRIPTION 타입 메시지만 처리
     """
     
+    기본처리시간범위 = (0.1, 2.0)
+    기본실패율 = 0.05
+    세부유형키 = '가입타입'
+    결과레코드키 = '고객정보'
+    
     def __init__(self):
         """가입 처리 서비스 초기화"""
         super().__init__(MessageType.SUBSCRIPTION.value)
@@ -54,7 +58,7 @@ class 가입처리서비스(기본처리서비스):
             if 처리결과['성공']:
                 # 성공 시 통계 업데이트
                 가입타입 = 처리결과.get('가입타입', '신규가입')
-                self.가입통계[가입타입] += 1
+                self._통계증가(self.가입통계, 가입타입)
                 
                 self.로거.info(f"가입 처리 완료: {메시지.아이디} - {가입타입}")
                 
@@ -70,7 +74,7 @@ class 가입처리서비스(기본처리서비스):
                     }
                 }
             else:
-                self.가입통계['가입실패'] += 1
+                self._통계증가(self.가입통계, '가입실패')
                 return {
                     '성공': False,
                     '메시지': f'가입 처리 실패: {처리결과["오류"]}',
@@ -81,7 +85,7 @@ class 가입처리서비스(기본처리서비스):
                 }
                 
         except Exception as e:
-            self.가입통계['가입실패'] += 1
+            self._통계증가(self.가입통계, '가입실패')
             error_msg = f"가입 처리 중 예외 발생: {e}"
             self.로거.error(error_msg)
             
@@ -103,26 +107,17 @@ class 가입처리서비스(기본처리서비스):
             dict: 시뮬레이션 결과
         """
         try:
-            # 처리 시간 시뮬레이션 (0.1~2.0초)
-            처리시간 = random.uniform(0.1, 2.0)
-            time.sleep(처리시간)
+            # 처리 시간 시뮬레이션 (기본 0.1~2.0초 균등, SERVICE_TIME_SUBSCRIPTION로 분포 변경)
+            처리시간 = self.처리시간분포.표본(self.난수)
+            self.시계.대기(처리시간)
             
-            # 가입 타입 랜덤 결정 (80% 신규가입, 15% 재가입, 5% 실패)
-            rand = random.random()
-            if rand < 0.8:
-                가입타입 = '신규가입'
-                성공 = True
-            elif rand < 0.95:
-                가입타입 = '재가입'
-                성공 = True
-            else:
-                가입타입 = '가입실패'
-                성공 = False
+            # 가입 타입 결정 (기본 80% 신규가입, 15% 재가입, 5% 실패)
+            가입타입, 성공 = self._결과유형선택({'신규가입': 80, '재가입': 15}, '가입실패')
             
             if 성공:
                 # 성공 시뮬레이션
-                고객번호 = f"CUST{random.randint(100000, 999999)}"
-                서비스번호 = f"010{random.randint(10000000, 99999999)}"
+                고객번호 = f"CUST{self.난수.randint(100000, 999999)}"
+                서비스번호 = f"010{self.난수.randint(10000000, 99999999)}"
                 
                 return {
                     '성공': True,
@@ -137,7 +132,7 @@ class 가입처리서비스(기본처리서비스):
                 }
             else:
                 # 실패 시뮬레이션
-                오류원인 = random.choice([
+                오류원인 = self.난수.choice([
                     '신용정보 불량',
                     '중복 가입',
                     '서류 미비',
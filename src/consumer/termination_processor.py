@@ -2,7 +2,6 @@
 # 해지 처리 서비스
 
 import time
-import random
 from typing import Dict, Any
 from src.consumer.base_processor import 기본처리서비스
 from src.common.message_models import BSS메시지, MessageType
@@ -14,6 +13,11 @@ class 해지처리서비스(기본처리서비스):
     TERMINATION 타입 메시지만 처리
     """
     
+    기본처리시간범위 = (1.0, 4.0)
+    기본실패율 = 0.1
+    세부유형키 = '해지타입'
+    결과레코드키 = '해지정보'
+    
     def __init__(self):
         """해지 처리 서비스 초기화"""
         super().__init__(MessageType.TERMINATION.value)
@@ -54,6 +58,74 @@ class 해지처리서비스(기본처리서비스):
             
             if 처리결과['성공']:
                 # 성공 시 통계 업데이트
+                해지타입 = 처리결과.get('해지타입', '일반해지')
+                self._통계증가(self.해지통계, 해지타입)
+                
+                self.로거.info(f"해지 처리 완료: {메시지.아이디} - {해지타입}")
+                
+                return {
+                    '성공': True,
+                    '메시지': f'해지 처리 성공: {해지타입}',
+                    '결과데이터': {
+                        '메시지아이디': 메시지.아이디,
+                        '처리타입': self.처리타입,
+                        '해지타입': 해지타입,
+                        '처리시간': 처리결과['처리시간'],
+                        '해지정보': 처리결과.get('해지정보', {})
+                    }
+                }
+            else:
+                self._통계증가(self.해지통계, '해지실패')
+                return {
+                    '성공': False,
+                    '메시지': f'해지 처리 실패: {처리결과["오류"]}',
+                    '결과데이터': {
+                        '메시지아이디': 메시지.아이디,
+                        '오류원인': 처리결과.get('오류', '알 수 없는 오류')
+                    }
+                }
+                
+        except Exception as e:
+            self._통계증가(self.해지통계, '해지실패')
+            error_msg = f"해지 처리 중 예외 발생: {e}"
+            self.로거.error(error_msg)
+            
+            return {
+                '성공': False,
+                '메시지': error_msg,
+                '결과데이터': {
+                    '메시지아이디': 메시지.아이디,
+                    '예외타입': type(e).__name__
+                }
+            }
+    
+    def 처리시뮬레이션(self) -> Dict[str, Any]:
+        """
+        해지 처리 시뮬레이션
+        실제 요금 정산, 서비스 해지, 장비 반납 처리 대신 시뮬레이션 수행
+        
+        Returns:
+            dict: 시뮬레이션 결과
+        """
+        try:
+            # 처리 시간 시뮬레이션 (기본 1.0~4.0초 균등, SERVICE_TIME_TERMINATION로 분포 변경)
+            처리시간 = self.처리시간분포.표본(self.난수)
+            self.시계.대기(처리시간)
+            
+            # 해지 타입 결정 (기본 50% 일반해지, 25% 즉시해지, 15% 번호보존해지, 10% 실패)
+            해지타입, 성공 = self._결과유형선택({'일반해지': 50, '즉시해지': 25, '번호보존해지': 15}, '해지실패')
+            
+            if 성공:
+                # 성공 시뮬레이션
+                서비스번호 = f"010{self.난수.randint(10000000, 99999999)}"
+                계약번호 = f"CONTRACT{self.난수.randint(100000, 999999)}"
+                
+                # 요금 정산 시뮬레이션
+                사용요금 = self.난수.randint(10000, 150000)
+                위약금 = self.난수.randint(0, 200000) if self.난수.random() < 0.3 else 0
+                할인금액 = self.난수.randint(0, 50000) if self.난수.random() < 0.4 else 0
+                최종요금 = max(0, 사용요금 + 위약금 - 할인금액)
+                
                 해지정보 = {
                     '서비스번호': 서비스번호,
                     '계약번호': 계약번호,
@@ -73,17 +145,17 @@ class 해지처리서비스(기본처리서비스):
                     해지정보['즉시해지수수료'] = 10000
                     해지정보['최종요금'] = 최종요금 + 10000
                 elif 해지타입 == '번호보존해지':
-                    해지정보['보존기간'] = f"{random.randint(30, 90)}일"
+                    해지정보['보존기간'] = f"{self.난수.randint(30, 90)}일"
                     해지정보['보존수수료'] = 5000
                     해지정보['최종요금'] = 최종요금 + 5000
                 
                 # 장비 반납 정보 (30% 확률)
-                if random.random() < 0.3:
+                if self.난수.random() < 0.3:
                     해지정보['장비반납'] = {
-                        '단말기': f"DEVICE{random.randint(1000, 9999)}",
-                        '반납방법': random.choice(['택배', '매장방문', '기사방문']),
+                        '단말기': f"DEVICE{self.난수.randint(1000, 9999)}",
+                        '반납방법': self.난수.choice(['택배', '매장방문', '기사방문']),
                         '반납기한': time.strftime('%Y-%m-%d', 
-                            time.localtime(time.time() + random.randint(86400 * 7, 86400 * 14)))  # 1-2주 후
+                            time.localtime(time.time() + self.난수.randint(86400 * 7, 86400 * 14)))  # 1-2주 후
                     }
                 
                 return {
@@ -94,7 +166,7 @@ class 해지처리서비스(기본처리서비스):
                 }
             else:
                 # 실패 시뮬레이션
-                오류원인 = random.choice([
+                오류원인 = self.난수.choice([
                     '미납요금 존재',
                     '약정기간 위반',
                     '장비 미반납',
@@ -182,84 +254,4 @@ if __name__ == "__main__":
         processor.로거.error(f"해지 처리 서비스 실행 중 오류: {e}")
     finally:
         processor.메시지처리중지()
-        processor.로거.info("해지 처리 서비스 종료 완료")타입 = 처리결과.get('해지타입', '일반해지')
-                self.해지통계[해지타입] += 1
-                
-                self.로거.info(f"해지 처리 완료: {메시지.아이디} - {해지타입}")
-                
-                return {
-                    '성공': True,
-                    '메시지': f'해지 처리 성공: {해지타입}',
-                    '결과데이터': {
-                        '메시지아이디': 메시지.아이디,
-                        '처리타입': self.처리타입,
-                        '해지타입': 해지타입,
-                        '처리시간': 처리결과['처리시간'],
-                        '해지정보': 처리결과.get('해지정보', {})
-                    }
-                }
-            else:
-                self.해지통계['해지실패'] += 1
-                return {
-                    '성공': False,
-                    '메시지': f'해지 처리 실패: {처리결과["오류"]}',
-                    '결과데이터': {
-                        '메시지아이디': 메시지.아이디,
-                        '오류원인': 처리결과.get('오류', '알 수 없는 오류')
-                    }
-                }
-                
-        except Exception as e:
-            self.해지통계['해지실패'] += 1
-            error_msg = f"해지 처리 중 예외 발생: {e}"
-            self.로거.error(error_msg)
-            
-            return {
-                '성공': False,
-                '메시지': error_msg,
-                '결과데이터': {
-                    '메시지아이디': 메시지.아이디,
-                    '예외타입': type(e).__name__
-                }
-            }
-    
-    def 처리시뮬레이션(self) -> Dict[str, Any]:
-        """
-        해지 처리 시뮬레이션
-        실제 요금 정산, 서비스 해지, 장비 반납 처리 대신 시뮬레이션 수행
-        
-        Returns:
-            dict: 시뮬레이션 결과
-        """
-        try:
-            # 처리 시간 시뮬레이션 (1.0~4.0초 - 요금 정산 및 장비 확인 시간 포함)
-            처리시간 = random.uniform(1.0, 4.0)
-            time.sleep(처리시간)
-            
-            # 해지 타입 랜덤 결정 (50% 일반해지, 25% 즉시해지, 15% 번호보존해지, 10% 실패)
-            rand = random.random()
-            if rand < 0.5:
-                해지타입 = '일반해지'
-                성공 = True
-            elif rand < 0.75:
-                해지타입 = '즉시해지'
-                성공 = True
-            elif rand < 0.9:
-                해지타입 = '번호보존해지'
-                성공 = True
-            else:
-                해지타입 = '해지실패'
-                성공 = False
-            
-            if 성공:
-                # 성공 시뮬레이션
-                서비스번호 = f"010{random.randint(10000000, 99999999)}"
-                계약번호 = f"CONTRACT{random.randint(100000, 999999)}"
-                
-                # 요금 정산 시뮬레이션
-                사용요금 = random.randint(10000, 150000)
-                위약금 = random.randint(0, 200000) if random.random() < 0.3 else 0
-                할인금액 = random.randint(0, 50000) if random.random() < 0.4 else 0
-                최종요금 = max(0, 사용요금 + 위약금 - 할인금액)
-                
-                해지
\ No newline at end of file
+        processor.로거.info("해지 처리 서비스 종료 완료")
@@ -0,0 +1,268 @@
+# 파일 경로: src/consumer/write_behind.py
+# 처리 결과 레코드 지연 쓰기(write-behind) 버퍼와 모의 백엔드 클래스
+
+import random
+import threading
+import time
+from typing import Dict, Any, List, Callable, Optional
+
+from src.common.virtual_clock import 실제시계
+
+
+class 모의백엔드:
+    """
+    처리 결과 레코드를 저장하는 백엔드(DB) 쓰기 시뮬레이션
+
+    쓰기 한 번의 비용 = 왕복지연 + 레코드 수 × 레코드당지연 이므로,
+    레코드를 모아 한 번에 쓰면 메시지마다 쓸 때보다 왕복지연을 레코드 수만큼 덜 치름
+    동시 쓰기 수는 백엔드 연결 수처럼 동시쓰기한도로 제한
+
+    속성:
+        호출수 (int): 쓰기 호출 수
+        레코드수 (int): 기록한 레코드 수
+        실패호출수 (int): 실패한 쓰기 호출 수
+    """
+
+    def __init__(self, 왕복지연ms: float = 0.0, 레코드당지연ms: float = 0.0,
+                 동시쓰기한도: int = 4, 실패율: float = 0.0, 난수: Optional[random.Random] = None):
+        """
+        모의 백엔드 초기화
+
+        Args:
+            왕복지연ms: 쓰기 호출당 고정 지연 (네트워크 왕복, 커밋)
+            레코드당지연ms: 레코드 하나당 추가 지연
+            동시쓰기한도: 동시에 진행할 수 있는 쓰기 호출 수
+            실패율: 쓰기 호출이 실패할 비율 (0~1)
+            난수: 실패 여부를 정할 난수 생성기
+        """
+        if not 0 <= 실패율 <= 1:
+            raise ValueError(f"백엔드 쓰기 실패율은 0~1 사이여야 함: {실패율}")
+        self.왕복지연 = 왕복지연ms / 1000
+        self.레코드당지연 = 레코드당지연ms / 1000
+        self.동시쓰기한도 = max(1, 동시쓰기한도)
+        self.실패율 = 실패율
+        self.난수 = 난수 or random.Random()
+        self._세마포어 = threading.BoundedSemaphore(self.동시쓰기한도)
+        self._잠금 = threading.Lock()
+        self.호출수 = 0
+        self.레코드수 = 0
+        self.실패호출수 = 0
+
+    def 쓰기(self, 레코드목록: List[Dict[str, Any]], 시계=None):
+        """
+        레코드 목록을 한 번의 호출로 기록 (실패하면 목록 전체가 기록되지 않음)
+
+        Args:
+            레코드목록: 기록할 레코드 목록
+            시계: 지연을 적용할 시계 (None이면 실제 시계)
+
+        Raises:
+            ConnectionError: 실패율에 따라 쓰기가 실패한 경우
+        """
+        시계 = 시계 or 실제시계()
+        with self._세마포어:
+            시계.대기(self.왕복지연 + len(레코드목록) * self.레코드당지연)
+            with self._잠금:
+                self.호출수 += 1
+                if self.실패율 and self.난수.random() < self.실패율:
+                    self.실패호출수 += 1
+                    raise ConnectionError(f"백엔드 쓰기 실패: 레코드 {len(레코드목록)}개")
+                self.레코드수 += len(레코드목록)
+
+    def 통계조회(self) -> Dict[str, Any]:
+        """
+        백엔드 쓰기 통계 조회
+
+        Returns:
+            dict: 호출 수, 레코드 수, 실패 호출 수, 호출당 레코드 수
+        """
+        return {
+            '호출수': self.호출수,
+            '레코드수': self.레코드수,
+            '실패호출수': self.실패호출수,
+            '호출당레코드': round(self.레코드수 / self.호출수, 1) if self.호출수 else 0
+        }
+
+
+class 쓰기지연버퍼:
+    """
+    처리 결과 레코드를 모아 최대건수 또는 최대대기초에 먼저 도달하면 한 번에 쓰는 write-behind 버퍼
+
+    레코드마다 완료콜백을 받아 쓰기가 끝난 뒤 (성공 여부, 예외)로 호출하므로,
+    처리 서비스는 콜백에서 ACK하여 기록이 끝난 메시지만 확인함 (쓰기 실패 시 재시도 큐로 보냄)
+    쓰기는 전용 스레드 하나에서 차례로 수행 (쓰는 동안 들어온 레코드는 다음 묶음으로)
+
+    속성:
+        쓰기함수: 레코드 목록을 한 번에 기록하는 함수 (실패하면 예외)
+        최대건수 (int): 한 번에 쓸 최대 레코드 수
+        최대대기 (float): 첫 레코드가 들어온 뒤 쓰기까지 최대 대기 시간(초)
+    """
+
+    def __init__(self, 쓰기함수: Callable[[List[Dict[str, Any]]], Any],
+                 최대건수: int = 100, 최대대기ms: float = 50, 이름: str = '쓰기지연버퍼'):
+        """
+        쓰기 지연 버퍼 초기화 (쓰기 스레드 시작)
+
+        Args:
+            쓰기함수: 묶음 쓰기 함수
+            최대건수: 묶음 최대 레코드 수
+            최대대기ms: 첫 레코드 이후 최대 대기 시간
+            이름: 쓰기 스레드 이름
+        """
+        self.쓰기함수 = 쓰기함수
+        self.최대건수 = max(1, 최대건수)
+        self.최대대기 = max(0.0, 최대대기ms) / 1000
+        self._대기열: List[tuple] = []
+        self._첫추가시각: Optional[float] = None
+        self._조건 = threading.Condition()
+        self._쓰는중 = 0
+        self._중지 = False
+
+        self.쓰기통계 = {
+            '묶음수': 0,
+            '레코드수': 0,
+            '실패묶음수': 0,
+            '실패레코드수': 0,
+            '최대묶음크기': 0,
+            '크기도달': 0,
+            '시간만료': 0
+        }
+
+        self._쓰기스레드 = threading.Thread(target=self._쓰기루프, name=이름, daemon=True)
+        self._쓰기스레드.start()
+
+    def 추가(self, 레코드: Dict[str, Any], 완료콜백: Callable[[bool, Optional[Exception]], Any]):
+        """
+        레코드를 버퍼에 추가 (쓰기 스레드에서 완료콜백 호출)
+
+        Args:
+            레코드: 기록할 레코드
+            완료콜백: 쓰기 후 (성공 여부, 예외)로 호출할 함수
+
+        Raises:
+            RuntimeError: 이미 중지된 버퍼인 경우
+        """
+        with self._조건:
+            if self._중지:
+                raise RuntimeError("중지된 쓰기 지연 버퍼에는 추가할 수 없음")
+            if not self._대기열:
+                self._첫추가시각 = time.monotonic()
+            self._대기열.append((레코드, 완료콜백))
+            if len(self._대기열) == 1 or len(self._대기열) >= self.최대건수:
+                self._조건.notify_all()
+
+    def _쓰기루프(self):
+        """크기 도달, 대기 만료, 중지 중 하나가 되면 묶음을 떼어내 기록"""
+        while True:
+            with self._조건:
+                while True:
+                    if self._대기열 and (self._중지 or len(self._대기열) >= self.최대건수):
+                        사유 = '크기도달' if len(self._대기열) >= self.최대건수 else None
+                        break
+                    if self._대기열:
+                        남은시간 = self._첫추가시각 + self.최대대기 - time.monotonic()
+                        if 남은시간 <= 0:
+                            사유 = '시간만료'
+                            break
+                        self._조건.wait(남은시간)
+                    elif self._중지:
+                        return
+                    else:
+                        self._조건.wait()
+                묶음 = self._대기열[:self.최대건수]
+                del self._대기열[:self.최대건수]
+                self._첫추가시각 = time.monotonic() if self._대기열 else None
+                self._쓰는중 = len(묶음)
+                if 사유:
+                    self.쓰기통계[사유] += 1
+            self._묶음쓰기(묶음)
+            with self._조건:
+                self._쓰는중 = 0
+                self._조건.notify_all()
+
+    def _묶음쓰기(self, 묶음: List[tuple]):
+        """묶음을 한 번에 기록하고 레코드마다 완료콜백 호출"""
+        오류: Optional[Exception] = None
+        try:
+            self.쓰기함수([레코드 for 레코드, _ in 묶음])
+        except Exception as e:
+            오류 = e
+
+        통계 = self.쓰기통계
+        통계['묶음수'] += 1
+        통계['레코드수'] += len(묶음)
+        통계['최대묶음크기'] = max(통계['최대묶음크기'], len(묶음))
+        if 오류 is not None:
+            통계['실패묶음수'] += 1
+            통계['실패레코드수'] += len(묶음)
+
+        for _, 완료콜백 in 묶음:
+            try:
+                완료콜백(오류 is None, 오류)
+            except Exception:
+                # 콜백 실패가 같은 묶음의 다른 레코드 정산을 막지 않도록 함
+                pass
+
+    def 비우기(self, 타임아웃: float = 10) -> bool:
+        """
+        지금까지 추가된 레코드를 모두 기록할 때까지 대기 (대기 시간을 기다리지 않고 바로 기록)
+
+        Args:
+            타임아웃: 최대 대기 시간(초)
+
+        Returns:
+            bool: 타임아웃 전에 모두 기록했으면 True
+        """
+        마감 = time.monotonic() + 타임아웃
+        with self._조건:
+            if self._대기열:
+                self._첫추가시각 = time.monotonic() - self.최대대기
+                self._조건.notify_all()
+            while self._대기열 or self._쓰는중:
+                남은시간 = 마감 - time.monotonic()
+                if 남은시간 <= 0:
+                    return False
+                self._조건.wait(남은시간)
+        return True
+
+    def 중지(self, 타임아웃: float = 10) -> bool:
+        """
+        남은 레코드를 기록한 뒤 쓰기 스레드 종료
+
+        Args:
+            타임아웃: 최대 대기 시간(초)
+
+        Returns:
+            bool: 타임아웃 전에 모두 기록하고 종료했으면 True
+        """
+        with self._조건:
+            self._중지 = True
+            self._조건.notify_all()
+        self._쓰기스레드.join(타임아웃)
+        return not self._쓰기스레드.is_alive()
+
+    @property
+    def 중지됨(self) -> bool:
+        """중지 요청 여부 (중지된 버퍼에는 추가할 수 없음)"""
+        return self._중지
+
+    def 대기개수(self) -> int:
+        """기록을 기다리는 레코드 수 (쓰는 중인 묶음 포함)"""
+        with self._조건:
+            return len(self._대기열) + self._쓰는중
+
+    def 통계조회(self) -> Dict[str, Any]:
+        """
+        쓰기 통계 조회
+
+        Returns:
+            dict: 묶음/레코드 수, 실패 수, 묶음 크기, 쓰기 사유별 횟수, 대기 레코드 수
+        """
+        통계 = self.쓰기통계
+        return {
+            **통계,
+            '평균묶음크기': round(통계['레코드수'] / 통계['묶음수'], 1) if 통계['묶음수'] else 0,
+            '대기개수': self.대기개수(),
+            '최대건수': self.최대건수,
+            '최대대기ms': self.최대대기 * 1000
+        }
@@ -0,0 +1,105 @@
+# 파일 경로: src/experiments/codec_benchmark.py
+# 메시지 직렬화 코덱 벤치마크
+
+import argparse
+import time
+from typing import Dict, Any, List, Callable
+
+from src.common.message_models import BSS메시지, MessageType
+from src.common.message_codecs import JSON코덱, 바이너리코덱
+
+
+def 샘플메시지생성(개수: int) -> List[BSS메시지]:
+    """
+    API 게이트웨이를 거친 메시지와 비슷한 형태의 샘플 메시지 생성
+
+    Args:
+        개수: 생성할 메시지 수
+
+    Returns:
+        list: 샘플 메시지 목록
+    """
+    타입들 = [t.value for t in MessageType]
+    메시지목록 = []
+    for i in range(개수):
+        메시지 = BSS메시지(
+            타입=타입들[i % len(타입들)],
+            내용=f"테스트 요청 {i} - 고객 요청 처리",
+            속성들={
+                '고객정보': {'고객ID': f"CUST{i:06d}", '채널': 'APP'},
+                'API정보': {'요청시간': '2024-01-01T00:00:00', '게이트웨이': 'API게이트웨이'}
+            }
+        )
+        메시지목록.append(메시지)
+    return 메시지목록
+
+
+def _측정(함수: Callable, 대상목록: list) -> float:
+    """대상 목록 전체에 함수를 적용하는 데 걸린 시간(초) 측정"""
+    시작 = time.perf_counter()
+    for 대상 in 대상목록:
+        함수(대상)
+    return time.perf_counter() - 시작
+
+
+def 코덱벤치마크실행(메시지수: int = 10000) -> List[Dict[str, Any]]:
+    """
+    기존 JSON(indent=2), compact JSON, 바이너리 코덱의 크기와 속도 비교
+
+    Args:
+        메시지수: 측정에 사용할 메시지 수
+
+    Returns:
+        list: 코덱별 측정 결과 (메시지당 바이트, 인코딩/디코딩 µs)
+    """
+    메시지목록 = 샘플메시지생성(메시지수)
+    json코덱 = JSON코덱()
+    바이너리 = 바이너리코덱()
+
+    대상들 = {
+        'JSON (기존 to_json, indent=2)': (
+            lambda 메시지: 메시지.to_json().encode('utf-8'),
+            lambda 본문: BSS메시지.from_json(본문.decode('utf-8'))
+        ),
+        'JSON (compact)': (json코덱.인코딩, json코덱.디코딩),
+        '바이너리 (struct 헤더)': (바이너리.인코딩, 바이너리.디코딩)
+    }
+
+    결과목록 = []
+    for 이름, (인코딩, 디코딩) in 대상들.items():
+        본문들 = [인코딩(메시지) for 메시지 in 메시지목록]  # 워밍업 겸 디코딩 입력 준비
+        인코딩시간 = _측정(인코딩, 메시지목록)
+        디코딩시간 = _측정(디코딩, 본문들)
+
+        결과목록.append({
+            '코덱': 이름,
+            '메시지당바이트': round(sum(len(본문) for 본문 in 본문들) / 메시지수, 1),
+            '인코딩µs': round(인코딩시간 / 메시지수 * 1_000_000, 2),
+            '디코딩µs': round(디코딩시간 / 메시지수 * 1_000_000, 2)
+        })
+
+    return 결과목록
+
+
+def 결과출력(결과목록: List[Dict[str, Any]]):
+    """측정 결과를 표 형태로 출력"""
+    기준 = 결과목록[0]
+    print(f"{'코덱':<32}{'bytes/msg':>12}{'encode µs':>12}{'decode µs':>12}{'크기비':>8}")
+    for 결과 in 결과목록:
+        print(
+            f"{결과['코덱']:<32}{결과['메시지당바이트']:>12}"
+            f"{결과['인코딩µs']:>12}{결과['디코딩µs']:>12}"
+            f"{결과['메시지당바이트'] / 기준['메시지당바이트']:>8.2f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='BSS 메시지 코덱 벤치마크')
+    parser.add_argument('--messages', type=int, default=10000, help='측정 메시지 수')
+    args = parser.parse_args()
+
+    결과출력(코덱벤치마크실행(args.messages))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+# 파일 경로: src/experiments/message_benchmark.py
+# BSS 메시지 생성/직렬화 마이크로벤치마크
+
+import argparse
+import json
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, Any, List, Callable, Optional
+
+from src.common.message_models import BSS메시지, MessageType
+from src.common.message_codecs import JSON코덱
+
+
+class _기존메시지:
+    """
+    비교 기준용 dict 기반 메시지 (슬롯 도입 이전 BSS메시지와 같은 동작)
+    생성 시 uuid4 문자열, datetime, dict를 즉시 만들고 매번 다시 검증/포맷
+    """
+
+    def __init__(self, 타입: str, 내용: str, 아이디: Optional[str] = None,
+                 속성들: Optional[Dict[str, Any]] = None):
+        self.아이디 = 아이디 or str(uuid.uuid4())
+        self.타입 = 타입.upper()
+        self.내용 = 내용
+        self.생성시간 = datetime.now()
+        self.속성들 = 속성들 or {}
+
+    def 메시지검증(self) -> bool:
+        if not self.아이디 or not self.타입 or not self.내용:
+            return False
+        if self.타입 not in [t.value for t in MessageType]:
+            return False
+        return len(self.내용.strip()) > 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            '아이디': self.아이디,
+            '타입': self.타입,
+            '내용': self.내용,
+            '생성시간': self.생성시간.isoformat(),
+            '속성들': self.속성들
+        }
+
+
+def _게이트웨이경로(메시지클래스: Callable, 인덱스: int) -> bytes:
+    """
+    게이트웨이 → 라우터 → 생산자 구간에서 메시지 하나가 거치는 작업 재현
+    (생성, 3회 검증, 라우팅/헤더용 생성시간 문자열 2회, 본문 직렬화)
+    """
+    메시지 = 메시지클래스(
+        "SUBSCRIPTION",
+        f"벤치마크 요청 {인덱스}",
+        속성들={'고객정보': {'고객ID': f"CUST{인덱스:06d}"}}
+    )
+    for _ in range(3):
+        메시지.메시지검증()
+    if isinstance(메시지, BSS메시지):
+        메시지.생성시간문자열
+        메시지.생성시간문자열
+    else:
+        메시지.생성시간.isoformat()
+        메시지.생성시간.isoformat()
+    return json.dumps(
+        메시지.to_dict(), ensure_ascii=False, separators=(',', ':')
+    ).encode('utf-8')
+
+
+def _초당처리량(함수: Callable[[int], Any], 반복수: int) -> float:
+    """함수를 반복 실행한 초당 처리 횟수"""
+    시작 = time.perf_counter()
+    for i in range(반복수):
+        함수(i)
+    return 반복수 / (time.perf_counter() - 시작)
+
+
+def 메시지벤치마크실행(메시지수: int = 100000) -> List[Dict[str, Any]]:
+    """
+    기존 dict 기반 메시지와 슬롯 기반 BSS메시지의 생성/직렬화 처리량 비교
+
+    Args:
+        메시지수: 측정에 사용할 메시지 수
+
+    Returns:
+        list: 구현별 측정 결과 (초당 생성 수, 초당 생성+직렬화 수, 객체 크기)
+    """
+    코덱 = JSON코덱()
+    대상들 = {
+        '기존 (dict 기반)': (
+            lambda i: _기존메시지("SUBSCRIPTION", "벤치마크"),
+            lambda i: _게이트웨이경로(_기존메시지, i)
+        ),
+        '슬롯 (BSS메시지)': (
+            lambda i: BSS메시지("SUBSCRIPTION", "벤치마크"),
+            lambda i: _게이트웨이경로(BSS메시지, i)
+        ),
+        '슬롯 + compact 코덱': (
+            lambda i: BSS메시지("SUBSCRIPTION", "벤치마크"),
+            lambda i: 코덱.인코딩(BSS메시지("SUBSCRIPTION", f"벤치마크 요청 {i}"))
+        )
+    }
+
+    결과목록 = []
+    for 이름, (생성, 생성직렬화) in 대상들.items():
+        _초당처리량(생성직렬화, min(1000, 메시지수))  # 워밍업
+        표본 = 생성(0)
+        객체크기 = (
+            표본.__sizeof__() + 표본.__dict__.__sizeof__()
+            if hasattr(표본, '__dict__') else 표본.__sizeof__()
+        )
+        결과목록.append({
+            '구현': 이름,
+            '초당생성': round(_초당처리량(생성, 메시지수)),
+            '초당생성직렬화': round(_초당처리량(생성직렬화, 메시지수)),
+            '객체바이트': 객체크기
+        })
+
+    return 결과목록
+
+
+def 결과출력(결과목록: List[Dict[str, Any]]):
+    """측정 결과를 표 형태로 출력"""
+    기준 = 결과목록[0]
+    print(f"{'구현':<24}{'build/s':>12}{'build+ser/s':>14}{'obj bytes':>11}{'배율':>8}")
+    for 결과 in 결과목록:
+        print(
+            f"{결과['구현']:<24}{결과['초당생성']:>12}{결과['초당생성직렬화']:>14}"
+            f"{결과['객체바이트']:>11}"
+            f"{결과['초당생성직렬화'] / 기준['초당생성직렬화']:>8.2f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='BSS 메시지 생성/직렬화 벤치마크')
+    parser.add_argument('--messages', type=int, default=100000, help='측정 메시지 수')
+    args = parser.parse_args()
+
+    결과출력(메시지벤치마크실행(args.messages))
+
+
+if __name__ == "__main__":
+    main()
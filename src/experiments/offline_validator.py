@@ -0,0 +1,356 @@
+# 파일 경로: src/experiments/offline_validator.py
+# 가상 시계 기반 오프라인 패턴 검증기 (RabbitMQ/API Gateway 없이 실행)
+
+import sys
+import json
+import time
+import heapq
+import random
+import logging
+import argparse
+import itertools
+from typing import Dict, Any, List, Optional
+
+from src.common.message_models import BSS메시지, MessageType
+from src.common.queue_topology import 큐토폴로지
+from src.common.virtual_clock import 가상시계
+from src.consumer.subscription_processor import 가입처리서비스
+from src.consumer.mnp_processor import 번호이동처리서비스
+from src.consumer.change_processor import 명의변경처리서비스
+from src.consumer.termination_processor import 해지처리서비스
+from src.experiments.pattern_validator import 패턴검증기, 검증결과
+
+
+처리서비스클래스 = {
+    MessageType.SUBSCRIPTION.value: 가입처리서비스,
+    MessageType.MNP.value: 번호이동처리서비스,
+    MessageType.CHANGE.value: 명의변경처리서비스,
+    MessageType.TERMINATION.value: 해지처리서비스
+}
+
+
+class 오프라인패턴검증기(패턴검증기):
+    """
+    패턴검증기의 세 검증(부하 평활화, 시스템 보호, 큐 버퍼링)을 가상 시계 위의
+    이산 사건 시뮬레이션으로 재현하는 검증기
+
+    네 처리 서비스의 메시지처리를 그대로 호출하되 시계를 가상시계로 바꿔
+    처리시뮬레이션의 대기가 sleep 없이 시각만 진행하므로, 수만 개 메시지 실험이 수 초 안에 끝남
+    같은 시드면 도착 순서, 처리 시간, 성공/실패가 모두 같아 튜닝 비교와 CI 성능 게이트에 사용
+
+    모델:
+        타입별 큐(FIFO)와 타입별 소비자 N개, 실패 메시지는 큐토폴로지의 단계별 지연 후 다시 도착,
+        최대 재시도를 넘으면 데드레터로 정산
+        백엔드 사용률 = 처리 중 메시지 수 / 백엔드 동시 처리 한도
+        (처리 중 메시지 수는 소비자 수를 넘지 않으므로, 보호 효과는 큐 없이 바로 호출했을 때와 비교)
+
+    속성:
+        시드 (int): 난수 시드
+        타입별소비자수 (dict): 타입별 소비자 수
+        백엔드한도 (int): 백엔드가 감당하는 동시 처리 수
+    """
+
+    def __init__(self, 시드: int = 42, 소비자수: int = 4,
+                 타입별소비자수: Optional[Dict[str, int]] = None,
+                 백엔드한도: Optional[int] = None, 측정간격: float = 5.0):
+        """
+        오프라인 패턴 검증기 초기화
+
+        Args:
+            시드: 난수 시드 (도착 패턴과 처리 서비스 난수 모두)
+            소비자수: 타입별 기본 소비자 수
+            타입별소비자수: 타입별 소비자 수 (지정한 타입만 덮어씀)
+            백엔드한도: 백엔드 동시 처리 한도 (None이면 전체 소비자 수의 1.5배)
+            측정간격: 상태 측정 간격 (가상 초)
+        """
+        super().__init__()
+        self.로거 = self.설정.로거설정('오프라인패턴검증기')
+        self.시드 = 시드
+        self.타입별소비자수 = {t.value: 소비자수 for t in MessageType}
+        self.타입별소비자수.update(타입별소비자수 or {})
+        전체소비자수 = sum(self.타입별소비자수.values())
+        self.백엔드한도 = 백엔드한도 or int(전체소비자수 * 1.5)
+        self.측정간격 = 측정간격
+        self.토폴로지 = 큐토폴로지()
+        self.누적가상시간 = 0.0
+
+    def _처리서비스생성(self, 시계: 가상시계) -> Dict[str, Any]:
+        """가상 시계와 시드 난수를 쓰는 타입별 처리 서비스 생성"""
+        처리서비스들 = {}
+        for 타입, 클래스 in 처리서비스클래스.items():
+            처리서비스 = 클래스()
+            처리서비스.시계 = 시계
+            처리서비스.난수 = random.Random(f"{self.시드}:{타입}")
+            # 메시지마다 남는 처리 로그는 시뮬레이션 속도를 떨어뜨리므로 끔
+            처리서비스.로거.setLevel(logging.CRITICAL)
+            처리서비스들[타입] = 처리서비스
+        return 처리서비스들
+
+    def 도착목록생성(self, 개수: int, 기간: float, 시작: float = 0.0,
+                  난수: Optional[random.Random] = None) -> List[tuple]:
+        """
+        기간 동안 균일하게 흩어진 (도착시각, 타입) 목록 생성 (타입은 무작위, 부하생성기와 같음)
+
+        Args:
+            개수: 메시지 수
+            기간: 투입 기간(가상 초, 0이면 모두 시작 시각에 도착)
+            시작: 투입 시작 시각
+            난수: 사용할 난수 (None이면 시드로 생성)
+        """
+        난수 = 난수 or random.Random(self.시드)
+        타입들 = [t.value for t in MessageType]
+        return sorted(
+            (시작 + 난수.random() * 기간, 난수.choice(타입들)) for _ in range(개수)
+        )
+
+    def 시뮬레이션(self, 도착목록: List[tuple]) -> Dict[str, Any]:
+        """
+        도착 목록을 모두 처리할 때까지 이산 사건 시뮬레이션 실행
+
+        Args:
+            도착목록: (도착시각, 타입) 목록
+
+        Returns:
+            dict: 측정데이터(측정간격별 큐 길이/처리 중/완료 수), 도착/완료 시각, 정산 결과
+        """
+        시계 = 가상시계()
+        처리서비스들 = self._처리서비스생성(시계)
+        큐들 = {타입: [] for 타입 in 처리서비스들}       # (도착시각, 순번, 메시지, 재시도횟수) 힙
+        유휴 = dict(self.타입별소비자수)
+        사건 = []                                      # (시각, 순번, 종류, 데이터)
+        순번 = itertools.count()
+
+        for 도착시각, 타입 in 도착목록:
+            heapq.heappush(사건, (도착시각, next(순번), '도착', (BSS메시지(타입, f"{타입} 요청"), 0)))
+        heapq.heappush(사건, (0.0, next(순번), '측정', None))
+
+        도착시각들, 완료시각들 = [], []
+        정산 = {'성공': 0, '재시도': 0, '데드레터': 0}
+        측정데이터 = []
+        처리중 = 0
+        남은메시지 = len(도착목록)
+
+        def 전달(타입: str, 지금: float):
+            nonlocal 처리중
+            처리서비스 = 처리서비스들[타입]
+            while 유휴[타입] and 큐들[타입]:
+                _, _, 메시지, 재시도횟수 = heapq.heappop(큐들[타입])
+                유휴[타입] -= 1
+                처리중 += 1
+                시계.이동(지금)
+                처리결과, 처리시간, 오류 = 처리서비스._처리실행(메시지)
+                판정 = 처리서비스._결과판정(메시지, 처리결과, 처리시간, 오류, 재시도횟수)
+                heapq.heappush(사건, (시계.시각(), next(순번), '완료', (타입, 메시지, 재시도횟수, 판정)))
+
+        while 사건:
+            지금, _, 종류, 데이터 = heapq.heappop(사건)
+
+            if 종류 == '도착':
+                메시지, 재시도횟수 = 데이터
+                if not 재시도횟수:
+                    도착시각들.append(지금)
+                heapq.heappush(큐들[메시지.타입], (지금, next(순번), 메시지, 재시도횟수))
+                전달(메시지.타입, 지금)
+
+            elif 종류 == '완료':
+                타입, 메시지, 재시도횟수, 판정 = 데이터
+                유휴[타입] += 1
+                처리중 -= 1
+                if 판정 == 'retry':
+                    정산['재시도'] += 1
+                    지연 = self.토폴로지.재시도지연ms(재시도횟수 + 1) / 1000
+                    heapq.heappush(사건, (지금 + 지연, next(순번), '도착', (메시지, 재시도횟수 + 1)))
+                else:
+                    정산['성공' if 판정 == 'ack' else '데드레터'] += 1
+                    완료시각들.append(지금)
+                    남은메시지 -= 1
+                전달(타입, 지금)
+
+            else:
+                측정데이터.append({
+                    '경과시간': 지금,
+                    '큐길이': sum(len(큐) for 큐 in 큐들.values()),
+                    '처리중': 처리중,
+                    '백엔드사용률': round(처리중 / self.백엔드한도 * 100, 1),
+                    '완료수': len(완료시각들)
+                })
+                if 남은메시지:
+                    heapq.heappush(사건, (지금 + self.측정간격, next(순번), '측정', None))
+
+        self.누적가상시간 += 시계.시각()
+        return {
+            '측정데이터': 측정데이터,
+            '도착시각들': 도착시각들,
+            '완료시각들': 완료시각들,
+            '정산': 정산,
+            '가상시간': 시계.시각(),
+            '평균처리시간': sum(
+                처리서비스.처리시간분포.평균() for 처리서비스 in 처리서비스들.values()
+            ) / len(처리서비스들),
+            '처리통계': {타입: 처리서비스.처리통계조회()['기본통계'] for 타입, 처리서비스 in 처리서비스들.items()}
+        }
+
+    def _구간분산(self, 시각들: List[float], 끝: float) -> float:
+        """측정간격 구간별 건수의 분산"""
+        구간수 = max(1, int(끝 // self.측정간격) + 1)
+        건수 = [0] * 구간수
+        for 시각 in 시각들:
+            건수[min(구간수 - 1, int(시각 // self.측정간격))] += 1
+        평균 = sum(건수) / 구간수
+        return sum((값 - 평균) ** 2 for 값 in 건수) / 구간수
+
+    async def 부하평활화검증(self, 급증메시지수: int = 1000, 측정시간: int = 60) -> 검증결과:
+        """
+        급증 트래픽을 소비자가 일정한 속도로 처리하는지 검증 (입력/출력 구간별 건수 분산 비)
+
+        Args:
+            급증메시지수: 급증 투입할 메시지 수
+            측정시간: 급증 투입 기간 (가상 초)
+        """
+        결과 = self.시뮬레이션(self.도착목록생성(급증메시지수, 측정시간))
+        끝 = 결과['가상시간']
+        입력분산 = self._구간분산(결과['도착시각들'], 끝)
+        출력분산 = self._구간분산(결과['완료시각들'], 끝)
+        평활화계수 = 입력분산 / 출력분산 if 출력분산 > 0 else 0
+        기준값 = self.검증기준['부하평활화계수']
+        성공 = 평활화계수 >= 기준값
+
+        return self._결과기록(검증결과(
+            검증명="부하평활화검증",
+            성공=성공,
+            점수=min(평활화계수 / 기준값 * 100, 100),
+            기준값=기준값,
+            측정값=round(평활화계수, 2),
+            메시지=f"평활화 계수: {평활화계수:.2f} ({'성공' if 성공 else '실패'})",
+            세부정보={
+                '급증메시지수': 급증메시지수,
+                '입력분산': round(입력분산, 2),
+                '출력분산': round(출력분산, 2),
+                '가상시간': round(끝, 1),
+                '정산': 결과['정산']
+            }
+        ))
+
+    async def 시스템보호검증(self, 부하강도: int = 500, 지속시간: int = 180) -> 검증결과:
+        """
+        지속 고부하에서도 백엔드 동시 처리 수가 소비자 수로 제한되는지 검증
+        
+        최대 사용률이 한계 이하이고, 큐 없이 바로 호출했을 때의 사용률보다 낮아야 성공
+        (백엔드한도가 소비자 수보다 작으면 한계를 넘고, 부하가 낮아 큐가 막아 준 것이 없으면 실패)
+
+        Args:
+            부하강도: 초당 메시지 수
+            지속시간: 부하 지속 시간 (가상 초)
+        """
+        결과 = self.시뮬레이션(self.도착목록생성(부하강도 * 지속시간, 지속시간))
+        사용률들 = [항목['백엔드사용률'] for 항목 in 결과['측정데이터']]
+        최대사용률 = max(사용률들) if 사용률들 else 0
+        # 큐 없이 API가 바로 백엔드를 호출했다면 동시 처리 수 = 도착률 × 평균 처리 시간 (Little's law)
+        직접호출사용률 = 부하강도 * 결과['평균처리시간'] / self.백엔드한도 * 100
+        기준값 = self.검증기준['CPU사용률한계']
+        보호효과 = 직접호출사용률 > 최대사용률
+        성공 = 최대사용률 <= 기준값 and 보호효과
+
+        return self._결과기록(검증결과(
+            검증명="시스템보호검증",
+            성공=성공,
+            점수=max(0, (기준값 - 최대사용률) / 기준값 * 100) if 보호효과 else 0,
+            기준값=기준값,
+            측정값=최대사용률,
+            메시지=(
+                f"최대 백엔드 사용률: {최대사용률:.1f}% "
+                f"(큐 없이 {직접호출사용률:.1f}%, {'성공' if 성공 else '실패'})"
+            ),
+            세부정보={
+                '부하강도': 부하강도,
+                '지속시간': 지속시간,
+                '백엔드한도': self.백엔드한도,
+                '직접호출사용률': round(직접호출사용률, 1),
+                '보호효과': 보호효과,
+                '평균사용률': round(sum(사용률들) / len(사용률들), 1) if 사용률들 else 0,
+                '가상시간': round(결과['가상시간'], 1),
+                '정산': 결과['정산']
+            }
+        ))
+
+    async def 큐버퍼링효과검증(self, 순간메시지수: int = 2000) -> 검증결과:
+        """
+        순간 대량 투입을 큐가 보관했다가 점진적으로 소진하는지 검증 (미정산 메시지 = 손실)
+
+        Args:
+            순간메시지수: 10초 안에 투입할 메시지 수
+        """
+        결과 = self.시뮬레이션(self.도착목록생성(순간메시지수, 10))
+        정산수 = 결과['정산']['성공'] + 결과['정산']['데드레터']
+        손실률 = (순간메시지수 - 정산수) / 순간메시지수 * 100 if 순간메시지수 else 0
+        큐길이들 = [항목['큐길이'] for 항목 in 결과['측정데이터']]
+        기준값 = self.검증기준['메시지손실률한계']
+        성공 = 손실률 <= 기준값
+
+        return self._결과기록(검증결과(
+            검증명="큐버퍼링효과검증",
+            성공=성공,
+            점수=max(0, (기준값 - 손실률) / 기준값 * 100),
+            기준값=기준값,
+            측정값=round(손실률, 2),
+            메시지=f"메시지 손실률: {손실률:.2f}% ({'성공' if 성공 else '실패'})",
+            세부정보={
+                '순간메시지수': 순간메시지수,
+                '최대큐길이': max(큐길이들) if 큐길이들 else 0,
+                '소진시간': round(결과['가상시간'], 1),
+                '정산': 결과['정산']
+            }
+        ))
+
+    def _결과기록(self, 결과: 검증결과) -> 검증결과:
+        """검증 결과 저장 및 로그"""
+        self.검증결과들.append(결과)
+        self.로거.info(f"{결과.검증명} 완료: {결과.메시지}")
+        return 결과
+
+    async def 전체검증(self, 급증메시지수: int = 1000, 부하강도: int = 500, 지속시간: int = 180,
+                   순간메시지수: int = 2000) -> Dict[str, Any]:
+        """세 검증을 차례로 실행하고 보고서 반환 (벽시계 실행 시간 포함)"""
+        시작 = time.perf_counter()
+        await self.부하평활화검증(급증메시지수)
+        await self.시스템보호검증(부하강도, 지속시간)
+        await self.큐버퍼링효과검증(순간메시지수)
+        보고서 = self.검증보고서생성()
+        실행시간 = time.perf_counter() - 시작
+        보고서['실행정보'] = {
+            '시드': self.시드,
+            '실행시간': round(실행시간, 3),
+            '가상시간': round(self.누적가상시간, 1),
+            '가속배율': round(self.누적가상시간 / 실행시간) if 실행시간 > 0 else 0
+        }
+        return 보고서
+
+
+def main():
+    import asyncio
+
+    parser = argparse.ArgumentParser(description='가상 시계 기반 오프라인 패턴 검증 (재현 가능, CI 성능 게이트)')
+    parser.add_argument('--seed', type=int, default=42, help='난수 시드')
+    parser.add_argument('--consumers', type=int, default=4, help='타입별 소비자 수')
+    parser.add_argument('--burst', type=int, default=1000, help='부하 평활화 검증 급증 메시지 수')
+    parser.add_argument('--backend-limit', type=int, default=None,
+                        help='백엔드 동시 처리 한도 (기본: 전체 소비자 수의 1.5배)')
+    parser.add_argument('--rate', type=int, default=500, help='시스템 보호 검증 초당 메시지 수')
+    parser.add_argument('--duration', type=int, default=180, help='시스템 보호 검증 지속 시간(가상 초)')
+    parser.add_argument('--spike', type=int, default=2000, help='큐 버퍼링 검증 순간 메시지 수')
+    parser.add_argument('--gate', action='store_true', help='검증 하나라도 실패하면 종료 코드 1')
+    args = parser.parse_args()
+
+    검증기 = 오프라인패턴검증기(시드=args.seed, 소비자수=args.consumers, 백엔드한도=args.backend_limit)
+    보고서 = asyncio.run(검증기.전체검증(args.burst, args.rate, args.duration, args.spike))
+    print(json.dumps(
+        {키: 보고서[키] for 키 in ('실행정보', '종합결과', '검증별결과')},
+        ensure_ascii=False, indent=2
+    ))
+
+    if args.gate and 보고서['보고서정보']['실패개수']:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,660 @@
+# 파일 경로: src/experiments/pipeline_simulator.py
+# 전체 파이프라인 이산 사건 시뮬레이터 (API 게이트웨이 → 큐 → Consumer 레플리카 + HPA)
+
+import csv
+import math
+import time
+import heapq
+import bisect
+import random
+import argparse
+import itertools
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Iterator, Tuple
+
+from src.common.config import 설정가져오기
+from src.common.message_models import MessageType
+from src.common.queue_topology import 큐토폴로지
+from src.consumer.service_time import 처리시간분포, 균등분포, 분포생성
+from src.consumer.subscription_processor import 가입처리서비스
+from src.consumer.mnp_processor import 번호이동처리서비스
+from src.consumer.change_processor import 명의변경처리서비스
+from src.consumer.termination_processor import 해지처리서비스
+from src.experiments.priority_benchmark import 백분위
+
+
+# 타입별 처리 서비스 클래스 (기본 처리 시간 범위/실패율) 와 HPA 대상 Deployment 이름
+처리서비스클래스 = {
+    MessageType.SUBSCRIPTION.value: 가입처리서비스,
+    MessageType.MNP.value: 번호이동처리서비스,
+    MessageType.CHANGE.value: 명의변경처리서비스,
+    MessageType.TERMINATION.value: 해지처리서비스
+}
+배포이름 = {
+    'subscription-processor': MessageType.SUBSCRIPTION.value,
+    'mnp-processor': MessageType.MNP.value,
+    'change-processor': MessageType.CHANGE.value,
+    'termination-processor': MessageType.TERMINATION.value
+}
+
+
+@dataclass
+class 확장동작:
+    """HPA behavior의 scaleUp 또는 scaleDown (쿠버네티스 기본값)"""
+    안정화구간: float = 0
+    정책: List[Tuple[str, int, float]] = field(default_factory=lambda: [('Percent', 100, 15)])
+    정책선택: str = 'Max'
+
+
+@dataclass
+class HPA규칙:
+    """
+    타입별 HPA 규칙 (k8s/consumer/hpa.yaml 에서 읽음)
+
+    속성:
+        최소레플리카 / 최대레플리카: minReplicas / maxReplicas
+        CPU목표: CPU averageUtilization(%)
+        큐길이목표: 큐 길이 External 메트릭 averageValue (없으면 None)
+    """
+    최소레플리카: int = 1
+    최대레플리카: int = 10
+    CPU목표: Optional[float] = 70
+    큐길이목표: Optional[float] = None
+    확장: 확장동작 = field(default_factory=lambda: 확장동작(0, [('Percent', 100, 15), ('Pods', 4, 15)], 'Max'))
+    축소: 확장동작 = field(default_factory=lambda: 확장동작(300, [('Percent', 100, 15)], 'Max'))
+
+
+def _확장동작변환(값: Optional[Dict[str, Any]], 기본: 확장동작) -> 확장동작:
+    """behavior.scaleUp/scaleDown 딕셔너리를 확장동작으로 변환 (빠진 항목은 기본값)"""
+    if not 값:
+        return 기본
+    정책 = [
+        (항목['type'], int(항목['value']), float(항목['periodSeconds']))
+        for 항목 in 값.get('policies', [])
+    ] or 기본.정책
+    return 확장동작(
+        float(값.get('stabilizationWindowSeconds', 기본.안정화구간)),
+        정책,
+        값.get('selectPolicy', 기본.정책선택)
+    )
+
+
+def HPA규칙읽기(경로: str = 'k8s/consumer/hpa.yaml') -> Dict[str, HPA규칙]:
+    """
+    HPA 매니페스트에서 타입별 HPA 규칙 읽기
+
+    CPU 메트릭과 큐 길이 External 메트릭(rabbitmq_queue_messages_ready)만 사용하며,
+    메모리 메트릭은 Consumer 메모리가 부하와 거의 무관하므로 무시
+
+    Args:
+        경로: HPA 매니페스트 경로
+
+    Returns:
+        dict: 메시지 타입 → HPA규칙
+    """
+    try:
+        import yaml
+    except ImportError:
+        raise ImportError("HPA 매니페스트를 읽으려면 PyYAML이 필요합니다 (pip install pyyaml)")
+
+    규칙들 = {}
+    with open(경로, encoding='utf-8') as 파일:
+        for 문서 in yaml.safe_load_all(파일):
+            if not 문서 or 문서.get('kind') != 'HorizontalPodAutoscaler':
+                continue
+            명세 = 문서['spec']
+            타입 = 배포이름.get(명세['scaleTargetRef']['name'])
+            if 타입 is None:
+                continue
+            기본 = HPA규칙()
+            규칙 = HPA규칙(
+                최소레플리카=int(명세.get('minReplicas', 1)),
+                최대레플리카=int(명세['maxReplicas']),
+                CPU목표=None
+            )
+            for 메트릭 in 명세.get('metrics', []):
+                if 메트릭['type'] == 'Resource' and 메트릭['resource']['name'] == 'cpu':
+                    규칙.CPU목표 = float(메트릭['resource']['target']['averageUtilization'])
+                elif 메트릭['type'] == 'External':
+                    규칙.큐길이목표 = float(메트릭['external']['target']['averageValue'])
+            동작 = 명세.get('behavior', {})
+            규칙.확장 = _확장동작변환(동작.get('scaleUp'), 기본.확장)
+            규칙.축소 = _확장동작변환(동작.get('scaleDown'), 기본.축소)
+            규칙들[타입] = 규칙
+    return 규칙들
+
+
+def 부하프로파일해석(문자열: str) -> List[Tuple[float, float]]:
+    """
+    '시각:초당메시지수,...' 형식의 부하 프로파일 해석 (점 사이는 선형 보간)
+
+    예: '0:50,600:50,900:2000,2700:2000,3000:50' - 10분 평상시 후 5분간 증가, 30분 폭주
+    """
+    점들 = []
+    for 항목 in 문자열.split(','):
+        시각, _, 비율 = 항목.partition(':')
+        점들.append((float(시각), float(비율)))
+    점들.sort()
+    if len(점들) < 2:
+        raise ValueError("부하 프로파일에는 시각:초당메시지수 점이 2개 이상 필요합니다")
+    return 점들
+
+
+def 도착생성(프로파일: List[Tuple[float, float]], 타입비율: Dict[str, float],
+         난수: random.Random) -> Iterator[Tuple[float, str]]:
+    """
+    구간별 선형 도착률의 비균질 포아송 도착을 thinning으로 생성
+
+    Yields:
+        tuple: (도착시각, 메시지 타입) - 도착시각 순
+    """
+    타입들 = list(타입비율)
+    누적 = list(itertools.accumulate(타입비율.values()))
+    합계 = 누적[-1]
+    for (시작, 시작비율), (끝, 끝비율) in zip(프로파일, 프로파일[1:]):
+        최대비율 = max(시작비율, 끝비율)
+        if 최대비율 <= 0 or 끝 <= 시작:
+            continue
+        기울기 = (끝비율 - 시작비율) / (끝 - 시작)
+        시각 = 시작
+        while True:
+            시각 += 난수.expovariate(최대비율)
+            if 시각 >= 끝:
+                break
+            if 난수.random() * 최대비율 <= 시작비율 + 기울기 * (시각 - 시작):
+                yield 시각, 타입들[bisect.bisect_right(누적, 난수.random() * 합계)]
+
+
+class _레플리카:
+    """Consumer Pod 하나 (처리 중 개수와 prefetch로 받아 둔 메시지)"""
+    __slots__ = ('준비시각', '처리중', '보유', '버퍼', '제거됨')
+
+    def __init__(self, 준비시각: float):
+        self.준비시각 = 준비시각
+        self.처리중 = 0
+        self.보유 = 0          # 처리 중 + 버퍼 (prefetch 한도까지)
+        self.버퍼 = deque()
+        self.제거됨 = False
+
+
+class _소비자그룹:
+    """메시지 타입 하나의 큐, 레플리카, HPA 상태와 측정값"""
+
+    def __init__(self, 타입: str, 분포: 처리시간분포, 실패율: float, 규칙: HPA규칙):
+        self.타입 = 타입
+        self.분포 = 분포
+        self.실패율 = 실패율
+        self.규칙 = 규칙
+        self.대기 = deque()            # (큐 진입 시각, 최초 도착 시각, 재시도횟수)
+        self.레플리카들: List[_레플리카] = []
+        self.준비목록: List[_레플리카] = []   # 메시지를 받을 수 있는 레플리카 (라운드로빈 전달)
+        self.순환 = 0
+        self.준비용량 = 0              # 준비된 레플리카들의 prefetch 합
+        self.보유합 = 0                # 준비된 레플리카들이 보유한 메시지 수
+        self.처리중합 = 0
+        self.바쁜적분 = 0.0            # 처리 중 작업자 수 × 시간 (CPU 사용률 계산용)
+        self.마지막갱신 = 0.0
+        self.지난바쁜적분 = 0.0
+        self.사용률 = 0.0
+        self.추천기록 = deque()        # (시각, HPA 추천 레플리카 수) - 안정화 구간용
+        self.변경기록 = deque()        # (시각, 레플리카 증감) - 확장 정책 기간용
+        self.대기시간들: List[float] = []
+        self.종단지연들: List[float] = []
+        self.구간대기합 = 0.0
+        self.구간대기수 = 0
+        self.최대대기열 = 0
+        self.최대레플리카 = 0
+
+    def 바쁜적분갱신(self, 지금: float):
+        self.바쁜적분 += self.처리중합 * (지금 - self.마지막갱신)
+        self.마지막갱신 = 지금
+
+    def 활성레플리카수(self) -> int:
+        return sum(1 for 레플리카 in self.레플리카들 if not 레플리카.제거됨)
+
+    def 준비레플리카수(self) -> int:
+        return len(self.준비목록)
+
+
+class 파이프라인시뮬레이터:
+    """
+    API 게이트웨이 수신부터 큐, prefetch, 타입별 Consumer 레플리카, HPA까지의 이산 사건 시뮬레이터
+
+    Minikube 없이 프로모션 같은 폭주 시나리오에서 필요한 레플리카 수와 큐 적체를 추정
+    (수백만 메시지를 수 초~수십 초에 실행)
+
+    모델:
+        게이트웨이: 초당 수신 한도를 넘는 요청은 거부, 나머지는 발행지연 후 큐에 들어감
+        큐: 타입별 FIFO (단일 큐 모드는 다른 타입 Consumer가 받아 reject/requeue하는 재전달 비용을 더함 -
+            여유 prefetch 중 자기 타입 비율이 p면 재전달 횟수는 기하분포)
+        레플리카: 동시처리수만큼 동시에 처리하고 prefetch까지 미리 받아 둠,
+            기동지연 후 준비되며 축소 시 받아 둔 메시지를 큐로 반환(드레인)
+        처리: 처리 서비스의 처리 시간 분포(SERVICE_TIME_*)와 실패율(FAILURE_RATIOS),
+            실패는 큐토폴로지의 단계별 지연 후 재시도, 최대재시도 초과는 데드레터
+        HPA: 쿠버네티스 알고리즘 (허용오차 10%, 안정화 구간, 확장/축소 정책)
+            CPU 사용률 = 처리 중 작업자 비율 × 포화CPU사용률 (처리가 모두 CPU를 쓴다고 가정)
+
+    속성:
+        HPA규칙들 (dict): 타입별 HPA 규칙
+        동시처리수 (int): 레플리카당 동시 처리 수
+        프리페치 (int): 레플리카당 prefetch
+    """
+
+    def __init__(self, HPA규칙들: Optional[Dict[str, HPA규칙]] = None, 동시처리수: Optional[int] = None,
+                 프리페치: Optional[int] = None, 기동지연: float = 30.0, 라우팅모드: Optional[str] = None,
+                 게이트웨이처리량: float = 2000.0, 발행지연: float = 0.005, 재전달지연: float = 0.001,
+                 HPA주기: float = 15.0, 측정간격: float = 60.0, 포화CPU사용률: float = 100.0,
+                 시드: int = 42):
+        """
+        파이프라인 시뮬레이터 초기화
+
+        Args:
+            HPA규칙들: 타입별 HPA 규칙 (None이면 k8s/consumer/hpa.yaml 읽음)
+            동시처리수: 레플리카당 동시 처리 수 (None이면 CONSUMER_CONCURRENCY)
+            프리페치: 레플리카당 prefetch (None이면 CONSUMER_PREFETCH_COUNT, 최소 동시처리수)
+            기동지연: 새 레플리카가 메시지를 받기 시작하기까지 걸리는 시간(초)
+            라우팅모드: single/direct/headers (None이면 ROUTING_MODE)
+            게이트웨이처리량: API 게이트웨이 전체 초당 수신 한도
+            발행지연: 수신부터 큐 진입까지 시간(초)
+            재전달지연: 단일 큐 모드에서 reject/requeue 한 번에 걸리는 시간(초)
+            HPA주기: HPA 동기화 주기(초)
+            측정간격: 시계열 기록 간격(초)
+            포화CPU사용률: 모든 작업자가 처리 중일 때 Pod CPU 사용률(%)
+            시드: 난수 시드
+        """
+        설정 = 설정가져오기()
+        처리설정 = 설정.처리설정가져오기()
+        시뮬레이션설정 = 설정.시뮬레이션설정가져오기()
+
+        self.HPA규칙들 = HPA규칙들 if HPA규칙들 is not None else HPA규칙읽기()
+        self.동시처리수 = max(1, 동시처리수 or 처리설정['동시처리수'])
+        self.프리페치 = max(self.동시처리수, 프리페치 or 처리설정['프리페치카운트'])
+        self.기동지연 = 기동지연
+        self.라우팅모드 = 라우팅모드 or 설정.라우팅설정가져오기()['라우팅모드']
+        self.단일큐 = self.라우팅모드 == 'single'
+        self.게이트웨이처리량 = 게이트웨이처리량
+        self.발행지연 = 발행지연
+        self.재전달지연 = 재전달지연
+        self.HPA주기 = HPA주기
+        self.측정간격 = 측정간격
+        self.포화CPU사용률 = 포화CPU사용률
+        self.시드 = 시드
+        self.토폴로지 = 큐토폴로지()
+        self.최대재시도 = 처리설정['최대재시도']
+
+        # 처리 서비스를 만들지 않고 같은 규칙으로 타입별 분포/실패율 결정
+        self._분포들 = {}
+        self._실패율들 = {}
+        for 타입, 클래스 in 처리서비스클래스.items():
+            명세 = 시뮬레이션설정['처리시간분포'].get(타입)
+            self._분포들[타입] = 분포생성(명세) if 명세 else 균등분포(*클래스.기본처리시간범위)
+            self._실패율들[타입] = 시뮬레이션설정['실패율'].get(타입, 클래스.기본실패율)
+
+    def 실행(self, 프로파일: List[Tuple[float, float]],
+           타입비율: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """
+        부하 프로파일로 시뮬레이션 실행 (도착이 끝나고 큐가 모두 빌 때까지)
+
+        Args:
+            프로파일: 부하프로파일해석 결과 [(시각, 초당메시지수)]
+            타입비율: 타입별 도착 비율 (None이면 균등 - 부하생성기와 같음)
+
+        Returns:
+            dict: 요약, 타입별 지연/레플리카 통계, 시계열, 스케일 이벤트
+        """
+        실행시작 = time.perf_counter()
+        난수 = random.Random(self.시드)
+        타입비율 = 타입비율 or {타입: 1.0 for 타입 in 처리서비스클래스}
+        그룹들 = {
+            타입: _소비자그룹(타입, self._분포들[타입], self._실패율들[타입], self.HPA규칙들.get(타입, HPA규칙()))
+            for 타입 in 처리서비스클래스
+        }
+        사건 = []     # (시각, 순번, 종류, 데이터)
+        순번 = itertools.count()
+        통계 = {'도착': 0, '게이트웨이거부': 0, '완료': 0, '데드레터': 0, '재시도': 0, '필터재전달': 0}
+        시계열 = []
+        스케일이벤트 = []
+
+        # 시작 레플리카는 minReplicas (이미 준비된 상태)
+        for 그룹 in 그룹들.values():
+            for _ in range(그룹.규칙.최소레플리카):
+                그룹.레플리카들.append(_레플리카(0.0))
+            그룹.준비목록 = list(그룹.레플리카들)
+            그룹.준비용량 = 그룹.규칙.최소레플리카 * self.프리페치
+            그룹.최대레플리카 = 그룹.규칙.최소레플리카
+        전체여유 = sum(그룹.준비용량 for 그룹 in 그룹들.values())   # 모든 타입의 남은 prefetch 합
+
+        def 처리시작(그룹: _소비자그룹, 레플리카: _레플리카, 메시지: tuple, 지금: float,
+                 전달지연: float = 0.0):
+            시작 = 지금 + 전달지연
+            대기시간 = 시작 - 메시지[0]
+            그룹.대기시간들.append(대기시간)
+            그룹.구간대기합 += 대기시간
+            그룹.구간대기수 += 1
+            그룹.바쁜적분갱신(지금)
+            그룹.처리중합 += 1
+            레플리카.처리중 += 1
+            heapq.heappush(사건, (시작 + 그룹.분포.표본(난수), next(순번), '완료', (그룹, 레플리카, 메시지)))
+
+        def 전달(그룹: _소비자그룹, 지금: float):
+            # 큐 앞쪽 메시지를 prefetch 여유가 있는 준비된 레플리카에 라운드로빈으로 전달
+            nonlocal 전체여유
+            목록 = 그룹.준비목록
+            while 그룹.대기 and 그룹.보유합 < 그룹.준비용량:
+                while True:
+                    레플리카 = 목록[그룹.순환 % len(목록)]
+                    그룹.순환 += 1
+                    if 레플리카.보유 < self.프리페치:
+                        break
+                전달지연 = 0.0
+                if self.단일큐:
+                    # 다른 타입 Consumer에게 먼저 전달되어 reject/requeue되는 횟수 (기하분포)
+                    p = (그룹.준비용량 - 그룹.보유합) / 전체여유
+                    if p < 1:
+                        재전달 = int(math.log(1.0 - 난수.random()) / math.log(1.0 - p))
+                        통계['필터재전달'] += 재전달
+                        전달지연 = 재전달 * self.재전달지연
+                메시지 = 그룹.대기.popleft()
+                레플리카.보유 += 1
+                그룹.보유합 += 1
+                전체여유 -= 1
+                if 레플리카.처리중 < self.동시처리수:
+                    처리시작(그룹, 레플리카, 메시지, 지금, 전달지연)
+                else:
+                    레플리카.버퍼.append(메시지)
+
+        def 완료(그룹: _소비자그룹, 레플리카: _레플리카, 메시지: tuple, 지금: float):
+            nonlocal 전체여유
+            그룹.바쁜적분갱신(지금)
+            그룹.처리중합 -= 1
+            레플리카.처리중 -= 1
+            레플리카.보유 -= 1
+            if not 레플리카.제거됨:
+                그룹.보유합 -= 1
+                전체여유 += 1
+
+            _, 최초도착, 재시도횟수 = 메시지
+            if 난수.random() < 그룹.실패율:
+                if 재시도횟수 < self.최대재시도:
+                    통계['재시도'] += 1
+                    지연 = self.토폴로지.재시도지연ms(재시도횟수 + 1) / 1000
+                    heapq.heappush(사건, (지금 + 지연, next(순번), '재시도', (그룹, 최초도착, 재시도횟수 + 1)))
+                else:
+                    통계['데드레터'] += 1
+            else:
+                통계['완료'] += 1
+                그룹.종단지연들.append(지금 - 최초도착)
+
+            if not 레플리카.제거됨 and 레플리카.버퍼:
+                처리시작(그룹, 레플리카, 레플리카.버퍼.popleft(), 지금)
+            전달(그룹, 지금)
+
+        def HPA실행(그룹: _소비자그룹, 지금: float):
+            nonlocal 전체여유
+            규칙 = 그룹.규칙
+            그룹.바쁜적분갱신(지금)
+            현재 = 그룹.활성레플리카수()
+            준비 = 그룹.준비레플리카수()
+            작업자용량 = max(1, 준비) * self.동시처리수 * self.HPA주기
+            그룹.사용률 = (그룹.바쁜적분 - 그룹.지난바쁜적분) / 작업자용량 * self.포화CPU사용률
+            그룹.지난바쁜적분 = 그룹.바쁜적분
+
+            # 메트릭별 희망 레플리카 수 중 최대 (변화율이 허용오차 10% 이내면 유지)
+            추천 = 규칙.최소레플리카
+            if 규칙.CPU목표 and 준비:
+                비율 = 그룹.사용률 / 규칙.CPU목표
+                추천 = max(추천, 현재 if abs(비율 - 1) <= 0.1 else math.ceil(준비 * 비율))
+            if 규칙.큐길이목표:
+                비율 = len(그룹.대기) / (현재 * 규칙.큐길이목표)
+                추천 = max(추천, 현재 if abs(비율 - 1) <= 0.1 else math.ceil(len(그룹.대기) / 규칙.큐길이목표))
+            추천 = min(추천, 규칙.최대레플리카)
+
+            # 안정화: 확장은 구간 내 최소 추천, 축소는 구간 내 최대 추천까지만
+            그룹.추천기록.append((지금, 추천))
+            보관구간 = max(규칙.확장.안정화구간, 규칙.축소.안정화구간)
+            while 그룹.추천기록 and 그룹.추천기록[0][0] < 지금 - 보관구간:
+                그룹.추천기록.popleft()
+            확장추천 = min(값 for 시각, 값 in 그룹.추천기록 if 시각 >= 지금 - 규칙.확장.안정화구간)
+            축소추천 = max(값 for 시각, 값 in 그룹.추천기록 if 시각 >= 지금 - 규칙.축소.안정화구간)
+            목표 = 현재
+            if 목표 < 확장추천:
+                목표 = min(확장추천, self._확장한도(그룹, 규칙.확장, 현재, 지금, 1))
+            if 목표 > 축소추천:
+                목표 = max(축소추천, self._확장한도(그룹, 규칙.축소, 현재, 지금, -1))
+
+            if 목표 > 현재:
+                for _ in range(목표 - 현재):
+                    레플리카 = _레플리카(지금 + self.기동지연)
+                    그룹.레플리카들.append(레플리카)
+                    heapq.heappush(사건, (레플리카.준비시각, next(순번), '준비', (그룹, 레플리카)))
+            elif 목표 < 현재:
+                # 준비 전이거나 가장 최근에 만든 레플리카부터 제거, 받아 둔 메시지는 큐 앞으로 반환
+                for 레플리카 in sorted(
+                    (r for r in 그룹.레플리카들 if not r.제거됨), key=lambda r: -r.준비시각
+                )[:현재 - 목표]:
+                    레플리카.제거됨 = True
+                    if 레플리카 in 그룹.준비목록:
+                        그룹.준비목록.remove(레플리카)
+                        그룹.준비용량 -= self.프리페치
+                        그룹.보유합 -= 레플리카.보유
+                        전체여유 -= self.프리페치 - 레플리카.보유
+                        그룹.대기.extendleft(reversed(레플리카.버퍼))
+                        레플리카.보유 -= len(레플리카.버퍼)
+                        레플리카.버퍼.clear()
+                그룹.레플리카들 = [r for r in 그룹.레플리카들 if not r.제거됨 or r.처리중]
+                전달(그룹, 지금)
+            if 목표 != 현재:
+                그룹.변경기록.append((지금, 목표 - 현재))
+                그룹.최대레플리카 = max(그룹.최대레플리카, 목표)
+                스케일이벤트.append({
+                    '시각': round(지금), '타입': 그룹.타입, '이전': 현재, '이후': 목표,
+                    '사용률': round(그룹.사용률, 1), '대기': len(그룹.대기)
+                })
+
+        def 측정(지금: float):
+            항목 = {'시각': round(지금)}
+            for 타입, 그룹 in 그룹들.items():
+                그룹.최대대기열 = max(그룹.최대대기열, len(그룹.대기))
+                항목[타입] = {
+                    '대기': len(그룹.대기),
+                    '미확인': 그룹.보유합,
+                    '레플리카': 그룹.활성레플리카수(),
+                    '준비레플리카': 그룹.준비레플리카수(),
+                    '사용률': round(그룹.사용률, 1),
+                    '평균대기시간': round(그룹.구간대기합 / 그룹.구간대기수, 2) if 그룹.구간대기수 else 0.0
+                }
+                그룹.구간대기합 = 0.0
+                그룹.구간대기수 = 0
+            시계열.append(항목)
+
+        도착들 = 도착생성(프로파일, 타입비율, 난수)
+        다음도착 = next(도착들, None)
+        초구간, 초구간수신 = -1, 0
+        다음HPA = self.HPA주기
+        다음측정 = 0.0
+        지금 = 0.0
+
+        while True:
+            도착시각 = 다음도착[0] + self.발행지연 if 다음도착 else math.inf
+            사건시각 = 사건[0][0] if 사건 else math.inf
+            if 도착시각 == math.inf and 사건시각 == math.inf:
+                if not any(그룹.대기 for 그룹 in 그룹들.values()):
+                    break
+            지금 = min(도착시각, 사건시각, 다음HPA, 다음측정)
+
+            if 지금 == 다음측정:
+                측정(지금)
+                다음측정 += self.측정간격
+            elif 지금 == 다음HPA:
+                for 그룹 in 그룹들.values():
+                    HPA실행(그룹, 지금)
+                다음HPA += self.HPA주기
+            elif 지금 == 도착시각:
+                # 게이트웨이 초당 수신 한도 초과분은 거부 (부하생성기 입장에서는 실패 응답)
+                통계['도착'] += 1
+                초 = int(다음도착[0])
+                if 초 != 초구간:
+                    초구간, 초구간수신 = 초, 0
+                if 초구간수신 >= self.게이트웨이처리량:
+                    통계['게이트웨이거부'] += 1
+                else:
+                    초구간수신 += 1
+                    그룹 = 그룹들[다음도착[1]]
+                    그룹.대기.append((지금, 다음도착[0], 0))
+                    전달(그룹, 지금)
+                다음도착 = next(도착들, None)
+            else:
+                _, _, 종류, 데이터 = heapq.heappop(사건)
+                if 종류 == '완료':
+                    완료(*데이터, 지금)
+                elif 종류 == '재시도':
+                    그룹, 최초도착, 재시도횟수 = 데이터
+                    그룹.대기.append((지금, 최초도착, 재시도횟수))
+                    전달(그룹, 지금)
+                elif 종류 == '준비':
+                    그룹, 레플리카 = 데이터
+                    if not 레플리카.제거됨:
+                        그룹.준비목록.append(레플리카)
+                        그룹.준비용량 += self.프리페치
+                        전체여유 += self.프리페치
+                        전달(그룹, 지금)
+        측정(지금)
+
+        타입별 = {}
+        for 타입, 그룹 in 그룹들.items():
+            그룹.대기시간들.sort()
+            그룹.종단지연들.sort()
+            타입별[타입] = {
+                '처리수': len(그룹.대기시간들),
+                '대기p50': round(백분위(그룹.대기시간들, 50), 2),
+                '대기p95': round(백분위(그룹.대기시간들, 95), 2),
+                '대기p99': round(백분위(그룹.대기시간들, 99), 2),
+                '대기최대': round(그룹.대기시간들[-1], 2) if 그룹.대기시간들 else 0.0,
+                '종단p99': round(백분위(그룹.종단지연들, 99), 2),
+                '최대대기열': 그룹.최대대기열,
+                '최대레플리카': 그룹.최대레플리카,
+                '평균처리시간': round(그룹.분포.평균(), 3)
+            }
+
+        return {
+            '요약': {
+                **통계,
+                '시뮬레이션시간': round(지금, 1),
+                '실행시간': round(time.perf_counter() - 실행시작, 2),
+                '라우팅모드': self.라우팅모드,
+                '동시처리수': self.동시처리수,
+                '프리페치': self.프리페치
+            },
+            '타입별': 타입별,
+            '시계열': 시계열,
+            '스케일이벤트': 스케일이벤트
+        }
+
+    def _확장한도(self, 그룹: _소비자그룹, 동작: 확장동작, 현재: int, 지금: float, 방향: int) -> int:
+        """
+        확장(방향 1)/축소(방향 -1) 정책이 허용하는 레플리카 수 한도
+
+        정책 기간 안에 이미 바뀐 만큼을 빼서 기간 시작 시점 레플리카 수를 구한 뒤 정책별 한도를 계산하고,
+        selectPolicy Max는 가장 큰 변화, Min은 가장 작은 변화를 허용하는 한도 선택
+        """
+        if 동작.정책선택 == 'Disabled':
+            return 현재
+        한도들 = []
+        for 종류, 값, 기간 in 동작.정책:
+            변화 = sum(증감 for 시각, 증감 in 그룹.변경기록 if 시각 > 지금 - 기간 and 증감 * 방향 > 0)
+            기간시작 = 현재 - 변화
+            if 종류 == 'Pods':
+                한도들.append(기간시작 + 방향 * 값)
+            elif 방향 > 0:
+                한도들.append(math.ceil(기간시작 * (1 + 값 / 100)))
+            else:
+                한도들.append(math.ceil(기간시작 * (1 - 값 / 100)))
+        if (동작.정책선택 == 'Max') == (방향 > 0):
+            return max(한도들)
+        return min(한도들)
+
+
+def 결과출력(결과: Dict[str, Any], 최대행수: int = 60):
+    """요약, 타입별 지연/레플리카, 시계열(대기열/레플리카)을 표 형태로 출력 (시간 단위: 초, 시계열은 최대행수까지 솎아냄)"""
+    요약 = 결과['요약']
+    print(
+        f"도착 {요약['도착']:,}  게이트웨이거부 {요약['게이트웨이거부']:,}  완료 {요약['완료']:,}  "
+        f"재시도 {요약['재시도']:,}  데드레터 {요약['데드레터']:,}  필터재전달 {요약['필터재전달']:,}"
+    )
+    print(
+        f"시뮬레이션 {요약['시뮬레이션시간']:,}초 / 실행 {요약['실행시간']}초  "
+        f"({요약['라우팅모드']}, 동시처리수 {요약['동시처리수']}, prefetch {요약['프리페치']})\n"
+    )
+
+    print(f"{'타입':<14}{'처리수':>10}{'대기p50':>10}{'대기p95':>10}{'대기p99':>10}{'종단p99':>10}{'최대대기열':>12}{'최대Pod':>9}")
+    for 타입, 값 in 결과['타입별'].items():
+        print(
+            f"{타입:<14}{값['처리수']:>10}{값['대기p50']:>10}{값['대기p95']:>10}{값['대기p99']:>10}"
+            f"{값['종단p99']:>10}{값['최대대기열']:>12}{값['최대레플리카']:>9}"
+        )
+
+    타입들 = list(결과['타입별'])
+    print(f"\n{'시각':>7}  " + "  ".join(f"{타입[:4]:>4} 대기/Pod/사용률/대기시간" for 타입 in 타입들))
+    for 항목 in 결과['시계열'][::max(1, len(결과['시계열']) // 최대행수)]:
+        print(f"{항목['시각']:>7}  " + "  ".join(
+            f"{항목[타입]['대기']:>9}/{항목[타입]['레플리카']:>2}/{항목[타입]['사용률']:>5}%/{항목[타입]['평균대기시간']:>7}"
+            for 타입 in 타입들
+        ))
+
+
+def 시계열저장(결과: Dict[str, Any], 경로: str):
+    """시계열을 CSV로 저장 (열: 시각, 타입_항목)"""
+    타입들 = list(결과['타입별'])
+    항목들 = ['대기', '미확인', '레플리카', '준비레플리카', '사용률', '평균대기시간']
+    with open(경로, 'w', newline='', encoding='utf-8') as 파일:
+        기록기 = csv.writer(파일)
+        기록기.writerow(['시각'] + [f"{타입}_{항목}" for 타입 in 타입들 for 항목 in 항목들])
+        for 행 in 결과['시계열']:
+            기록기.writerow([행['시각']] + [행[타입][항목] for 타입 in 타입들 for 항목 in 항목들])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='전체 파이프라인 이산 사건 시뮬레이터 (클러스터 용량 산정)')
+    parser.add_argument('--profile', default='0:5,600:5,900:50,2700:50,3000:5,3600:5',
+                        help="부하 프로파일 '시각:초당메시지수,...' (선형 보간)")
+    parser.add_argument('--mix', default=None, help="타입별 비율 'SUBSCRIPTION=4,MNP=2,...' (기본 균등)")
+    parser.add_argument('--hpa', default='k8s/consumer/hpa.yaml', help='HPA 매니페스트 경로')
+    parser.add_argument('--queue-target', type=float, default=None,
+                        help='큐 길이 External 메트릭 averageValue (모든 타입에 추가)')
+    parser.add_argument('--concurrency', type=int, default=None, help='레플리카당 동시 처리 수')
+    parser.add_argument('--prefetch', type=int, default=None, help='레플리카당 prefetch')
+    parser.add_argument('--startup', type=float, default=30.0, help='레플리카 기동 지연(초)')
+    parser.add_argument('--routing', choices=['single', 'direct', 'headers'], default=None, help='라우팅 모드')
+    parser.add_argument('--gateway-rate', type=float, default=2000.0, help='게이트웨이 전체 초당 수신 한도')
+    parser.add_argument('--cpu-saturation', type=float, default=100.0,
+                        help='모든 작업자가 처리 중일 때 Pod CPU 사용률(%%)')
+    parser.add_argument('--interval', type=float, default=60.0, help='시계열 기록 간격(초)')
+    parser.add_argument('--seed', type=int, default=42, help='난수 시드')
+    parser.add_argument('--csv', default=None, help='시계열 CSV 저장 경로')
+    args = parser.parse_args()
+
+    규칙들 = HPA규칙읽기(args.hpa)
+    if args.queue_target:
+        for 규칙 in 규칙들.values():
+            규칙.큐길이목표 = args.queue_target
+    타입비율 = None
+    if args.mix:
+        타입비율 = {
+            타입.strip().upper(): float(값)
+            for 타입, _, 값 in (항목.partition('=') for 항목 in args.mix.split(','))
+        }
+
+    시뮬레이터 = 파이프라인시뮬레이터(
+        규칙들, args.concurrency, args.prefetch, args.startup, args.routing,
+        args.gateway_rate, HPA주기=15.0, 측정간격=args.interval,
+        포화CPU사용률=args.cpu_saturation, 시드=args.seed
+    )
+    결과 = 시뮬레이터.실행(부하프로파일해석(args.profile), 타입비율)
+    결과출력(결과)
+    if args.csv:
+        시계열저장(결과, args.csv)
+
+
+if __name__ == "__main__":
+    main()
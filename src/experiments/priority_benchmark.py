@@ -0,0 +1,180 @@
+# 파일 경로: src/experiments/priority_benchmark.py
+# 메시지 우선순위 벤치마크 (혼합 폭주 시 타입별 지연 꼬리 비교)
+
+import argparse
+import heapq
+import random
+import itertools
+from collections import deque
+from typing import Dict, Any, List, Optional
+
+from src.common.message_models import MessageType
+
+
+# 타입별 처리 시간 범위(초) - 각 처리 서비스의 처리시뮬레이션과 같은 값
+처리시간범위 = {
+    'SUBSCRIPTION': (0.1, 2.0),
+    'MNP': (1.0, 5.0),
+    'CHANGE': (0.5, 3.0),
+    'TERMINATION': (1.0, 4.0)
+}
+
+# 기본 타입별 우선순위 (MESSAGE_PRIORITIES 기본값과 동일)
+기본우선순위 = {'TERMINATION': 8, 'MNP': 6, 'CHANGE': 4, 'SUBSCRIPTION': 2}
+
+
+def 백분위(값목록: List[float], 비율: float) -> float:
+    """정렬된 값 목록의 백분위 (nearest-rank)"""
+    if not 값목록:
+        return 0.0
+    순위 = max(0, min(len(값목록) - 1, int(round(비율 / 100 * len(값목록))) - 1))
+    return 값목록[순위]
+
+
+def 도착목록생성(폭주개수: int, 긴급초당: float, 지속시간: float, 시드: int) -> List[tuple]:
+    """
+    혼합 폭주 도착 목록 생성: 0초에 SUBSCRIPTION 폭주 + 지속시간 동안 나머지 타입이 포아송 도착
+
+    Returns:
+        list: (도착시각, 타입, 처리시간) 목록 (도착시각 순)
+    """
+    난수 = random.Random(시드)
+    도착목록 = [
+        (0.0, 'SUBSCRIPTION', 난수.uniform(*처리시간범위['SUBSCRIPTION']))
+        for _ in range(폭주개수)
+    ]
+    for 타입 in (t.value for t in MessageType if t is not MessageType.SUBSCRIPTION):
+        시각 = 0.0
+        while True:
+            시각 += 난수.expovariate(긴급초당)
+            if 시각 >= 지속시간:
+                break
+            도착목록.append((시각, 타입, 난수.uniform(*처리시간범위[타입])))
+    도착목록.sort(key=lambda 항목: 항목[0])
+    return 도착목록
+
+
+def 큐시뮬레이션(도착목록: List[tuple], 작업자수: int, 프리페치: int,
+             우선순위: Optional[Dict[str, int]] = None) -> Dict[str, List[float]]:
+    """
+    작업자들이 하나의 큐를 소비하는 과정을 이산 사건으로 시뮬레이션
+
+    브로커 동작을 따라 큐에 남은 메시지만 우선순위 순으로 꺼내고(같은 우선순위는 FIFO),
+    작업자는 prefetch만큼 미리 받아 둔 메시지를 받은 순서대로 하나씩 처리
+
+    Args:
+        도착목록: 도착목록생성 결과
+        작업자수: 큐를 소비하는 작업자 수
+        프리페치: 작업자당 prefetch
+        우선순위: 타입별 우선순위 (None이면 FIFO)
+
+    Returns:
+        dict: 타입별 지연 시간(도착부터 처리 완료까지, 초) 목록
+    """
+    큐 = []  # (-우선순위, 순번, 도착시각, 타입, 처리시간)
+    받은메시지 = [deque() for _ in range(작업자수)]
+    처리중 = [False] * 작업자수
+    사건 = []  # (시각, 순번, 작업자) 처리 완료 사건
+    지연 = {t.value: [] for t in MessageType}
+    순번 = itertools.count()
+
+    def 작업시작(작업자: int, 지금: float):
+        if 처리중[작업자] or not 받은메시지[작업자]:
+            return
+        _, _, _, _, 처리시간 = 받은메시지[작업자][0]
+        처리중[작업자] = True
+        heapq.heappush(사건, (지금 + 처리시간, next(순번), 작업자))
+
+    def 전달(지금: float):
+        # prefetch 여유가 있는 작업자에게 큐 앞쪽 메시지를 차례로 전달
+        for 작업자 in range(작업자수):
+            while 큐 and len(받은메시지[작업자]) < 프리페치:
+                받은메시지[작업자].append(heapq.heappop(큐))
+            작업시작(작업자, 지금)
+
+    위치 = 0
+    while 위치 < len(도착목록) or 사건:
+        다음도착 = 도착목록[위치][0] if 위치 < len(도착목록) else float('inf')
+        if 사건 and 사건[0][0] <= 다음도착:
+            지금, _, 작업자 = heapq.heappop(사건)
+            _, _, 도착시각, 타입, _ = 받은메시지[작업자].popleft()
+            지연[타입].append(지금 - 도착시각)
+            처리중[작업자] = False
+        else:
+            지금 = 다음도착
+            while 위치 < len(도착목록) and 도착목록[위치][0] <= 지금:
+                도착시각, 타입, 처리시간 = 도착목록[위치]
+                순위 = 우선순위.get(타입, 0) if 우선순위 else 0
+                heapq.heappush(큐, (-순위, next(순번), 도착시각, 타입, 처리시간))
+                위치 += 1
+        전달(지금)
+
+    return 지연
+
+
+def 우선순위벤치마크실행(폭주개수: int = 10000, 작업자수: int = 50, 프리페치목록: tuple = (1, 10),
+                   긴급초당: float = 1.0, 시드: int = 42) -> List[Dict[str, Any]]:
+    """
+    SUBSCRIPTION 폭주와 다른 타입의 꾸준한 요청이 섞인 상황에서
+    FIFO와 우선순위 큐의 타입별 지연 꼬리(p50/p95/p99) 비교
+
+    Args:
+        폭주개수: 0초에 한꺼번에 들어오는 SUBSCRIPTION 수
+        작업자수: 큐를 소비하는 작업자 수
+        프리페치목록: 비교할 작업자당 prefetch 값들 (prefetch가 크면 우선순위 효과가 줄어듦)
+        긴급초당: 나머지 타입별 초당 도착 수
+        시드: 난수 시드
+
+    Returns:
+        list: (모드, prefetch, 타입)별 지연 통계
+    """
+    # 폭주를 다 처리할 때까지 나머지 타입이 계속 도착하도록 지속시간 설정
+    평균처리시간 = sum(처리시간범위['SUBSCRIPTION']) / 2
+    지속시간 = 폭주개수 * 평균처리시간 / 작업자수
+    도착목록 = 도착목록생성(폭주개수, 긴급초당, 지속시간, 시드)
+
+    결과목록 = []
+    for 프리페치 in 프리페치목록:
+        for 모드, 우선순위 in (('FIFO', None), ('우선순위', 기본우선순위)):
+            지연 = 큐시뮬레이션(도착목록, 작업자수, 프리페치, 우선순위)
+            for 타입, 값목록 in 지연.items():
+                값목록.sort()
+                결과목록.append({
+                    '모드': 모드,
+                    '프리페치': 프리페치,
+                    '타입': 타입,
+                    '개수': len(값목록),
+                    'p50': round(백분위(값목록, 50), 2),
+                    'p95': round(백분위(값목록, 95), 2),
+                    'p99': round(백분위(값목록, 99), 2),
+                    '최대': round(값목록[-1], 2) if 값목록 else 0.0
+                })
+    return 결과목록
+
+
+def 결과출력(결과목록: List[Dict[str, Any]]):
+    """측정 결과를 표 형태로 출력 (지연 단위: 초)"""
+    print(f"{'모드':<8}{'prefetch':>9}  {'타입':<14}{'개수':>7}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}")
+    for 결과 in 결과목록:
+        print(
+            f"{결과['모드']:<8}{결과['프리페치']:>9}  {결과['타입']:<14}{결과['개수']:>7}"
+            f"{결과['p50']:>9}{결과['p95']:>9}{결과['p99']:>9}{결과['최대']:>9}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='메시지 우선순위 벤치마크 (혼합 폭주 시 타입별 지연)')
+    parser.add_argument('--burst', type=int, default=10000, help='동시에 들어오는 SUBSCRIPTION 수')
+    parser.add_argument('--workers', type=int, default=50, help='큐를 소비하는 작업자 수')
+    parser.add_argument('--prefetch', type=int, nargs='+', default=[1, 10], help='비교할 작업자당 prefetch')
+    parser.add_argument('--urgent-rate', type=float, default=1.0, help='나머지 타입별 초당 도착 수')
+    parser.add_argument('--seed', type=int, default=42, help='난수 시드')
+    args = parser.parse_args()
+
+    결과출력(우선순위벤치마크실행(
+        args.burst, args.workers, tuple(args.prefetch), args.urgent_rate, args.seed
+    ))
+
+
+if __name__ == "__main__":
+    main()
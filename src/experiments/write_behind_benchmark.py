@@ -0,0 +1,131 @@
+# 파일 경로: src/experiments/write_behind_benchmark.py
+# 처리 결과 지연 쓰기(write-behind) 벤치마크 (메시지마다 쓰기 vs 묶음 쓰기)
+
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+
+from src.common.latency_histogram import 지연히스토그램
+from src.consumer.write_behind import 모의백엔드, 쓰기지연버퍼
+
+
+def _레코드(순번: int) -> Dict[str, Any]:
+    """가입 처리 결과와 비슷한 형태의 레코드"""
+    return {
+        '메시지아이디': f"MSG{순번:08d}",
+        '처리타입': 'SUBSCRIPTION',
+        '고객정보': {'고객번호': f"CUST{순번:06d}", '상태': '활성'}
+    }
+
+
+def 쓰기벤치마크실행(메시지수: int = 2000, 작업자수: int = 8, 프리페치: int = 200,
+               처리시간ms: float = 1.0, 왕복지연ms: float = 5.0, 레코드당지연ms: float = 0.05,
+               동시쓰기한도: int = 4, 최대건수: Optional[int] = None,
+               최대대기ms: float = 20) -> Dict[str, Any]:
+    """
+    작업자들이 메시지를 처리하고 결과 레코드를 모의 백엔드에 기록하는 과정을 실제 시간으로 측정
+
+    작업자는 처리 중이거나 ACK을 기다리는 메시지가 프리페치만큼 차면 다음 메시지를 받지 못함
+    최대건수가 None이면 메시지마다 바로 쓰고 ACK, 아니면 쓰기 지연 버퍼에 넣고 묶음 쓰기 후 ACK
+
+    Args:
+        메시지수: 처리할 메시지 수
+        작업자수: 처리 작업 스레드 수 (CONSUMER_CONCURRENCY)
+        프리페치: ACK되지 않은 메시지 수 상한 (CONSUMER_PREFETCH_COUNT)
+        처리시간ms: 메시지당 처리 시간 (쓰기 제외)
+        왕복지연ms / 레코드당지연ms / 동시쓰기한도: 모의 백엔드 쓰기 비용
+        최대건수: 지연 쓰기 묶음 최대 레코드 수 (None이면 메시지마다 쓰기)
+        최대대기ms: 지연 쓰기 첫 레코드 이후 최대 대기 시간
+
+    Returns:
+        dict: 처리량, ACK 지연(처리 완료 → ACK) 분포, 백엔드 호출 통계
+    """
+    백엔드 = 모의백엔드(왕복지연ms, 레코드당지연ms, 동시쓰기한도)
+    버퍼 = 쓰기지연버퍼(백엔드.쓰기, 최대건수, 최대대기ms) if 최대건수 else None
+    미확인 = threading.Semaphore(프리페치)
+    확인지연 = 지연히스토그램(최대값=60)
+    잠금 = threading.Lock()
+    완료 = threading.Event()
+    확인수 = [0]
+
+    def 확인(처리완료시각: float):
+        with 잠금:
+            확인지연.기록(time.perf_counter() - 처리완료시각)
+            확인수[0] += 1
+            if 확인수[0] == 메시지수:
+                완료.set()
+        미확인.release()
+
+    def 처리(순번: int):
+        time.sleep(처리시간ms / 1000)
+        처리완료시각 = time.perf_counter()
+        if 버퍼 is None:
+            백엔드.쓰기([_레코드(순번)])
+            확인(처리완료시각)
+        else:
+            버퍼.추가(_레코드(순번), lambda 성공, 오류, 시각=처리완료시각: 확인(시각))
+
+    시작 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=작업자수) as 작업실행기:
+        for 순번 in range(메시지수):
+            미확인.acquire()
+            작업실행기.submit(처리, 순번)
+        완료.wait()
+    소요시간 = time.perf_counter() - 시작
+    if 버퍼 is not None:
+        버퍼.중지()
+
+    요약 = 확인지연.요약()
+    return {
+        '방식': f"write-behind({최대건수})" if 최대건수 else 'per-message',
+        '처리량': round(메시지수 / 소요시간, 1),
+        '소요시간': round(소요시간, 3),
+        '확인지연p50ms': round(요약['p50'] * 1000, 1),
+        '확인지연p99ms': round(요약['p99'] * 1000, 1),
+        **백엔드.통계조회()
+    }
+
+
+def 결과출력(결과목록: List[Dict[str, Any]]):
+    """측정 결과를 표 형태로 출력 (첫 행 대비 처리량 배율 포함)"""
+    기준 = 결과목록[0]
+    print(
+        f"{'방식':<22}{'msg/s':>10}{'배율':>8}{'ACK p50 ms':>12}{'ACK p99 ms':>12}"
+        f"{'백엔드 호출':>12}{'호출당 레코드':>14}"
+    )
+    for 결과 in 결과목록:
+        print(
+            f"{결과['방식']:<22}{결과['처리량']:>10}{결과['처리량'] / 기준['처리량']:>8.1f}"
+            f"{결과['확인지연p50ms']:>12}{결과['확인지연p99ms']:>12}"
+            f"{결과['호출수']:>12}{결과['호출당레코드']:>14}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='처리 결과 지연 쓰기 벤치마크')
+    parser.add_argument('--messages', type=int, default=2000, help='처리할 메시지 수')
+    parser.add_argument('--workers', type=int, default=8, help='작업 스레드 수')
+    parser.add_argument('--prefetch', type=int, default=200, help='ACK되지 않은 메시지 수 상한')
+    parser.add_argument('--service-ms', type=float, default=1.0, help='메시지당 처리 시간(ms, 쓰기 제외)')
+    parser.add_argument('--rtt-ms', type=float, default=5.0, help='백엔드 쓰기 호출당 왕복 지연(ms)')
+    parser.add_argument('--per-record-ms', type=float, default=0.05, help='백엔드 레코드당 지연(ms)')
+    parser.add_argument('--backend-concurrency', type=int, default=4, help='백엔드 동시 쓰기 한도')
+    parser.add_argument('--max-records', default='10,100', help='비교할 묶음 최대 레코드 수 목록')
+    parser.add_argument('--max-wait-ms', type=float, default=20, help='묶음 최대 대기 시간(ms)')
+    args = parser.parse_args()
+
+    공통 = dict(
+        메시지수=args.messages, 작업자수=args.workers, 프리페치=args.prefetch,
+        처리시간ms=args.service_ms, 왕복지연ms=args.rtt_ms, 레코드당지연ms=args.per_record_ms,
+        동시쓰기한도=args.backend_concurrency, 최대대기ms=args.max_wait_ms
+    )
+    결과목록 = [쓰기벤치마크실행(**공통)]
+    for 최대건수 in (int(값) for 값 in args.max_records.split(',') if 값.strip()):
+        결과목록.append(쓰기벤치마크실행(최대건수=최대건수, **공통))
+    결과출력(결과목록)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,9 +6,11 @@
 from .api_gateway import API게이트웨이
 from .message_router import 메시지라우터
 from .message_producer import BSS메시지생산자
+from .async_producer import 비동기메시지생산자
 
 __all__ = [
     'API게이트웨이',
     '메시지라우터',
-    'BSS메시지생산자'
+    'BSS메시지생산자',
+    '비동기메시지생산자'
 ]
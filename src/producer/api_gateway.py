@@ -7,11 +7,15 @@ from pydantic import BaseModel, Field
 from typing import Dict, Any, List, Optional
 import uvicorn
 import asyncio
+import functools
 from datetime import datetime
 
 from src.common.message_models import BSS메시지, MessageType
 from src.producer.message_router import 메시지라우터
+from src.producer.micro_batcher import 마이크로배처
+from src.producer.spool import 로컬스풀, 스풀재생기
 from src.common.config import 설정가져오기
+from src.common.dead_letter import 데드레터관리자
 
 
 # 요청 모델 정의
@@ -25,6 +29,13 @@ class 배치메시지요청(BaseModel):
     메시지목록: List[메시지요청] = Field(..., description="전송할 메시지 목록")
 
 
+class 재주입요청(BaseModel):
+    타입: Optional[str] = Field(None, description="재주입할 메시지 타입 (없으면 전체)")
+    사유: Optional[str] = Field(None, description="실패 사유에 포함된 문자열")
+    최대개수: Optional[int] = Field(None, description="재주입할 최대 메시지 수 (없으면 조건에 맞는 전체)")
+    초당개수: Optional[float] = Field(None, description="초당 재주입 수 (없으면 DLQ_REPLAY_RATE_PER_SEC, 0이면 제한 없음)")
+
+
 # 응답 모델 정의
 class 기본응답(BaseModel):
     성공: bool
@@ -48,7 +59,26 @@ class API게이트웨이:
         """API 게이트웨이 초기화"""
         self.설정 = 설정가져오기()
         self.로거 = self.설정.로거설정('API게이트웨이')
-        self.라우터 = 메시지라우터()
+        
+        # 브로커 장애 대비 로컬 스풀 (선택)
+        self.스풀: Optional[로컬스풀] = None
+        self.스풀재생기: Optional[스풀재생기] = None
+        if self.설정.스풀설정가져오기()['활성화']:
+            self.스풀 = 로컬스풀()
+        
+        self.라우터 = 메시지라우터(스풀=self.스풀)
+        if self.스풀:
+            self.스풀재생기 = 스풀재생기(self.스풀, self.라우터.스풀재전송)
+        
+        # 데드레터 큐 조회/재주입 (재주입은 백그라운드 스레드에서 실행)
+        self.데드레터 = 데드레터관리자()
+        self._재주입작업: Optional[asyncio.Future] = None
+        
+        # 단일 메시지 요청 마이크로 배칭 (선택)
+        self.마이크로배처: Optional[마이크로배처] = None
+        if self.설정.게이트웨이설정가져오기()['마이크로배치']:
+            self.마이크로배처 = 마이크로배처(self.라우터.비동기메시지목록전송)
+        
         self.앱 = FastAPI(
             title="BSS Queue-Based Load Leveling API",
             description="BSS 메시지 처리를 위한 Queue-Based Load Leveling 패턴 API",
@@ -69,6 +99,25 @@ class API게이트웨이:
     def _라우트설정(self):
         """FastAPI 라우트 설정"""
         
+        @self.앱.on_event("startup")
+        async def 시작처리():
+            """연결 감독 및 스풀 재생 태스크 시작"""
+            self.라우터.감독자.시작()
+            if self.스풀재생기:
+                self.스풀재생기.시작()
+        
+        @self.앱.on_event("shutdown")
+        async def 종료처리():
+            """대기 중인 마이크로 배치 전송 후 스풀 정리, 생산자 연결 풀 및 실행기 정리"""
+            if self.마이크로배처:
+                await self.마이크로배처.종료()
+            if self.스풀재생기:
+                await self.스풀재생기.종료()
+            if self._재주입작업 is not None and not self._재주입작업.done():
+                self.데드레터.중지()
+                await self._재주입작업
+            await self.라우터.종료()
+        
         @self.앱.get("/health")
         async def 헬스체크():
             """헬스 체크 엔드포인트"""
@@ -76,10 +125,14 @@ class API게이트웨이:
         
         @self.앱.get("/ready")
         async def 레디니스체크():
-            """레디니스 체크 엔드포인트"""
-            연결상태 = self.라우터.연결상태확인()
-            if 연결상태['성공']:
-                return {"상태": "준비완료", "타임스탬프": datetime.now().isoformat()}
+            """레디니스 체크 엔드포인트 (브로커 호출 없이 연결 회로 상태로 판단)"""
+            # 스풀이 있으면 브로커 장애 중에도 요청을 받을 수 있으므로 준비 상태 유지
+            if self.라우터.감독자.요청허용() or self.스풀:
+                return {
+                    "상태": "준비완료",
+                    "회로상태": self.라우터.감독자.회로.상태,
+                    "타임스탬프": datetime.now().isoformat()
+                }
             else:
                 raise HTTPException(status_code=503, detail="서비스 준비되지 않음")
         
@@ -96,17 +149,61 @@ class API게이트웨이:
         @self.앱.get("/api/queue/status")
         async def 큐상태조회():
             """큐 상태 조회"""
-            return self.라우터.큐상태조회()
+            return await self.라우터.비동기큐상태조회()
         
         @self.앱.get("/api/stats")
         async def 통계조회():
             """API 통계 조회"""
             return await self._통계정보조회()
         
+        @self.앱.get("/api/spool/status")
+        async def 스풀상태조회():
+            """로컬 스풀 상태 조회 (깊이, 바이트, 재생률)"""
+            return self._스풀통계()
+        
+        @self.앱.get("/api/dlq")
+        async def 데드레터조회(타입: Optional[str] = None, 사유: Optional[str] = None,
+                         최대개수: int = 100):
+            """데드레터 큐 메시지 조회 (타입/실패 사유 필터, 사유별 개수)"""
+            try:
+                return await asyncio.get_running_loop().run_in_executor(
+                    None, functools.partial(self.데드레터.조회, 타입, 사유, 최대개수)
+                )
+            except Exception as e:
+                raise HTTPException(status_code=503, detail=f"데드레터 큐 조회 실패: {e}")
+        
+        @self.앱.post("/api/dlq/replay", response_model=기본응답)
+        async def 데드레터재주입(요청: 재주입요청):
+            """조건에 맞는 데드레터 메시지를 속도 제한하여 원래 작업 큐로 재주입 (백그라운드)"""
+            if self.데드레터.실행중():
+                raise HTTPException(status_code=409, detail="이미 데드레터 재주입이 실행 중입니다")
+            self._재주입작업 = asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(
+                    self.데드레터.재주입, 요청.타입, 요청.사유, 요청.최대개수, 요청.초당개수
+                )
+            )
+            return 기본응답(
+                성공=True,
+                메시지="데드레터 재주입 시작 (진행 상황: GET /api/dlq/replay/status)",
+                타임스탬프=datetime.now().isoformat(),
+                세부정보=요청.model_dump()
+            )
+        
+        @self.앱.get("/api/dlq/replay/status")
+        async def 데드레터재주입상태():
+            """데드레터 재주입 진행 상황"""
+            return self.데드레터.진행상황조회()
+        
+        @self.앱.post("/api/dlq/replay/stop")
+        async def 데드레터재주입중지():
+            """실행 중인 데드레터 재주입 중지"""
+            self.데드레터.중지()
+            return {"성공": True, "진행상황": self.데드레터.진행상황조회()}
+        
         @self.앱.get("/api/router/info")
         async def 라우터정보조회():
             """라우터 정보 조회"""
-            return self.라우터.라우터통계()
+            return await self.라우터.비동기라우터통계()
         
         # 개발/디버깅용 엔드포인트
         @self.앱.get("/api/config")
@@ -137,11 +234,20 @@ class API게이트웨이:
         try:
             self.요청통계['총요청수'] += 1
             
+            # 회로가 열려 있고 스풀도 없으면 브로커를 기다리지 않고 즉시 실패
+            차단응답 = self._회로차단응답()
+            if 차단응답:
+                self.요청통계['실패요청수'] += 1
+                return 차단응답
+            
             # HTTP 요청에서 BSS 메시지 생성
             메시지 = self.메시지생성(요청)
             
-            # 메시지 라우터로 전송
-            결과 = self.라우터.메시지전송(메시지)
+            # 메시지 라우터로 전송 (마이크로 배칭 활성화 시 동시 요청과 묶어서 전송)
+            if self.마이크로배처:
+                결과 = await self.마이크로배처.제출(메시지)
+            else:
+                결과 = await self.라우터.비동기메시지전송(메시지)
             
             # 통계 업데이트
             if 결과['성공']:
@@ -182,6 +288,11 @@ class API게이트웨이:
         try:
             self.요청통계['총요청수'] += len(요청.메시지목록)
             
+            차단응답 = self._회로차단응답()
+            if 차단응답:
+                self.요청통계['실패요청수'] += len(요청.메시지목록)
+                return 차단응답
+            
             # HTTP 요청에서 BSS 메시지 목록 생성
             메시지목록 = []
             for 메시지요청 in 요청.메시지목록:
@@ -189,7 +300,7 @@ class API게이트웨이:
                 메시지목록.append(메시지)
             
             # 배치 메시지 라우터로 전송
-            결과 = self.라우터.배치메시지전송(메시지목록)
+            결과 = await self.라우터.비동기배치메시지전송(메시지목록)
             
             # 통계 업데이트
             성공개수 = 결과.get('세부정보', {}).get('전송성공개수', 0)
@@ -222,6 +333,22 @@ class API게이트웨이:
                 세부정보={'오류타입': type(e).__name__}
             )
     
+    def _회로차단응답(self) -> Optional[기본응답]:
+        """
+        연결 회로가 열려 있고 스풀로 우회할 수 없으면 즉시 실패 응답 생성
+        
+        Returns:
+            기본응답: 실패 응답 (요청을 진행해도 되면 None)
+        """
+        if self.라우터.감독자.요청허용() or self.스풀:
+            return None
+        return 기본응답(
+            성공=False,
+            메시지='RabbitMQ 연결 불가 - 잠시 후 다시 시도하세요',
+            타임스탬프=datetime.now().isoformat(),
+            세부정보={'회로상태': self.라우터.감독자.회로.상태}
+        )
+    
     def 메시지생성(self, 요청: 메시지요청) -> BSS메시지:
         """
         HTTP 요청에서 BSS메시지 객체 생성
@@ -257,6 +384,12 @@ class API게이트웨이:
         
         return 메시지
     
+    def _스풀통계(self) -> Dict[str, Any]:
+        """로컬 스풀 통계 (비활성화 시 활성화 여부만)"""
+        if not self.스풀재생기:
+            return {'활성화': False}
+        return self.스풀재생기.통계조회()
+    
     async def _통계정보조회(self) -> Dict[str, Any]:
         """
         API 통계 정보 조회
@@ -275,6 +408,9 @@ class API게이트웨이:
                 '성공률': f"{성공률}%"
             },
             '타입별통계': self.요청통계['타입별통계'],
+            '마이크로배치': self.마이크로배처.통계조회() if self.마이크로배처 else {'활성화': False},
+            '스풀': self._스풀통계(),
+            '연결회로': self.라우터.연결회로상태(),
             '시스템정보': {
                 '시작시간': datetime.now().isoformat(),
                 '모니터링상태': self.설정.모니터링상태확인(),
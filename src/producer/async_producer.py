@@ -0,0 +1,310 @@
+# 파일 경로: src/producer/async_producer.py
+# 비동기 BSS 메시지 생산자 클래스 (aio-pika 기반)
+
+import asyncio
+from typing import Optional, Dict, Any
+
+import aio_pika
+from aio_pika.pool import Pool
+
+from src.common.message_models import BSS메시지
+from src.common.config import 설정가져오기
+from src.common.queue_topology import 큐토폴로지
+from src.common.message_codecs import 코덱가져오기
+
+
+# 브로커에 연결할 수 없어 발생하는 예외 (AMQPConnectionError는 ConnectionError의 하위 클래스)
+_연결오류 = (OSError, aio_pika.exceptions.ChannelInvalidStateError)
+
+
+class 비동기메시지생산자:
+    """
+    asyncio 네이티브 BSS 메시지 생산자 클래스
+    이벤트 루프를 막지 않도록 aio-pika 연결 풀과 채널 풀을 사용하여 발행
+
+    속성:
+        설정: 설정 관리자 인스턴스
+        연결풀: aio-pika 연결 풀 (최초 사용 시 생성)
+        채널풀: aio-pika 채널 풀 (최초 사용 시 생성)
+    """
+
+    def __init__(self):
+        """비동기 메시지 생산자 초기화 (연결은 최초 발행 시 이벤트 루프 안에서 생성)"""
+        self.설정 = 설정가져오기()
+        self.로거 = self.설정.로거설정('비동기메시지생산자')
+
+        생산자설정 = self.설정.생산자설정가져오기()
+        self.발행확인 = 생산자설정['발행확인']
+        self.확인타임아웃 = 생산자설정['확인타임아웃']
+        self.연결풀크기 = 생산자설정['연결풀크기']
+        self.채널풀크기 = 생산자설정['채널풀크기']
+        self.코덱 = 코덱가져오기(생산자설정['코덱'])
+
+        self.토폴로지 = 큐토폴로지()
+        self.연결풀: Optional[Pool] = None
+        self.채널풀: Optional[Pool] = None
+        self._초기화잠금: Optional[asyncio.Lock] = None
+
+    async def _연결생성(self) -> aio_pika.abc.AbstractRobustConnection:
+        """연결 풀용 RabbitMQ 연결 생성 (끊어지면 백그라운드에서 자동 재연결)"""
+        return await aio_pika.connect_robust(self.설정.연결문자열가져오기())
+
+    async def _채널생성(self) -> aio_pika.abc.AbstractChannel:
+        """채널 풀용 채널 생성"""
+        async with self.연결풀.acquire() as 연결:
+            return await 연결.channel(publisher_confirms=self.발행확인)
+
+    async def _풀초기화(self):
+        """연결/채널 풀 생성 및 큐 선언 (최초 1회)"""
+        if self.채널풀 is not None:
+            return
+
+        if self._초기화잠금 is None:
+            self._초기화잠금 = asyncio.Lock()
+
+        async with self._초기화잠금:
+            if self.채널풀 is not None:
+                return
+
+            연결풀 = Pool(self._연결생성, max_size=self.연결풀크기)
+            self.연결풀 = 연결풀
+            채널풀 = Pool(self._채널생성, max_size=self.채널풀크기)
+
+            try:
+                # 큐/Exchange 선언
+                async with 채널풀.acquire() as 채널:
+                    await self.토폴로지.비동기선언(채널)
+            except Exception as e:
+                self.로거.error(f"RabbitMQ 연결 실패: {e}")
+                await 채널풀.close()
+                await 연결풀.close()
+                self.연결풀 = None
+                raise
+
+            self.채널풀 = 채널풀
+            self.로거.info(
+                f"RabbitMQ 비동기 연결 풀 생성: {self.토폴로지.큐이름} "
+                f"(연결 {self.연결풀크기}개, 채널 {self.채널풀크기}개)"
+            )
+
+    def _발행메시지생성(self, 메시지: BSS메시지) -> aio_pika.Message:
+        """
+        BSS 메시지를 aio-pika 메시지로 변환
+
+        Args:
+            메시지: 변환할 BSS 메시지
+
+        Returns:
+            aio_pika.Message: 발행할 메시지
+        """
+        return aio_pika.Message(
+            body=self.코덱.인코딩(메시지),
+            message_id=메시지.아이디,
+            content_type=self.코덱.content_type,
+            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+            priority=self.토폴로지.우선순위(메시지),
+            timestamp=메시지.생성시간ns // 1_000_000_000,
+            headers={
+                'message_type': 메시지.타입,
+                'created_at': 메시지.생성시간문자열
+            }
+        )
+
+    async def _발행(self, 채널: aio_pika.abc.AbstractChannel, 메시지: BSS메시지,
+                  발행메시지: Optional[aio_pika.Message] = None) -> Dict[str, Any]:
+        """
+        채널 하나로 메시지 발행 (Confirm 모드면 브로커 확정까지 대기)
+
+        Args:
+            채널: 발행에 사용할 채널
+            메시지: 전송할 BSS 메시지
+            발행메시지: 미리 직렬화된 aio-pika 메시지 (None이면 여기서 생성)
+
+        Returns:
+            dict: 전송 결과 {'성공': bool, '메시지': str, '메시지아이디': str, '확인상태': str}
+        """
+        try:
+            교환기이름, 라우팅키 = self.토폴로지.발행대상(메시지.타입)
+            교환기 = (
+                await 채널.get_exchange(교환기이름, ensure=False)
+                if 교환기이름 else 채널.default_exchange
+            )
+            await 교환기.publish(
+                발행메시지 or self._발행메시지생성(메시지),
+                routing_key=라우팅키,
+                timeout=self.확인타임아웃
+            )
+            return {
+                '성공': True,
+                '메시지': '메시지 전송 성공',
+                '메시지아이디': 메시지.아이디,
+                '확인상태': '확인됨' if self.발행확인 else '미사용'
+            }
+        except asyncio.TimeoutError:
+            return {
+                '성공': False,
+                '메시지': '브로커 확정 실패: 시간초과',
+                '메시지아이디': 메시지.아이디,
+                '확인상태': '시간초과'
+            }
+        except aio_pika.exceptions.DeliveryError as e:
+            return {
+                '성공': False,
+                '메시지': f'브로커 확정 실패: {e}',
+                '메시지아이디': 메시지.아이디,
+                '확인상태': '거부됨'
+            }
+
+    async def 큐전송(self, 메시지: BSS메시지) -> Dict[str, Any]:
+        """
+        메시지를 RabbitMQ 단일 큐로 비동기 전송
+
+        Args:
+            메시지: 전송할 BSS 메시지
+
+        Returns:
+            dict: 전송 결과 {'성공': bool, '메시지': str, '메시지아이디': str, '확인상태': str}
+        """
+        try:
+            if not 메시지.메시지검증():
+                return {
+                    '성공': False,
+                    '메시지': '메시지 유효성 검증 실패',
+                    '메시지아이디': 메시지.아이디
+                }
+
+            await self._풀초기화()
+
+            async with self.채널풀.acquire() as 채널:
+                결과 = await self._발행(채널, 메시지)
+
+            if 결과['성공']:
+                self.로거.info(f"메시지 전송 성공: {메시지.타입} - {메시지.아이디}")
+            return 결과
+
+        except Exception as e:
+            error_msg = f"메시지 전송 실패: {e}"
+            self.로거.error(error_msg)
+            결과 = {
+                '성공': False,
+                '메시지': error_msg,
+                '메시지아이디': 메시지.아이디
+            }
+            if isinstance(e, _연결오류):
+                결과['확인상태'] = '연결실패'
+            return 결과
+
+    async def 배치전송(self, 메시지목록: list[BSS메시지]) -> Dict[str, Any]:
+        """
+        여러 메시지를 하나의 채널에서 동시에 발행하여 확정을 파이프라인 처리
+
+        Args:
+            메시지목록: 전송할 BSS 메시지 리스트
+
+        Returns:
+            dict: 배치 전송 결과 (상세결과에 메시지별 확정 상태 포함)
+        """
+        결과목록 = []
+
+        try:
+            # 본문을 미리 직렬화한 뒤 연결 확인은 배치당 한 번만 수행
+            발행메시지들 = [self._발행메시지생성(메시지) for 메시지 in 메시지목록]
+            await self._풀초기화()
+
+            async with self.채널풀.acquire() as 채널:
+                결과목록 = list(await asyncio.gather(
+                    *(self._발행(채널, 메시지, 발행메시지)
+                      for 메시지, 발행메시지 in zip(메시지목록, 발행메시지들)),
+                    return_exceptions=True
+                ))
+
+            결과목록 = [
+                결과 if isinstance(결과, dict) else {
+                    '성공': False,
+                    '메시지': f"메시지 전송 실패: {결과}",
+                    '메시지아이디': 메시지.아이디,
+                    **({'확인상태': '연결실패'} if isinstance(결과, _연결오류) else {})
+                }
+                for 메시지, 결과 in zip(메시지목록, 결과목록)
+            ]
+
+        except Exception as e:
+            error_msg = f"메시지 전송 실패: {e}"
+            self.로거.error(error_msg)
+            추가정보 = {'확인상태': '연결실패'} if isinstance(e, _연결오류) else {}
+            결과목록 = [
+                {'성공': False, '메시지': error_msg, '메시지아이디': 메시지.아이디, **추가정보}
+                for 메시지 in 메시지목록
+            ]
+
+        성공개수 = sum(1 for 결과 in 결과목록 if 결과['성공'])
+        실패개수 = len(결과목록) - 성공개수
+
+        self.로거.info(f"배치 전송 완료: {성공개수}/{len(메시지목록)} 성공")
+
+        return {
+            '전체개수': len(메시지목록),
+            '성공개수': 성공개수,
+            '실패개수': 실패개수,
+            '성공률': round(성공개수 / len(메시지목록) * 100, 2) if 메시지목록 else 0,
+            '상세결과': 결과목록
+        }
+
+    async def 연결확인(self) -> bool:
+        """
+        RabbitMQ 연결 상태 확인 (네트워크 왕복 없이 풀의 연결 상태만 확인)
+
+        Returns:
+            bool: 연결이 정상이면 True, 그렇지 않으면 False
+        """
+        try:
+            await self._풀초기화()
+            async with self.연결풀.acquire() as 연결:
+                return not 연결.is_closed
+        except Exception as e:
+            self.로거.warning(f"연결 상태 확인 실패: {e}")
+            return False
+
+    async def 큐상태확인(self) -> Dict[str, Any]:
+        """
+        큐 상태 정보 조회
+
+        Returns:
+            dict: 큐 상태 정보
+        """
+        try:
+            await self._풀초기화()
+
+            큐별상태 = {}
+            async with self.채널풀.acquire() as 채널:
+                for 큐이름 in self.토폴로지.소비큐목록():
+                    큐 = await 채널.declare_queue(큐이름, passive=True)
+                    큐별상태[큐이름] = {
+                        '메시지개수': 큐.declaration_result.message_count,
+                        '소비자개수': 큐.declaration_result.consumer_count
+                    }
+
+            return {
+                '큐이름': self.토폴로지.큐이름,
+                '라우팅모드': self.토폴로지.라우팅모드,
+                '메시지개수': sum(상태['메시지개수'] for 상태 in 큐별상태.values()),
+                '소비자개수': sum(상태['소비자개수'] for 상태 in 큐별상태.values()),
+                '큐별상태': 큐별상태
+            }
+
+        except Exception as e:
+            self.로거.error(f"큐 상태 확인 실패: {e}")
+            return {'오류': str(e)}
+
+    async def 종료(self):
+        """채널 풀과 연결 풀 정리"""
+        try:
+            if self.채널풀 is not None:
+                await self.채널풀.close()
+            if self.연결풀 is not None:
+                await self.연결풀.close()
+        except Exception as e:
+            self.로거.warning(f"연결 해제 중 오류: {e}")
+        finally:
+            self.채널풀 = None
+            self.연결풀 = None
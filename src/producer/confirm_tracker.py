@@ -0,0 +1,167 @@
+# 파일 경로: src/producer/confirm_tracker.py
+# Publisher Confirm 추적기 클래스
+
+import threading
+from typing import Dict, Any, List, Optional
+
+
+class 발행확인추적기:
+    """
+    Publisher Confirm 모드에서 미확정 발행 메시지를 delivery tag 기준으로 추적하는 클래스
+    브로커의 Basic.Ack / Basic.Nack 프레임을 비동기로 받아 메시지별 결과를 확정
+
+    확정 결과는 결과가져오기로 꺼낼 때까지 보관하되, 꺼내지 않는 결과(확인대기 없이 보낸 발행)가
+    쌓이지 않도록 최대결과수를 넘으면 오래된 것부터 버림
+    시간 초과로 포기한 태그는 대기 목록에서 빼므로 뒤늦게 온 Ack/Nack은 무시
+
+    속성:
+        최대미확정수 (int): 동시에 확정 대기할 수 있는 최대 발행 수 (윈도우 크기)
+        최대결과수 (int): 꺼내지 않은 확정 결과 보관 한도
+        다음태그 (int): 다음 발행에 부여될 delivery tag (채널별 1부터 시작)
+    """
+
+    확인됨 = '확인됨'
+    거부됨 = '거부됨'
+
+    def __init__(self, 최대미확정수: int = 256, 최대결과수: Optional[int] = None):
+        """
+        발행 확인 추적기 초기화
+
+        Args:
+            최대미확정수: 확정 대기 윈도우 크기
+            최대결과수: 꺼내지 않은 확정 결과 보관 한도 (None이면 윈도우 크기의 4배)
+        """
+        self.최대미확정수 = max(1, 최대미확정수)
+        self.최대결과수 = max(1, 최대결과수 or self.최대미확정수 * 4)
+        self._잠금 = threading.Lock()
+        self.초기화()
+
+    def 초기화(self):
+        """채널이 새로 열릴 때 태그 번호와 대기 목록 초기화"""
+        with self._잠금:
+            self.다음태그 = 1
+            self._미확정: Dict[int, str] = {}
+            self._결과: Dict[int, str] = {}
+
+    def 등록(self, 메시지아이디: str) -> int:
+        """
+        발행 직전에 메시지를 등록하고 delivery tag 반환
+
+        Args:
+            메시지아이디: 발행할 메시지 아이디
+
+        Returns:
+            int: 부여된 delivery tag
+        """
+        with self._잠금:
+            태그 = self.다음태그
+            self.다음태그 += 1
+            self._미확정[태그] = 메시지아이디
+            return 태그
+
+    def 등록취소(self, 태그: int) -> bool:
+        """
+        발행하지 못한 메시지의 등록 취소 (등록 직후 발행 호출이 실패한 경우)
+        브로커는 발행된 메시지에만 태그를 부여하므로 마지막으로 부여한 태그이면 번호도 되돌림
+
+        Args:
+            태그: 등록에서 받은 delivery tag
+
+        Returns:
+            bool: 태그 번호까지 되돌렸으면 True
+        """
+        with self._잠금:
+            self._미확정.pop(태그, None)
+            if 태그 == self.다음태그 - 1:
+                self.다음태그 = 태그
+                return True
+            return False
+
+    def 확인처리(self, 태그: int, 다중: bool, 성공: bool) -> int:
+        """
+        브로커의 Ack/Nack 결과 반영
+
+        Args:
+            태그: 브로커가 보낸 delivery tag
+            다중: multiple 플래그 (True면 태그 이하 전체에 적용)
+            성공: Ack이면 True, Nack이면 False
+
+        Returns:
+            int: 확정된 메시지 개수
+        """
+        상태 = self.확인됨 if 성공 else self.거부됨
+        with self._잠금:
+            if 다중:
+                대상태그들 = [t for t in self._미확정 if t <= 태그]
+            else:
+                대상태그들 = [태그] if 태그 in self._미확정 else []
+
+            for t in 대상태그들:
+                del self._미확정[t]
+                self._결과[t] = 상태
+
+            # 꺼내지 않은 결과는 오래된 것(작은 태그)부터 버림
+            while len(self._결과) > self.최대결과수:
+                del self._결과[next(iter(self._결과))]
+
+            return len(대상태그들)
+
+    def 결과가져오기(self, 태그: int) -> Optional[str]:
+        """
+        확정된 결과를 꺼내고 내부 저장소에서 제거
+
+        Args:
+            태그: 조회할 delivery tag
+
+        Returns:
+            str: '확인됨' / '거부됨', 아직 확정되지 않았으면 None
+        """
+        with self._잠금:
+            return self._결과.pop(태그, None)
+
+    def 포기(self, 태그: int) -> bool:
+        """
+        확정을 더 기다리지 않을 태그 제거 (이후 도착하는 Ack/Nack은 무시)
+
+        Args:
+            태그: 포기할 delivery tag
+
+        Returns:
+            bool: 아직 확정 대기 중이던 태그이면 True
+        """
+        with self._잠금:
+            self._결과.pop(태그, None)
+            return self._미확정.pop(태그, None) is not None
+
+    def 미확정여부(self, 태그: int) -> bool:
+        """태그가 아직 확정 대기 중인지 확인"""
+        with self._잠금:
+            return 태그 in self._미확정
+
+    def 미확정개수(self) -> int:
+        """확정 대기 중인 발행 수 반환"""
+        with self._잠금:
+            return len(self._미확정)
+
+    def 윈도우여유(self) -> bool:
+        """윈도우에 새 발행을 넣을 여유가 있는지 확인"""
+        return self.미확정개수() < self.최대미확정수
+
+    def 미확정목록(self) -> List[int]:
+        """확정 대기 중인 태그 목록 반환"""
+        with self._잠금:
+            return sorted(self._미확정)
+
+    def 상태조회(self) -> Dict[str, Any]:
+        """
+        추적기 상태 정보 반환
+
+        Returns:
+            dict: 윈도우 크기와 대기 개수
+        """
+        with self._잠금:
+            return {
+                '윈도우크기': self.최대미확정수,
+                '미확정개수': len(self._미확정),
+                '다음태그': self.다음태그
+            }
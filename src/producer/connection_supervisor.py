@@ -0,0 +1,218 @@
+# 파일 경로: src/producer/connection_supervisor.py
+# 생산자 연결 감독자 및 회로 차단기 클래스
+
+import asyncio
+import random
+import time
+from typing import Dict, Any, Callable, Awaitable, Optional
+
+from src.common.config import 설정가져오기
+
+
+class 회로차단기:
+    """
+    브로커 연결 상태를 나타내는 회로 차단기
+    상태는 속성 하나로 관리하여 요청 경로에서 O(1)로 조회
+
+    상태:
+        닫힘 (closed): 연결 정상, 요청 허용
+        열림 (open): 연결 불가, 요청은 즉시 실패 또는 스풀로 우회
+        반열림 (half_open): 연결 감독자가 재연결을 시험 중, 요청은 열림과 동일하게 처리
+
+    속성:
+        상태 (str): 현재 회로 상태
+        열림횟수 (int): 닫힘에서 열림으로 전환된 누적 횟수
+    """
+
+    닫힘 = 'closed'
+    열림 = 'open'
+    반열림 = 'half_open'
+
+    def __init__(self):
+        """회로 차단기 초기화 (닫힘 상태로 시작)"""
+        self.상태 = self.닫힘
+        self.열림횟수 = 0
+        self._상태변경시각 = time.monotonic()
+
+    def 요청허용(self) -> bool:
+        """브로커로 요청을 보내도 되는지 확인"""
+        return self.상태 == self.닫힘
+
+    def _전환(self, 새상태: str):
+        """상태 전환 및 전환 시각 기록"""
+        if self.상태 != 새상태:
+            if 새상태 == self.열림 and self.상태 == self.닫힘:
+                self.열림횟수 += 1
+            self.상태 = 새상태
+            self._상태변경시각 = time.monotonic()
+
+    def 열기(self):
+        """회로 열기 (연결 불가)"""
+        self._전환(self.열림)
+
+    def 반열기(self):
+        """회로 반열기 (재연결 시험 중)"""
+        self._전환(self.반열림)
+
+    def 닫기(self):
+        """회로 닫기 (연결 정상)"""
+        self._전환(self.닫힘)
+
+    def 상태조회(self) -> Dict[str, Any]:
+        """
+        회로 상태 조회
+
+        Returns:
+            dict: 현재 상태, 상태 유지 시간, 열림 횟수
+        """
+        return {
+            '상태': self.상태,
+            '상태유지초': round(time.monotonic() - self._상태변경시각, 1),
+            '열림횟수': self.열림횟수
+        }
+
+
+class 연결감독자:
+    """
+    생산자 연결을 백그라운드에서 감시하고 재연결을 전담하는 asyncio 태스크
+    요청 경로는 회로 상태만 읽고, 연결 점검과 재연결(지수 백오프 + 지터)은 이 태스크가 수행
+
+    속성:
+        회로: 회로차단기 인스턴스
+        상태확인함수: 연결이 살아 있는지 확인하는 코루틴 함수 (bool 반환)
+        연결시도함수: 재연결을 시도하는 코루틴 함수 (bool 반환)
+        점검간격 (float): 회로가 닫혀 있을 때의 주기적 연결 점검 간격(초)
+        기본지연 (float): 첫 재연결 대기 시간(초)
+        최대지연 (float): 재연결 대기 시간 상한(초)
+    """
+
+    def __init__(self, 상태확인함수: Callable[[], Awaitable[bool]],
+                 연결시도함수: Callable[[], Awaitable[bool]],
+                 점검간격: Optional[float] = None, 기본지연: Optional[float] = None,
+                 최대지연: Optional[float] = None):
+        """
+        연결 감독자 초기화
+
+        Args:
+            상태확인함수: 연결 점검 코루틴 함수
+            연결시도함수: 재연결 코루틴 함수
+            점검간격: 연결 점검 간격 (None이면 설정에서 가져옴)
+            기본지연: 첫 재연결 대기 시간 (None이면 설정에서 가져옴)
+            최대지연: 재연결 대기 시간 상한 (None이면 설정에서 가져옴)
+        """
+        self.설정 = 설정가져오기()
+        self.로거 = self.설정.로거설정('연결감독자')
+
+        생산자설정 = self.설정.생산자설정가져오기()
+        self.상태확인함수 = 상태확인함수
+        self.연결시도함수 = 연결시도함수
+        self.점검간격 = 점검간격 if 점검간격 is not None else 생산자설정['점검간격']
+        self.기본지연 = 기본지연 if 기본지연 is not None else 생산자설정['재연결기본지연']
+        self.최대지연 = 최대지연 if 최대지연 is not None else 생산자설정['재연결최대지연']
+
+        self.회로 = 회로차단기()
+        self.연속실패 = 0
+        self.재연결성공횟수 = 0
+
+        self._태스크: Optional[asyncio.Task] = None
+        self._깨움: Optional[asyncio.Event] = None
+        self._중지 = False
+
+    def 시작(self):
+        """감독 태스크 시작 (이벤트 루프 안에서 호출, 이미 실행 중이면 무시)"""
+        if self._태스크 is None:
+            self._중지 = False
+            self._깨움 = asyncio.Event()
+            self._태스크 = asyncio.get_running_loop().create_task(self._감독루프())
+
+    def 요청허용(self) -> bool:
+        """요청 경로에서 브로커 호출 여부 판단 (O(1))"""
+        return self.회로.요청허용()
+
+    def 실패보고(self):
+        """요청 경로에서 연결 실패를 관측했을 때 호출 → 회로를 열고 재연결 시작"""
+        if self.회로.상태 == 회로차단기.닫힘:
+            self.로거.warning("브로커 연결 실패 관측 - 회로 열림")
+            self.회로.열기()
+            if self._깨움 is not None:
+                self._깨움.set()
+
+    def 백오프지연(self) -> float:
+        """
+        다음 재연결까지의 대기 시간 (지수 백오프 + equal jitter)
+
+        Returns:
+            float: 대기 시간(초), 상한의 절반 이상 상한 이하에서 무작위
+        """
+        상한 = min(self.최대지연, self.기본지연 * (2 ** self.연속실패))
+        return random.uniform(상한 / 2, 상한)
+
+    async def _안전호출(self, 함수: Callable[[], Awaitable[bool]]) -> bool:
+        """점검/재연결 함수의 예외를 실패로 처리"""
+        try:
+            return bool(await 함수())
+        except Exception as e:
+            self.로거.warning(f"연결 점검 실패: {e}")
+            return False
+
+    async def _대기(self, 초: float):
+        """지정 시간 대기 (실패 보고나 종료 시 즉시 깨어남)"""
+        try:
+            await asyncio.wait_for(self._깨움.wait(), timeout=초)
+        except asyncio.TimeoutError:
+            pass
+        self._깨움.clear()
+
+    async def _감독루프(self):
+        """회로가 닫혀 있으면 주기적으로 점검하고, 열려 있으면 백오프 후 재연결 시도"""
+        if not await self._안전호출(self.상태확인함수):
+            self.로거.warning("초기 브로커 연결 불가 - 회로 열림")
+            self.회로.열기()
+
+        while not self._중지:
+            if self.회로.상태 == 회로차단기.닫힘:
+                await self._대기(self.점검간격)
+                if self._중지 or self.회로.상태 != 회로차단기.닫힘:
+                    continue
+                if not await self._안전호출(self.상태확인함수):
+                    self.로거.warning("주기 점검에서 브로커 연결 끊김 감지 - 회로 열림")
+                    self.회로.열기()
+                continue
+
+            지연 = self.백오프지연()
+            self.로거.info(f"{지연:.2f}초 후 재연결 시도 (연속 실패 {self.연속실패}회)")
+            await self._대기(지연)
+            if self._중지:
+                break
+
+            self.회로.반열기()
+            if await self._안전호출(self.연결시도함수):
+                self.회로.닫기()
+                self.연속실패 = 0
+                self.재연결성공횟수 += 1
+                self.로거.info("브로커 재연결 성공 - 회로 닫힘")
+            else:
+                self.연속실패 += 1
+                self.회로.열기()
+
+    async def 종료(self):
+        """감독 태스크 중지"""
+        self._중지 = True
+        if self._태스크 is not None:
+            self._깨움.set()
+            await self._태스크
+            self._태스크 = None
+
+    def 상태조회(self) -> Dict[str, Any]:
+        """
+        연결 감독 상태 조회
+
+        Returns:
+            dict: 회로 상태, 연속 실패 횟수, 재연결 성공 횟수
+        """
+        return {
+            **self.회로.상태조회(),
+            '연속실패': self.연속실패,
+            '재연결성공횟수': self.재연결성공횟수,
+            '감독중': self._태스크 is not None
+        }
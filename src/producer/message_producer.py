@@ -7,6 +7,13 @@ import time
 from typing import Optional, Dict, Any
 from src.common.message_models import BSS메시지
 from src.common.config import 설정가져오기
+from src.common.queue_topology import 큐토폴로지
+from src.common.message_codecs import 코덱가져오기
+from src.producer.confirm_tracker import 발행확인추적기
+
+
+# 브로커 연결이 끊겨 발생하는 예외 (연결 감독자에게 보고하여 회로를 엶)
+_연결오류 = (pika.exceptions.AMQPConnectionError, pika.exceptions.AMQPChannelError, OSError)
 
 
 class BSS메시지생산자:
@@ -17,6 +24,7 @@ class BSS메시지생산자:
         큐연결: RabbitMQ 연결 객체
         채널: RabbitMQ 채널 객체
         설정: 설정 관리자 인스턴스
+        확인추적기: Publisher Confirm 추적기 (확인 모드 비활성화 시 None)
     """
     
     def __init__(self):
@@ -25,7 +33,21 @@ class BSS메시지생산자:
         self.로거 = self.설정.로거설정('BSS메시지생산자')
         self.큐연결: Optional[pika.BlockingConnection] = None
         self.채널: Optional[pika.channel.Channel] = None
-        self._연결생성()
+        self.토폴로지 = 큐토폴로지()
+        
+        # Publisher Confirm 설정
+        생산자설정 = self.설정.생산자설정가져오기()
+        self.확인추적기: Optional[발행확인추적기] = (
+            발행확인추적기(생산자설정['확인윈도우']) if 생산자설정['발행확인'] else None
+        )
+        self.확인타임아웃 = 생산자설정['확인타임아웃']
+        self.코덱 = 코덱가져오기(생산자설정['코덱'])
+        
+        try:
+            self._연결생성()
+        except Exception:
+            # 브로커가 없어도 게이트웨이는 기동 (재연결은 연결 감독자가 수행)
+            self.로거.warning("초기 RabbitMQ 연결 실패 - 연결 감독자가 재연결 시도")
     
     def _연결생성(self):
         """RabbitMQ 연결 및 채널 생성"""
@@ -37,21 +59,119 @@ class BSS메시지생산자:
             self.큐연결 = pika.BlockingConnection(connection_params)
             self.채널 = self.큐연결.channel()
             
-            # 큐 선언
-            큐설정 = self.설정.큐설정가져오기()
-            self.채널.queue_declare(
-                queue=큐설정['큐이름'],
-                durable=큐설정['내구성'],
-                auto_delete=큐설정['자동삭제'],
-                exclusive=큐설정['배타적']
-            )
+            # 큐/Exchange 선언 (타입별 라우팅 모드면 모든 타입 큐를 미리 선언)
+            self.토폴로지.선언(self.채널)
             
-            self.로거.info(f"RabbitMQ 연결 성공: {큐설정['큐이름']}")
+            # Publisher Confirm 모드 활성화
+            if self.확인추적기:
+                self._발행확인모드설정()
+            
+            self.로거.info(
+                f"RabbitMQ 연결 성공: {self.토폴로지.큐이름} "
+                f"(라우팅 모드: {self.토폴로지.라우팅모드})"
+            )
             
         except Exception as e:
             self.로거.error(f"RabbitMQ 연결 실패: {e}")
             raise
     
+    def _발행확인모드설정(self):
+        """
+        채널을 Confirm 모드로 전환
+        
+        BlockingChannel.confirm_delivery()는 발행마다 브로커 응답을 기다리므로
+        하위 채널에 직접 Ack/Nack 콜백을 등록하여 확정을 비동기로 수신
+        """
+        선택완료 = []
+        self.확인추적기.초기화()
+        self.채널._impl.confirm_delivery(
+            ack_nack_callback=self._발행확인콜백,
+            callback=선택완료.append
+        )
+        
+        종료시각 = time.monotonic() + self.확인타임아웃
+        while not 선택완료:
+            if time.monotonic() >= 종료시각:
+                raise TimeoutError("Confirm.Select 응답 시간 초과")
+            self.큐연결.process_data_events(time_limit=0.05)
+        
+        self.로거.info(f"Publisher Confirm 모드 활성화 (윈도우: {self.확인추적기.최대미확정수})")
+    
+    def _발행확인콜백(self, method_frame):
+        """
+        브로커의 Basic.Ack / Basic.Nack 수신 콜백
+        
+        Args:
+            method_frame: Ack 또는 Nack 메소드 프레임
+        """
+        method = method_frame.method
+        성공 = isinstance(method, pika.spec.Basic.Ack)
+        self.확인추적기.확인처리(method.delivery_tag, method.multiple, 성공)
+        
+        if not 성공:
+            self.로거.warning(f"브로커가 메시지를 거부함 (delivery_tag={method.delivery_tag})")
+    
+    def _확인대기(self, 조건, 타임아웃: float) -> bool:
+        """
+        조건이 만족될 때까지 연결 이벤트를 처리하며 확정 프레임 수신
+        
+        Args:
+            조건: 대기를 끝낼 조건 함수
+            타임아웃: 최대 대기 시간(초)
+            
+        Returns:
+            bool: 시간 내 조건이 만족되면 True
+        """
+        종료시각 = time.monotonic() + 타임아웃
+        while not 조건():
+            남은시간 = 종료시각 - time.monotonic()
+            if 남은시간 <= 0:
+                return False
+            self.큐연결.process_data_events(time_limit=min(남은시간, 0.05))
+        return True
+    
+    def 확인완료대기(self, 타임아웃: Optional[float] = None) -> bool:
+        """
+        확정 대기 중인 모든 발행이 Ack/Nack 될 때까지 대기
+        
+        Args:
+            타임아웃: 최대 대기 시간(초), None이면 설정값 사용
+            
+        Returns:
+            bool: 모든 발행이 확정되면 True
+        """
+        if not self.확인추적기:
+            return True
+        return self._확인대기(
+            lambda: self.확인추적기.미확정개수() == 0,
+            타임아웃 if 타임아웃 is not None else self.확인타임아웃
+        )
+    
+    def _확인결과반영(self, 결과: Dict[str, Any], 태그: Optional[int]) -> Dict[str, Any]:
+        """
+        발행 결과에 브로커 확정 상태 반영
+        
+        Args:
+            결과: 발행 단계 결과
+            태그: 발행 시 부여된 delivery tag (Confirm 미사용 시 None)
+            
+        Returns:
+            dict: 확정 상태가 반영된 결과
+        """
+        if 태그 is None:
+            return 결과
+        
+        확인상태 = self.확인추적기.결과가져오기(태그)
+        if 확인상태 is None:
+            # 아직 대기 중이면 시간 초과 (더 기다리지 않으므로 태그를 버림), 재연결로 사라졌으면 확인 실패
+            확인상태 = '시간초과' if self.확인추적기.포기(태그) else '확인실패'
+        
+        결과['확인상태'] = 확인상태
+        if 확인상태 != 발행확인추적기.확인됨:
+            결과['성공'] = False
+            결과['메시지'] = f'브로커 확정 실패: {확인상태}'
+        return 결과
+    
     def 연결확인(self) -> bool:
         """
         RabbitMQ 연결 상태 확인
@@ -69,40 +189,67 @@ class BSS메시지생산자:
             self.로거.warning(f"연결 상태 확인 실패: {e}")
             return False
     
-    def _연결재시도(self, 최대시도: int = 3, 지연시간: int = 5) -> bool:
+    def 연결가능(self) -> bool:
         """
-        연결 재시도
+        네트워크 왕복 없이 연결/채널이 열려 있는지만 확인 (발행 경로용)
+        
+        Returns:
+            bool: 연결과 채널이 모두 열려 있으면 True
+        """
+        return bool(
+            self.큐연결 and not self.큐연결.is_closed
+            and self.채널 and not self.채널.is_closed
+        )
+    
+    def 재연결(self) -> bool:
+        """
+        기존 연결을 닫고 새로 연결 (연결 감독자가 백오프 후 호출)
+        
+        Returns:
+            bool: 재연결 성공 여부
+        """
+        try:
+            self._연결해제()
+            self._연결생성()
+            return True
+        except Exception as e:
+            self.로거.warning(f"재연결 실패: {e}")
+            return False
+    
+    def _발행속성생성(self, 메시지: BSS메시지) -> pika.BasicProperties:
+        """
+        메시지 발행 속성 생성
         
         Args:
-            최대시도: 최대 재시도 횟수
-            지연시간: 재시도 간 지연 시간(초)
+            메시지: 발행할 BSS 메시지
             
         Returns:
-            bool: 재연결 성공 여부
+            pika.BasicProperties: AMQP 메시지 속성
         """
-        for 시도 in range(최대시도):
-            try:
-                self.로거.info(f"연결 재시도 {시도 + 1}/{최대시도}")
-                self._연결해제()
-                time.sleep(지연시간)
-                self._연결생성()
-                return True
-            except Exception as e:
-                self.로거.warning(f"재시도 {시도 + 1} 실패: {e}")
-                if 시도 == 최대시도 - 1:
-                    self.로거.error("모든 재시도 실패")
-                    return False
-        return False
+        return pika.BasicProperties(
+            message_id=메시지.아이디,
+            content_type=self.코덱.content_type,
+            delivery_mode=2,  # 메시지 지속성
+            priority=self.토폴로지.우선순위(메시지),
+            timestamp=메시지.생성시간ns // 1_000_000_000,
+            headers={
+                'message_type': 메시지.타입,
+                'created_at': 메시지.생성시간문자열
+            }
+        )
     
-    def 큐전송(self, 메시지: BSS메시지) -> Dict[str, Any]:
+    def 큐전송(self, 메시지: BSS메시지, 확인대기: bool = True) -> Dict[str, Any]:
         """
-        메시지를 RabbitMQ 단일 큐로 전송
+        메시지를 라우팅 모드에 맞는 큐(단일 큐 또는 타입별 Exchange)로 전송
         
         Args:
             메시지: 전송할 BSS 메시지
+            확인대기: Confirm 모드에서 브로커 확정까지 기다릴지 여부
+                      (False면 결과에 '확인태그'를 담아 즉시 반환, 확정 결과는
+                      확인추적기.결과가져오기로 꺼내며 최근 최대결과수개까지만 보관)
             
         Returns:
-            dict: 전송 결과 {'성공': bool, '메시지': str, '메시지아이디': str}
+            dict: 전송 결과 {'성공': bool, '메시지': str, '메시지아이디': str, '확인상태': str}
         """
         try:
             # 메시지 유효성 검증
@@ -113,77 +260,121 @@ class BSS메시지생산자:
                     '메시지아이디': 메시지.아이디
                 }
             
-            # 연결 상태 확인 및 재연결
-            if not self.연결확인():
-                if not self._연결재시도():
+            # 연결 상태 확인 (재연결은 연결 감독자가 전담)
+            if not self.연결가능():
+                return {
+                    '성공': False,
+                    '메시지': 'RabbitMQ 연결 실패',
+                    '메시지아이디': 메시지.아이디,
+                    '확인상태': '연결실패'
+                }
+            
+            # 메시지 발행 대상 (라우팅 모드에 따라 단일 큐 또는 타입별 Exchange)
+            교환기, 라우팅키 = self.토폴로지.발행대상(메시지.타입)
+            
+            # 본문 직렬화와 메시지 속성 설정 (실패하면 태그를 부여하지 않도록 등록 전에 수행)
+            본문 = self.코덱.인코딩(메시지)
+            properties = self._발행속성생성(메시지)
+            
+            # Confirm 윈도우가 가득 차면 확정 프레임을 받아 자리 확보
+            태그 = None
+            if self.확인추적기:
+                if not self._확인대기(self.확인추적기.윈도우여유, self.확인타임아웃):
                     return {
                         '성공': False,
-                        '메시지': 'RabbitMQ 연결 실패',
-                        '메시지아이디': 메시지.아이디
+                        '메시지': 'Publisher Confirm 윈도우 대기 시간 초과',
+                        '메시지아이디': 메시지.아이디,
+                        '확인상태': '시간초과'
                     }
             
-            # 메시지 발행
-            큐설정 = self.설정.큐설정가져오기()
-            
-            # 메시지 속성 설정
-            properties = pika.BasicProperties(
-                message_id=메시지.아이디,
-                content_type='application/json',
-                delivery_mode=2,  # 메시지 지속성
-                timestamp=int(메시지.생성시간.timestamp()),
-                headers={
-                    'message_type': 메시지.타입,
-                    'created_at': 메시지.생성시간.isoformat()
-                }
-            )
-            
-            # 메시지 발행
-            self.채널.basic_publish(
-                exchange='',
-                routing_key=큐설정['큐이름'],
-                body=메시지.to_json(),
-                properties=properties
-            )
+            # 메시지 발행 (태그는 발행 직전에 등록하고, 발행 호출이 실패하면 되돌림)
+            if self.확인추적기:
+                태그 = self.확인추적기.등록(메시지.아이디)
+            try:
+                self.채널.basic_publish(
+                    exchange=교환기,
+                    routing_key=라우팅키,
+                    body=본문,
+                    properties=properties
+                )
+            except Exception:
+                if 태그 is not None:
+                    self.확인추적기.등록취소(태그)
+                raise
             
             self.로거.info(f"메시지 전송 성공: {메시지.타입} - {메시지.아이디}")
             
-            return {
+            결과 = {
                 '성공': True,
                 '메시지': '메시지 전송 성공',
-                '메시지아이디': 메시지.아이디
+                '메시지아이디': 메시지.아이디,
+                '확인상태': '대기' if 태그 else '미사용'
             }
             
+            if 태그 is None:
+                return 결과
+            if not 확인대기:
+                결과['확인태그'] = 태그
+                return 결과
+            
+            self._확인대기(lambda: not self.확인추적기.미확정여부(태그), self.확인타임아웃)
+            return self._확인결과반영(결과, 태그)
+            
         except Exception as e:
             error_msg = f"메시지 전송 실패: {e}"
             self.로거.error(error_msg)
-            return {
+            결과 = {
                 '성공': False,
                 '메시지': error_msg,
                 '메시지아이디': 메시지.아이디
             }
+            if isinstance(e, _연결오류):
+                결과['확인상태'] = '연결실패'
+            return 결과
     
     def 배치전송(self, 메시지목록: list[BSS메시지]) -> Dict[str, Any]:
         """
-        여러 메시지를 배치로 전송
+        여러 메시지를 한 번에 대량 발행
+        
+        연결 확인은 배치당 한 번만 수행하고, 모든 본문과 속성을 미리 직렬화한 뒤
+        채널에 연속으로 기록하여 마지막에 한 번만 flush (Confirm 모드면 윈도우 단위로 확정 대기)
         
         Args:
             메시지목록: 전송할 BSS 메시지 리스트
             
         Returns:
-            dict: 배치 전송 결과
+            dict: 배치 전송 결과 (상세결과에 메시지별 결과 및 확정 상태 포함)
         """
-        성공개수 = 0
-        실패개수 = 0
-        결과목록 = []
+        결과목록: list = [None] * len(메시지목록)
+        발행대상 = []
         
-        for 메시지 in 메시지목록:
-            결과 = self.큐전송(메시지)
-            결과목록.append(결과)
-            
-            if 결과['성공']:
-                성공개수 += 1
-            else:
-                실패개수 += 1
+        # 1단계: 유효성 검증 및 사전 직렬화
+        for 위치, 메시지 in enumerate(메시지목록):
+            if not 메시지.메시지검증():
+                결과목록[위치] = {
+                    '성공': False,
+                    '메시지': '메시지 유효성 검증 실패',
+                    '메시지아이디': 메시지.아이디
+                }
+                continue
+            try:
+                발행대상.append((위치, 메시지, self.코덱.인코딩(메시지), self._발행속성생성(메시지)))
+            except Exception as e:
+                error_msg = f"메시지 직렬화 실패: {e}"
+                self.로거.error(error_msg)
+                결과목록[위치] = {
+                    '성공': False,
+                    '메시지': error_msg,
+                    '메시지아이디': 메시지.아이디
+                }
+        
+        if 발행대상:
+            self._대량발행(발행대상, 결과목록)
+        
+        성공개수 = sum(1 for 결과 in 결과목록 if 결과['성공'])
+        실패개수 = len(결과목록) - 성공개수
+        
+        self.로거.info(f"배치 전송 완료: {성공개수}/{len(메시지목록)} 성공")
         
         return {
             '전체개수': len(메시지목록),
@@ -193,6 +384,83 @@ class BSS메시지생산자:
             '상세결과': 결과목록
         }
     
+    def _대량발행(self, 발행대상: list, 결과목록: list):
+        """
+        사전 직렬화된 메시지들을 채널에 연속 발행하고 결과목록을 채움
+        
+        Args:
+            발행대상: (위치, 메시지, 본문, 속성) 튜플 리스트
+            결과목록: 위치별 결과를 기록할 리스트
+        """
+        def 일괄실패(메시지문구: str, 시작: int = 0, **추가정보):
+            for 위치, 메시지, _, _ in 발행대상[시작:]:
+                결과목록[위치] = {
+                    '성공': False,
+                    '메시지': 메시지문구,
+                    '메시지아이디': 메시지.아이디,
+                    **추가정보
+                }
+        
+        # 2단계: 배치당 한 번만 연결 확인 (재연결은 연결 감독자가 전담)
+        if not self.연결가능():
+            일괄실패('RabbitMQ 연결 실패', 확인상태='연결실패')
+            return
+        
+        태그목록 = {}
+        
+        # 3단계: 연속 발행 (하위 채널에 직접 기록하여 메시지마다 flush하지 않음)
+        for 순번, (위치, 메시지, 본문, 속성) in enumerate(발행대상):
+            try:
+                if self.확인추적기:
+                    if not self.확인추적기.윈도우여유():
+                        if not self._확인대기(self.확인추적기.윈도우여유, self.확인타임아웃):
+                            일괄실패('Publisher Confirm 윈도우 대기 시간 초과', 순번)
+                            break
+                
+                # 태그는 발행 직전에 등록하고, 발행 호출이 실패하면 되돌림
+                교환기, 라우팅키 = self.토폴로지.발행대상(메시지.타입)
+                if self.확인추적기:
+                    태그목록[위치] = self.확인추적기.등록(메시지.아이디)
+                try:
+                    self.채널._impl.basic_publish(
+                        exchange=교환기,
+                        routing_key=라우팅키,
+                        body=본문,
+                        properties=속성
+                    )
+                except Exception:
+                    if 위치 in 태그목록:
+                        self.확인추적기.등록취소(태그목록.pop(위치))
+                    raise
+                결과목록[위치] = {
+                    '성공': True,
+                    '메시지': '메시지 전송 성공',
+                    '메시지아이디': 메시지.아이디,
+                    '확인상태': '대기' if 위치 in 태그목록 else '미사용'
+                }
+            except Exception as e:
+                error_msg = f"메시지 전송 실패: {e}"
+                self.로거.error(error_msg)
+                일괄실패(error_msg, 순번, **({'확인상태': '연결실패'} if isinstance(e, _연결오류) else {}))
+                break
+        
+        # 4단계: 한 번에 flush 후 확정 대기
+        try:
+            if self.확인추적기:
+                self.확인완료대기()
+            else:
+                self.큐연결.process_data_events(time_limit=0)
+        except Exception as e:
+            error_msg = f"배치 flush 실패: {e}"
+            self.로거.error(error_msg)
+            for 위치, _, _, _ in 발행대상:
+                if 결과목록[위치]['성공'] and 위치 not in 태그목록:
+                    결과목록[위치].update({'성공': False, '메시지': error_msg})
+        
+        for 위치, 태그 in 태그목록.items():
+            if 결과목록[위치]['성공']:
+                self._확인결과반영(결과목록[위치], 태그)
+    
     def 큐상태확인(self) -> Dict[str, Any]:
         """
         큐 상태 정보 조회
@@ -204,16 +472,23 @@ class BSS메시지생산자:
             if not self.연결확인():
                 return {'오류': 'RabbitMQ 연결 실패'}
             
-            큐설정 = self.설정.큐설정가져오기()
-            method = self.채널.queue_declare(
-                queue=큐설정['큐이름'],
-                passive=True  # 큐 상태만 확인
-            )
+            큐별상태 = {}
+            for 큐이름 in self.토폴로지.소비큐목록():
+                method = self.채널.queue_declare(
+                    queue=큐이름,
+                    passive=True  # 큐 상태만 확인
+                )
+                큐별상태[큐이름] = {
+                    '메시지개수': method.method.message_count,
+                    '소비자개수': method.method.consumer_count
+                }
             
             return {
-                '큐이름': 큐설정['큐이름'],
-                '메시지개수': method.method.message_count,
-                '소비자개수': method.method.consumer_count
+                '큐이름': self.토폴로지.큐이름,
+                '라우팅모드': self.토폴로지.라우팅모드,
+                '메시지개수': sum(상태['메시지개수'] for 상태 in 큐별상태.values()),
+                '소비자개수': sum(상태['소비자개수'] for 상태 in 큐별상태.values()),
+                '큐별상태': 큐별상태
             }
             
         except Exception as e:
@@ -1,10 +1,16 @@
 # 파일 경로: src/producer/message_router.py
 # 메시지 라우터 클래스
 
-from typing import Dict, Any
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional
 from src.common.message_models import BSS메시지, MessageType
 from src.producer.message_producer import BSS메시지생산자
+from src.producer.async_producer import 비동기메시지생산자
 from src.common.config import 설정가져오기
+from src.common.queue_topology import 큐토폴로지
+from src.producer.spool import 로컬스풀
+from src.producer.connection_supervisor import 연결감독자
 
 
 class 메시지라우터:
@@ -12,74 +18,338 @@ class 메시지라우터:
     BSS 메시지 라우팅 및 전송을 담당하는 클래스
     단일 큐 구조에서 메시지 타입 검증 및 전송 처리
     
+    비동기... API는 두 백엔드 모두에서 사용하고, 동기 API(메시지전송, 배치메시지전송, 큐상태조회,
+    연결상태확인, 라우터통계)는 blocking 백엔드 전용 (이벤트 루프 밖에서만 호출)
+    동기 API도 pika 연결은 전용 스레드에서만 사용하므로 비동기 API와 함께 써도 연결을 공유하지 않고,
+    전송은 비동기 API와 같이 회로가 열려 있으면 브로커를 호출하지 않으며 연결 실패 메시지는 스풀에 보관
+    (감독 태스크는 이벤트 루프에서 비동기 API가 처음 호출될 때 시작)
+    
     속성:
-        생산자: BSS메시지생산자 인스턴스
+        생산자: BSS메시지생산자 인스턴스 (blocking 백엔드)
+        비동기생산자: 비동기메시지생산자 인스턴스 (asyncio 백엔드)
+        스풀: 브로커 연결 실패 시 메시지를 보관할 로컬 스풀 (없으면 None)
         설정: 설정 관리자 인스턴스
     """
     
-    def __init__(self):
-        """메시지 라우터 초기화"""
+    def __init__(self, 스풀: Optional[로컬스풀] = None):
+        """
+        메시지 라우터 초기화
+        
+        Args:
+            스풀: 브로커 연결 실패 시 메시지를 보관할 로컬 스풀
+        """
         self.설정 = 설정가져오기()
         self.로거 = self.설정.로거설정('메시지라우터')
-        self.생산자 = BSS메시지생산자()
+        
+        self.토폴로지 = 큐토폴로지()
+        self.스풀 = 스풀
+        
+        # 생산자 백엔드 선택
+        self.생산자: Optional[BSS메시지생산자] = None
+        self.비동기생산자: Optional[비동기메시지생산자] = None
+        self._블로킹실행기: Optional[ThreadPoolExecutor] = None
+        
+        if self.설정.생산자설정가져오기()['백엔드'] == 'asyncio':
+            self.비동기생산자 = 비동기메시지생산자()
+        else:
+            self.생산자 = BSS메시지생산자()
+            # pika BlockingConnection은 스레드 안전하지 않으므로 전용 스레드 1개에서만 사용
+            self._블로킹실행기 = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix='blocking-producer'
+            )
+        
+        # 연결 점검/재연결은 감독자가 전담하고 요청 경로는 회로 상태만 확인
+        if self.비동기생산자:
+            self.감독자 = 연결감독자(self.비동기생산자.연결확인, self.비동기생산자.연결확인)
+        else:
+            self.감독자 = 연결감독자(
+                lambda: self._블로킹호출(self.생산자.연결확인),
+                lambda: self._블로킹호출(self.생산자.재연결)
+            )
         
         # 유효한 메시지 타입 목록
         self.유효한타입들 = [t.value for t in MessageType]
         
-        self.로거.info("메시지 라우터 초기화 완료")
+        self.로거.info(
+            f"메시지 라우터 초기화 완료 (생산자 백엔드: "
+            f"{'asyncio' if self.비동기생산자 else 'blocking'})"
+        )
+    
+    async def _블로킹호출(self, 함수, *인자):
+        """
+        blocking 생산자 호출을 전용 스레드에서 실행하여 이벤트 루프를 막지 않도록 함
+        
+        Args:
+            함수: 호출할 생산자 메소드
+            인자: 메소드 인자
+        """
+        루프 = asyncio.get_running_loop()
+        return await 루프.run_in_executor(self._블로킹실행기, 함수, *인자)
+    
+    def _동기백엔드확인(self):
+        """
+        동기 API를 쓸 수 있는 blocking 백엔드인지 확인
+        
+        Raises:
+            RuntimeError: asyncio 생산자 백엔드인 경우 (비동기 API를 사용해야 함)
+        """
+        if self.생산자 is None:
+            raise RuntimeError("PRODUCER_BACKEND=asyncio에서는 동기 API를 사용할 수 없음 (비동기 API 사용)")
+    
+    def _동기호출(self, 함수명: str, *인자):
+        """
+        blocking 생산자 메소드를 전용 스레드에서 실행하고 결과를 기다림 (동기 API용)
+        
+        Args:
+            함수명: 호출할 생산자 메소드 이름
+            인자: 메소드 인자
+        """
+        return self._블로킹실행기.submit(getattr(self.생산자, 함수명), *인자).result()
+    
+    def _회로차단결과(self, 메시지: BSS메시지) -> Dict[str, Any]:
+        """회로가 열려 있어 브로커를 호출하지 않은 결과 생성"""
+        return {
+            '성공': False,
+            '메시지': f'RabbitMQ 연결 불가 (회로 {self.감독자.회로.상태})',
+            '메시지아이디': 메시지.아이디,
+            '확인상태': '연결실패'
+        }
+    
+    def _연결실패관측(self, 결과목록: list):
+        """전송 결과에 연결 실패가 있으면 연결 감독자에게 보고"""
+        if any(결과.get('확인상태') == '연결실패' for 결과 in 결과목록):
+            self.감독자.실패보고()
+    
+    async def _생산자전송(self, 메시지: BSS메시지) -> Dict[str, Any]:
+        """선택된 백엔드로 단일 메시지 전송 (회로가 열려 있으면 즉시 실패, 연결 실패 시 스풀로 보관)"""
+        self.감독자.시작()
+        if not self.감독자.요청허용():
+            전송결과 = self._회로차단결과(메시지)
+        elif self.비동기생산자:
+            전송결과 = await self.비동기생산자.큐전송(메시지)
+        else:
+            전송결과 = await self._블로킹호출(self.생산자.큐전송, 메시지)
+        
+        self._연결실패관측([전송결과])
+        return self._스풀대체([메시지], [전송결과])[0]
+    
+    async def _생산자배치전송(self, 메시지목록: list[BSS메시지], 스풀사용: bool = True) -> Dict[str, Any]:
+        """
+        선택된 백엔드로 배치 전송
+        
+        Args:
+            메시지목록: 전송할 BSS 메시지 리스트
+            스풀사용: 연결 실패한 메시지를 스풀로 보관할지 여부 (스풀 재생 시 False)
+            
+        Returns:
+            dict: 생산자 배치 전송 결과
+        """
+        self.감독자.시작()
+        if not self.감독자.요청허용():
+            전송결과 = self._회로차단배치결과(메시지목록)
+        elif self.비동기생산자:
+            전송결과 = await self.비동기생산자.배치전송(메시지목록)
+        else:
+            전송결과 = await self._블로킹호출(self.생산자.배치전송, 메시지목록)
+        
+        return self._배치전송결과반영(메시지목록, 전송결과, 스풀사용)
+    
+    def _동기생산자전송(self, 메시지: BSS메시지) -> Dict[str, Any]:
+        """동기 API용 단일 메시지 전송 (_생산자전송과 같은 회로 확인/스풀 보관 규칙)"""
+        if not self.감독자.요청허용():
+            전송결과 = self._회로차단결과(메시지)
+        else:
+            전송결과 = self._동기호출('큐전송', 메시지)
+        
+        self._연결실패관측([전송결과])
+        return self._스풀대체([메시지], [전송결과])[0]
+    
+    def _동기생산자배치전송(self, 메시지목록: list[BSS메시지]) -> Dict[str, Any]:
+        """동기 API용 배치 전송 (_생산자배치전송과 같은 회로 확인/스풀 보관 규칙)"""
+        if not self.감독자.요청허용():
+            전송결과 = self._회로차단배치결과(메시지목록)
+        else:
+            전송결과 = self._동기호출('배치전송', 메시지목록)
+        
+        return self._배치전송결과반영(메시지목록, 전송결과, 스풀사용=True)
+    
+    def _회로차단배치결과(self, 메시지목록: list[BSS메시지]) -> Dict[str, Any]:
+        """회로가 열려 있어 브로커를 호출하지 않은 배치 결과 생성"""
+        return {
+            '전체개수': len(메시지목록),
+            '성공개수': 0,
+            '실패개수': len(메시지목록),
+            '성공률': 0,
+            '상세결과': [self._회로차단결과(메시지) for 메시지 in 메시지목록]
+        }
+    
+    def _배치전송결과반영(self, 메시지목록: list[BSS메시지], 전송결과: Dict[str, Any],
+                   스풀사용: bool) -> Dict[str, Any]:
+        """배치 전송 결과의 연결 실패를 감독자에게 보고하고, 스풀사용이면 스풀 보관을 반영해 집계"""
+        self._연결실패관측(전송결과['상세결과'])
+        
+        if 스풀사용 and self.스풀:
+            상세결과 = self._스풀대체(메시지목록, 전송결과['상세결과'])
+            성공개수 = sum(1 for 결과 in 상세결과 if 결과['성공'])
+            전송결과.update({
+                '성공개수': 성공개수,
+                '실패개수': len(상세결과) - 성공개수,
+                '성공률': round(성공개수 / len(상세결과) * 100, 2) if 상세결과 else 0,
+                '상세결과': 상세결과
+            })
+        return 전송결과
+    
+    def _스풀대체(self, 메시지목록: list[BSS메시지], 결과목록: list) -> list:
+        """
+        브로커 연결 실패로 전송하지 못한 메시지를 로컬 스풀에 보관하고 결과를 '스풀됨'으로 변경
+        
+        Args:
+            메시지목록: 전송한 메시지 목록
+            결과목록: 같은 순서의 생산자 전송 결과
+            
+        Returns:
+            list: 스풀 보관이 반영된 결과 목록
+        """
+        if not self.스풀:
+            return 결과목록
+        
+        대상위치 = [
+            위치 for 위치, 결과 in enumerate(결과목록)
+            if 결과.get('확인상태') == '연결실패'
+        ]
+        if not 대상위치:
+            return 결과목록
+        
+        try:
+            self.스풀.메시지추가([메시지목록[위치] for 위치 in 대상위치])
+        except Exception as e:
+            self.로거.error(f"로컬 스풀 보관 실패: {e}")
+            return 결과목록
+        
+        for 위치 in 대상위치:
+            결과목록[위치] = {
+                '성공': True,
+                '메시지': '브로커 연결 불가 - 로컬 스풀에 보관 (연결 복구 후 전송)',
+                '메시지아이디': 메시지목록[위치].아이디,
+                '확인상태': '스풀됨'
+            }
+        return 결과목록
+    
+    async def 스풀재전송(self, 메시지목록: list[BSS메시지]) -> list[Dict[str, Any]]:
+        """
+        스풀에 보관된 메시지를 다시 전송하고 메시지별 생산자 결과 반환
+        (라우팅 검증은 보관 전에 끝났으므로 생략하고, 실패해도 다시 스풀하지 않음)
+        
+        Args:
+            메시지목록: 스풀에서 읽은 BSS 메시지 리스트
+            
+        Returns:
+            list: 입력 순서와 같은 메시지별 전송 결과
+        """
+        전송결과 = await self._생산자배치전송(메시지목록, 스풀사용=False)
+        return 전송결과['상세결과']
+    
+    def _검증실패결과(self, 메시지: BSS메시지) -> Dict[str, Any]:
+        """메시지 타입 검증 실패 결과 생성"""
+        return {
+            '성공': False,
+            '메시지': '메시지 타입 검증 실패',
+            '세부정보': {
+                '원본타입': 메시지.타입,
+                '유효한타입들': self.유효한타입들
+            }
+        }
+    
+    def _전송결과구성(self, 메시지: BSS메시지, 전송결과: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        생산자 전송 결과를 라우터 응답 형식으로 변환
+        
+        Args:
+            메시지: 전송된 메시지
+            전송결과: 생산자 전송 결과
+            
+        Returns:
+            dict: 전송 결과 {'성공': bool, '메시지': str, '세부정보': dict}
+        """
+        # 라우팅 로그 기록
+        self._라우팅로그기록(메시지, 전송결과['성공'])
+        
+        return {
+            '성공': 전송결과['성공'],
+            '메시지': 전송결과['메시지'],
+            '세부정보': {
+                '메시지아이디': 전송결과['메시지아이디'],
+                '메시지타입': 메시지.타입,
+                '큐이름': self.토폴로지.소비큐이름(메시지.타입),
+                '전송시간': 메시지.생성시간문자열,
+                '확인상태': 전송결과.get('확인상태', '미사용')
+            }
+        }
+    
+    def _라우팅실패결과(self, 메시지: BSS메시지, e: Exception) -> Dict[str, Any]:
+        """라우팅 중 예외 발생 결과 생성"""
+        error_msg = f"메시지 라우팅 실패: {e}"
+        self.로거.error(error_msg)
+        return {
+            '성공': False,
+            '메시지': error_msg,
+            '세부정보': {
+                '메시지아이디': 메시지.아이디,
+                '오류타입': type(e).__name__
+            }
+        }
     
     def 메시지전송(self, 메시지: BSS메시지) -> Dict[str, Any]:
         """
-        메시지를 큐로 전송하고 결과 반환
+        메시지를 큐로 전송하고 결과 반환 (blocking 백엔드 전용)
         
         Args:
             메시지: 전송할 BSS 메시지
             
         Returns:
             dict: 전송 결과 {'성공': bool, '메시지': str, '세부정보': dict}
+            
+        Raises:
+            RuntimeError: asyncio 생산자 백엔드인 경우
         """
+        self._동기백엔드확인()
         try:
             # 메시지 타입 설정 및 검증
             검증된메시지 = self.메시지타입설정(메시지)
             
             if not 검증된메시지:
-                return {
-                    '성공': False,
-                    '메시지': '메시지 타입 검증 실패',
-                    '세부정보': {
-                        '원본타입': 메시지.타입,
-                        '유효한타입들': self.유효한타입들
-                    }
-                }
+                return self._검증실패결과(메시지)
             
             # 메시지 전송
-            전송결과 = self.생산자.큐전송(검증된메시지)
+            전송결과 = self._동기생산자전송(검증된메시지)
             
-            # 라우팅 로그 기록
-            self._라우팅로그기록(검증된메시지, 전송결과['성공'])
+            return self._전송결과구성(검증된메시지, 전송결과)
             
-            return {
-                '성공': 전송결과['성공'],
-                '메시지': 전송결과['메시지'],
-                '세부정보': {
-                    '메시지아이디': 전송결과['메시지아이디'],
-                    '메시지타입': 검증된메시지.타입,
-                    '큐이름': self.설정.큐설정가져오기()['큐이름'],
-                    '전송시간': 검증된메시지.생성시간.isoformat()
-                }
-            }
+        except Exception as e:
+            return self._라우팅실패결과(메시지, e)
+    
+    async def 비동기메시지전송(self, 메시지: BSS메시지) -> Dict[str, Any]:
+        """
+        메시지를 큐로 전송하고 결과 반환 (이벤트 루프를 막지 않음)
+        
+        Args:
+            메시지: 전송할 BSS 메시지
+            
+        Returns:
+            dict: 전송 결과 {'성공': bool, '메시지': str, '세부정보': dict}
+        """
+        try:
+            검증된메시지 = self.메시지타입설정(메시지)
+            
+            if not 검증된메시지:
+                return self._검증실패결과(메시지)
+            
+            전송결과 = await self._생산자전송(검증된메시지)
+            
+            return self._전송결과구성(검증된메시지, 전송결과)
             
         except Exception as e:
-            error_msg = f"메시지 라우팅 실패: {e}"
-            self.로거.error(error_msg)
-            return {
-                '성공': False,
-                '메시지': error_msg,
-                '세부정보': {
-                    '메시지아이디': 메시지.아이디,
-                    '오류타입': type(e).__name__
-                }
-            }
+            return self._라우팅실패결과(메시지, e)
     
     def 메시지타입설정(self, 메시지: BSS메시지) -> BSS메시지:
         """
@@ -113,8 +383,8 @@ class 메시지라우터:
             # 메시지에 라우팅 정보 추가
             메시지.속성들['라우팅정보'] = {
                 '라우터': '메시지라우터',
-                '대상큐': self.설정.큐설정가져오기()['큐이름'],
-                '라우팅시간': 메시지.생성시간.isoformat()
+                '대상큐': self.토폴로지.소비큐이름(정규화된타입),
+                '라우팅시간': 메시지.생성시간문자열
             }
             
             return 메시지
@@ -123,38 +393,117 @@ class 메시지라우터:
             self.로거.error(f"메시지 타입 설정 실패: {e}")
             return None
     
+    def _배치검증(self, 메시지목록: list[BSS메시지]) -> list[BSS메시지]:
+        """배치 메시지 검증 후 유효한 메시지만 반환"""
+        검증된메시지들 = []
+        for 메시지 in 메시지목록:
+            검증된메시지 = self.메시지타입설정(메시지)
+            if 검증된메시지:
+                검증된메시지들.append(검증된메시지)
+        return 검증된메시지들
+    
+    def _빈배치결과(self) -> Dict[str, Any]:
+        """빈 배치 요청 결과 생성"""
+        return {
+            '성공': False,
+            '메시지': '전송할 메시지가 없습니다',
+            '세부정보': {'전체개수': 0}
+        }
+    
     def 배치메시지전송(self, 메시지목록: list[BSS메시지]) -> Dict[str, Any]:
         """
-        여러 메시지를 배치로 라우팅 및 전송
+        여러 메시지를 배치로 라우팅 및 전송 (blocking 백엔드 전용)
         
         Args:
             메시지목록: 전송할 BSS 메시지 리스트
             
         Returns:
             dict: 배치 전송 결과
+            
+        Raises:
+            RuntimeError: asyncio 생산자 백엔드인 경우
         """
+        self._동기백엔드확인()
         if not 메시지목록:
-            return {
-                '성공': False,
-                '메시지': '전송할 메시지가 없습니다',
-                '세부정보': {'전체개수': 0}
-            }
+            return self._빈배치결과()
         
-        검증된메시지들 = []
-        검증실패개수 = 0
+        검증된메시지들 = self._배치검증(메시지목록)
+        전송결과 = self._동기생산자배치전송(검증된메시지들) if 검증된메시지들 else None
         
-        # 메시지 검증 단계
-        for 메시지 in 메시지목록:
+        return self._배치결과구성(메시지목록, 검증된메시지들, 전송결과)
+    
+    async def 비동기배치메시지전송(self, 메시지목록: list[BSS메시지]) -> Dict[str, Any]:
+        """
+        여러 메시지를 배치로 라우팅 및 전송 (이벤트 루프를 막지 않음)
+        
+        Args:
+            메시지목록: 전송할 BSS 메시지 리스트
+            
+        Returns:
+            dict: 배치 전송 결과
+        """
+        if not 메시지목록:
+            return self._빈배치결과()
+        
+        검증된메시지들 = self._배치검증(메시지목록)
+        전송결과 = None
+        if 검증된메시지들:
+            전송결과 = await self._생산자배치전송(검증된메시지들)
+        
+        return self._배치결과구성(메시지목록, 검증된메시지들, 전송결과)
+    
+    async def 비동기메시지목록전송(self, 메시지목록: list[BSS메시지]) -> list[Dict[str, Any]]:
+        """
+        여러 메시지를 한 번의 대량 발행으로 전송하고 메시지별 결과 반환
+        (각 결과는 비동기메시지전송과 같은 형식)
+        
+        Args:
+            메시지목록: 전송할 BSS 메시지 리스트
+            
+        Returns:
+            list: 입력 순서와 같은 메시지별 전송 결과
+        """
+        결과목록: list = [None] * len(메시지목록)
+        검증된항목들 = []
+        
+        for 위치, 메시지 in enumerate(메시지목록):
             검증된메시지 = self.메시지타입설정(메시지)
             if 검증된메시지:
-                검증된메시지들.append(검증된메시지)
+                검증된항목들.append((위치, 검증된메시지))
             else:
-                검증실패개수 += 1
+                결과목록[위치] = self._검증실패결과(메시지)
         
-        # 검증된 메시지들 배치 전송
-        if 검증된메시지들:
-            전송결과 = self.생산자.배치전송(검증된메시지들)
-        else:
+        if not 검증된항목들:
+            return 결과목록
+        
+        검증된메시지들 = [메시지 for _, 메시지 in 검증된항목들]
+        try:
+            전송결과 = await self._생산자배치전송(검증된메시지들)
+            
+            for (위치, 메시지), 상세결과 in zip(검증된항목들, 전송결과['상세결과']):
+                결과목록[위치] = self._전송결과구성(메시지, 상세결과)
+        except Exception as e:
+            for 위치, 메시지 in 검증된항목들:
+                결과목록[위치] = self._라우팅실패결과(메시지, e)
+        
+        return 결과목록
+    
+    def _배치결과구성(self, 메시지목록: list[BSS메시지], 검증된메시지들: list[BSS메시지],
+                   전송결과: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        생산자 배치 전송 결과를 라우터 응답 형식으로 변환
+        
+        Args:
+            메시지목록: 원본 메시지 목록
+            검증된메시지들: 검증을 통과한 메시지 목록
+            전송결과: 생산자 배치 전송 결과 (검증 통과 메시지가 없으면 None)
+            
+        Returns:
+            dict: 배치 전송 결과
+        """
+        검증실패개수 = len(메시지목록) - len(검증된메시지들)
+        
+        if 전송결과 is None:
             전송결과 = {
                 '전체개수': 0,
                 '성공개수': 0,
@@ -178,61 +527,123 @@ class 메시지라우터:
     
     def 큐상태조회(self) -> Dict[str, Any]:
         """
-        큐 상태 정보 조회
+        큐 상태 정보 조회 (blocking 백엔드 전용)
         
         Returns:
             dict: 큐 상태 정보
+            
+        Raises:
+            RuntimeError: asyncio 생산자 백엔드인 경우
         """
+        self._동기백엔드확인()
         try:
-            큐상태 = self.생산자.큐상태확인()
-            
-            if '오류' in 큐상태:
-                return {
-                    '성공': False,
-                    '메시지': f"큐 상태 조회 실패: {큐상태['오류']}"
-                }
-            
-            return {
-                '성공': True,
-                '메시지': '큐 상태 조회 성공',
-                '세부정보': 큐상태
-            }
-            
+            return self._큐상태결과구성(self._동기호출('큐상태확인'))
         except Exception as e:
-            error_msg = f"큐 상태 조회 중 오류: {e}"
-            self.로거.error(error_msg)
+            return self._큐상태조회실패(e)
+    
+    async def 비동기큐상태조회(self) -> Dict[str, Any]:
+        """
+        큐 상태 정보 조회 (이벤트 루프를 막지 않음)
+        
+        Returns:
+            dict: 큐 상태 정보
+        """
+        try:
+            return self._큐상태결과구성(await self._생산자큐상태())
+        except Exception as e:
+            return self._큐상태조회실패(e)
+    
+    async def _생산자큐상태(self) -> Dict[str, Any]:
+        """선택된 백엔드에서 큐 상태 조회"""
+        if self.비동기생산자:
+            return await self.비동기생산자.큐상태확인()
+        return await self._블로킹호출(self.생산자.큐상태확인)
+    
+    def _큐상태결과구성(self, 큐상태: Dict[str, Any]) -> Dict[str, Any]:
+        """생산자 큐 상태를 라우터 응답 형식으로 변환"""
+        if '오류' in 큐상태:
             return {
                 '성공': False,
-                '메시지': error_msg
+                '메시지': f"큐 상태 조회 실패: {큐상태['오류']}"
             }
+        
+        return {
+            '성공': True,
+            '메시지': '큐 상태 조회 성공',
+            '세부정보': 큐상태
+        }
+    
+    def _큐상태조회실패(self, e: Exception) -> Dict[str, Any]:
+        """큐 상태 조회 중 예외 발생 결과 생성"""
+        error_msg = f"큐 상태 조회 중 오류: {e}"
+        self.로거.error(error_msg)
+        return {
+            '성공': False,
+            '메시지': error_msg
+        }
     
     def 연결상태확인(self) -> Dict[str, Any]:
         """
-        RabbitMQ 연결 상태 확인
+        RabbitMQ 연결 상태 확인 (blocking 백엔드 전용)
         
         Returns:
             dict: 연결 상태 정보
+            
+        Raises:
+            RuntimeError: asyncio 생산자 백엔드인 경우
         """
+        self._동기백엔드확인()
         try:
-            연결상태 = self.생산자.연결확인()
-            
-            return {
-                '성공': True,
-                '메시지': '연결 상태 확인 완료',
-                '세부정보': {
-                    '연결상태': '정상' if 연결상태 else '비정상',
-                    '연결가능': 연결상태,
-                    '큐설정': self.설정.큐설정가져오기()
-                }
-            }
-            
+            return self._연결상태결과구성(self._동기호출('연결확인'))
         except Exception as e:
-            error_msg = f"연결 상태 확인 실패: {e}"
-            self.로거.error(error_msg)
-            return {
-                '성공': False,
-                '메시지': error_msg
+            return self._연결상태확인실패(e)
+    
+    async def 비동기연결상태확인(self) -> Dict[str, Any]:
+        """
+        RabbitMQ 연결 상태 확인 (이벤트 루프를 막지 않음)
+        
+        Returns:
+            dict: 연결 상태 정보
+        """
+        try:
+            if self.비동기생산자:
+                연결상태 = await self.비동기생산자.연결확인()
+            else:
+                연결상태 = await self._블로킹호출(self.생산자.연결확인)
+            return self._연결상태결과구성(연결상태)
+        except Exception as e:
+            return self._연결상태확인실패(e)
+    
+    def 연결회로상태(self) -> Dict[str, Any]:
+        """
+        연결 감독자의 회로 상태 조회 (브로커 호출 없이 O(1))
+        
+        Returns:
+            dict: 회로 상태 정보
+        """
+        return self.감독자.상태조회()
+    
+    def _연결상태결과구성(self, 연결상태: bool) -> Dict[str, Any]:
+        """연결 상태를 라우터 응답 형식으로 변환"""
+        return {
+            '성공': True,
+            '메시지': '연결 상태 확인 완료',
+            '세부정보': {
+                '연결상태': '정상' if 연결상태 else '비정상',
+                '연결가능': 연결상태,
+                '회로상태': self.감독자.회로.상태,
+                '큐설정': self.설정.큐설정가져오기()
             }
+        }
+    
+    def _연결상태확인실패(self, e: Exception) -> Dict[str, Any]:
+        """연결 상태 확인 중 예외 발생 결과 생성"""
+        error_msg = f"연결 상태 확인 실패: {e}"
+        self.로거.error(error_msg)
+        return {
+            '성공': False,
+            '메시지': error_msg
+        }
     
     def _라우팅로그기록(self, 메시지: BSS메시지, 전송성공: bool):
         """
@@ -247,7 +658,7 @@ class 메시지라우터:
             f"메시지 라우팅 {상태}: "
             f"타입={메시지.타입}, "
             f"아이디={메시지.아이디}, "
-            f"큐={self.설정.큐설정가져오기()['큐이름']}"
+            f"큐={self.토폴로지.소비큐이름(메시지.타입)}"
         )
         
         # 모니터링이 활성화된 경우 추가 로그
@@ -256,29 +667,60 @@ class 메시지라우터:
     
     def 라우터통계(self) -> Dict[str, Any]:
         """
-        라우터 동작 통계 정보 반환
+        라우터 동작 통계 정보 반환 (blocking 백엔드 전용)
         
         Returns:
             dict: 라우터 통계 정보
+            
+        Raises:
+            RuntimeError: asyncio 생산자 백엔드인 경우
         """
+        self._동기백엔드확인()
         try:
-            큐상태 = self.생산자.큐상태확인()
-            
+            return self._라우터통계구성(self._동기호출('큐상태확인'))
+        except Exception as e:
+            self.로거.error(f"라우터 통계 조회 실패: {e}")
             return {
-                '라우터정보': {
-                    '유효한메시지타입': self.유효한타입들,
-                    '대상큐': self.설정.큐설정가져오기()['큐이름'],
-                    '모니터링상태': self.설정.모니터링상태확인()
-                },
-                '큐상태': 큐상태,
-                '설정정보': {
-                    '연결문자열': self.설정.연결문자열가져오기(),
-                    '큐설정': self.설정.큐설정가져오기()
-                }
+                '오류': str(e)
             }
-            
+    
+    async def 비동기라우터통계(self) -> Dict[str, Any]:
+        """
+        라우터 동작 통계 정보 반환 (이벤트 루프를 막지 않음)
+        
+        Returns:
+            dict: 라우터 통계 정보
+        """
+        try:
+            return self._라우터통계구성(await self._생산자큐상태())
         except Exception as e:
             self.로거.error(f"라우터 통계 조회 실패: {e}")
             return {
                 '오류': str(e)
-            }
\ No newline at end of file
+            }
+    
+    def _라우터통계구성(self, 큐상태: Dict[str, Any]) -> Dict[str, Any]:
+        """큐 상태를 포함한 라우터 통계 구성"""
+        return {
+            '라우터정보': {
+                '유효한메시지타입': self.유효한타입들,
+                '대상큐': self.토폴로지.소비큐목록(),
+                '토폴로지': self.토폴로지.토폴로지정보(),
+                '모니터링상태': self.설정.모니터링상태확인(),
+                '생산자백엔드': 'asyncio' if self.비동기생산자 else 'blocking',
+                '연결회로': self.감독자.상태조회()
+            },
+            '큐상태': 큐상태,
+            '설정정보': {
+                '연결문자열': self.설정.연결문자열가져오기(),
+                '큐설정': self.설정.큐설정가져오기()
+            }
+        }
+    
+    async def 종료(self):
+        """연결 감독 중지 후 생산자 백엔드 자원 정리"""
+        await self.감독자.종료()
+        if self.비동기생산자:
+            await self.비동기생산자.종료()
+        if self._블로킹실행기:
+            self._블로킹실행기.shutdown(wait=True)
\ No newline at end of file
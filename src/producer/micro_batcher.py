@@ -0,0 +1,131 @@
+# 파일 경로: src/producer/micro_batcher.py
+# 단일 메시지 요청 마이크로 배칭 클래스
+
+import asyncio
+from typing import Dict, Any, List, Tuple, Callable, Awaitable, Optional, Set
+
+from src.common.message_models import BSS메시지
+from src.common.config import 설정가져오기
+
+
+class 마이크로배처:
+    """
+    동시에 들어온 단일 메시지 요청을 모아 한 번의 대량 발행으로 전송하는 클래스
+    최대 대기 시간(ms) 또는 최대 메시지 수에 먼저 도달하면 묶음을 전송하고,
+    각 요청자에게는 자신의 메시지에 대한 결과만 돌려줌
+
+    속성:
+        일괄전송함수: 메시지 목록을 받아 같은 순서의 결과 목록을 반환하는 코루틴 함수
+        최대대기시간 (float): 첫 메시지 도착 후 묶음을 기다리는 최대 시간(초)
+        최대크기 (int): 한 묶음의 최대 메시지 수
+    """
+
+    def __init__(self, 일괄전송함수: Callable[[List[BSS메시지]], Awaitable[List[Dict[str, Any]]]],
+                 최대대기ms: Optional[int] = None, 최대크기: Optional[int] = None):
+        """
+        마이크로 배처 초기화
+
+        Args:
+            일괄전송함수: 묶음 전송 코루틴 함수
+            최대대기ms: 최대 대기 시간 (None이면 설정에서 가져옴)
+            최대크기: 최대 묶음 크기 (None이면 설정에서 가져옴)
+        """
+        self.설정 = 설정가져오기()
+        self.로거 = self.설정.로거설정('마이크로배처')
+
+        게이트웨이설정 = self.설정.게이트웨이설정가져오기()
+        self.일괄전송함수 = 일괄전송함수
+        self.최대대기시간 = (최대대기ms if 최대대기ms is not None else 게이트웨이설정['배치대기ms']) / 1000
+        self.최대크기 = max(1, 최대크기 if 최대크기 is not None else 게이트웨이설정['배치최대크기'])
+
+        self._대기열: List[Tuple[BSS메시지, asyncio.Future]] = []
+        self._타이머: Optional[asyncio.TimerHandle] = None
+        self._전송태스크들: Set[asyncio.Task] = set()
+
+        # 통계 정보
+        self.배치통계 = {
+            '묶음수': 0,
+            '메시지수': 0,
+            '최대묶음크기': 0
+        }
+
+    async def 제출(self, 메시지: BSS메시지) -> Dict[str, Any]:
+        """
+        메시지를 현재 묶음에 추가하고 해당 메시지의 전송 결과를 기다림
+
+        Args:
+            메시지: 전송할 BSS 메시지
+
+        Returns:
+            dict: 해당 메시지의 전송 결과
+        """
+        루프 = asyncio.get_running_loop()
+        결과대기 = 루프.create_future()
+        self._대기열.append((메시지, 결과대기))
+
+        if len(self._대기열) >= self.최대크기:
+            self._묶음전송시작()
+        elif self._타이머 is None:
+            self._타이머 = 루프.call_later(self.최대대기시간, self._묶음전송시작)
+
+        return await 결과대기
+
+    def _묶음전송시작(self):
+        """대기 중인 요청을 하나의 묶음으로 떼어내 전송 태스크 시작"""
+        if self._타이머 is not None:
+            self._타이머.cancel()
+            self._타이머 = None
+
+        if not self._대기열:
+            return
+
+        묶음 = self._대기열
+        self._대기열 = []
+
+        태스크 = asyncio.get_running_loop().create_task(self._묶음전송(묶음))
+        self._전송태스크들.add(태스크)
+        태스크.add_done_callback(self._전송태스크들.discard)
+
+    async def _묶음전송(self, 묶음: List[Tuple[BSS메시지, asyncio.Future]]):
+        """
+        묶음을 한 번에 전송하고 요청별 결과 전달
+
+        Args:
+            묶음: (메시지, 결과 Future) 목록
+        """
+        self.배치통계['묶음수'] += 1
+        self.배치통계['메시지수'] += len(묶음)
+        self.배치통계['최대묶음크기'] = max(self.배치통계['최대묶음크기'], len(묶음))
+
+        try:
+            결과목록 = await self.일괄전송함수([메시지 for 메시지, _ in 묶음])
+            for (_, 결과대기), 결과 in zip(묶음, 결과목록):
+                if not 결과대기.done():
+                    결과대기.set_result(결과)
+        except Exception as e:
+            self.로거.error(f"마이크로 배치 전송 실패: {e}")
+            for _, 결과대기 in 묶음:
+                if not 결과대기.done():
+                    결과대기.set_exception(e)
+
+    async def 종료(self):
+        """남은 요청을 모두 전송하고 진행 중인 전송 완료 대기"""
+        self._묶음전송시작()
+        if self._전송태스크들:
+            await asyncio.gather(*self._전송태스크들, return_exceptions=True)
+
+    def 통계조회(self) -> Dict[str, Any]:
+        """
+        마이크로 배치 통계 조회
+
+        Returns:
+            dict: 묶음 수, 메시지 수, 평균 묶음 크기
+        """
+        묶음수 = self.배치통계['묶음수']
+        return {
+            **self.배치통계,
+            '평균묶음크기': round(self.배치통계['메시지수'] / 묶음수, 2) if 묶음수 > 0 else 0,
+            '대기중': len(self._대기열),
+            '최대대기ms': self.최대대기시간 * 1000,
+            '최대크기': self.최대크기
+        }
@@ -0,0 +1,501 @@
+# 파일 경로: src/producer/spool.py
+# 브로커 장애 시 메시지를 보관하는 로컬 스풀 클래스
+
+import asyncio
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from collections import namedtuple
+from typing import Dict, Any, List, Tuple, Callable, Awaitable, Optional
+
+from src.common.message_models import BSS메시지
+from src.common.message_codecs import 바이너리코덱
+from src.common.config import 설정가져오기
+
+
+# 읽은 레코드와 그 레코드 다음의 읽기 위치 (세그먼트 번호, 오프셋)
+스풀레코드 = namedtuple('스풀레코드', ['본문', '다음위치'])
+
+
+class 로컬스풀:
+    """
+    메모리 매핑된 세그먼트 파일 기반 append-only 로컬 스풀
+    RabbitMQ에 연결할 수 없을 때 게이트웨이가 메시지를 보관하고, 연결이 돌아오면 재생
+
+    파일 구성:
+        spool-{번호}.seg: 고정 크기 세그먼트, 레코드 = 길이(I) CRC32(I) + 본문
+                          (길이 0 헤더는 세그먼트 데이터의 끝)
+        cursor: 재생이 확정된 위치 (세그먼트 번호, 오프셋), 원자적 교체로 기록
+
+    기록은 mmap에 쓰고 디스크 동기화(msync)는 동기화간격마다 묶어서 수행하므로,
+    프로세스가 아닌 노드 장애 시에는 마지막 동기화 이후 기록이 유실될 수 있음
+
+    속성:
+        디렉터리 (str): 세그먼트 파일 디렉터리
+        세그먼트크기 (int): 새 세그먼트 파일 크기(바이트)
+        동기화간격 (float): 디스크 동기화 간격(초)
+        깊이 (int): 재생 대기 중인 메시지 수
+        바이트 (int): 재생 대기 중인 본문 바이트 수
+    """
+
+    _레코드헤더 = struct.Struct('!II')
+    _커서형식 = struct.Struct('!QQ')
+    _끝표시 = b'\x00' * 8
+    _세그먼트접두어 = 'spool-'
+    _세그먼트확장자 = '.seg'
+    _커서파일 = 'cursor'
+
+    def __init__(self, 디렉터리: Optional[str] = None, 세그먼트크기: Optional[int] = None,
+                 동기화간격ms: Optional[int] = None):
+        """
+        로컬 스풀 초기화 (기존 세그먼트가 있으면 복구)
+
+        Args:
+            디렉터리: 세그먼트 파일 디렉터리 (None이면 설정에서 가져옴)
+            세그먼트크기: 세그먼트 파일 크기 (None이면 설정에서 가져옴)
+            동기화간격ms: 디스크 동기화 간격 (None이면 설정에서 가져옴)
+        """
+        self.설정 = 설정가져오기()
+        self.로거 = self.설정.로거설정('로컬스풀')
+
+        스풀설정 = self.설정.스풀설정가져오기()
+        self.디렉터리 = 디렉터리 or 스풀설정['디렉터리']
+        self.세그먼트크기 = 세그먼트크기 or 스풀설정['세그먼트크기']
+        self.동기화간격 = (동기화간격ms if 동기화간격ms is not None else 스풀설정['동기화간격ms']) / 1000
+        self.코덱 = 바이너리코덱()
+
+        self._잠금 = threading.Lock()
+        self._세그먼트: Dict[int, Tuple[Any, mmap.mmap]] = {}
+        self._쓰기세그먼트 = 0
+        self._쓰기위치 = 0
+        self._커서: Tuple[int, int] = (0, 0)
+        self._미동기화바이트 = 0
+        self._마지막동기화 = time.monotonic()
+
+        self.깊이 = 0
+        self.바이트 = 0
+        self.스풀통계 = {
+            '총기록수': 0,
+            '총확정수': 0,
+            '동기화횟수': 0
+        }
+
+        os.makedirs(self.디렉터리, exist_ok=True)
+        self._복구()
+
+    def _세그먼트경로(self, 번호: int) -> str:
+        """세그먼트 파일 경로"""
+        return os.path.join(self.디렉터리, f"{self._세그먼트접두어}{번호:010d}{self._세그먼트확장자}")
+
+    def _세그먼트열기(self, 번호: int, 생성: bool = False) -> mmap.mmap:
+        """
+        세그먼트 파일을 열어 메모리 매핑
+
+        Args:
+            번호: 세그먼트 번호
+            생성: 새 세그먼트 파일을 만들지 여부
+        """
+        경로 = self._세그먼트경로(번호)
+        if 생성:
+            파일 = open(경로, 'w+b')
+            파일.truncate(self.세그먼트크기)
+            self._디렉터리동기화()
+        else:
+            파일 = open(경로, 'r+b')
+        매핑 = mmap.mmap(파일.fileno(), 0)
+        self._세그먼트[번호] = (파일, 매핑)
+        return 매핑
+
+    def _디렉터리동기화(self):
+        """새 파일 생성/교체가 디렉터리 엔트리에 반영되도록 동기화"""
+        try:
+            fd = os.open(self.디렉터리, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass  # 디렉터리 fsync를 지원하지 않는 파일시스템
+
+    def _레코드스캔(self, 매핑: mmap.mmap, 시작: int) -> Tuple[int, int, int]:
+        """
+        세그먼트의 유효한 레코드를 끝까지 훑음
+
+        Args:
+            매핑: 세그먼트 mmap
+            시작: 스캔 시작 오프셋
+
+        Returns:
+            tuple: (레코드 수, 본문 바이트 수, 유효 데이터 끝 오프셋)
+        """
+        개수, 바이트, 위치 = 0, 0, 시작
+        헤더크기 = self._레코드헤더.size
+        while 위치 + 헤더크기 <= len(매핑):
+            길이, crc = self._레코드헤더.unpack_from(매핑, 위치)
+            끝 = 위치 + 헤더크기 + 길이
+            if 길이 == 0 or 끝 > len(매핑):
+                break
+            if zlib.crc32(매핑[위치 + 헤더크기:끝]) != crc:
+                break  # 기록 도중 중단된 레코드
+            개수 += 1
+            바이트 += 길이
+            위치 = 끝
+        return 개수, 바이트, 위치
+
+    def _복구(self):
+        """기존 세그먼트와 커서로부터 쓰기 위치와 깊이 복원"""
+        번호목록 = sorted(
+            int(이름[len(self._세그먼트접두어):-len(self._세그먼트확장자)])
+            for 이름 in os.listdir(self.디렉터리)
+            if 이름.startswith(self._세그먼트접두어) and 이름.endswith(self._세그먼트확장자)
+        )
+
+        커서경로 = os.path.join(self.디렉터리, self._커서파일)
+        if os.path.exists(커서경로):
+            with open(커서경로, 'rb') as 파일:
+                self._커서 = self._커서형식.unpack(파일.read(self._커서형식.size))
+        elif 번호목록:
+            self._커서 = (번호목록[0], 0)
+
+        # 이미 재생이 끝난 세그먼트 정리
+        for 번호 in [번호 for 번호 in 번호목록 if 번호 < self._커서[0]]:
+            os.remove(self._세그먼트경로(번호))
+        번호목록 = [번호 for 번호 in 번호목록 if 번호 >= self._커서[0]]
+
+        if not 번호목록:
+            self._쓰기세그먼트, self._쓰기위치 = self._커서[0], 0
+            self._세그먼트열기(self._쓰기세그먼트, 생성=True)
+            self._커서 = (self._쓰기세그먼트, 0)
+            return
+
+        for 번호 in 번호목록:
+            매핑 = self._세그먼트열기(번호)
+            시작 = self._커서[1] if 번호 == self._커서[0] else 0
+            개수, 바이트, 끝 = self._레코드스캔(매핑, 시작)
+            self.깊이 += 개수
+            self.바이트 += 바이트
+            self._쓰기세그먼트, self._쓰기위치 = 번호, 끝
+
+        if self.깊이:
+            self.로거.info(f"로컬 스풀 복구: 재생 대기 {self.깊이}개 ({self.바이트} bytes)")
+
+    def _세그먼트전환(self):
+        """현재 세그먼트를 디스크에 동기화하고 새 세그먼트로 전환"""
+        self._세그먼트[self._쓰기세그먼트][1].flush()
+        self._쓰기세그먼트 += 1
+        self._쓰기위치 = 0
+        self._세그먼트열기(self._쓰기세그먼트, 생성=True)
+
+    def 추가(self, 본문목록: List[bytes]):
+        """
+        레코드들을 스풀 끝에 기록 (디스크 동기화는 동기화간격마다 일괄 수행)
+
+        Args:
+            본문목록: 기록할 본문 바이트열 목록
+
+        Raises:
+            ValueError: 본문이 비어 있거나 세그먼트보다 큰 경우
+        """
+        헤더크기 = self._레코드헤더.size
+        with self._잠금:
+            for 본문 in 본문목록:
+                필요크기 = 헤더크기 + len(본문)
+                if not 본문 or 필요크기 + 헤더크기 > self.세그먼트크기:
+                    raise ValueError(f"스풀에 기록할 수 없는 레코드 크기: {len(본문)}")
+
+                매핑 = self._세그먼트[self._쓰기세그먼트][1]
+                if self._쓰기위치 + 필요크기 > len(매핑):
+                    self._세그먼트전환()
+                    매핑 = self._세그먼트[self._쓰기세그먼트][1]
+
+                위치 = self._쓰기위치
+                self._레코드헤더.pack_into(매핑, 위치, len(본문), zlib.crc32(본문))
+                매핑[위치 + 헤더크기:위치 + 필요크기] = 본문
+                위치 += 필요크기
+                # 다음 헤더 자리를 비워 중단된 이전 기록의 잔여 바이트가 레코드로 읽히지 않도록 함
+                if 위치 + 헤더크기 <= len(매핑):
+                    매핑[위치:위치 + 헤더크기] = self._끝표시
+
+                self._쓰기위치 = 위치
+                self._미동기화바이트 += 필요크기
+                self.깊이 += 1
+                self.바이트 += len(본문)
+                self.스풀통계['총기록수'] += 1
+
+    def 메시지추가(self, 메시지목록: List[BSS메시지]):
+        """
+        메시지들을 바이너리 코덱으로 직렬화하여 스풀에 기록
+
+        Args:
+            메시지목록: 보관할 BSS 메시지 목록
+        """
+        self.추가([self.코덱.인코딩(메시지) for 메시지 in 메시지목록])
+        self.로거.warning(f"로컬 스풀에 메시지 보관: {len(메시지목록)}개 (대기 {self.깊이}개)")
+
+    def 동기화필요(self) -> bool:
+        """동기화간격이 지났고 동기화되지 않은 기록이 있는지 확인"""
+        return (
+            self._미동기화바이트 > 0
+            and time.monotonic() - self._마지막동기화 >= self.동기화간격
+        )
+
+    def 동기화(self):
+        """동기화되지 않은 기록을 디스크에 반영 (msync)"""
+        with self._잠금:
+            if self._미동기화바이트 == 0:
+                return
+            매핑 = self._세그먼트[self._쓰기세그먼트][1]
+            self._미동기화바이트 = 0
+            self._마지막동기화 = time.monotonic()
+            self.스풀통계['동기화횟수'] += 1
+        매핑.flush()
+
+    def 읽기(self, 최대개수: int) -> List[스풀레코드]:
+        """
+        확정된 위치부터 레코드를 읽음 (확정() 전까지 읽기 위치는 바뀌지 않음)
+
+        Args:
+            최대개수: 읽을 최대 레코드 수
+
+        Returns:
+            list: 스풀레코드 목록
+        """
+        결과 = []
+        헤더크기 = self._레코드헤더.size
+        with self._잠금:
+            번호, 위치 = self._커서
+            while len(결과) < 최대개수:
+                if 번호 == self._쓰기세그먼트 and 위치 >= self._쓰기위치:
+                    break
+
+                매핑 = self._세그먼트[번호][1]
+                길이 = 0
+                if 위치 + 헤더크기 <= len(매핑):
+                    길이, crc = self._레코드헤더.unpack_from(매핑, 위치)
+
+                if 길이 == 0:
+                    # 세그먼트 끝 → 다음 세그먼트
+                    번호, 위치 = 번호 + 1, 0
+                    continue
+
+                본문 = 매핑[위치 + 헤더크기:위치 + 헤더크기 + 길이]
+                위치 += 헤더크기 + 길이
+                if zlib.crc32(본문) != crc:
+                    self.로거.error(f"손상된 스풀 레코드 발견 (세그먼트 {번호}), 세그먼트 나머지 건너뜀")
+                    번호, 위치 = 번호 + 1, 0
+                    continue
+                결과.append(스풀레코드(본문, (번호, 위치)))
+        return 결과
+
+    def 메시지읽기(self, 최대개수: int) -> List[Tuple[Optional[BSS메시지], 스풀레코드]]:
+        """
+        레코드를 읽어 BSS 메시지로 복원
+
+        Args:
+            최대개수: 읽을 최대 메시지 수
+
+        Returns:
+            list: (메시지, 레코드) 목록 (복원할 수 없는 레코드는 메시지가 None)
+        """
+        결과 = []
+        for 레코드 in self.읽기(최대개수):
+            try:
+                결과.append((self.코덱.디코딩(레코드.본문), 레코드))
+            except ValueError as e:
+                self.로거.error(f"스풀 레코드 복원 실패: {e}")
+                결과.append((None, 레코드))
+        return 결과
+
+    def 확정(self, 레코드목록: List[스풀레코드]):
+        """
+        재생이 끝난 레코드까지 읽기 위치를 옮기고 다 읽은 세그먼트 삭제
+
+        Args:
+            레코드목록: 읽기()가 반환한 순서의 앞부분 레코드들
+        """
+        if not 레코드목록:
+            return
+
+        with self._잠금:
+            self._커서 = 레코드목록[-1].다음위치
+            self.깊이 -= len(레코드목록)
+            self.바이트 -= sum(len(레코드.본문) for 레코드 in 레코드목록)
+            self.스풀통계['총확정수'] += len(레코드목록)
+            self._커서기록()
+
+            for 번호 in [번호 for 번호 in self._세그먼트 if 번호 < self._커서[0]]:
+                파일, 매핑 = self._세그먼트.pop(번호)
+                매핑.close()
+                파일.close()
+                os.remove(self._세그먼트경로(번호))
+
+    def _커서기록(self):
+        """읽기 위치를 임시 파일에 쓴 뒤 원자적으로 교체"""
+        경로 = os.path.join(self.디렉터리, self._커서파일)
+        임시경로 = 경로 + '.tmp'
+        with open(임시경로, 'wb') as 파일:
+            파일.write(self._커서형식.pack(*self._커서))
+        os.replace(임시경로, 경로)
+
+    def 상태조회(self) -> Dict[str, Any]:
+        """
+        스풀 상태 조회
+
+        Returns:
+            dict: 깊이, 바이트, 세그먼트 수 및 누적 통계
+        """
+        return {
+            '깊이': self.깊이,
+            '바이트': self.바이트,
+            '세그먼트수': len(self._세그먼트),
+            '디렉터리': self.디렉터리,
+            **self.스풀통계
+        }
+
+    def 닫기(self):
+        """동기화 후 모든 세그먼트 닫기"""
+        self.동기화()
+        with self._잠금:
+            for 파일, 매핑 in self._세그먼트.values():
+                매핑.close()
+                파일.close()
+            self._세그먼트.clear()
+
+
+class 스풀재생기:
+    """
+    로컬 스풀을 주기적으로 동기화하고, 브로커 연결이 돌아오면 묶음 단위로 재생하는 백그라운드 태스크
+    재생은 순서대로 진행하며 앞에서부터 연속으로 성공한 메시지까지만 확정 (최소 1회 전달)
+
+    속성:
+        스풀: 로컬스풀 인스턴스
+        재전송함수: 메시지 목록을 받아 같은 순서의 결과 목록을 반환하는 코루틴 함수
+        배치크기 (int): 한 번에 재생할 최대 메시지 수
+        재생간격 (float): 재생 실패 후 다시 시도하기까지의 시간(초)
+    """
+
+    def __init__(self, 스풀: 로컬스풀,
+                 재전송함수: Callable[[List[BSS메시지]], Awaitable[List[Dict[str, Any]]]],
+                 배치크기: Optional[int] = None, 재생간격: Optional[float] = None):
+        """
+        스풀 재생기 초기화
+
+        Args:
+            스풀: 재생할 로컬 스풀
+            재전송함수: 묶음 재전송 코루틴 함수
+            배치크기: 재생 묶음 크기 (None이면 설정에서 가져옴)
+            재생간격: 재생 재시도 간격 (None이면 설정에서 가져옴)
+        """
+        self.설정 = 설정가져오기()
+        self.로거 = self.설정.로거설정('스풀재생기')
+
+        스풀설정 = self.설정.스풀설정가져오기()
+        self.스풀 = 스풀
+        self.재전송함수 = 재전송함수
+        self.배치크기 = 배치크기 or 스풀설정['재생배치크기']
+        self.재생간격 = 재생간격 if 재생간격 is not None else 스풀설정['재생간격']
+
+        self._태스크: Optional[asyncio.Task] = None
+        self._중지 = False
+
+        # 재생 통계
+        self.재생통계 = {
+            '재생묶음수': 0,
+            '총재생수': 0,
+            '폐기수': 0,
+            '최근재생률': 0.0,
+            '마지막재생시간': None
+        }
+
+    def 시작(self):
+        """재생 태스크 시작 (이벤트 루프 안에서 호출)"""
+        if self._태스크 is None:
+            self._중지 = False
+            self._태스크 = asyncio.get_running_loop().create_task(self._재생루프())
+
+    async def _재생루프(self):
+        """동기화간격마다 스풀을 동기화하고, 대기 메시지가 있으면 재생 시도"""
+        루프 = asyncio.get_running_loop()
+        다음재생시각 = 0.0
+
+        while not self._중지:
+            try:
+                if self.스풀.동기화필요():
+                    await 루프.run_in_executor(None, self.스풀.동기화)
+
+                if self.스풀.깊이 > 0 and time.monotonic() >= 다음재생시각:
+                    if await self._재생() > 0:
+                        continue  # 연결이 살아 있으면 남은 묶음을 바로 이어서 재생
+                    다음재생시각 = time.monotonic() + self.재생간격
+
+            except Exception as e:
+                self.로거.error(f"스풀 재생 실패: {e}")
+                다음재생시각 = time.monotonic() + self.재생간격
+
+            await asyncio.sleep(self.스풀.동기화간격)
+
+    async def _재생(self) -> int:
+        """
+        스풀에서 한 묶음을 읽어 재전송
+
+        Returns:
+            int: 확정된 메시지 수
+        """
+        항목들 = self.스풀.메시지읽기(self.배치크기)
+        if not 항목들:
+            return 0
+
+        # 게이트웨이에서 이미 검증된 메시지이므로 복원/검증에 실패하면 복구 불가로 보고 폐기
+        유효여부 = [메시지 is not None and 메시지.메시지검증() for 메시지, _ in 항목들]
+        전송메시지들 = [메시지 for (메시지, _), 유효 in zip(항목들, 유효여부) if 유효]
+
+        시작 = time.perf_counter()
+        결과목록 = await self.재전송함수(전송메시지들) if 전송메시지들 else []
+        소요시간 = time.perf_counter() - 시작
+
+        # 앞에서부터 연속으로 처리된 레코드까지만 확정 (실패 지점 이후는 다음 재생에서 다시 전송)
+        결과반복 = iter(결과목록)
+        확정개수, 성공개수 = 0, 0
+        for (메시지, 레코드), 유효 in zip(항목들, 유효여부):
+            if 유효:
+                if not next(결과반복)['성공']:
+                    break
+                성공개수 += 1
+            else:
+                self.로거.error(f"유효하지 않은 스풀 레코드 폐기: {레코드.다음위치}")
+                self.재생통계['폐기수'] += 1
+            확정개수 += 1
+        self.스풀.확정([레코드 for _, 레코드 in 항목들[:확정개수]])
+
+        if 성공개수:
+            self.재생통계['재생묶음수'] += 1
+            self.재생통계['총재생수'] += 성공개수
+            self.재생통계['최근재생률'] = round(성공개수 / 소요시간, 1) if 소요시간 > 0 else 0.0
+            self.재생통계['마지막재생시간'] = time.time()
+            self.로거.info(f"스풀 재생: {성공개수}/{len(전송메시지들)}개 전송 (남은 {self.스풀.깊이}개)")
+
+        return 확정개수
+
+    async def 종료(self):
+        """재생 태스크 중지 후 스풀 동기화 및 닫기"""
+        self._중지 = True
+        if self._태스크 is not None:
+            await self._태스크
+            self._태스크 = None
+        self.스풀.닫기()
+
+    def 통계조회(self) -> Dict[str, Any]:
+        """
+        스풀 및 재생 통계 조회
+
+        Returns:
+            dict: 스풀 상태와 재생 통계
+        """
+        return {
+            '활성화': True,
+            **self.스풀.상태조회(),
+            **self.재생통계
+        }
@@ -18,6 +18,37 @@ def setup_test_environment():
     os.environ['LOG_LEVEL'] = 'DEBUG'
 
 
+@pytest.fixture
+def 환경설정(monkeypatch):
+    """환경변수를 바꾼 뒤 설정을 다시 읽는 함수 (테스트 후 환경변수 복원 및 설정 초기화)"""
+    from src.common.config import 설정초기화
+
+    def 설정(**환경변수):
+        for 키, 값 in 환경변수.items():
+            monkeypatch.setenv(키, 값)
+        설정초기화()
+
+    yield 설정
+    설정초기화()
+
+
+@pytest.fixture
+def 메시지전달():
+    """브로커 전달을 흉내 내어 처리 서비스의 메시지 콜백을 호출하는 함수"""
+    import pika
+
+    def 전달(처리서비스, 채널, 메시지, 태그: int, 재시도횟수: int = 0):
+        헤더 = {'message_type': 메시지.타입}
+        if 재시도횟수:
+            헤더['x-retry-count'] = 재시도횟수
+        properties = pika.BasicProperties(content_type='application/json', headers=헤더)
+        처리서비스._메시지콜백(
+            채널, Mock(delivery_tag=태그), properties, 메시지.to_json().encode('utf-8')
+        )
+
+    return 전달
+
+
 @pytest.fixture
 def mock_rabbitmq():
     """RabbitMQ Mock 픽스처"""
@@ -0,0 +1,374 @@
+# 파일 경로: tests/test_base_processor.py
+"""
+기본 처리 서비스 테스트
+"""
+
+import asyncio
+import time
+import threading
+import pika
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, AsyncMock
+from src.common.message_models import BSS메시지
+from src.consumer.base_processor import 기본처리서비스
+from src.consumer.async_engine import 비동기소비엔진
+from src.consumer.batch_ack import 일괄확인추적기
+
+
+class 테스트처리서비스(기본처리서비스):
+    """처리 시간이 고정된 테스트용 처리 서비스"""
+
+    def __init__(self, 처리시간: float = 0.05):
+        super().__init__("MNP")
+        self.처리시간 = 처리시간
+        self.처리스레드들 = set()
+
+    def 메시지처리(self, 메시지):
+        self.처리스레드들.add(threading.current_thread().name)
+        time.sleep(self.처리시간)
+        return {'성공': 메시지.내용 != "실패", '메시지': '처리 완료', '결과데이터': None}
+
+    def 처리시뮬레이션(self):
+        return {'성공': True}
+
+
+class 테스트비동기처리서비스(기본처리서비스):
+    """메시지처리가 코루틴인 테스트용 처리 서비스"""
+
+    def __init__(self, 처리시간: float = 0.05):
+        super().__init__("MNP")
+        self.처리시간 = 처리시간
+        self.동시최대 = 0
+        self._동시 = 0
+
+    async def 메시지처리(self, 메시지):
+        self._동시 += 1
+        self.동시최대 = max(self.동시최대, self._동시)
+        await asyncio.sleep(self.처리시간)
+        self._동시 -= 1
+        return {'성공': True, '메시지': '처리 완료', '결과데이터': None}
+
+    def 처리시뮬레이션(self):
+        return {'성공': True}
+
+
+def _수신메시지(메시지: BSS메시지):
+    """aio-pika 수신 메시지 흉내"""
+    return Mock(
+        body=메시지.to_json().encode('utf-8'),
+        content_type='application/json',
+        headers={'message_type': 메시지.타입},
+        delivery_mode=2,
+        priority=None,
+        message_id=None,
+        ack=AsyncMock(),
+        nack=AsyncMock(),
+        reject=AsyncMock()
+    )
+
+
+class Test기본처리서비스:
+    """기본처리서비스 작업 스레드 풀 테스트"""
+
+    def test_동시처리(self, 메시지전달):
+        """작업 스레드 풀에서 동시에 처리하고 ACK은 연결 스레드 콜백으로 넘기는지 테스트"""
+        처리서비스 = 테스트처리서비스(처리시간=0.1)
+        처리서비스._작업실행기 = ThreadPoolExecutor(max_workers=4)
+        대기콜백 = []
+        처리서비스.연결 = Mock(add_callback_threadsafe=대기콜백.append, is_closed=True)
+        채널 = Mock()
+
+        시작 = time.monotonic()
+        for 태그 in range(1, 5):
+            메시지전달(처리서비스, 채널, BSS메시지("MNP", f"번호이동 {태그}"), 태그)
+        assert 처리서비스.처리중개수 == 4
+
+        처리서비스._작업실행기.shutdown(wait=True)
+        경과 = time.monotonic() - 시작
+
+        # 작업 스레드에서는 ACK하지 않고 연결 스레드용 콜백만 등록
+        채널.basic_ack.assert_not_called()
+        assert len(대기콜백) == 4
+        assert 경과 < 0.35
+        assert len(처리서비스.처리스레드들) > 1
+
+        for 콜백 in 대기콜백:
+            콜백()
+        assert 채널.basic_ack.call_count == 4
+        assert 처리서비스.처리중개수 == 0
+        assert 처리서비스.처리통계['성공처리개수'] == 4
+        처리서비스._작업실행기 = None
+
+    def test_통계증가_동시갱신(self):
+        """여러 작업 스레드가 같은 통계를 갱신해도 증가분이 유실되지 않는지 테스트"""
+        처리서비스 = 테스트처리서비스(처리시간=0)
+
+        def 증가():
+            for _ in range(5000):
+                처리서비스._통계증가(처리서비스.처리통계, '성공처리개수', '총처리개수')
+
+        스레드목록 = [threading.Thread(target=증가) for _ in range(8)]
+        for 스레드 in 스레드목록:
+            스레드.start()
+        for 스레드 in 스레드목록:
+            스레드.join()
+
+        assert 처리서비스.처리통계['성공처리개수'] == 40000
+        assert 처리서비스.처리통계['총처리개수'] == 40000
+
+    def test_단일처리_실패재시도(self, 메시지전달):
+        """실패 메시지는 재시도 횟수 헤더와 함께 지연 큐로 재발행하고 원본은 ACK하는지 테스트"""
+        처리서비스 = 테스트처리서비스(처리시간=0)
+        채널 = Mock()
+
+        메시지전달(처리서비스, 채널, BSS메시지("MNP", "실패"), 7)
+
+        채널.basic_reject.assert_not_called()
+        채널.basic_ack.assert_called_once_with(delivery_tag=7)
+        발행 = 채널.basic_publish.call_args.kwargs
+        assert 발행['routing_key'] == 처리서비스.토폴로지.재시도큐이름("MNP", 1)
+        assert 발행['properties'].headers['x-retry-count'] == 1
+        assert 발행['properties'].headers['message_type'] == "MNP"
+        assert 처리서비스.처리통계['재시도개수'] == 1
+
+        # 두 번째 재시도는 다음 단계(더 긴 지연) 큐로
+        메시지전달(처리서비스, 채널, BSS메시지("MNP", "실패"), 8, 재시도횟수=1)
+        assert 채널.basic_publish.call_args.kwargs['routing_key'].endswith('.retry.2')
+
+    def test_최대재시도초과_데드레터(self, 메시지전달):
+        """최대 재시도를 넘은 메시지는 데드레터 큐로 옮기는지 테스트"""
+        처리서비스 = 테스트처리서비스(처리시간=0)
+        채널 = Mock()
+        최대재시도 = 처리서비스.설정.처리설정가져오기()['최대재시도']
+
+        메시지전달(처리서비스, 채널, BSS메시지("MNP", "실패"), 9, 재시도횟수=최대재시도)
+
+        발행 = 채널.basic_publish.call_args.kwargs
+        assert 발행['routing_key'] == 처리서비스.토폴로지.데드레터큐이름("MNP")
+        assert 발행['properties'].headers['x-retry-count'] == 최대재시도
+        채널.basic_ack.assert_called_once_with(delivery_tag=9)
+        assert 처리서비스.처리통계['데드레터개수'] == 1
+
+    def test_파싱실패_데드레터(self):
+        """디코딩할 수 없는 메시지는 데드레터 큐로 격리하는지 테스트"""
+        처리서비스 = 테스트처리서비스(처리시간=0)
+        채널 = Mock()
+        properties = pika.BasicProperties(
+            content_type='application/json', headers={'message_type': 'MNP'}
+        )
+
+        처리서비스._메시지콜백(채널, Mock(delivery_tag=3), properties, b'{broken')
+
+        assert 채널.basic_publish.call_args.kwargs['routing_key'].endswith('.dlq')
+        채널.basic_ack.assert_called_once_with(delivery_tag=3)
+
+    def test_다른타입거부(self, 메시지전달):
+        """헤더 타입이 다르면 처리하지 않고 reject하는지 테스트"""
+        처리서비스 = 테스트처리서비스(처리시간=0)
+        채널 = Mock()
+
+        메시지전달(처리서비스, 채널, BSS메시지("CHANGE", "명의변경"), 3)
+
+        채널.basic_reject.assert_called_once()
+        assert 처리서비스.처리중개수 == 0
+        assert not 처리서비스.처리스레드들
+
+
+class Test일괄처리:
+    """메시지일괄처리 및 multiple ACK 테스트"""
+
+    def test_확인추적기_연속구간(self):
+        """앞쪽 메시지가 처리 중이면 뒤쪽 성공 메시지의 확인을 미루는지 테스트"""
+        추적기 = 일괄확인추적기()
+        for 태그 in range(1, 7):
+            추적기.등록(태그)
+
+        추적기.완료(4, True)
+        추적기.완료(5, True)
+        assert 추적기.확인가능태그() is None
+
+        추적기.완료(1, True)
+        추적기.완료(2, False)
+        추적기.완료(3, True)
+        assert 추적기.확인가능태그() == 5
+        assert 추적기.대기개수() == 1
+
+        추적기.완료(6, False)
+        assert 추적기.확인가능태그() is None
+        assert 추적기.통계조회()['확인메시지수'] == 4
+
+    def test_일괄처리_multiple_ack(self, 메시지전달):
+        """일괄크기만큼 모이면 한 번에 처리하고, 실패는 재시도 큐로 옮긴 뒤 multiple ACK 한 번으로 확인하는지 테스트"""
+        처리서비스 = 테스트처리서비스(처리시간=0)
+        처리서비스.일괄크기 = 4
+        호출목록 = []
+        원래일괄처리 = 처리서비스.메시지일괄처리
+        처리서비스.메시지일괄처리 = lambda 목록: 호출목록.append(len(목록)) or 원래일괄처리(목록)
+        처리서비스.연결 = Mock()
+        채널 = Mock()
+
+        for 태그, 내용 in enumerate(["가", "실패", "다", "라"], start=1):
+            메시지전달(처리서비스, 채널, BSS메시지("MNP", 내용), 태그)
+
+        assert 호출목록 == [4]
+        처리서비스.연결.call_later.assert_called_once()
+        처리서비스.연결.remove_timeout.assert_called_once()
+        채널.basic_reject.assert_not_called()
+        assert 채널.basic_publish.call_count == 1
+        채널.basic_ack.assert_called_once_with(delivery_tag=4, multiple=True)
+        assert 처리서비스.처리통계['성공처리개수'] == 3
+        assert 처리서비스.처리중개수 == 0
+
+    def test_일괄대기만료(self, 메시지전달):
+        """일괄크기가 차지 않아도 대기 시간이 지나면 모인 메시지를 처리하는지 테스트"""
+        처리서비스 = 테스트처리서비스(처리시간=0)
+        처리서비스.일괄크기 = 10
+        처리서비스.연결 = Mock()
+        채널 = Mock()
+
+        메시지전달(처리서비스, 채널, BSS메시지("MNP", "가"), 1)
+        메시지전달(처리서비스, 채널, BSS메시지("MNP", "나"), 2)
+        채널.basic_ack.assert_not_called()
+
+        만료콜백 = 처리서비스.연결.call_later.call_args[0][1]
+        만료콜백()
+        채널.basic_ack.assert_called_once_with(delivery_tag=2, multiple=True)
+
+
+class Test드레인:
+    """처리 중지 시 드레인 테스트"""
+
+    def test_미시작메시지반환(self, 메시지전달):
+        """드레인 중에는 작업 스레드를 잡지 못한 메시지를 처리하지 않고 requeue nack하는지 테스트"""
+        처리서비스 = 테스트처리서비스(처리시간=0.2)
+        처리서비스._작업실행기 = ThreadPoolExecutor(max_workers=1)
+        대기콜백 = []
+        처리서비스.연결 = Mock(add_callback_threadsafe=대기콜백.append)
+        채널 = Mock()
+
+        메시지전달(처리서비스, 채널, BSS메시지("MNP", "처리 중"), 1)
+        time.sleep(0.05)
+        메시지전달(처리서비스, 채널, BSS메시지("MNP", "대기 1"), 2)
+        메시지전달(처리서비스, 채널, BSS메시지("MNP", "대기 2"), 3)
+        처리서비스.소비상태 = '드레인중'
+
+        처리서비스._작업실행기.shutdown(wait=True)
+        for 콜백 in 대기콜백:
+            콜백()
+
+        채널.basic_ack.assert_called_once_with(delivery_tag=1)
+        assert [c.kwargs['delivery_tag'] for c in 채널.basic_nack.call_args_list] == [2, 3]
+        assert all(c.kwargs['requeue'] for c in 채널.basic_nack.call_args_list)
+        assert 처리서비스.드레인정보['반환개수'] == 2
+        assert 처리서비스.처리중개수 == 0
+        처리서비스._작업실행기 = None
+
+    def test_드레인순서(self, 메시지전달):
+        """Consumer를 먼저 취소하고 일괄 버퍼의 메시지를 반환한 뒤 상태를 기록하는지 테스트"""
+        처리서비스 = 테스트처리서비스(처리시간=0)
+        처리서비스.일괄크기 = 10
+        처리서비스.연결 = Mock()
+        처리서비스.채널 = 채널 = Mock(is_closed=False)
+        처리서비스._소비자태그 = 'ctag-1'
+
+        메시지전달(처리서비스, 채널, BSS메시지("MNP", "가"), 1)
+        메시지전달(처리서비스, 채널, BSS메시지("MNP", "나"), 2)
+        처리서비스._드레인()
+
+        채널.basic_cancel.assert_called_once_with('ctag-1')
+        처리서비스.연결.remove_timeout.assert_called_once()
+        assert 채널.basic_nack.call_count == 2
+        채널.basic_ack.assert_not_called()
+        assert 처리서비스.처리통계['총처리개수'] == 0
+        상태 = 처리서비스.처리통계조회()['상태정보']
+        assert 상태['소비상태'] == '드레인중'
+        assert 상태['드레인']['반환개수'] == 2
+        assert 상태['드레인']['미완료개수'] == 0
+
+    @pytest.mark.asyncio
+    async def test_비동기_대기메시지반환(self):
+        """asyncio 엔진은 처리 자리를 기다리던 메시지를 드레인 중 반환하는지 테스트"""
+        처리서비스 = 테스트비동기처리서비스(처리시간=0.1)
+        엔진 = 비동기소비엔진(처리서비스, 동시처리수=1)
+        엔진._세마포어 = asyncio.Semaphore(1)
+        처리중 = _수신메시지(BSS메시지("MNP", "처리 중"))
+        대기 = _수신메시지(BSS메시지("MNP", "대기"))
+        큐 = Mock(cancel=AsyncMock())
+
+        await 엔진._메시지콜백(처리중)
+        대기콜백 = asyncio.create_task(엔진._메시지콜백(대기))
+        await asyncio.sleep(0.01)
+        await 엔진._드레인(큐, 'ctag-1')
+        await 대기콜백
+
+        큐.cancel.assert_awaited_once_with('ctag-1')
+        처리중.ack.assert_awaited_once()
+        대기.nack.assert_awaited_once_with(requeue=True)
+        assert 처리서비스.드레인정보['반환개수'] == 1
+        assert 처리서비스.처리통계['성공처리개수'] == 1
+
+
+class Test비동기소비엔진:
+    """asyncio 소비 엔진 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_코루틴처리_동시처리수제한(self):
+        """async 메시지처리를 세마포어 한도까지 동시에 처리하는지 테스트"""
+        처리서비스 = 테스트비동기처리서비스(처리시간=0.05)
+        엔진 = 비동기소비엔진(처리서비스, 동시처리수=10)
+        엔진._세마포어 = asyncio.Semaphore(엔진.동시처리수)
+        수신목록 = [_수신메시지(BSS메시지("MNP", f"번호이동 {i}")) for i in range(30)]
+
+        시작 = time.monotonic()
+        for 수신 in 수신목록:
+            await 엔진._메시지콜백(수신)
+        await 엔진._작업완료대기()
+        경과 = time.monotonic() - 시작
+
+        assert 엔진.비동기처리
+        assert 처리서비스.동시최대 == 10
+        assert 경과 < 0.5
+        assert all(수신.ack.await_count == 1 for 수신 in 수신목록)
+        assert 처리서비스.처리통계['성공처리개수'] == 30
+        assert 처리서비스.처리중개수 == 0
+
+    @pytest.mark.asyncio
+    async def test_동기처리어댑터(self):
+        """기존 동기 메시지처리도 스레드 풀 어댑터로 처리하고 실패는 requeue하는지 테스트"""
+        처리서비스 = 테스트처리서비스(처리시간=0)
+        엔진 = 비동기소비엔진(처리서비스, 동시처리수=2)
+        엔진._세마포어 = asyncio.Semaphore(엔진.동시처리수)
+        엔진._작업실행기 = ThreadPoolExecutor(max_workers=2)
+        엔진._채널 = Mock(default_exchange=Mock(publish=AsyncMock()))
+        성공 = _수신메시지(BSS메시지("MNP", "번호이동"))
+        실패 = _수신메시지(BSS메시지("MNP", "실패"))
+        다른타입 = _수신메시지(BSS메시지("CHANGE", "명의변경"))
+
+        for 수신 in (성공, 실패, 다른타입):
+            await 엔진._메시지콜백(수신)
+        await 엔진._작업완료대기()
+        엔진._작업실행기.shutdown(wait=True)
+
+        assert not 엔진.비동기처리
+        성공.ack.assert_awaited_once()
+        실패.ack.assert_awaited_once()
+        발행 = 엔진._채널.default_exchange.publish.await_args
+        assert 발행.kwargs['routing_key'] == 처리서비스.토폴로지.재시도큐이름("MNP", 1)
+        assert 발행.args[0].headers['x-retry-count'] == 1
+        다른타입.reject.assert_awaited_once()
+        assert not 처리서비스.처리스레드들 & {threading.main_thread().name}
+
+    def test_일괄처리미지원_지연쓰기프리페치(self, 환경설정):
+        """asyncio 엔진은 일괄크기를 1로 두고, 지연 쓰기면 묶음 하나만큼 prefetch를 더 받는지 테스트"""
+        환경설정(
+            CONSUMER_ENGINE='asyncio', CONSUMER_BATCH_SIZE='10', CONSUMER_PREFETCH_COUNT='1',
+            WRITE_BEHIND_ENABLED='true', WRITE_BEHIND_MAX_RECORDS='50'
+        )
+        처리서비스 = 테스트처리서비스()
+        엔진 = 비동기소비엔진(처리서비스, 동시처리수=8)
+
+        assert 처리서비스.일괄크기 == 1
+        assert 처리서비스.쓰기지연버퍼 is not None
+        assert 엔진.프리페치카운트 == 58
+        처리서비스.쓰기지연버퍼.중지()
@@ -0,0 +1,149 @@
+# 파일 경로: tests/test_confirm_tracker.py
+"""
+Publisher Confirm 추적기 테스트
+"""
+
+import datetime
+import pytest
+from unittest.mock import Mock
+from src.common.message_models import BSS메시지
+from src.producer.confirm_tracker import 발행확인추적기
+from src.producer.message_producer import BSS메시지생산자
+
+
+class Test발행확인추적기:
+    """발행확인추적기 클래스 테스트"""
+
+    def test_태그부여(self):
+        """delivery tag가 1부터 순차 부여되는지 테스트"""
+        추적기 = 발행확인추적기(최대미확정수=10)
+
+        assert 추적기.등록("msg-1") == 1
+        assert 추적기.등록("msg-2") == 2
+        assert 추적기.미확정개수() == 2
+
+    def test_다중확인(self):
+        """multiple Ack이 태그 이하 전체를 확정하는지 테스트"""
+        추적기 = 발행확인추적기(최대미확정수=10)
+        태그들 = [추적기.등록(f"msg-{i}") for i in range(5)]
+
+        assert 추적기.확인처리(3, 다중=True, 성공=True) == 3
+        assert 추적기.미확정목록() == [4, 5]
+        assert 추적기.결과가져오기(태그들[0]) == 발행확인추적기.확인됨
+        assert 추적기.결과가져오기(4) is None
+
+    def test_거부처리(self):
+        """Nack이 거부 상태로 기록되는지 테스트"""
+        추적기 = 발행확인추적기(최대미확정수=10)
+        태그 = 추적기.등록("msg-1")
+
+        추적기.확인처리(태그, 다중=False, 성공=False)
+
+        assert not 추적기.미확정여부(태그)
+        assert 추적기.결과가져오기(태그) == 발행확인추적기.거부됨
+
+    def test_윈도우제한(self):
+        """윈도우가 가득 차면 여유가 없다고 보고하는지 테스트"""
+        추적기 = 발행확인추적기(최대미확정수=2)
+        추적기.등록("msg-1")
+        assert 추적기.윈도우여유()
+
+        추적기.등록("msg-2")
+        assert not 추적기.윈도우여유()
+
+        추적기.확인처리(1, 다중=False, 성공=True)
+        assert 추적기.윈도우여유()
+
+    def test_등록취소(self):
+        """발행하지 못한 마지막 태그는 번호까지 되돌리고, 중간 태그는 대기 목록에서만 제거"""
+        추적기 = 발행확인추적기(최대미확정수=10)
+        추적기.등록("msg-1")
+        태그 = 추적기.등록("msg-2")
+
+        assert 추적기.등록취소(태그)
+        assert 추적기.미확정목록() == [1]
+        assert 추적기.등록("msg-3") == 2
+
+        추적기.등록("msg-4")
+        assert not 추적기.등록취소(2)
+        assert 추적기.미확정목록() == [1, 3]
+
+    def test_포기_늦은확인무시(self):
+        """포기한 태그는 대기 목록에서 빠지고 뒤늦게 온 Ack은 결과로 남지 않음"""
+        추적기 = 발행확인추적기(최대미확정수=10)
+        태그 = 추적기.등록("msg-1")
+
+        assert 추적기.포기(태그)
+        assert 추적기.확인처리(태그, 다중=False, 성공=True) == 0
+        assert 추적기.결과가져오기(태그) is None
+        assert not 추적기.포기(태그)
+
+    def test_결과보관한도(self):
+        """꺼내지 않은 확정 결과는 최대결과수까지만 남기고 오래된 것부터 버림"""
+        추적기 = 발행확인추적기(최대미확정수=10, 최대결과수=3)
+        for 번호 in range(5):
+            추적기.등록(f"msg-{번호}")
+        추적기.확인처리(5, 다중=True, 성공=True)
+
+        assert [추적기.결과가져오기(태그) for 태그 in range(1, 6)] == [
+            None, None, 발행확인추적기.확인됨, 발행확인추적기.확인됨, 발행확인추적기.확인됨
+        ]
+
+
+class Test생산자확인태그:
+    """직렬화/발행 실패 시 Confirm 태그가 브로커 태그와 어긋나지 않는지 테스트"""
+
+    @pytest.fixture
+    def 생산자(self):
+        생산자 = BSS메시지생산자()
+        생산자.큐연결 = Mock(is_closed=False)
+        생산자.채널 = Mock(is_closed=False)
+        생산자.확인추적기 = 발행확인추적기(최대미확정수=10)
+        return 생산자
+
+    def test_인코딩실패_태그미부여(self, 생산자):
+        """검증은 통과했지만 직렬화에 실패한 메시지는 태그를 받지 않음"""
+        메시지 = BSS메시지("MNP", "번호이동", 속성들={'요청시각': datetime.datetime.now()})
+
+        결과 = 생산자.큐전송(메시지, 확인대기=False)
+
+        assert not 결과['성공']
+        생산자.채널.basic_publish.assert_not_called()
+        assert 생산자.확인추적기.다음태그 == 1
+        assert 생산자.확인추적기.미확정개수() == 0
+
+    def test_발행실패_태그되돌림(self, 생산자):
+        """발행 호출이 실패하면 등록한 태그를 되돌려 다음 발행이 같은 태그를 받음"""
+        생산자.채널.basic_publish.side_effect = [OSError("소켓 끊김"), None]
+
+        assert not 생산자.큐전송(BSS메시지("MNP", "번호이동 1"), 확인대기=False)['성공']
+        결과 = 생산자.큐전송(BSS메시지("MNP", "번호이동 2"), 확인대기=False)
+
+        assert 결과['확인태그'] == 1
+        assert 생산자.확인추적기.미확정목록() == [1]
+
+    def test_확인시간초과_태그포기(self, 생산자):
+        """확정 대기 시간이 지나면 태그를 버려 뒤늦은 Ack이 결과로 쌓이지 않음"""
+        생산자.확인타임아웃 = 0.05
+
+        결과 = 생산자.큐전송(BSS메시지("MNP", "번호이동"))
+
+        assert not 결과['성공'] and 결과['확인상태'] == '시간초과'
+        assert 생산자.확인추적기.미확정개수() == 0
+        assert 생산자.확인추적기.확인처리(1, 다중=False, 성공=True) == 0
+        assert 생산자.확인추적기.결과가져오기(1) is None
+
+    def test_배치전송_인코딩실패_메시지별결과(self, 생산자):
+        """배치 중 직렬화에 실패한 메시지만 실패로 기록하고 나머지는 발행"""
+        생산자.확인추적기 = None
+        메시지목록 = [
+            BSS메시지("MNP", "번호이동", 속성들={'요청시각': datetime.datetime.now()}),
+            BSS메시지("CHANGE", "명의변경"),
+        ]
+
+        결과 = 생산자.배치전송(메시지목록)
+
+        assert 결과['성공개수'] == 1 and 결과['실패개수'] == 1
+        assert '직렬화 실패' in 결과['상세결과'][0]['메시지']
+        assert 결과['상세결과'][1]['성공']
+        생산자.채널._impl.basic_publish.assert_called_once()
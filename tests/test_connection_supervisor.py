@@ -0,0 +1,76 @@
+# 파일 경로: tests/test_connection_supervisor.py
+"""
+연결 감독자 및 회로 차단기 테스트
+"""
+
+import asyncio
+import pytest
+from src.producer.connection_supervisor import 회로차단기, 연결감독자
+
+
+class Test회로차단기:
+    """회로차단기 클래스 테스트"""
+
+    def test_상태전환(self):
+        """닫힘 → 열림 → 반열림 → 닫힘 전환과 요청 허용 여부 테스트"""
+        회로 = 회로차단기()
+        assert 회로.요청허용()
+
+        회로.열기()
+        assert not 회로.요청허용()
+        assert 회로.열림횟수 == 1
+
+        회로.반열기()
+        assert not 회로.요청허용()
+
+        회로.닫기()
+        assert 회로.요청허용()
+        assert 회로.상태조회()['상태'] == 회로차단기.닫힘
+
+
+class Test연결감독자:
+    """연결감독자 클래스 테스트"""
+
+    def test_백오프지연(self):
+        """연속 실패에 따라 지연이 지수적으로 늘고 상한을 넘지 않는지 테스트"""
+        async def 항상성공():
+            return True
+
+        감독자 = 연결감독자(항상성공, 항상성공, 점검간격=1, 기본지연=0.5, 최대지연=4)
+
+        감독자.연속실패 = 0
+        assert 0.25 <= 감독자.백오프지연() <= 0.5
+        감독자.연속실패 = 2
+        assert 1.0 <= 감독자.백오프지연() <= 2.0
+        감독자.연속실패 = 10
+        assert 2.0 <= 감독자.백오프지연() <= 4.0
+
+    @pytest.mark.asyncio
+    async def test_실패보고후재연결(self):
+        """실패 보고로 회로가 열리고 재연결 성공 시 다시 닫히는지 테스트"""
+        시도결과 = [False, True]
+        시도횟수 = []
+
+        async def 상태확인():
+            return True
+
+        async def 연결시도():
+            시도횟수.append(1)
+            return 시도결과[len(시도횟수) - 1]
+
+        감독자 = 연결감독자(상태확인, 연결시도, 점검간격=10, 기본지연=0.01, 최대지연=0.02)
+        감독자.시작()
+        await asyncio.sleep(0)
+
+        감독자.실패보고()
+        assert not 감독자.요청허용()
+
+        for _ in range(100):
+            if 감독자.요청허용():
+                break
+            await asyncio.sleep(0.01)
+
+        assert 감독자.요청허용()
+        assert len(시도횟수) == 2
+        assert 감독자.상태조회()['재연결성공횟수'] == 1
+        await 감독자.종료()
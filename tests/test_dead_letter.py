@@ -0,0 +1,123 @@
+# 파일 경로: tests/test_dead_letter.py
+"""
+데드레터 큐 조회/재주입 테스트
+"""
+
+import time
+import pika
+from unittest.mock import Mock
+from src.common.message_models import BSS메시지
+from src.common.dead_letter import 데드레터관리자
+
+
+def _데드레터메시지(타입: str, 사유: str, 태그: int):
+    """소비자가 데드레터 큐로 옮긴 메시지 흉내 (method, properties, body)"""
+    메시지 = BSS메시지(타입, f"{타입} 요청")
+    properties = pika.BasicProperties(
+        content_type='application/json',
+        delivery_mode=2,
+        headers={
+            'message_type': 타입,
+            'x-retry-count': 3,
+            'x-failure-reason': 사유,
+            'x-original-queue': f"bss_queue.{타입.lower()}",
+            'x-failed-at': '2024-01-01T00:00:00'
+        }
+    )
+    return Mock(delivery_tag=태그), properties, 메시지.to_json().encode('utf-8')
+
+
+def _관리자(수신목록: list, 큐깊이: int = 0):
+    """basic_get이 수신목록을 차례로 돌려주는 채널을 가진 관리자"""
+    관리자 = 데드레터관리자()
+    채널 = Mock()
+    채널.basic_get.side_effect = list(수신목록) + [(None, None, None)] * 10
+    채널.queue_declare.return_value = Mock(method=Mock(message_count=큐깊이))
+    연결 = Mock(is_closed=False)
+    연결.channel.return_value = 채널
+    관리자._연결생성 = lambda: 연결
+    관리자.토폴로지.데드레터큐목록 = lambda: ['bss_queue.dlq']
+    return 관리자, 채널, 연결
+
+
+class Test데드레터관리자:
+    """데드레터관리자 클래스 테스트"""
+
+    def test_조회_사유별집계(self):
+        """메시지를 ACK하지 않고 타입/사유별로 집계하는지 테스트"""
+        관리자, 채널, 연결 = _관리자([
+            _데드레터메시지("MNP", "번호이동 처리 실패: 타 통신사 응답 없음", 1),
+            _데드레터메시지("MNP", "번호이동 처리 실패: 타 통신사 응답 없음", 2),
+            _데드레터메시지("CHANGE", "파싱 실패: invalid", 3)
+        ], 큐깊이=3)
+
+        결과 = 관리자.조회()
+
+        assert 결과['검사개수'] == 3
+        assert 결과['타입별개수'] == {'MNP': 2, 'CHANGE': 1}
+        assert 결과['메시지목록'][0]['원래큐'] == 'bss_queue.mnp'
+        assert 결과['메시지목록'][0]['재시도횟수'] == 3
+        채널.basic_ack.assert_not_called()
+        연결.close.assert_called_once()
+
+    def test_재주입_조건필터(self):
+        """조건에 맞는 메시지만 원래 큐로 재주입하고 실패 헤더를 지우는지 테스트"""
+        관리자, 채널, 연결 = _관리자([
+            _데드레터메시지("MNP", "타 통신사 응답 없음", 1),
+            _데드레터메시지("CHANGE", "파싱 실패", 2),
+            _데드레터메시지("MNP", "타 통신사 응답 없음", 3)
+        ])
+
+        결과 = 관리자.재주입(사유="응답 없음", 초당개수=10000, 큐상한=0)
+
+        assert 결과['상태'] == '완료'
+        assert 결과['재주입개수'] == 2
+        assert 결과['건너뜀개수'] == 1
+        채널.confirm_delivery.assert_called_once()
+        발행 = 채널.basic_publish.call_args.kwargs
+        assert 발행['routing_key'] == 'bss_queue.mnp'
+        헤더 = 발행['properties'].headers
+        assert 'x-retry-count' not in 헤더 and 'x-failure-reason' not in 헤더
+        assert 헤더['x-replay-count'] == 1
+        assert [c.kwargs['delivery_tag'] for c in 채널.basic_ack.call_args_list] == [1, 3]
+        assert not 관리자.실행중()
+
+    def test_재주입_속도제한(self):
+        """초당 개수에 맞춰 발행 간격을 두는지 테스트"""
+        관리자, 채널, 연결 = _관리자([
+            _데드레터메시지("MNP", "실패", 태그) for 태그 in range(1, 6)
+        ])
+        연결.sleep.side_effect = time.sleep
+
+        시작 = time.monotonic()
+        결과 = 관리자.재주입(초당개수=100, 큐상한=0)
+        경과 = time.monotonic() - 시작
+
+        assert 결과['재주입개수'] == 5
+        assert 0.035 <= 경과 < 0.2
+
+    def test_재주입_초당개수0_제한없음(self):
+        """초당개수를 0으로 주면 설정값으로 바꾸지 않고 속도 제한 없이 재주입하는지 테스트"""
+        관리자, 채널, 연결 = _관리자([
+            _데드레터메시지("MNP", "실패", 태그) for 태그 in range(1, 6)
+        ])
+        관리자.기본초당개수 = 1
+
+        결과 = 관리자.재주입(초당개수=0, 큐상한=0)
+
+        assert 결과['재주입개수'] == 5
+        assert 관리자.진행상황['초당개수'] == 0
+        연결.sleep.assert_not_called()
+
+    def test_재주입_큐상한대기(self):
+        """대상 작업 큐가 상한을 넘으면 줄어들 때까지 기다리는지 테스트"""
+        관리자, 채널, 연결 = _관리자([_데드레터메시지("MNP", "실패", 1)])
+        채널.queue_declare.side_effect = [
+            Mock(method=Mock(message_count=5000)),
+            Mock(method=Mock(message_count=10))
+        ]
+
+        결과 = 관리자.재주입(초당개수=10000, 큐상한=1000)
+
+        assert 결과['재주입개수'] == 1
+        연결.sleep.assert_any_call(1)
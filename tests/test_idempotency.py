@@ -0,0 +1,77 @@
+# 파일 경로: tests/test_idempotency.py
+"""
+처리 완료 캐시(중복 처리 방지) 테스트
+"""
+
+import time
+from unittest.mock import Mock
+from src.common.message_models import BSS메시지
+from src.consumer.idempotency import 처리완료캐시
+from tests.test_base_processor import 테스트처리서비스
+
+
+class Test처리완료캐시:
+    """처리완료캐시 클래스 테스트"""
+
+    def test_기록후확인(self):
+        """기록한 아이디만 적중하고 적중률을 계산하는지 테스트"""
+        캐시 = 처리완료캐시(최대개수=10)
+        캐시.기록("msg-1")
+
+        assert 캐시.확인("msg-1")
+        assert not 캐시.확인("msg-2")
+        assert 캐시.통계조회()['적중률'] == "50.0%"
+
+    def test_LRU제거(self):
+        """최대개수를 넘으면 가장 오래 쓰지 않은 아이디부터 제거하는지 테스트"""
+        캐시 = 처리완료캐시(최대개수=2)
+        캐시.기록("a")
+        캐시.기록("b")
+        캐시.확인("a")
+        캐시.기록("c")
+
+        assert 캐시.확인("a")
+        assert not 캐시.확인("b")
+        assert 캐시.통계조회()['보관개수'] == 2
+
+    def test_TTL만료(self):
+        """보관 시간이 지난 아이디는 적중하지 않는지 테스트"""
+        캐시 = 처리완료캐시(TTL초=0.05)
+        캐시.기록("msg-1")
+        time.sleep(0.1)
+
+        assert not 캐시.확인("msg-1")
+        assert 캐시.통계조회()['보관개수'] == 0
+
+    def test_SQLite영속계층(self, tmp_path):
+        """메모리에서 밀려나거나 재시작한 뒤에도 SQLite 기록으로 적중하는지 테스트"""
+        경로 = str(tmp_path / "processed.db")
+        캐시 = 처리완료캐시(최대개수=1, 저장경로=경로)
+        캐시.기록("msg-1")
+        캐시.기록("msg-2")
+        캐시.닫기()
+
+        새캐시 = 처리완료캐시(최대개수=1, 저장경로=경로)
+        assert 새캐시.확인("msg-1")
+        assert 새캐시.확인("msg-2")
+        assert 새캐시.영속적중수 == 2
+
+
+class Test중복메시지건너뜀:
+    """기본처리서비스 중복 처리 방지 테스트"""
+
+    def test_재전달메시지_ACK만(self, 메시지전달):
+        """처리 완료된 아이디가 다시 오면 처리하지 않고 ACK만 하는지 테스트"""
+        처리서비스 = 테스트처리서비스(처리시간=0)
+        처리서비스.처리완료캐시 = 처리완료캐시()
+        채널 = Mock()
+        메시지 = BSS메시지("MNP", "번호이동")
+
+        메시지전달(처리서비스, 채널, 메시지, 1)
+        메시지전달(처리서비스, 채널, 메시지, 2)
+
+        assert 채널.basic_ack.call_count == 2
+        assert len(처리서비스.처리스레드들) == 1
+        assert 처리서비스.처리통계['성공처리개수'] == 1
+        assert 처리서비스.처리통계['중복건너뜀개수'] == 1
+        assert 처리서비스.처리통계조회()['상태정보']['중복제거']['적중수'] == 1
@@ -0,0 +1,100 @@
+# 파일 경로: tests/test_latency_histogram.py
+"""
+지연 시간 히스토그램 테스트
+"""
+
+import math
+import random
+import pytest
+from src.common.latency_histogram import 지연히스토그램, 지연통계
+from src.common.message_models import BSS메시지
+from src.common.virtual_clock import 가상시계
+from src.consumer.subscription_processor import 가입처리서비스
+
+
+def _정확한백분위(값들: list, 비율: float) -> float:
+    정렬 = sorted(값들)
+    return 정렬[max(0, math.ceil(len(정렬) * 비율 / 100) - 1)]
+
+
+def test_백분위_정확도():
+    """백분위 상대 오차가 유효자릿수(1%) 이내"""
+    난수 = random.Random(1)
+    값들 = [난수.lognormvariate(0, 1.5) for _ in range(50000)]
+    히스토그램 = 지연히스토그램()
+    for 값 in 값들:
+        히스토그램.기록(값)
+
+    p50, p99, p999 = 히스토그램.백분위(50, 99, 99.9)
+    for 비율, 측정값 in ((50, p50), (99, p99), (99.9, p999)):
+        assert 측정값 == pytest.approx(_정확한백분위(값들, 비율), rel=0.01)
+    assert 히스토그램.개수 == 50000
+    assert 히스토그램.최대 == max(값들)
+
+
+def test_고정메모리():
+    """기록 수와 관계없이 계수 배열 크기가 일정하고, 최대값을 넘는 값은 최대값으로 기록"""
+    히스토그램 = 지연히스토그램(최대값=10)
+    크기 = len(히스토그램._계수)
+    for 값 in (0, 0.00005, 0.5, 9.99, 50, 1e9):
+        히스토그램.기록(값)
+    assert len(히스토그램._계수) == 크기
+    assert 히스토그램.상한초과수 == 2
+    assert 히스토그램.백분위(100)[0] <= 10
+
+
+def test_병합():
+    """두 히스토그램 병합은 모든 값을 한 히스토그램에 기록한 것과 같음"""
+    가, 나, 전체 = 지연히스토그램(), 지연히스토그램(), 지연히스토그램()
+    for 값 in range(1, 1001):
+        (가 if 값 % 2 else 나).기록(값 / 100)
+        전체.기록(값 / 100)
+    가.병합(나)
+    assert 가.요약() == 전체.요약()
+
+    with pytest.raises(ValueError):
+        가.병합(지연히스토그램(최대값=10))
+
+
+def test_지연통계_분류():
+    """분류별로 나눠 기록하고 전체 합산을 함께 반환, 분류 수 상한을 넘으면 '기타'"""
+    통계 = 지연통계(최대분류수=2)
+    통계.기록('성공/신규가입', 0.5, 1.0, 1.5)
+    통계.기록('재시도', 0.2)
+    통계.기록('데드레터', 0.3)
+
+    결과 = 통계.조회()
+    assert set(결과['분류별']) == {'성공/신규가입', '재시도', '기타'}
+    assert 결과['분류별']['성공/신규가입']['큐대기시간']['개수'] == 1
+    assert '큐대기시간' not in 결과['분류별']['재시도']
+    assert 결과['전체']['처리시간']['개수'] == 3
+
+
+def test_처리서비스_지연기록():
+    """처리 서비스가 세부유형별로 처리시간/큐대기시간/종단시간을 기록하고 통계조회로 반환"""
+    처리서비스 = 가입처리서비스()
+    메시지 = BSS메시지('SUBSCRIPTION', '가입 요청')
+    생성시각 = 메시지.생성시간ns / 1_000_000_000
+    처리시간 = {'시작시간': 생성시각 + 2.0, '종료시간': 생성시각 + 2.5, '처리시간': 0.5}
+
+    처리서비스._지연기록(메시지, {'결과데이터': {'가입타입': '재가입'}}, 처리시간, 'ack')
+    처리서비스._지연기록(메시지, None, 처리시간, 'retry')
+
+    지연분포 = 처리서비스.가입통계조회()['지연분포']
+    재가입 = 지연분포['분류별']['성공/재가입']
+    assert 재가입['처리시간']['p50'] == pytest.approx(0.5, rel=0.01)
+    assert 재가입['큐대기시간']['p99'] == pytest.approx(2.0, rel=0.01)
+    assert 재가입['종단시간']['p999'] == pytest.approx(2.5, rel=0.01)
+    assert 지연분포['분류별']['재시도']['처리시간']['개수'] == 1
+
+
+def test_가상시계_처리시간만기록():
+    """가상 시계로 실행하면 큐대기/종단시간은 기록하지 않음"""
+    처리서비스 = 가입처리서비스()
+    처리서비스.시계 = 가상시계()
+    메시지 = BSS메시지('SUBSCRIPTION', '가입 요청')
+    처리서비스._결과판정(메시지, *처리서비스._처리실행(메시지))
+
+    전체 = 처리서비스.지연통계.조회()['전체']
+    assert 전체['처리시간']['개수'] == 1
+    assert 전체['큐대기시간']['개수'] == 0
@@ -0,0 +1,72 @@
+# 파일 경로: tests/test_message_codecs.py
+"""
+메시지 코덱 테스트
+"""
+
+import pytest
+from src.common.message_models import BSS메시지
+from src.common.message_codecs import JSON코덱, 바이너리코덱, 코덱가져오기
+
+
+class Test메시지코덱:
+    """메시지 코덱 테스트"""
+
+    @pytest.mark.parametrize("코덱", [JSON코덱(), 바이너리코덱()])
+    def test_왕복변환(self, 코덱):
+        """인코딩 후 디코딩하면 원본 필드가 유지되는지 테스트"""
+        원본 = BSS메시지("TERMINATION", "해지 요청 테스트", 속성들={"해지정보": {"사유": "이사"}})
+
+        복원 = 코덱.디코딩(코덱.인코딩(원본))
+
+        assert 복원.아이디 == 원본.아이디
+        assert 복원.타입 == 원본.타입
+        assert 복원.내용 == 원본.내용
+        assert 복원.속성들 == 원본.속성들
+        assert abs((복원.생성시간 - 원본.생성시간).total_seconds()) < 0.001
+
+    def test_바이너리_비UUID아이디(self):
+        """UUID 형식이 아닌 아이디도 보존되는지 테스트"""
+        코덱 = 바이너리코덱()
+        원본 = BSS메시지("MNP", "번호이동", 아이디="custom-id-001")
+
+        assert 코덱.디코딩(코덱.인코딩(원본)).아이디 == "custom-id-001"
+
+    @pytest.mark.parametrize('아이디', [
+        "12345678-1234-5678-1234-567812345678",
+        "12345678-1234-5678-1234-567812345ABC",
+        "{12345678-1234-5678-1234-567812345678}",
+        "urn:uuid:12345678-1234-5678-1234-567812345678",
+        "12345678123456781234567812345678"
+    ])
+    def test_바이너리_UUID표기보존(self, 아이디):
+        """표준 표기가 아닌 UUID 아이디도 원문 그대로 복원되는지 테스트"""
+        코덱 = 바이너리코덱()
+        원본 = BSS메시지("MNP", "번호이동", 아이디=아이디)
+
+        assert 코덱.디코딩(코덱.인코딩(원본)).아이디 == 아이디
+
+    def test_바이너리가더작음(self):
+        """바이너리 코덱 본문이 JSON보다 작은지 테스트"""
+        메시지 = BSS메시지("SUBSCRIPTION", "신규 가입", 속성들={"고객ID": "CUST001"})
+
+        assert len(바이너리코덱().인코딩(메시지)) < len(JSON코덱().인코딩(메시지))
+
+    def test_코덱선택(self):
+        """content_type과 별칭으로 코덱을 찾고 모르면 JSON으로 대체하는지 테스트"""
+        assert isinstance(코덱가져오기('application/x-bss-binary'), 바이너리코덱)
+        assert isinstance(코덱가져오기('binary'), 바이너리코덱)
+        assert isinstance(코덱가져오기(None), JSON코덱)
+        assert isinstance(코덱가져오기('text/plain'), JSON코덱)
+
+    def test_기존JSON형식디코딩(self):
+        """기존 to_json() 형식 본문도 JSON 코덱으로 디코딩되는지 테스트"""
+        원본 = BSS메시지("CHANGE", "명의변경")
+
+        복원 = JSON코덱().디코딩(원본.to_json().encode('utf-8'))
+
+        assert 복원.아이디 == 원본.아이디
+
+    def test_잘못된바이너리(self):
+        """손상된 바이너리 본문은 ValueError를 발생시키는지 테스트"""
+        with pytest.raises(ValueError):
+            바이너리코덱().디코딩(b'\x01\x00')
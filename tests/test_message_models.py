@@ -5,7 +5,8 @@ BSS메시지 모델 테스트
 
 import pytest
 from datetime import datetime
-from src.common.message_models import BSS메시지, MessageType, 가입메시지생성
+from unittest.mock import Mock
+from src.common.message_models import BSS메시지, 지연BSS메시지, MessageType, 가입메시지생성
 
 
 class TestBSS메시지:
@@ -58,6 +59,35 @@ class TestBSS메시지:
         assert 복원메시지.내용 == 원본메시지.내용
         assert 복원메시지.아이디 == 원본메시지.아이디
 
+    def test_검증결과캐시(self):
+        """검증을 한 번 통과하면 기억하고, 필드가 바뀌면 다시 검증하는지 테스트"""
+        메시지 = BSS메시지("MNP", "번호이동")
+
+        assert 메시지.메시지검증()
+        assert 메시지._검증됨
+
+        메시지.타입 = "INVALID"
+        assert not 메시지.메시지검증()
+
+    def test_생성시간캐시(self):
+        """생성시간 문자열이 캐시되고 생성시간 변경 시 갱신되는지 테스트"""
+        메시지 = BSS메시지("CHANGE", "명의변경")
+
+        문자열 = 메시지.생성시간문자열
+        assert 문자열 is 메시지.생성시간문자열
+        assert 문자열 == 메시지.생성시간.isoformat()
+
+        메시지.생성시간 = datetime(2024, 1, 1, 9, 30)
+        assert 메시지.생성시간문자열 == "2024-01-01T09:30:00"
+
+    def test_슬롯사용(self):
+        """인스턴스 dict 없이 슬롯만 사용하는지 테스트"""
+        메시지 = BSS메시지("SUBSCRIPTION", "가입")
+
+        assert not hasattr(메시지, '__dict__')
+        with pytest.raises(AttributeError):
+            메시지.임의필드 = 1
+
 
 def test_헬퍼함수들():
     """메시지 생성 헬퍼 함수 테스트"""
@@ -65,4 +95,41 @@ def test_헬퍼함수들():
     가입메시지 = 가입메시지생성("신규 가입", {"고객ID": "CUST001"})
     assert 가입메시지.타입 == "SUBSCRIPTION"
     assert "신규 가입" in 가입메시지.내용
-    assert 가입메시지.속성들["고객정보"]["고객ID"] == "CUST001"
\ No newline at end of file
+    assert 가입메시지.속성들["고객정보"]["고객ID"] == "CUST001"
+
+
+class Test지연BSS메시지:
+    """지연BSS메시지 클래스 테스트"""
+
+    def test_헤더만으로타입확인(self):
+        """헤더 타입이 있으면 본문을 파싱하지 않고 타입을 확인하는지 테스트"""
+        디코딩함수 = Mock()
+        메시지 = 지연BSS메시지(b'not-json', 디코딩함수, 'mnp')
+
+        assert 메시지.타입확인("MNP")
+        assert not 메시지.타입확인("CHANGE")
+        assert not 메시지.파싱완료
+        디코딩함수.assert_not_called()
+
+    def test_필드접근시파싱(self):
+        """필드에 처음 접근할 때 한 번만 본문을 파싱하는지 테스트"""
+        원본 = 가입메시지생성("지연 파싱 테스트", {"고객ID": "CUST001"})
+        디코딩함수 = Mock(side_effect=lambda 본문: BSS메시지.from_json(본문.decode('utf-8')))
+        메시지 = 지연BSS메시지(원본.to_json().encode('utf-8'), 디코딩함수, 원본.타입)
+
+        assert 메시지.내용 == "지연 파싱 테스트"
+        assert 메시지.속성들 == {"고객정보": {"고객ID": "CUST001"}}
+        assert 메시지.메시지검증()
+        assert 메시지.파싱완료
+        디코딩함수.assert_called_once()
+
+    def test_헤더없으면본문으로타입확인(self):
+        """헤더 타입이 없는 기존 메시지는 본문을 파싱하여 타입을 확인하는지 테스트"""
+        원본 = BSS메시지("TERMINATION", "해지")
+        메시지 = 지연BSS메시지(
+            원본.to_json().encode('utf-8'),
+            lambda 본문: BSS메시지.from_json(본문.decode('utf-8'))
+        )
+
+        assert 메시지.타입확인("TERMINATION")
+        assert 메시지.파싱완료
@@ -0,0 +1,65 @@
+# 파일 경로: tests/test_message_router.py
+"""
+메시지 라우터 동기 API 테스트
+"""
+
+import threading
+import pytest
+from unittest.mock import patch
+from src.common.message_models import BSS메시지
+from src.producer.message_router import 메시지라우터
+from src.producer.spool import 로컬스풀
+
+
+class Test동기API:
+    """blocking 백엔드 전용 동기 API 테스트"""
+
+    def test_asyncio백엔드_거부(self, 환경설정):
+        """asyncio 백엔드에서 동기 API를 부르면 명확한 오류를 내는지 테스트"""
+        환경설정(PRODUCER_BACKEND='asyncio')
+        with patch('src.producer.message_router.비동기메시지생산자'):
+            라우터 = 메시지라우터()
+
+        for 호출 in (
+            lambda: 라우터.메시지전송(BSS메시지("MNP", "번호이동")),
+            lambda: 라우터.배치메시지전송([BSS메시지("MNP", "번호이동")]),
+            라우터.큐상태조회, 라우터.연결상태확인, 라우터.라우터통계
+        ):
+            with pytest.raises(RuntimeError, match='PRODUCER_BACKEND=asyncio'):
+                호출()
+
+    def test_blocking백엔드_전용스레드호출(self, 환경설정):
+        """동기 API도 pika 연결을 생산자 전용 스레드에서만 사용하는지 테스트"""
+        환경설정(PRODUCER_BACKEND='blocking')
+        호출스레드 = []
+        with patch('src.producer.message_router.BSS메시지생산자') as 생산자클래스:
+            def 큐전송(메시지):
+                호출스레드.append(threading.current_thread().name)
+                return {'성공': True, '메시지': '전송 성공', '메시지아이디': 메시지.아이디}
+
+            생산자클래스.return_value.큐전송 = 큐전송
+            라우터 = 메시지라우터()
+            결과 = 라우터.메시지전송(BSS메시지("MNP", "번호이동"))
+            라우터._블로킹실행기.shutdown(wait=True)
+
+        assert 결과['성공']
+        assert 호출스레드[0].startswith('blocking-producer')
+
+    def test_회로열림_스풀보관(self, 환경설정, tmp_path):
+        """동기 전송도 회로가 열려 있으면 브로커를 호출하지 않고 스풀에 보관하는지 테스트"""
+        환경설정(PRODUCER_BACKEND='blocking')
+        스풀 = 로컬스풀(str(tmp_path / 'spool'), 세그먼트크기=4096)
+        with patch('src.producer.message_router.BSS메시지생산자') as 생산자클래스:
+            라우터 = 메시지라우터(스풀=스풀)
+            라우터.감독자.회로.열기()
+
+            단일 = 라우터.메시지전송(BSS메시지("MNP", "번호이동"))
+            배치 = 라우터.배치메시지전송([BSS메시지("CHANGE", "명의변경"), BSS메시지("MNP", "번호이동")])
+            라우터._블로킹실행기.shutdown(wait=True)
+
+        생산자클래스.return_value.큐전송.assert_not_called()
+        생산자클래스.return_value.배치전송.assert_not_called()
+        assert 단일['성공'] and 단일['세부정보']['확인상태'] == '스풀됨'
+        assert 배치['세부정보']['전송성공개수'] == 2
+        assert 스풀.깊이 == 3
+        스풀.닫기()
@@ -0,0 +1,58 @@
+# 파일 경로: tests/test_micro_batcher.py
+"""
+마이크로 배처 테스트
+"""
+
+import asyncio
+import pytest
+from src.common.message_models import BSS메시지
+from src.producer.micro_batcher import 마이크로배처
+
+
+class Test마이크로배처:
+    """마이크로배처 클래스 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_동시요청묶음(self):
+        """동시에 제출된 요청이 한 묶음으로 전송되고 각자 결과를 받는지 테스트"""
+        호출기록 = []
+
+        async def 일괄전송(메시지목록):
+            호출기록.append(len(메시지목록))
+            return [{'성공': True, '메시지아이디': 메시지.아이디} for 메시지 in 메시지목록]
+
+        배처 = 마이크로배처(일괄전송, 최대대기ms=20, 최대크기=100)
+        메시지들 = [BSS메시지("SUBSCRIPTION", f"가입 {i}") for i in range(5)]
+
+        결과목록 = await asyncio.gather(*(배처.제출(메시지) for 메시지 in 메시지들))
+
+        assert 호출기록 == [5]
+        assert [결과['메시지아이디'] for 결과 in 결과목록] == [메시지.아이디 for 메시지 in 메시지들]
+
+    @pytest.mark.asyncio
+    async def test_최대크기도달시즉시전송(self):
+        """최대 크기에 도달하면 대기 시간 없이 묶음을 나누어 전송하는지 테스트"""
+        호출기록 = []
+
+        async def 일괄전송(메시지목록):
+            호출기록.append(len(메시지목록))
+            return [{'성공': True} for _ in 메시지목록]
+
+        배처 = 마이크로배처(일괄전송, 최대대기ms=10000, 최대크기=2)
+        메시지들 = [BSS메시지("MNP", f"번호이동 {i}") for i in range(4)]
+
+        await asyncio.wait_for(asyncio.gather(*(배처.제출(메시지) for 메시지 in 메시지들)), timeout=1)
+
+        assert 호출기록 == [2, 2]
+        assert 배처.통계조회()['평균묶음크기'] == 2
+
+    @pytest.mark.asyncio
+    async def test_전송실패전파(self):
+        """묶음 전송 실패가 모든 요청자에게 전달되는지 테스트"""
+        async def 일괄전송(메시지목록):
+            raise RuntimeError("브로커 오류")
+
+        배처 = 마이크로배처(일괄전송, 최대대기ms=1, 최대크기=10)
+
+        with pytest.raises(RuntimeError):
+            await 배처.제출(BSS메시지("CHANGE", "명의변경"))
@@ -0,0 +1,74 @@
+# 파일 경로: tests/test_offline_validator.py
+"""
+가상 시계 및 오프라인 패턴 검증기 테스트
+"""
+
+import time
+import asyncio
+from src.common.message_models import BSS메시지
+from src.common.virtual_clock import 가상시계
+from src.consumer.subscription_processor import 가입처리서비스
+from src.experiments.offline_validator import 오프라인패턴검증기
+
+
+def test_가상시계_대기():
+    """가상 시계는 sleep 없이 시각만 진행"""
+    시계 = 가상시계(시작시각=10.0)
+    시작 = time.perf_counter()
+    시계.대기(3600)
+    assert time.perf_counter() - 시작 < 0.1
+    assert 시계.시각() == 3610.0
+    시계.이동(5.0)
+    assert 시계.시각() == 5.0
+    assert 시계.누적대기 == 3600
+
+
+def test_처리서비스_가상시계():
+    """처리 서비스에 가상 시계를 넣으면 처리 시간이 가상 시각으로 측정됨"""
+    처리서비스 = 가입처리서비스()
+    처리서비스.시계 = 가상시계()
+    처리결과, 처리시간, 오류 = 처리서비스._처리실행(BSS메시지('SUBSCRIPTION', '가입 요청'))
+
+    assert 오류 is None
+    assert 0.1 <= 처리서비스.시계.시각() <= 2.0
+    assert 처리시간['처리시간'] == 처리서비스.시계.시각()
+
+
+def test_같은시드_같은결과():
+    """같은 시드면 시뮬레이션 결과가 같음"""
+    결과들 = []
+    for _ in range(2):
+        검증기 = 오프라인패턴검증기(시드=7)
+        결과 = 검증기.시뮬레이션(검증기.도착목록생성(300, 10))
+        결과들.append((결과['완료시각들'], 결과['정산']))
+    assert 결과들[0] == 결과들[1]
+
+    다른검증기 = 오프라인패턴검증기(시드=8)
+    다른결과 = 다른검증기.시뮬레이션(다른검증기.도착목록생성(300, 10))
+    assert 다른결과['완료시각들'] != 결과들[0][0]
+
+
+def test_전체검증():
+    """세 검증이 벽시계보다 훨씬 빠르게 끝나고 모든 메시지가 정산됨"""
+    검증기 = 오프라인패턴검증기(시드=42)
+    보고서 = asyncio.run(검증기.전체검증(급증메시지수=500, 부하강도=20, 지속시간=30, 순간메시지수=500))
+
+    assert 보고서['보고서정보']['검증수행개수'] == 3
+    assert 보고서['실행정보']['가상시간'] > 보고서['실행정보']['실행시간'] * 100
+    버퍼링 = 검증기.검증결과들[2]
+    assert 버퍼링.측정값 == 0
+    assert sum(버퍼링.세부정보['정산'][키] for 키 in ('성공', '데드레터')) == 500
+
+
+def test_시스템보호_실패조건():
+    """백엔드한도가 소비자 수보다 작거나, 큐 없이도 한도에 못 미치는 부하면 시스템 보호 검증 실패"""
+    기본 = asyncio.run(오프라인패턴검증기(시드=42).시스템보호검증(부하강도=20, 지속시간=30))
+    assert 기본.성공 and 기본.세부정보['직접호출사용률'] > 기본.측정값
+
+    한도부족 = asyncio.run(
+        오프라인패턴검증기(시드=42, 백엔드한도=8).시스템보호검증(부하강도=20, 지속시간=30)
+    )
+    assert not 한도부족.성공 and 한도부족.측정값 > 100
+
+    저부하 = asyncio.run(오프라인패턴검증기(시드=42).시스템보호검증(부하강도=1, 지속시간=60))
+    assert not 저부하.성공 and not 저부하.세부정보['보호효과']
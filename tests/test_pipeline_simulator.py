@@ -0,0 +1,90 @@
+# 파일 경로: tests/test_pipeline_simulator.py
+"""
+파이프라인 이산 사건 시뮬레이터 테스트
+"""
+
+import pytest
+from src.experiments.pipeline_simulator import (
+    파이프라인시뮬레이터, HPA규칙, 확장동작, HPA규칙읽기, 부하프로파일해석
+)
+
+
+def _규칙들(최소: int = 1, 최대: int = 4, **값) -> dict:
+    return {
+        타입: HPA규칙(최소레플리카=최소, 최대레플리카=최대, **값)
+        for 타입 in ('SUBSCRIPTION', 'MNP', 'CHANGE', 'TERMINATION')
+    }
+
+
+def test_HPA규칙읽기():
+    """hpa.yaml의 레플리카 범위, CPU 목표, behavior를 읽음"""
+    pytest.importorskip('yaml')
+    규칙들 = HPA규칙읽기('k8s/consumer/hpa.yaml')
+
+    assert set(규칙들) == {'SUBSCRIPTION', 'MNP', 'CHANGE', 'TERMINATION'}
+    가입 = 규칙들['SUBSCRIPTION']
+    assert (가입.최소레플리카, 가입.최대레플리카, 가입.CPU목표) == (2, 10, 70)
+    assert 가입.확장.안정화구간 == 60
+    assert 가입.확장.정책 == [('Percent', 100, 60), ('Pods', 2, 60)]
+    assert 가입.축소.정책선택 == 'Min'
+    assert 규칙들['CHANGE'].CPU목표 == 75
+
+
+def test_부하프로파일해석():
+    """시각:초당메시지수 목록 해석"""
+    assert 부하프로파일해석('600:50,0:10') == [(0.0, 10.0), (600.0, 50.0)]
+    with pytest.raises(ValueError):
+        부하프로파일해석('0:10')
+
+
+def test_저부하():
+    """처리 용량보다 낮은 부하는 최소 레플리카로 대기 없이 모두 처리"""
+    시뮬레이터 = 파이프라인시뮬레이터(_규칙들(), 동시처리수=8, 프리페치=8, 라우팅모드='direct')
+    결과 = 시뮬레이터.실행(부하프로파일해석('0:2,600:2'))
+
+    요약 = 결과['요약']
+    assert 요약['도착'] == 요약['완료'] + 요약['데드레터']
+    assert 요약['필터재전달'] == 0
+    for 값 in 결과['타입별'].values():
+        assert 값['최대레플리카'] == 1
+        assert 값['대기p95'] < 1
+
+
+def test_폭주_확장():
+    """폭주 시 CPU 목표에 따라 최대 레플리카까지 확장하되 정책 기간당 증가폭을 지킴"""
+    규칙들 = _규칙들(최대=8, 확장=확장동작(0, [('Pods', 1, 60)], 'Max'))
+    시뮬레이터 = 파이프라인시뮬레이터(규칙들, 동시처리수=4, 프리페치=4, 기동지연=10, 라우팅모드='direct')
+    결과 = 시뮬레이터.실행(부하프로파일해석('0:40,900:40'))
+
+    # MNP/TERMINATION은 평균 처리 시간이 길어 CPU 70%를 맞추려면 8개보다 많이 필요
+    assert 결과['타입별']['MNP']['최대레플리카'] == 8
+    assert 결과['타입별']['TERMINATION']['최대레플리카'] == 8
+    for 타입, 값 in 결과['타입별'].items():
+        assert 값['최대레플리카'] > 1
+        확장시각 = [이벤트['시각'] for 이벤트 in 결과['스케일이벤트']
+                if 이벤트['타입'] == 타입 and 이벤트['이후'] > 이벤트['이전']]
+        assert all(이후 - 이전 >= 60 for 이전, 이후 in zip(확장시각, 확장시각[1:]))
+    assert 결과['요약']['도착'] == 결과['요약']['완료'] + 결과['요약']['데드레터']
+
+
+def test_게이트웨이한도_단일큐():
+    """게이트웨이 초당 한도를 넘는 요청은 거부되고, 단일 큐 모드는 필터 재전달이 생김"""
+    시뮬레이터 = 파이프라인시뮬레이터(
+        _규칙들(), 동시처리수=8, 프리페치=8, 라우팅모드='single', 게이트웨이처리량=10
+    )
+    결과 = 시뮬레이터.실행(부하프로파일해석('0:50,60:50'))
+
+    assert 결과['요약']['게이트웨이거부'] > 0
+    assert 결과['요약']['도착'] - 결과['요약']['게이트웨이거부'] <= 61 * 10
+    assert 결과['요약']['필터재전달'] > 0
+
+
+def test_같은시드_같은결과():
+    """같은 시드면 같은 결과"""
+    결과들 = [
+        파이프라인시뮬레이터(_규칙들(), 동시처리수=2, 시드=3).실행(부하프로파일해석('0:5,300:20'))
+        for _ in range(2)
+    ]
+    for 결과 in 결과들:
+        결과['요약'].pop('실행시간')
+    assert 결과들[0] == 결과들[1]
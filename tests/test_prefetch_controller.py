@@ -0,0 +1,127 @@
+# 파일 경로: tests/test_prefetch_controller.py
+"""
+적응형 prefetch 제어기 테스트
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+from src.common.message_models import BSS메시지
+from src.consumer.base_processor import 기본처리서비스
+from src.consumer.prefetch_controller import 적응형프리페치제어기
+
+
+def _관측반복(제어기, 횟수: int, 처리시간: float, ACK지연: float, 처리중개수: int):
+    """같은 관측을 여러 번 기록"""
+    for _ in range(횟수):
+        제어기.관측(처리시간, ACK지연, 처리중개수)
+
+
+class Test적응형프리페치제어기:
+    """적응형프리페치제어기 클래스 테스트"""
+
+    def test_목표값_리틀의법칙(self):
+        """동시처리수 + 처리율 × 보충지연으로 목표값을 계산하는지 테스트"""
+        제어기 = 적응형프리페치제어기(초기값=10, 동시처리수=8, 보충지연=0.2)
+        assert 제어기.목표값() is None
+
+        _관측반복(제어기, 10, 0.01, 0.01, 8)
+        # 처리율 800/초 × 0.2초 = 160
+        assert 제어기.목표값() == 168
+
+        느린제어기 = 적응형프리페치제어기(초기값=10, 동시처리수=8, 보충지연=0.2)
+        _관측반복(느린제어기, 10, 2.0, 2.0, 8)
+        # MNP처럼 느린 처리는 작업자 수 근처
+        assert 느린제어기.목표값() == 9
+
+    def test_가산증가(self):
+        """포화 상태에서 증가단계씩 목표값까지 늘리는지 테스트"""
+        제어기 = 적응형프리페치제어기(초기값=10, 동시처리수=8, 조정간격=5)
+        _관측반복(제어기, 20, 0.01, 0.01, 10)
+
+        assert 제어기.조정(지금=time.monotonic()) is None
+        assert 제어기.조정(지금=time.monotonic() + 100) == 18
+
+        _관측반복(제어기, 20, 0.01, 0.01, 18)
+        assert 제어기.조정(지금=time.monotonic() + 200) == 26
+        assert 제어기.조정횟수 == 2
+
+    def test_미포화시_유지(self):
+        """처리 중 메시지가 prefetch까지 차지 않으면 늘리지 않는지 테스트"""
+        제어기 = 적응형프리페치제어기(초기값=10, 동시처리수=8)
+        _관측반복(제어기, 20, 0.01, 0.01, 3)
+
+        assert 제어기.조정(지금=time.monotonic() + 100) is None
+        assert 제어기.현재값 == 10
+
+    def test_승산감소(self):
+        """로컬 대기가 길어지면 절반씩 목표값까지 줄이는지 테스트"""
+        제어기 = 적응형프리페치제어기(초기값=100, 동시처리수=4, 보충지연=0.2)
+        # 처리 2초, 수신부터 ACK까지 10초 → 받아 둔 메시지가 8초씩 대기
+        _관측반복(제어기, 20, 2.0, 10.0, 4)
+
+        assert 제어기.조정(지금=time.monotonic() + 100) == 50
+        _관측반복(제어기, 20, 2.0, 10.0, 4)
+        assert 제어기.조정(지금=time.monotonic() + 200) == 25
+        assert 제어기.상태조회()['로컬대기'] == 8.0
+
+    def test_최소표본_및_상한(self):
+        """표본이 부족하면 조정하지 않고 최대값을 넘지 않는지 테스트"""
+        제어기 = 적응형프리페치제어기(초기값=10, 동시처리수=8, 최대값=12, 최소표본=10)
+        _관측반복(제어기, 5, 0.01, 0.01, 10)
+        assert 제어기.조정(지금=time.monotonic() + 100) is None
+
+        _관측반복(제어기, 10, 0.01, 0.01, 10)
+        assert 제어기.조정(지금=time.monotonic() + 200) == 12
+
+
+class _즉시처리서비스(기본처리서비스):
+    """처리 시간이 없는 테스트용 처리 서비스"""
+
+    def __init__(self):
+        super().__init__("MNP")
+
+    def 메시지처리(self, 메시지):
+        return {'성공': True, '메시지': '처리 완료', '결과데이터': None}
+
+    def 처리시뮬레이션(self):
+        return {'성공': True}
+
+
+class Test처리서비스프리페치조정:
+    """처리 서비스에서 적응형 prefetch가 basic_qos를 다시 설정하는지 테스트"""
+
+    _적응형 = {
+        'CONSUMER_PREFETCH_ADAPTIVE': 'true',
+        'CONSUMER_PREFETCH_COUNT': '2',
+        'CONSUMER_PREFETCH_ADJUST_INTERVAL_SEC': '0'
+    }
+
+    def test_작업스레드_포화시_basic_qos재설정(self, 환경설정, 메시지전달):
+        """작업 스레드 풀로 처리하면 처리 중 메시지가 prefetch까지 차는 것을 관측해 prefetch를 늘림"""
+        환경설정(**self._적응형, CONSUMER_CONCURRENCY='2')
+        처리서비스 = _즉시처리서비스()
+        처리서비스._작업실행기 = ThreadPoolExecutor(max_workers=2)
+        대기콜백 = []
+        처리서비스.연결 = Mock(add_callback_threadsafe=대기콜백.append)
+        처리서비스.채널 = 채널 = Mock()
+
+        for 태그 in range(1, 13):
+            메시지전달(처리서비스, 채널, BSS메시지("MNP", f"번호이동 {태그}"), 태그)
+        처리서비스._작업실행기.shutdown(wait=True)
+        처리서비스._작업실행기 = None
+        for 콜백 in 대기콜백:
+            콜백()
+        처리서비스._프리페치조정()
+
+        assert 채널.basic_ack.call_count == 12
+        채널.basic_qos.assert_called_once_with(prefetch_count=4)
+        assert 처리서비스.프리페치제어기.조정횟수 == 1
+
+    def test_동시처리1_비활성화(self, 환경설정):
+        """연결 스레드에서 바로 처리하면 포화를 관측할 수 없으므로 제어기를 만들지 않음"""
+        환경설정(**self._적응형, CONSUMER_CONCURRENCY='1')
+        처리서비스 = _즉시처리서비스()
+
+        assert 처리서비스.프리페치제어기 is None
+        assert 처리서비스.프리페치카운트 == 2
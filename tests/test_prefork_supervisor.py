@@ -0,0 +1,132 @@
+# 파일 경로: tests/test_prefork_supervisor.py
+"""
+prefork 다중 프로세스 감독자 테스트
+"""
+
+import os
+import time
+import signal
+import logging
+import threading
+from src.consumer.prefork_supervisor import 프리포크감독자, _통계기록
+
+
+class _처리스레드없는처리서비스:
+    """처리 스레드가 바로 죽은 것처럼 보이는 처리 서비스 (작업 프로세스 재시작 확인용)"""
+
+    def __init__(self):
+        self.로거 = logging.getLogger(__name__)
+        self.처리스레드 = None
+
+    def 메시지처리시작(self):
+        pass
+
+    def 메시지처리중지(self):
+        pass
+
+    def 처리통계조회(self):
+        return {
+            '기본통계': {'총처리개수': 1, '성공처리개수': 1},
+            '상태정보': {'처리중개수': 0}
+        }
+
+
+class _대기처리서비스(_처리스레드없는처리서비스):
+    """중지할 때까지 처리 스레드가 살아 있는 처리 서비스"""
+
+    def 메시지처리시작(self):
+        self._중지 = threading.Event()
+        self.처리스레드 = threading.Thread(target=self._중지.wait, daemon=True)
+        self.처리스레드.start()
+
+    def 메시지처리중지(self):
+        self._중지.set()
+
+
+class Test프리포크감독자:
+    """프리포크감독자 클래스 테스트"""
+
+    def test_통계합산(self):
+        """작업 프로세스별 공유 메모리 통계를 합산하는지 테스트"""
+        감독자 = 프리포크감독자('SUBSCRIPTION', 작업프로세스수=2)
+        _통계기록(감독자._공유통계, 0, {
+            '기본통계': {'총처리개수': 10, '성공처리개수': 9, '실패처리개수': 1,
+                     '재시도개수': 1, '데드레터개수': 0},
+            '상태정보': {'처리중개수': 3}
+        })
+        _통계기록(감독자._공유통계, 1, {
+            '기본통계': {'총처리개수': 30, '성공처리개수': 27, '실패처리개수': 3,
+                     '재시도개수': 2, '데드레터개수': 1},
+            '상태정보': {'처리중개수': 5}
+        })
+
+        통계 = 감독자.처리통계조회()
+
+        assert 통계['기본통계']['총처리개수'] == 40
+        assert 통계['기본통계']['성공처리개수'] == 36
+        assert 통계['기본통계']['데드레터개수'] == 1
+        assert 통계['기본통계']['성공률'] == "90.0%"
+        assert 통계['상태정보']['처리중개수'] == 8
+        assert [항목['총처리개수'] for 항목 in 통계['작업프로세스']] == [10, 30]
+
+    def test_작업프로세스재시작(self):
+        """죽은 작업 프로세스를 다시 띄우는지 테스트"""
+        감독자 = 프리포크감독자(
+            'tests.test_prefork_supervisor:_처리스레드없는처리서비스',
+            작업프로세스수=1, 보고간격=0.05, 재시작지연=0.01
+        )
+        감독자.시작()
+        try:
+            첫pid = 감독자._프로세스들[0].pid
+            마감 = time.monotonic() + 10
+            while 감독자.재시작횟수[0] == 0 and time.monotonic() < 마감:
+                감독자.상태점검()
+                time.sleep(0.02)
+        finally:
+            감독자.중지(타임아웃=5)
+
+        assert 감독자.재시작횟수[0] >= 1
+        assert 감독자._프로세스들[0].pid != 첫pid
+        assert 감독자._프로세스들[0].exitcode is not None
+
+    def test_재시작후_통계유지(self):
+        """작업 프로세스가 재시작해도 합산 누적 카운터가 줄지 않는지 테스트"""
+        감독자 = 프리포크감독자(
+            'tests.test_prefork_supervisor:_처리스레드없는처리서비스',
+            작업프로세스수=1, 보고간격=0.05, 재시작지연=0.01
+        )
+        감독자.시작()
+        합계목록 = []
+        try:
+            마감 = time.monotonic() + 10
+            while 감독자.재시작횟수[0] < 2 and time.monotonic() < 마감:
+                감독자.상태점검()
+                합계목록.append(감독자.처리통계조회()['기본통계']['총처리개수'])
+                time.sleep(0.02)
+        finally:
+            감독자.중지(타임아웃=5)
+
+        # 작업 프로세스마다 1개씩 처리했다고 보고하므로 재시작할수록 늘어나야 함
+        assert 감독자.재시작횟수[0] >= 2
+        assert 합계목록 == sorted(합계목록)
+        assert 감독자.처리통계조회()['기본통계']['총처리개수'] >= 3
+        assert 감독자.이전통계[0]['총처리개수'] >= 2
+
+    def test_SIGTERM_해당작업프로세스만종료(self):
+        """작업 프로세스 하나에 SIGTERM을 보내도 다른 작업 프로세스와 감독자는 계속 실행되는지 테스트"""
+        감독자 = 프리포크감독자(
+            'tests.test_prefork_supervisor:_대기처리서비스',
+            작업프로세스수=2, 보고간격=0.05, 재시작지연=10
+        )
+        감독자.시작()
+        try:
+            time.sleep(0.3)
+            대상, 나머지 = 감독자._프로세스들
+            os.kill(대상.pid, signal.SIGTERM)
+            대상.join(5)
+
+            assert 대상.exitcode == 0
+            assert 나머지.is_alive()
+            assert not 감독자._중단이벤트.is_set()
+        finally:
+            감독자.중지(타임아웃=5)
@@ -0,0 +1,113 @@
+# 파일 경로: tests/test_queue_topology.py
+"""
+큐 토폴로지 테스트
+"""
+
+import pytest
+from unittest.mock import Mock
+from src.common.message_models import BSS메시지
+from src.common.queue_topology import 큐토폴로지
+
+
+class Test큐토폴로지:
+    """큐토폴로지 클래스 테스트"""
+
+    def test_단일큐모드(self, 환경설정):
+        """단일 큐 모드는 기본 Exchange로 같은 큐에 발행하는지 테스트"""
+        환경설정(ROUTING_MODE='single')
+        토폴로지 = 큐토폴로지()
+
+        assert 토폴로지.발행대상("MNP") == ('', 토폴로지.큐이름)
+        assert 토폴로지.소비큐이름("MNP") == 토폴로지.큐이름
+        assert 토폴로지.타입필터필요()
+
+    def test_direct모드(self, 환경설정):
+        """direct 모드는 타입을 routing key로 사용하고 타입별 큐를 쓰는지 테스트"""
+        환경설정(ROUTING_MODE='direct')
+        토폴로지 = 큐토폴로지()
+
+        assert 토폴로지.발행대상("MNP") == (토폴로지.교환기이름, "MNP")
+        assert 토폴로지.소비큐이름("MNP") == f"{토폴로지.큐이름}.mnp"
+        assert not 토폴로지.타입필터필요()
+
+    def test_소비자선언(self, 환경설정):
+        """소비자는 자신의 타입 큐만 선언하고 바인딩하는지 테스트"""
+        환경설정(ROUTING_MODE='headers')
+        토폴로지 = 큐토폴로지()
+        채널 = Mock()
+
+        토폴로지.선언(채널, "CHANGE")
+
+        교환기목록 = [호출.kwargs['exchange'] for 호출 in 채널.exchange_declare.call_args_list]
+        assert sorted(교환기목록) == sorted([토폴로지.교환기이름, 토폴로지.데드레터교환기이름])
+        작업큐 = [호출 for 호출 in 채널.queue_declare.call_args_list
+               if 호출.kwargs['queue'] == 토폴로지.소비큐이름("CHANGE")]
+        assert len(작업큐) == 1
+        바인딩목록 = [호출.kwargs for 호출 in 채널.queue_bind.call_args_list
+                 if 호출.kwargs['exchange'] == 토폴로지.교환기이름]
+        assert len(바인딩목록) == 1
+        바인딩 = 바인딩목록[0]
+        assert 바인딩['arguments'] == {'x-match': 'all', 'message_type': 'CHANGE'}
+
+    def test_재시도큐선언(self, 환경설정):
+        """작업 큐마다 단계별 TTL 재시도 큐와 데드레터 큐를 선언하는지 테스트"""
+        환경설정(ROUTING_MODE='direct')
+        토폴로지 = 큐토폴로지()
+        채널 = Mock()
+
+        토폴로지.선언(채널, "MNP")
+
+        선언 = {호출.kwargs['queue']: 호출.kwargs['arguments']
+              for 호출 in 채널.queue_declare.call_args_list}
+        작업큐 = 토폴로지.소비큐이름("MNP")
+        for 단계 in range(1, 토폴로지.재시도단계수 + 1):
+            인자 = 선언[f"{작업큐}.retry.{단계}"]
+            assert 인자['x-message-ttl'] == 토폴로지.재시도기본지연ms * 2 ** (단계 - 1)
+            assert 인자['x-dead-letter-routing-key'] == 작업큐
+        assert f"{작업큐}.dlq" in 선언
+        assert 선언[작업큐] == {
+            'x-dead-letter-exchange': 토폴로지.데드레터교환기이름,
+            'x-dead-letter-routing-key': 작업큐
+        }
+        채널.queue_bind.assert_any_call(
+            queue=f"{작업큐}.dlq", exchange=토폴로지.데드레터교환기이름, routing_key=작업큐
+        )
+        assert 토폴로지.재시도큐이름("MNP", 99).endswith(f".retry.{토폴로지.재시도단계수}")
+        assert 토폴로지.재시도횟수({'x-retry-count': 2}) == 2
+        assert 토폴로지.재시도횟수(None) == 0
+
+    def test_우선순위(self, 환경설정):
+        """x-max-priority로 작업 큐를 선언하고 타입별/메시지별 우선순위를 정하는지 테스트"""
+        환경설정(
+            ROUTING_MODE='single', QUEUE_MAX_PRIORITY='10',
+            MESSAGE_PRIORITIES='TERMINATION=9,SUBSCRIPTION=1'
+        )
+        토폴로지 = 큐토폴로지()
+        채널 = Mock()
+
+        토폴로지.선언(채널)
+
+        작업큐선언 = [
+            호출.kwargs for 호출 in 채널.queue_declare.call_args_list
+            if 호출.kwargs['queue'] == 토폴로지.큐이름
+        ][0]
+        assert 작업큐선언['arguments']['x-max-priority'] == 10
+        assert 토폴로지.우선순위(BSS메시지("TERMINATION", "해지")) == 9
+        assert 토폴로지.우선순위(BSS메시지("SUBSCRIPTION", "가입")) == 1
+        assert 토폴로지.우선순위(BSS메시지("CHANGE", "명의변경")) == 0
+        assert 토폴로지.우선순위(BSS메시지("SUBSCRIPTION", "가입", 속성들={'우선순위': 99})) == 10
+
+    def test_우선순위_미사용(self, 환경설정):
+        """QUEUE_MAX_PRIORITY가 0이면 기존 큐 인자와 priority를 그대로 두는지 테스트"""
+        환경설정(ROUTING_MODE='single')
+        토폴로지 = 큐토폴로지()
+
+        assert 'x-max-priority' not in 토폴로지.큐인자()
+        assert 토폴로지.우선순위(BSS메시지("TERMINATION", "해지")) is None
+
+    def test_잘못된모드(self, 환경설정):
+        """지원하지 않는 라우팅 모드는 거부하는지 테스트"""
+        환경설정(ROUTING_MODE='fanout')
+
+        with pytest.raises(ValueError):
+            큐토폴로지()
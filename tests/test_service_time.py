@@ -0,0 +1,99 @@
+# 파일 경로: tests/test_service_time.py
+"""
+처리 시간 분포 테스트
+"""
+
+import random
+import pytest
+from src.consumer.service_time import (
+    분포생성, 균등분포, 로그정규분포, 파레토분포, 이봉분포, 경험분포
+)
+from src.consumer.mnp_processor import 번호이동처리서비스
+
+
+def _표본평균(분포, 개수: int = 20000) -> float:
+    난수 = random.Random(1)
+    return sum(분포.표본(난수) for _ in range(개수)) / 개수
+
+
+def test_분포생성():
+    """명세 문자열로 분포 생성"""
+    분포 = 분포생성('lognormal:median=1.2,sigma=0.8')
+    assert isinstance(분포, 로그정규분포)
+    assert (분포.median, 분포.sigma) == (1.2, 0.8)
+    assert isinstance(분포생성('uniform:low=0.1,high=2'), 균등분포)
+    assert isinstance(분포생성('bimodal:fast=0.2,slow=5,slow_ratio=0.1'), 이봉분포)
+
+    with pytest.raises(ValueError):
+        분포생성('weibull:k=1')
+    with pytest.raises(ValueError):
+        분포생성('lognormal:median=1')
+    with pytest.raises(ValueError):
+        분포생성('gamma:shape=-1,scale=1')
+
+
+@pytest.mark.parametrize('명세', [
+    'uniform:low=1,high=5',
+    'lognormal:median=1,sigma=0.5',
+    'gamma:shape=2,scale=0.5',
+    'pareto:xmin=0.5,alpha=2.5,cap=30',
+    'bimodal:fast=0.2,slow=4,slow_ratio=0.2',
+])
+def test_평균(명세):
+    """표본 평균이 분포의 평균과 가까움"""
+    분포 = 분포생성(명세)
+    assert _표본평균(분포) == pytest.approx(분포.평균(), rel=0.05)
+
+
+def test_파레토_상한():
+    """파레토 분포는 cap을 넘지 않고 꼬리가 두꺼움"""
+    분포 = 파레토분포(xmin=0.1, alpha=1.1, cap=60)
+    난수 = random.Random(3)
+    표본 = sorted(분포.표본(난수) for _ in range(10000))
+    assert 표본[-1] <= 60
+    assert 표본[9899] > 표본[4999] * 10  # p99가 중앙값의 10배 이상
+
+
+def test_경험분포(tmp_path):
+    """히스토그램 파일의 구간 비율대로 표본 추출 (누적 건수 형식 포함)"""
+    경로 = tmp_path / 'latency.csv'
+    경로.write_text('# 상한(초),건수\n0.1,90\n\n1.0,0\n10,10\n', encoding='utf-8')
+    분포 = 경험분포(str(경로))
+    난수 = random.Random(5)
+    표본 = [분포.표본(난수) for _ in range(10000)]
+    assert sum(1 for 값 in 표본 if 값 <= 0.1) / len(표본) == pytest.approx(0.9, abs=0.02)
+    assert not any(0.1 < 값 <= 1.0 for 값 in 표본)
+    assert 분포.평균() == pytest.approx(0.9 * 0.05 + 0.1 * 5.5)
+
+    누적경로 = tmp_path / 'cumulative.csv'
+    누적경로.write_text('0.1,90\n1.0,90\n10,100\n', encoding='utf-8')
+    assert 분포생성(f'empirical:path={누적경로},cumulative=true').평균() == pytest.approx(분포.평균())
+
+    잘못된경로 = tmp_path / 'bad.csv'
+    잘못된경로.write_text('1.0,5\n0.5,5\n', encoding='utf-8')
+    with pytest.raises(ValueError):
+        경험분포(str(잘못된경로))
+
+
+def test_처리서비스_분포설정(환경설정):
+    """SERVICE_TIME_{타입}과 FAILURE_RATIOS가 처리 서비스에 적용됨"""
+    환경설정(
+        SERVICE_TIME_MNP='lognormal:median=2,sigma=1',
+        FAILURE_RATIOS='MNP=0.5,CHANGE=0',
+        SIMULATION_SEED='1'
+    )
+    처리서비스 = 번호이동처리서비스()
+    assert isinstance(처리서비스.처리시간분포, 로그정규분포)
+    assert 처리서비스.실패율 == 0.5
+
+    결과 = [처리서비스._결과유형선택({'이동완료': 1}, '이동실패') for _ in range(2000)]
+    assert sum(1 for _, 성공 in 결과 if not 성공) / len(결과) == pytest.approx(0.5, abs=0.05)
+
+
+def test_처리서비스_기본분포(환경설정):
+    """설정이 없으면 기존 균등 분포와 실패율 사용"""
+    환경설정()
+    처리서비스 = 번호이동처리서비스()
+    assert isinstance(처리서비스.처리시간분포, 균등분포)
+    assert (처리서비스.처리시간분포.low, 처리서비스.처리시간분포.high) == (1.0, 5.0)
+    assert 처리서비스.실패율 == 0.05
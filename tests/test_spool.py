@@ -0,0 +1,119 @@
+# 파일 경로: tests/test_spool.py
+"""
+로컬 스풀 테스트
+"""
+
+import pytest
+from src.common.message_models import BSS메시지
+from src.producer.spool import 로컬스풀, 스풀재생기
+
+
+@pytest.fixture
+def 스풀경로(tmp_path):
+    """테스트용 스풀 디렉터리"""
+    return str(tmp_path / 'spool')
+
+
+class Test로컬스풀:
+    """로컬스풀 클래스 테스트"""
+
+    def test_기록후읽기확정(self, 스풀경로):
+        """기록한 순서대로 읽고 확정하면 깊이가 줄어드는지 테스트"""
+        스풀 = 로컬스풀(스풀경로, 세그먼트크기=4096)
+        스풀.추가([b'first', b'second', b'third'])
+
+        레코드들 = 스풀.읽기(2)
+        assert [레코드.본문 for 레코드 in 레코드들] == [b'first', b'second']
+        assert 스풀.깊이 == 3
+
+        스풀.확정(레코드들)
+        assert 스풀.깊이 == 1
+        assert [레코드.본문 for 레코드 in 스풀.읽기(10)] == [b'third']
+        스풀.닫기()
+
+    def test_세그먼트전환및삭제(self, 스풀경로):
+        """세그먼트가 가득 차면 새 세그먼트로 넘어가고, 다 읽은 세그먼트는 삭제되는지 테스트"""
+        스풀 = 로컬스풀(스풀경로, 세그먼트크기=256)
+        본문들 = [bytes([i]) * 50 for i in range(10)]
+        스풀.추가(본문들)
+        assert 스풀.상태조회()['세그먼트수'] > 1
+
+        레코드들 = 스풀.읽기(100)
+        assert [레코드.본문 for 레코드 in 레코드들] == 본문들
+
+        스풀.확정(레코드들)
+        assert 스풀.깊이 == 0
+        assert 스풀.상태조회()['세그먼트수'] == 1
+        스풀.닫기()
+
+    def test_재시작복구(self, 스풀경로):
+        """다시 열면 확정 위치 이후의 레코드만 남아 있는지 테스트"""
+        스풀 = 로컬스풀(스풀경로, 세그먼트크기=256)
+        스풀.추가([bytes([i]) * 40 for i in range(8)])
+        스풀.확정(스풀.읽기(3))
+        스풀.닫기()
+
+        복구된스풀 = 로컬스풀(스풀경로, 세그먼트크기=256)
+        assert 복구된스풀.깊이 == 5
+        assert 복구된스풀.읽기(1)[0].본문 == bytes([3]) * 40
+
+        복구된스풀.추가([b'after-restart'])
+        assert 복구된스풀.읽기(10)[-1].본문 == b'after-restart'
+        복구된스풀.닫기()
+
+    def test_너무큰레코드(self, 스풀경로):
+        """세그먼트보다 큰 레코드는 거부하는지 테스트"""
+        스풀 = 로컬스풀(스풀경로, 세그먼트크기=128)
+
+        with pytest.raises(ValueError):
+            스풀.추가([b'x' * 200])
+        스풀.닫기()
+
+
+class Test스풀재생기:
+    """스풀재생기 클래스 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_연속성공분만확정(self, 스풀경로):
+        """실패 지점 앞까지만 확정하고 나머지는 남겨두는지 테스트"""
+        스풀 = 로컬스풀(스풀경로, 세그먼트크기=4096)
+        메시지들 = [BSS메시지("MNP", f"번호이동 {i}") for i in range(4)]
+        스풀.메시지추가(메시지들)
+
+        async def 재전송(목록):
+            return [{'성공': 메시지.내용 != "번호이동 2"} for 메시지 in 목록]
+
+        재생기 = 스풀재생기(스풀, 재전송, 배치크기=10)
+        assert await 재생기._재생() == 2
+
+        남은메시지 = [메시지 for 메시지, _ in 스풀.메시지읽기(10)]
+        assert [메시지.아이디 for 메시지 in 남은메시지] == [메시지.아이디 for 메시지 in 메시지들[2:]]
+        assert 재생기.통계조회()['총재생수'] == 2
+        스풀.닫기()
+
+
+class Test라우터스풀대체:
+    """메시지라우터의 스풀 보관 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_연결실패시스풀보관(self, 스풀경로):
+        """연결 실패 결과는 스풀에 보관하고 성공(스풀됨)으로 응답하는지 테스트"""
+        from unittest.mock import Mock, patch
+        from src.producer.message_router import 메시지라우터
+
+        스풀 = 로컬스풀(스풀경로, 세그먼트크기=4096)
+        with patch('src.producer.message_router.BSS메시지생산자') as 생산자클래스:
+            생산자클래스.return_value.큐전송 = Mock(side_effect=lambda 메시지: {
+                '성공': False,
+                '메시지': 'RabbitMQ 연결 실패',
+                '메시지아이디': 메시지.아이디,
+                '확인상태': '연결실패'
+            })
+            라우터 = 메시지라우터(스풀=스풀)
+            결과 = await 라우터.비동기메시지전송(BSS메시지("CHANGE", "명의변경"))
+            await 라우터.종료()
+
+        assert 결과['성공']
+        assert 결과['세부정보']['확인상태'] == '스풀됨'
+        assert 스풀.깊이 == 1
+        스풀.닫기()
@@ -0,0 +1,274 @@
+# 파일 경로: tests/test_write_behind.py
+"""
+처리 결과 지연 쓰기 버퍼 테스트
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, AsyncMock
+from src.common.message_models import BSS메시지
+from src.common.virtual_clock import 가상시계
+from src.consumer.async_engine import 비동기소비엔진
+from src.consumer.subscription_processor import 가입처리서비스
+from src.consumer.write_behind import 모의백엔드, 쓰기지연버퍼
+
+
+# 처리 실패로 재시도 큐에 가지 않도록 가입 처리 실패 비율을 0으로 둠
+_처리성공 = {'FAILURE_RATIOS': 'SUBSCRIPTION=0'}
+
+
+def _처리서비스() -> 가입처리서비스:
+    """sleep 없이 처리하는 가입 처리 서비스"""
+    처리서비스 = 가입처리서비스()
+    처리서비스.시계 = 가상시계()
+    return 처리서비스
+
+
+class _코루틴가입처리서비스(가입처리서비스):
+    """메시지처리가 코루틴인 가입 처리 서비스"""
+
+    async def 메시지처리(self, 메시지):
+        return {
+            '성공': True,
+            '메시지': '가입 처리 성공',
+            '결과데이터': {'메시지아이디': 메시지.아이디, '고객정보': {'고객번호': 'CUST1'}}
+        }
+
+
+def test_크기도달_묶음쓰기():
+    """최대건수가 차면 대기 시간을 기다리지 않고 한 번에 기록"""
+    묶음들 = []
+    버퍼 = 쓰기지연버퍼(묶음들.append, 최대건수=5, 최대대기ms=10000)
+    완료 = []
+    for 순번 in range(10):
+        버퍼.추가({'순번': 순번}, lambda 성공, 오류: 완료.append(성공))
+    assert 버퍼.비우기(1)
+
+    assert [len(묶음) for 묶음 in 묶음들] == [5, 5]
+    assert 완료 == [True] * 10
+    assert 버퍼.쓰기통계['크기도달'] == 2
+    assert 버퍼.중지()
+
+
+def test_시간만료_쓰기():
+    """최대건수가 차지 않아도 첫 레코드 이후 최대대기가 지나면 기록"""
+    묶음들 = []
+    버퍼 = 쓰기지연버퍼(묶음들.append, 최대건수=100, 최대대기ms=20)
+    완료 = threading.Event()
+    시작 = time.monotonic()
+    for 순번 in range(3):
+        버퍼.추가({'순번': 순번}, lambda 성공, 오류: 완료.set())
+
+    assert 완료.wait(1)
+    assert 0.015 <= time.monotonic() - 시작 < 0.5
+    assert len(묶음들[0]) == 3
+    assert 버퍼.쓰기통계['시간만료'] == 1
+    버퍼.중지()
+
+
+def test_쓰기실패_중지():
+    """쓰기 실패는 묶음의 모든 레코드에 예외와 함께 알리고, 중지하면 남은 레코드를 기록한 뒤 종료"""
+    def 실패쓰기(레코드목록):
+        raise ConnectionError('백엔드 연결 끊김')
+
+    버퍼 = 쓰기지연버퍼(실패쓰기, 최대건수=100, 최대대기ms=10000)
+    결과 = []
+    for 순번 in range(3):
+        버퍼.추가({'순번': 순번}, lambda 성공, 오류: 결과.append((성공, type(오류))))
+    assert 버퍼.중지(1)
+
+    assert 결과 == [(False, ConnectionError)] * 3
+    assert 버퍼.쓰기통계['실패레코드수'] == 3
+    with pytest.raises(RuntimeError):
+        버퍼.추가({}, lambda 성공, 오류: None)
+
+
+def test_모의백엔드_비용():
+    """쓰기 비용은 호출당 왕복지연 + 레코드당지연"""
+    백엔드 = 모의백엔드(왕복지연ms=5, 레코드당지연ms=1)
+    시계 = 가상시계()
+    for _ in range(10):
+        백엔드.쓰기([{}], 시계)
+    메시지마다 = 시계.시각()
+    백엔드.쓰기([{}] * 10, 시계)
+
+    assert 메시지마다 == pytest.approx(0.06)
+    assert 시계.시각() - 메시지마다 == pytest.approx(0.015)
+    assert 백엔드.통계조회() == {'호출수': 11, '레코드수': 20, '실패호출수': 0, '호출당레코드': 1.8}
+
+
+def test_처리서비스_쓰기후ACK(환경설정, 메시지전달):
+    """지연 쓰기면 레코드를 묶음으로 기록한 뒤 ACK하고, 그 전까지 처리 중으로 셈"""
+    환경설정(
+        **_처리성공, WRITE_BEHIND_ENABLED='true', WRITE_BEHIND_MAX_RECORDS='3',
+        WRITE_BEHIND_MAX_WAIT_MS='10000'
+    )
+    처리서비스 = _처리서비스()
+    대기콜백 = []
+    처리서비스.연결 = Mock(add_callback_threadsafe=대기콜백.append)
+    채널 = Mock()
+
+    for 태그 in (1, 2):
+        메시지전달(처리서비스, 채널, BSS메시지('SUBSCRIPTION', '가입 요청'), 태그)
+    assert 처리서비스.처리중개수 == 2
+    채널.basic_ack.assert_not_called()
+
+    메시지전달(처리서비스, 채널, BSS메시지('SUBSCRIPTION', '가입 요청'), 3)
+    assert 처리서비스.쓰기지연버퍼.비우기(1)
+    for 콜백 in 대기콜백:
+        콜백()
+
+    assert [호출.kwargs['delivery_tag'] for 호출 in 채널.basic_ack.call_args_list] == [1, 2, 3]
+    assert 처리서비스.처리중개수 == 0
+    assert 처리서비스.백엔드.통계조회()['호출당레코드'] == 3
+    처리서비스.쓰기지연버퍼.중지()
+
+
+def test_결과레코드():
+    """성공한 처리 결과의 결과레코드키 값만 레코드로 기록"""
+    처리서비스 = _처리서비스()
+    레코드 = 처리서비스._결과레코드({
+        '성공': True,
+        '결과데이터': {'메시지아이디': 'M1', '가입타입': '신규가입', '고객정보': {'고객번호': 'CUST1'}}
+    })
+    assert 레코드 == {'메시지아이디': 'M1', '처리타입': 'SUBSCRIPTION', '고객정보': {'고객번호': 'CUST1'}}
+    assert 처리서비스._결과레코드({'성공': False, '결과데이터': {'고객정보': {}}}) is None
+
+
+@pytest.mark.parametrize('지연쓰기', ['true', 'false'])
+def test_쓰기실패_재시도(환경설정, 메시지전달, 지연쓰기):
+    """백엔드 쓰기가 실패하면 처리가 성공했어도 재시도 큐로 보냄 (지연 쓰기/바로 쓰기 모두)"""
+    환경설정(
+        **_처리성공, WRITE_BEHIND_ENABLED=지연쓰기, WRITE_BEHIND_MAX_RECORDS='1',
+        BACKEND_WRITE_FAILURE_RATIO='1'
+    )
+    처리서비스 = _처리서비스()
+    대기콜백 = []
+    처리서비스.연결 = Mock(add_callback_threadsafe=대기콜백.append)
+    채널 = Mock()
+
+    메시지전달(처리서비스, 채널, BSS메시지('SUBSCRIPTION', '가입 요청'), 1)
+    if 처리서비스.쓰기지연버퍼:
+        assert 처리서비스.쓰기지연버퍼.비우기(1)
+        for 콜백 in 대기콜백:
+            콜백()
+        assert 처리서비스.처리통계['쓰기실패개수'] == 1
+        처리서비스.쓰기지연버퍼.중지()
+
+    발행 = 채널.basic_publish.call_args.kwargs
+    assert 발행['routing_key'] == 처리서비스.토폴로지.재시도큐이름('SUBSCRIPTION', 1)
+    assert 처리서비스.처리통계['재시도개수'] == 1
+    assert 처리서비스.처리중개수 == 0
+
+
+@pytest.mark.asyncio
+async def test_비동기엔진_쓰기후ACK(환경설정):
+    """asyncio 엔진도 묶음 쓰기가 끝난 뒤 ACK"""
+    환경설정(
+        **_처리성공, WRITE_BEHIND_ENABLED='true', WRITE_BEHIND_MAX_RECORDS='4',
+        WRITE_BEHIND_MAX_WAIT_MS='10000'
+    )
+    처리서비스 = _처리서비스()
+    엔진 = 비동기소비엔진(처리서비스, 동시처리수=4)
+    엔진._세마포어 = asyncio.Semaphore(엔진.동시처리수)
+    엔진._작업실행기 = ThreadPoolExecutor(max_workers=1)
+    수신목록 = []
+    for _ in range(4):
+        메시지 = BSS메시지('SUBSCRIPTION', '가입 요청')
+        수신목록.append(Mock(
+            body=메시지.to_json().encode('utf-8'), content_type='application/json',
+            headers={'message_type': 'SUBSCRIPTION'}, ack=AsyncMock()
+        ))
+
+    for 수신 in 수신목록:
+        await 엔진._메시지콜백(수신)
+    await 엔진._작업완료대기(1)
+    엔진._작업실행기.shutdown(wait=True)
+
+    assert all(수신.ack.await_count == 1 for 수신 in 수신목록)
+    assert 처리서비스.백엔드.통계조회()['호출수'] == 1
+    assert 처리서비스.처리중개수 == 0
+    처리서비스.쓰기지연버퍼.중지()
+
+
+@pytest.mark.asyncio
+async def test_비동기엔진_코루틴처리_바로쓰기(환경설정):
+    """지연 쓰기가 아니면 async 메시지처리 결과도 ACK 전에 레코드를 바로 기록"""
+    환경설정(**_처리성공)
+    처리서비스 = _코루틴가입처리서비스()
+    엔진 = 비동기소비엔진(처리서비스, 동시처리수=2)
+
+    처리결과, _, 오류 = await 엔진._처리실행(BSS메시지('SUBSCRIPTION', '가입 요청'))
+
+    assert 오류 is None and 처리결과['성공']
+    assert 처리서비스.백엔드.통계조회()['레코드수'] == 1
+
+
+def test_일괄처리_중복제거캐시기록(환경설정, 메시지전달):
+    """지연 쓰기를 켜도 일괄 처리는 묶음 단위로 바로 쓰므로 성공한 메시지를 바로 캐시에 기록"""
+    환경설정(
+        **_처리성공, WRITE_BEHIND_ENABLED='true', IDEMPOTENCY_ENABLED='true',
+        CONSUMER_BATCH_SIZE='2', CONSUMER_CONCURRENCY='1'
+    )
+    처리서비스 = _처리서비스()
+    처리서비스.연결 = Mock()
+    채널 = Mock()
+    메시지목록 = [BSS메시지('SUBSCRIPTION', '가입 요청') for _ in range(2)]
+
+    for 태그, 메시지 in enumerate(메시지목록, start=1):
+        메시지전달(처리서비스, 채널, 메시지, 태그)
+
+    assert 처리서비스.쓰기지연버퍼 is None
+    채널.basic_ack.assert_called_once_with(delivery_tag=2, multiple=True)
+    assert all(처리서비스.처리완료캐시.확인(메시지.아이디) for 메시지 in 메시지목록)
+
+
+@pytest.mark.asyncio
+async def test_비동기엔진_코루틴처리_쓰기중_루프미차단(환경설정):
+    """바로 쓰기의 백엔드 왕복 지연 동안 이벤트 루프를 막지 않아 여러 메시지의 쓰기가 겹침"""
+    환경설정(**_처리성공, BACKEND_WRITE_RTT_MS='100', BACKEND_WRITE_CONCURRENCY='4')
+    처리서비스 = _코루틴가입처리서비스()
+    엔진 = 비동기소비엔진(처리서비스, 동시처리수=4)
+
+    시작 = time.monotonic()
+    결과목록 = await asyncio.gather(*(
+        엔진._처리실행(BSS메시지('SUBSCRIPTION', '가입 요청')) for _ in range(4)
+    ))
+    경과 = time.monotonic() - 시작
+
+    assert all(오류 is None and 처리결과['성공'] for 처리결과, _, 오류 in 결과목록)
+    assert 처리서비스.백엔드.통계조회()['레코드수'] == 4
+    # 루프에서 차례로 썼다면 4 × 100ms 이상
+    assert 경과 < 0.3
+
+
+def test_드레인_지연쓰기비우기_중지(환경설정, 메시지전달):
+    """드레인은 최대대기를 기다리지 않고 버퍼를 비워 ACK하고, 처리 중지 시 쓰기 스레드를 종료"""
+    환경설정(**_처리성공, WRITE_BEHIND_ENABLED='true', WRITE_BEHIND_MAX_WAIT_MS='10000')
+    처리서비스 = _처리서비스()
+    대기콜백 = []
+
+    def 이벤트처리(time_limit=0):
+        while 대기콜백:
+            대기콜백.pop(0)()
+
+    처리서비스.연결 = Mock(is_closed=False, add_callback_threadsafe=대기콜백.append,
+                      process_data_events=이벤트처리)
+    채널 = 처리서비스.채널 = Mock(is_closed=False)
+
+    메시지전달(처리서비스, 채널, BSS메시지('SUBSCRIPTION', '가입 요청'), 1)
+    assert 처리서비스.처리중개수 == 1
+
+    시작 = time.monotonic()
+    처리서비스._드레인()
+
+    assert time.monotonic() - 시작 < 1
+    채널.basic_ack.assert_called_once_with(delivery_tag=1)
+    assert 처리서비스.드레인정보['미완료개수'] == 0
+
+    처리서비스.메시지처리중지()
+    assert 처리서비스.쓰기지연버퍼.중지됨
+    assert not 처리서비스.쓰기지연버퍼._쓰기스레드.is_alive()